@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+#
+#  bench_build.py
+"""
+Benchmark for building a large synthetic project with sphinx-toolbox's extensions.
+
+Generates a project with :mod:`synthetic_project` and builds it with each of the given builders,
+reporting the time taken and the peak memory allocated in each phase of the build:
+
+* ``init`` -- creating the Sphinx application and loading the extensions.
+* ``read`` -- reading the source files, including running autodoc and autosummary.
+* ``resolve`` -- the ``env-updated`` handlers, which include fetching the titles of GitHub issues.
+* ``write`` -- resolving references and writing the output files.
+* ``finish`` -- the ``build-finished`` handlers, such as those writing stylesheets
+  and replacing unknown Unicode characters in LaTeX output.
+
+The titles of issues are fetched from a local :class:`~.StubGitHubServer`, so no network access is needed.
+The HTTP cache is redirected to a temporary directory, and cleared before each build.
+
+Times are the minimum of ``--repeat`` builds, and the peak memory is measured in a separate build
+with :mod:`tracemalloc`, as tracing allocations slows the build down considerably.
+
+Results can be saved with ``--save``, and compared against previously saved results with ``--compare``.
+The comparison fails if any phase is more than ``--threshold`` slower, or uses that much more memory,
+than in the saved results. Baselines for the default parameters are stored in ``benchmarks/baselines``,
+but as they depend on the machine they should be regenerated before comparing on a different one.
+
+Usage::
+
+	python benchmarks/bench_build.py [--modules N] [--classes N] [--mro-depth N] [--issues N]
+		[--installations N] [--rest-examples N] [--builders html,latex] [--repeat N] [--latency SECONDS]
+		[--save FILE] [--compare FILE] [--threshold FRACTION]
+"""
+
+# stdlib
+import argparse
+import gc
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from io import StringIO
+from typing import Any, Dict, List, Optional
+
+# 3rd party
+import sphinx
+from domdf_python_tools.paths import PathPlus
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx.util.docutils import docutils_namespace
+
+# this package
+from sphinx_toolbox.cache import CACHE_DIR_ENV_VAR
+from synthetic_project import PACKAGE_NAME, ProjectSpec, generate_project
+from synthetic_project.server import StubGitHubServer
+
+#: The phases of the build, in order.
+PHASES = ("init", "read", "resolve", "write", "finish")
+
+#: The location of the baseline results for the default parameters.
+DEFAULT_BASELINE = PathPlus(__file__).parent / "baselines" / "bench_build.json"
+
+#: Phases which take less time than this, in seconds, are not checked for regressions, as they are too noisy.
+MIN_CHECKED_TIME = 0.05
+
+
+class PhaseRecorder:
+	"""
+	Records the time taken, and optionally the peak memory allocated, in each phase of a build.
+
+	:param trace_memory: Whether to record the peak memory allocated in each phase.
+		:mod:`tracemalloc` must already be tracing.
+	"""
+
+	def __init__(self, trace_memory: bool = False):
+		self.trace_memory = trace_memory
+		self.times: Dict[str, float] = {}
+		self.peaks: Dict[str, int] = {}
+		self._phase = 0
+		self._start = time.perf_counter()
+
+	def mark(self) -> None:
+		"""
+		Mark the end of the current phase, and the start of the next.
+		"""
+
+		now = time.perf_counter()
+		phase = PHASES[self._phase]
+		self.times[phase] = now - self._start
+
+		if self.trace_memory:
+			self.peaks[phase] = tracemalloc.get_traced_memory()[1]
+			# Prior to Python 3.9 the peak covers all the phases so far.
+			if hasattr(tracemalloc, "reset_peak"):
+				tracemalloc.reset_peak()
+
+		self._phase += 1
+		self._start = time.perf_counter()
+
+	def connect(self, app: Sphinx) -> None:
+		"""
+		Connect to the events marking the end of the ``read``, ``resolve`` and ``write`` phases.
+
+		:param app:
+		"""
+
+		def env_updated(app: Sphinx, env: BuildEnvironment) -> None:
+			self.mark()
+
+		app.connect("env-updated", env_updated, priority=1)
+		app.connect("env-updated", env_updated, priority=999)
+		app.connect("build-finished", lambda app, exception: self.mark(), priority=1)
+
+
+def clear_http_cache(tmpdir: PathPlus) -> None:
+	"""
+	Clear the ``sphinx-toolbox`` HTTP cache, so the titles of issues are fetched again,
+	provided it has been redirected into the benchmark's temporary directory by :func:`~.run`.
+
+	:param tmpdir:
+	"""  # noqa: D400
+
+	# this package
+	from sphinx_toolbox.cache import cache
+
+	if tmpdir in cache.cache_dir.parents:
+		cache.clear()
+
+
+def build(srcdir: PathPlus, outdir: PathPlus, buildername: str, trace_memory: bool = False) -> PhaseRecorder:
+	"""
+	Build the project in ``srcdir`` from scratch.
+
+	:param srcdir:
+	:param outdir:
+	:param buildername:
+	:param trace_memory: Whether to record the peak memory allocated in each phase.
+	"""
+
+	# Import the package afresh, as a new project would.
+	for module in [name for name in sys.modules if name.split('.')[0] == PACKAGE_NAME]:
+		del sys.modules[module]
+
+	# Fetch the titles of issues every time.
+	title_store = srcdir / "issue_titles.sqlite"
+	if title_store.is_file():
+		title_store.unlink()
+
+	clear_http_cache(srcdir.parent)
+
+	shutil.rmtree(outdir, ignore_errors=True)
+
+	if trace_memory:
+		gc.collect()
+		tracemalloc.start()
+
+	try:
+		with docutils_namespace():
+			recorder = PhaseRecorder(trace_memory)
+			app = Sphinx(
+					srcdir,
+					srcdir,
+					outdir / buildername,
+					outdir / "doctrees",
+					buildername,
+					freshenv=True,
+					status=StringIO(),
+					warning=StringIO(),
+					)
+			recorder.mark()
+			recorder.connect(app)
+			app.build()
+			recorder.mark()
+	finally:
+		if trace_memory:
+			tracemalloc.stop()
+
+	return recorder
+
+
+def run(spec: ProjectSpec, builders: List[str], repeat: int, latency: float) -> Dict[str, Any]:
+	"""
+	Generate a project, and build it with each of the given builders.
+
+	:param spec:
+	:param builders:
+	:param repeat: The number of builds to take the best time from.
+	:param latency: The latency of the stub GitHub API, in seconds.
+
+	:returns: The results, in the form written by ``--save``.
+	"""
+
+	results: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+	with tempfile.TemporaryDirectory() as tmpdir, StubGitHubServer(latency) as server:
+		# Keep the responses from the stub server out of the user's HTTP cache.
+		# The cache is created on first use, so this must happen before the first build.
+		os.environ[CACHE_DIR_ENV_VAR] = os.path.join(tmpdir, "cache")
+
+		srcdir = generate_project(tmpdir, spec, api_url=server.api_url)
+		outdir = PathPlus(tmpdir) / "build"
+
+		for buildername in builders:
+			times = [build(srcdir, outdir, buildername).times for _ in range(repeat)]
+			peaks = build(srcdir, outdir, buildername, trace_memory=True).peaks
+
+			results[buildername] = {
+					phase: {"time": min(t[phase] for t in times), "peak": peaks[phase]}
+					for phase in PHASES
+					}
+
+		print(f"The stub GitHub API served {server.requests} requests.")
+
+	return {
+			"parameters": spec._asdict(),
+			"python": platform.python_version(),
+			"sphinx": sphinx.__display_version__,
+			"results": results,
+			}
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+	"""
+	Returns a description of each phase of the build which has regressed compared to the baseline.
+
+	:param results:
+	:param baseline:
+	:param threshold: The fraction by which the time or peak memory may increase.
+	"""
+
+	regressions = []
+
+	for buildername, phases in results["results"].items():
+		for phase, current in phases.items():
+			previous: Optional[Dict[str, float]] = baseline["results"].get(buildername, {}).get(phase)
+			if previous is None:
+				continue
+
+			if previous["time"] >= MIN_CHECKED_TIME and current["time"] > previous["time"] * (1 + threshold):
+				regressions.append(
+						f"{buildername} {phase}: {current['time']:.2f} s, "
+						f"previously {previous['time']:.2f} s"
+						)
+
+			if current["peak"] > previous["peak"] * (1 + threshold):
+				regressions.append(
+						f"{buildername} {phase}: peak {current['peak'] / 2**20:.1f} MiB, "
+						f"previously {previous['peak'] / 2**20:.1f} MiB"
+						)
+
+	return regressions
+
+
+def main() -> None:  # noqa: D103
+	defaults = ProjectSpec()
+
+	parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+	parser.add_argument("--modules", type=int, default=defaults.modules)
+	parser.add_argument("--classes", type=int, default=defaults.classes)
+	parser.add_argument("--mro-depth", type=int, default=defaults.mro_depth)
+	parser.add_argument("--regexes", type=int, default=defaults.regexes)
+	parser.add_argument("--issues", type=int, default=defaults.issues)
+	parser.add_argument("--installations", type=int, default=defaults.installations)
+	parser.add_argument("--rest-examples", type=int, default=defaults.rest_examples)
+	parser.add_argument("--pages", type=int, default=defaults.pages)
+	parser.add_argument("--builders", default="html,latex")
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--latency", type=float, default=0)
+	parser.add_argument("--save", metavar="FILE")
+	parser.add_argument("--compare", metavar="FILE", nargs='?', const=str(DEFAULT_BASELINE))
+	parser.add_argument("--threshold", type=float, default=0.25)
+	args = parser.parse_args()
+
+	spec = ProjectSpec(
+			modules=args.modules,
+			classes=args.classes,
+			mro_depth=args.mro_depth,
+			regexes=args.regexes,
+			issues=args.issues,
+			installations=args.installations,
+			rest_examples=args.rest_examples,
+			pages=args.pages,
+			)
+
+	results = run(spec, args.builders.split(','), args.repeat, args.latency)
+
+	for buildername, phases in results["results"].items():
+		print(buildername)
+		for phase, result in phases.items():
+			print(f"  {phase:<8} {result['time'] * 1000:8.0f} ms, peak {result['peak'] / 2**20:6.1f} MiB")
+
+	if args.save:
+		PathPlus(args.save).parent.maybe_make(parents=True)
+		PathPlus(args.save).dump_json(results, indent=2)
+
+	if args.compare:
+		baseline = PathPlus(args.compare).load_json()
+
+		if baseline["parameters"] != results["parameters"]:
+			print(f"Warning: the parameters differ from those of the baseline {args.compare!r}.")
+
+		regressions = compare(results, baseline, args.threshold)
+
+		if regressions:
+			print(f"Regressions of more than {args.threshold:.0%} compared to {args.compare!r}:")
+			for regression in regressions:
+				print(f"  {regression}")
+			sys.exit(1)
+
+		print(f"No regressions of more than {args.threshold:.0%} compared to {args.compare!r}.")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+#
+#  bench_latex_unicode.py
+"""
+Benchmark for :func:`sphinx_toolbox.latex.replace_unknown_unicode`.
+
+Processes a synthetic LaTeX file containing some of the replaced characters,
+comparing against the implementation used prior to version 2.19.0
+which read the whole file and called :meth:`str.replace` once per character.
+Both the time taken and the peak memory allocated are reported.
+
+Usage::
+
+	python benchmarks/bench_latex_unicode.py [--megabytes N]
+"""
+
+# stdlib
+import argparse
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from sphinx_toolbox import latex
+
+
+def legacy_replace(output_file: PathPlus) -> None:
+	"""
+	The replacement performed by :func:`~.replace_unknown_unicode` prior to 2.19.0.
+
+	:param output_file:
+	"""
+
+	output_content = output_file.read_text()
+
+	for old, new in latex._default_unicode_replacements.items():
+		output_content = output_content.replace(old, new)
+
+	output_file.write_clean(output_content)
+
+
+def current_replace(output_file: PathPlus) -> None:
+	"""
+	The replacement performed by :func:`~.replace_unknown_unicode`.
+
+	:param output_file:
+	"""
+
+	latex._replace_unicode_in_file(output_file, latex._make_unicode_replacer(latex._default_unicode_replacements))
+
+
+def measure(func: Callable[[PathPlus], None], filename: PathPlus, content: str) -> Tuple[float, int]:
+	"""
+	Returns the time taken by ``func`` to process ``filename``, and the peak memory it allocated.
+
+	:param func:
+	:param filename:
+	:param content: The content to write to the file before each run.
+	"""
+
+	filename.write_text(content)
+	start = time.perf_counter()
+	func(filename)
+	elapsed = time.perf_counter() - start
+
+	filename.write_text(content)
+	tracemalloc.start()
+	func(filename)
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+
+	return elapsed, peak
+
+
+def main() -> None:  # noqa: D103
+	parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+	parser.add_argument("--megabytes", type=int, default=40)
+	args = parser.parse_args()
+
+	# One line in twenty contains characters which are replaced.
+	block = "Some text with \\textbf{bold} and \\sphinxcode{code}.   \n" * 19
+	block += "A symbol ♠ or two: 1 ≤ 2 and μ.\n"
+	content = block * (args.megabytes * 2**20 // len(block.encode("UTF-8")))
+
+	with tempfile.TemporaryDirectory() as tmpdir:
+		filename = PathPlus(tmpdir) / "manual.tex"
+
+		filename.write_text(content)
+		legacy_replace(filename)
+		expected = filename.read_text()
+		filename.write_text(content)
+		current_replace(filename)
+		assert filename.read_text() == expected
+
+		legacy_time, legacy_peak = measure(legacy_replace, filename, content)
+		current_time, current_peak = measure(current_replace, filename, content)
+
+	print(f"{args.megabytes} MB LaTeX file")
+	print(f"  previous: {legacy_time * 1000:8.0f} ms, peak {legacy_peak / 2**20:6.1f} MiB")
+	print(
+			f"  current:  {current_time * 1000:8.0f} ms, peak {current_peak / 2**20:6.1f} MiB  "
+			f"({legacy_time / current_time:.1f}x)"
+			)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+#
+#  bench_parse_parameters.py
+"""
+Micro-benchmark for :func:`sphinx_toolbox.utils.parse_parameters` and :func:`sphinx_toolbox.utils.iter_parameters`.
+
+Parses a synthetic docstring with many parameters,
+comparing against the three-regex implementation used prior to version 2.19.0.
+
+Usage::
+
+	python benchmarks/bench_parse_parameters.py [--lines N] [--repeat N]
+"""
+
+# stdlib
+import argparse
+import itertools
+import timeit
+from typing import Dict, List, Optional
+
+# this package
+from sphinx_toolbox.utils import (
+		Param,
+		iter_parameters,
+		parse_parameters,
+		typed_flag_regex,
+		typed_param_regex,
+		untyped_param_regex
+		)
+
+
+def make_docstring(lines: int) -> List[str]:
+	"""
+	Create a docstring with approximately ``lines`` lines, mostly documenting parameters.
+
+	:param lines:
+	"""
+
+	docstring = ["A function with a very long docstring.", '', "It has many parameters.", '']
+
+	for i in itertools.count():
+		if len(docstring) >= lines - 3:
+			break
+
+		if i % 3 == 0:
+			docstring.append(f":param int arg_{i}: The argument number {i}.")
+		else:
+			docstring.append(f":param arg_{i}: The argument number {i}.")
+			docstring.append(f":type arg_{i}: str")
+
+		docstring.append("        Which has a description spanning two lines.")
+
+	docstring.extend(['', ":returns: Something.", ":raises ValueError: Sometimes."])
+
+	return docstring
+
+
+def legacy_parse_parameters(lines: List[str], tab_size: int = 8):
+	"""
+	The implementation of :func:`~.parse_parameters` prior to 2.19.0.
+	"""
+
+	a_tab = ' ' * tab_size
+	params: Dict[str, Param] = {}
+	last_arg: Optional[str] = None
+	pre_output: List[str] = []
+	post_output: List[str] = []
+
+	def add_empty(param_name: str):
+		if param_name not in params:
+			params[param_name] = {"doc": [], "type": ''}
+
+	for line in lines:
+		if post_output:
+			post_output.append(line)
+			continue
+
+		typed_m = typed_param_regex.match(line)
+		untyped_m = untyped_param_regex.match(line)
+		type_only_m = typed_flag_regex.match(line)
+
+		if typed_m:
+			last_arg = typed_m.group(3).strip()
+			add_empty(last_arg)
+			params[last_arg]["doc"] = [typed_m.group(4)]
+			params[last_arg]["type"] = typed_m.group(2).strip()
+		elif untyped_m:
+			last_arg = untyped_m.group(2).strip()
+			add_empty(last_arg)
+			params[last_arg]["doc"] = [untyped_m.group(3)]
+		elif type_only_m:
+			add_empty(type_only_m.group(2))
+			params[type_only_m.group(2)]["type"] = type_only_m.group(3)
+		elif line.startswith(a_tab) and last_arg is not None:
+			params[last_arg]["doc"].append(line)
+		elif last_arg is None:
+			pre_output.append(line)
+		else:
+			post_output.append(line)
+
+	return params, pre_output, post_output
+
+
+def first_parameter(lines: List[str]) -> Optional[str]:
+	"""
+	Returns the name of the first parameter, stopping as soon as it is found.
+	"""
+
+	for event in iter_parameters(lines):
+		if event.kind == "param":
+			return event.name
+
+	return None
+
+
+def main() -> None:  # noqa: D103
+	parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+	parser.add_argument("--lines", type=int, default=10_000)
+	parser.add_argument("--repeat", type=int, default=20)
+	args = parser.parse_args()
+
+	docstring = make_docstring(args.lines)
+	assert legacy_parse_parameters(docstring) == parse_parameters(docstring)
+
+	def best(func) -> float:
+		return min(timeit.repeat(lambda: func(docstring), number=1, repeat=args.repeat))
+
+	legacy = best(legacy_parse_parameters)
+	current = best(parse_parameters)
+	streaming = best(first_parameter)
+
+	print(f"Docstring with {len(docstring)} lines")
+	print(f"  previous:                        {legacy * 1000:8.2f} ms")
+	print(f"  parse_parameters:                {current * 1000:8.2f} ms  ({legacy / current:.1f}x)")
+	print(f"  iter_parameters (first param):   {streaming * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+#
+#  bench_process_docstring.py
+"""
+Micro-benchmark for :func:`sphinx_toolbox.more_autodoc.typehints.process_docstring`.
+
+Generates a synthetic module with many functions with wide signatures,
+and times adding their type annotations to the docstrings.
+The quadratic algorithm used prior to version 2.19.0 is included for comparison.
+
+Usage::
+
+	python benchmarks/bench_process_docstring.py [--functions N] [--params N] [--repeat N]
+"""
+
+# stdlib
+import argparse
+import timeit
+import types
+from typing import Any, Callable, Dict, List
+
+# this package
+from sphinx_toolbox.more_autodoc.typehints import format_annotation, get_all_type_hints, process_docstring
+from sphinx_toolbox.utils import escape_trailing__
+
+
+def make_module(functions: int, params: int) -> types.ModuleType:
+	"""
+	Create a module with ``functions`` functions, each taking ``params`` annotated arguments.
+
+	:param functions:
+	:param params:
+	"""
+
+	source = ["from typing import Dict, List, Optional"]
+	annotations = ["int", "str", "List[int]", "Dict[str, float]", "Optional[bytes]"]
+
+	for func_idx in range(functions):
+		args = ", ".join(f"arg_{i}: {annotations[i % len(annotations)]}" for i in range(params))
+		source.append(f"def function_{func_idx}({args}) -> Optional[int]: pass")
+
+	module = types.ModuleType("synthetic")
+	exec("\n".join(source), module.__dict__)  # pylint: disable=exec-used
+	return module
+
+
+def make_docstring(params: int) -> List[str]:
+	"""
+	Create a docstring documenting ``params`` parameters.
+
+	:param params:
+	"""
+
+	lines = ["A function with a wide signature.", '']
+
+	for i in range(params):
+		lines.append(f":param arg_{i}: The argument number {i}.")
+		lines.append("    Which has a description spanning two lines.")
+
+	lines.append('')
+	lines.append(":returns: Something.")
+
+	return lines
+
+
+def legacy_process_docstring(app, what: str, name: str, obj: Any, options: Dict, lines: List[str]) -> None:
+	"""
+	The parameter and return type handling from :func:`~.process_docstring` prior to 2.19.0.
+	"""
+
+	type_hints = get_all_type_hints(obj, name, obj)
+
+	for argname, annotation in type_hints.items():
+		if argname == "return":
+			continue
+
+		argname = escape_trailing__(argname)
+		formatted_annotation = format_annotation(annotation, fully_qualified=app.config.typehints_fully_qualified)
+		searchfor = [f":{field} {argname}:" for field in ("param", "parameter", "arg", "argument")]
+		insert_index = None
+
+		for i, line in enumerate(lines):
+			if any(line.startswith(search_string) for search_string in searchfor):
+				insert_index = i
+				break
+
+		if insert_index is not None:
+			lines.insert(insert_index, f":type {argname}: {formatted_annotation}")
+
+	formatted_annotation = format_annotation(type_hints["return"])
+	insert_index = len(lines)
+
+	for i, line in enumerate(lines):
+		if line.startswith(":rtype:"):
+			insert_index = i
+			lines.pop(i)
+			break
+		elif line.startswith(":return:") or line.startswith(":returns:"):
+			insert_index = i
+
+	lines.insert(insert_index, f":rtype: {formatted_annotation}")
+
+
+def time_implementation(implementation: Callable, module: types.ModuleType, docstring: List[str], repeat: int) -> float:
+	"""
+	Returns the best time to process the docstrings of all functions in the module.
+	"""
+
+	app = types.SimpleNamespace(
+			config=types.SimpleNamespace(
+					typehints_fully_qualified=False,
+					always_document_param_types=False,
+					typehints_document_rtype=True,
+					hide_none_rtype=False,
+					),
+			)
+
+	functions = [getattr(module, name) for name in dir(module) if name.startswith("function_")]
+
+	def run() -> None:
+		for function in functions:
+			implementation(app, "function", f"synthetic.{function.__name__}", function, {}, list(docstring))
+
+	return min(timeit.repeat(run, number=1, repeat=repeat))
+
+
+def main() -> None:  # noqa: D103
+	parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+	parser.add_argument("--functions", type=int, default=300)
+	parser.add_argument("--params", type=int, default=60)
+	parser.add_argument("--repeat", type=int, default=5)
+	args = parser.parse_args()
+
+	module = make_module(args.functions, args.params)
+	docstring = make_docstring(args.params)
+
+	legacy = time_implementation(legacy_process_docstring, module, docstring, args.repeat)
+	current = time_implementation(process_docstring, module, docstring, args.repeat)
+
+	print(f"{args.functions} functions with {args.params} parameters each")
+	print(f"  previous: {legacy * 1000:8.1f} ms")
+	print(f"  current:  {current * 1000:8.1f} ms  ({legacy / current:.1f}x)")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+#
+#  bench_protocol_members.py
+"""
+Micro-benchmark for :meth:`sphinx_toolbox.more_autodoc.autoprotocol.ProtocolDocumenter.filter_members`.
+
+Filters the members of a synthetic :class:`typing.Protocol` with many methods,
+which subclasses another protocol with many methods,
+comparing against the implementation used prior to version 2.19.0 which called :func:`dir` for every member.
+
+Usage::
+
+	python benchmarks/bench_protocol_members.py [--methods N] [--repeat N]
+"""
+
+# stdlib
+import argparse
+import timeit
+import types
+from typing import Any, List, Tuple
+
+# 3rd party
+from sphinx.ext.autodoc import Options
+from typing_extensions import Protocol
+
+# this package
+from sphinx_toolbox.more_autodoc.autoprotocol import ProtocolDocumenter, globally_excluded_methods
+
+
+def make_protocol(methods: int) -> type:
+	"""
+	Create a protocol with ``methods`` methods, half of which override those of its base protocol.
+
+	:param methods:
+	"""
+
+	def base_method(self) -> None: ...
+
+	def method(self) -> None: ...
+
+	base_namespace = {f"method_{i}": base_method for i in range(methods)}
+	namespace = {f"method_{i}": method for i in range(methods // 2, methods + methods // 2)}
+
+	base = types.new_class("BaseProtocol", (Protocol, ), exec_body=lambda ns: ns.update(base_namespace))
+	return types.new_class("SyntheticProtocol", (base, Protocol), exec_body=lambda ns: ns.update(namespace))
+
+
+def legacy_filter_members(documenter: ProtocolDocumenter, members: List[Tuple[str, Any]]) -> List[str]:
+	"""
+	The member filtering from :meth:`~.ProtocolDocumenter.filter_members` prior to 2.19.0.
+	"""
+
+	ret = []
+
+	for (membername, member) in members:
+		if membername.startswith('_') and not (membername.startswith("__") and membername.endswith("__")):
+			keep = False
+		elif membername not in globally_excluded_methods:
+			if membername in dir(documenter.object.__base__):
+				keep = member is not getattr(documenter.object.__base__, membername)
+			else:
+				keep = True
+		else:
+			keep = False
+
+		if keep:
+			ret.append(membername)
+
+	return ret
+
+
+def main() -> None:  # noqa: D103
+	parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+	parser.add_argument("--methods", type=int, default=500)
+	parser.add_argument("--repeat", type=int, default=5)
+	args = parser.parse_args()
+
+	protocol = make_protocol(args.methods)
+
+	documenter = ProtocolDocumenter.__new__(ProtocolDocumenter)
+	documenter.object = protocol
+	documenter.options = Options()
+	documenter.env = types.SimpleNamespace(app=None)  # type: ignore[assignment]
+
+	members = [(name, getattr(protocol, name)) for name in dir(protocol)]
+
+	current_members = [name for name, *_ in documenter.filter_members(members, True)]
+	assert legacy_filter_members(documenter, members) == current_members
+
+	def best(func) -> float:
+		return min(timeit.repeat(func, number=1, repeat=args.repeat))
+
+	legacy = best(lambda: legacy_filter_members(documenter, members))
+	current = best(lambda: documenter.filter_members(members, True))
+
+	print(f"Protocol with {len(members)} members, {len(current_members)} documented")
+	print(f"  previous: {legacy * 1000:8.2f} ms")
+	print(f"  current:  {current * 1000:8.2f} ms  ({legacy / current:.1f}x)")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+#
+#  bench_regex_parser.py
+"""
+Micro-benchmark for :meth:`sphinx_toolbox.more_autodoc.regex.RegexParser.parse_pattern`.
+
+Renders a set of synthetic regular expressions with the HTML and LaTeX parsers,
+as happens when the same project is built with both builders,
+comparing rendering every pattern from scratch against :data:`~.regex_render_cache`.
+
+Usage::
+
+	python benchmarks/bench_regex_parser.py [--patterns N] [--repeat N]
+"""
+
+# stdlib
+import argparse
+import re
+import timeit
+from typing import List, Pattern
+
+# this package
+from sphinx_toolbox.more_autodoc.regex import latex_regex_parser, regex_parser, regex_render_cache
+
+
+def make_patterns(count: int) -> List[Pattern]:
+	"""
+	Create ``count`` distinct regular expressions resembling validation rules.
+
+	:param count:
+	"""
+
+	return [
+			re.compile(rf"^(?P<code>[A-Z]{{2,4}})-{i}\s+[a-z0-9_.]+@(example|test)\.(com|org)(:\d{{1,5}})?$")
+			for i in range(count)
+			]
+
+
+def main() -> None:  # noqa: D103
+	parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+	parser.add_argument("--patterns", type=int, default=4000)
+	parser.add_argument("--repeat", type=int, default=5)
+	args = parser.parse_args()
+
+	patterns = make_patterns(args.patterns)
+
+	def render_uncached() -> None:
+		for pattern in patterns:
+			regex_parser._render(pattern)
+			latex_regex_parser._render(pattern)
+
+	def render_cached() -> None:
+		for pattern in patterns:
+			regex_parser.parse_pattern(pattern)
+			latex_regex_parser.parse_pattern(pattern)
+
+	for pattern in patterns:
+		assert regex_parser._render(pattern) in regex_parser.parse_pattern(pattern)
+
+	def best(func) -> float:
+		return min(timeit.repeat(func, number=1, repeat=args.repeat))
+
+	uncached = best(render_uncached)
+	cached = best(render_cached)
+
+	print(f"{len(patterns)} patterns, {len(regex_render_cache)} cache entries")
+	print(f"  uncached: {uncached * 1000:8.2f} ms")
+	print(f"  cached:   {cached * 1000:8.2f} ms  ({uncached / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+#
+#  __init__.py
+"""
+Generator for synthetic Sphinx projects, used by the build benchmarks.
+
+A project consists of a Python package, ``synthetic_pkg``, whose modules contain
+classes with deep MROs, named tuples, typed dictionaries, protocols,
+overloaded functions and regular expression constants,
+and documentation which documents the package with ``automodule`` and ``autosummary``
+and makes heavy use of the ``:issue:`` role and the ``installation`` and ``rest-example`` directives.
+
+The size of each part of the project is controlled by a :class:`~.ProjectSpec`.
+"""  # noqa: D400
+
+# stdlib
+import itertools
+import textwrap
+from typing import Iterator, List, NamedTuple, Optional
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.stringlist import StringList
+from domdf_python_tools.typing import PathLike
+
+__all__ = ["PACKAGE_NAME", "ProjectSpec", "generate_project", "make_module", "make_usage_page"]
+
+#: The name of the generated Python package.
+PACKAGE_NAME = "synthetic_pkg"
+
+_regexes = [
+		r"(?P<name>[A-Za-z_][\w.]*)\s*=\s*(?P<value>\d+|'[^']*')",
+		r"^(\d{4})-(\d{2})-(\d{2})(?:T(\d{2}):(\d{2}))?$",
+		r"[^@\s]+@[^@\s]+\.[a-z]{2,}",
+		r"(?i)(?:https?://)?(?:www\.)?github\.com/([\w-]+)/([\w.-]+)",
+		r"\b(?:0x[0-9a-fA-F]+|0o[0-7]+|0b[01]+|\d+)\b",
+		]
+
+
+class ProjectSpec(NamedTuple):
+	"""
+	The size of a synthetic project.
+	"""
+
+	#: The number of modules in the package, each of which is documented on its own page.
+	modules: int = 20
+
+	#: The number of classes in each module, in addition to those making up the class hierarchy.
+	classes: int = 5
+
+	#: The depth of the class hierarchy in each module.
+	mro_depth: int = 10
+
+	#: The number of regular expression constants in each module.
+	regexes: int = 5
+
+	#: The total number of uses of the ``:issue:`` role, each referring to a different issue.
+	issues: int = 2000
+
+	#: The total number of ``installation`` directives.
+	installations: int = 200
+
+	#: The total number of ``rest-example`` directives.
+	rest_examples: int = 200
+
+	#: The number of usage pages the roles and directives are spread across.
+	pages: int = 20
+
+
+def make_module(index: int, spec: ProjectSpec) -> str:
+	"""
+	Returns the source of the module with the given index.
+
+	:param index:
+	:param spec:
+	"""
+
+	source = StringList([
+			'"""',
+			f"Synthetic module {index}.",
+			'"""',
+			'',
+			"# stdlib",
+			"import re",
+			"from typing import Dict, List, NamedTuple, Optional, overload",
+			'',
+			"# 3rd party",
+			"from typing_extensions import Protocol, TypedDict, runtime_checkable",
+			'',
+			])
+
+	for number, pattern in zip(range(spec.regexes), itertools.cycle(_regexes)):
+		source.append(f"#: Regular expression number {number}.")
+		source.append(f"PATTERN_{number} = re.compile({pattern!r})")
+		source.blankline(ensure_single=True)
+
+	for depth in range(spec.mro_depth):
+		base = f"(Base{depth - 1})" if depth else ''
+		source.blankline(ensure_single=True)
+		source.append('')
+		source.append(f"class Base{depth}{base}:")
+		source.append(
+				textwrap.indent(
+						textwrap.dedent(
+								f'''\
+		"""
+		Level {depth} of the class hierarchy.
+		"""
+
+		def method_{depth}(self, value: int, name: str = "default") -> Optional[str]:
+			"""
+			The method introduced at level {depth}.
+
+			:param value: The value to process.
+			:param name: The name of the value.
+			"""
+
+			return None
+		'''
+								),
+						'\t',
+						)
+				)
+
+	leaf = f"Base{spec.mro_depth - 1}" if spec.mro_depth else "object"
+
+	for number in range(spec.classes):
+		source.blankline(ensure_single=True)
+		source.append('')
+		source.append(f"class Class{number}({leaf}):")
+		source.append(
+				textwrap.indent(
+						textwrap.dedent(
+								f'''\
+		"""
+		Class number {number} in module {index}.
+
+		:param size: The size of the object.
+		:param labels: Labels to attach to the object.
+		"""
+
+		#: The size of the object.
+		size: int
+
+		def __init__(self, size: int = 0, labels: Optional[List[str]] = None):
+			self.size = size
+
+		def process(self, data: Dict[str, int], *, strict: bool = False) -> List[int]:
+			"""
+			Process the data.
+
+			:param data: A mapping of names to values.
+			:param strict: Whether to raise an error for unknown names.
+			"""
+
+			return list(data.values())
+		'''
+								),
+						'\t',
+						)
+				)
+
+	source.blankline(ensure_single=True)
+	source.append(
+			textwrap.dedent(
+					f'''\
+
+	class Record(NamedTuple):
+		"""
+		A record in module {index}.
+		"""
+
+		#: The name of the record.
+		name: str
+
+		#: The value of the record.
+		value: int = 0
+
+
+	class Options(TypedDict, total=False):
+		"""
+		Options for module {index}.
+		"""
+
+		#: Whether to show more output.
+		verbose: bool
+
+		#: The level of detail.
+		level: int
+
+
+	@runtime_checkable
+	class SupportsProcess(Protocol):
+		"""
+		Objects which can process data.
+		"""
+
+		def process(self, data: Dict[str, int], *, strict: bool = False) -> List[int]: ...
+
+
+	@overload
+	def convert(value: int) -> str: ...
+
+
+	@overload
+	def convert(value: str) -> int: ...
+
+
+	def convert(value):
+		"""
+		Convert between strings and integers.
+
+		:param value: The value to convert.
+		"""
+
+		if isinstance(value, int):
+			return str(value)
+		return int(value)
+	'''
+					)
+			)
+
+	return str(source)
+
+
+def _spread(total: int, parts: int, part: int) -> range:
+	"""
+	Returns the indices of the items from ``range(total)`` which belong to the given part.
+	"""
+
+	return range(part, total, parts)
+
+
+def make_usage_page(index: int, spec: ProjectSpec) -> str:
+	"""
+	Returns the source of the usage page with the given index.
+
+	:param index:
+	:param spec:
+	"""
+
+	page = StringList([f"Usage {index}", '=' * len(f"Usage {index}"), ''])
+
+	issues: Iterator[int] = iter(_spread(spec.issues, spec.pages, index))
+
+	for number in _spread(spec.installations, spec.pages, index):
+		page.append(f".. installation:: synthetic-{number}")
+		page.append("\t:pypi:")
+		page.append("\t:github:")
+		page.blankline(ensure_single=True)
+
+	for number in _spread(spec.rest_examples, spec.pages, index):
+		page.append(".. rest-example::")
+		page.blankline(ensure_single=True)
+		page.append(f"\tExample {number} uses ``code`` and **bold** text.")
+		page.blankline(ensure_single=True)
+		page.append("\t.. code-block:: python")
+		page.blankline(ensure_single=True)
+		page.append(f"\t\tprint({number})")
+		page.blankline(ensure_single=True)
+
+	# Ten issues per paragraph.
+	while True:
+		numbers: List[int] = [issue + 1 for issue in itertools.islice(issues, 10)]
+		if not numbers:
+			break
+
+		page.append(' '.join(f"Fixed :issue:`{number}`." for number in numbers))
+		page.blankline(ensure_single=True)
+
+	return str(page)
+
+
+def generate_project(directory: PathLike, spec: ProjectSpec, api_url: Optional[str] = None) -> PathPlus:
+	"""
+	Generate a synthetic project in the given directory.
+
+	:param directory:
+	:param spec:
+	:param api_url: The base URL of the GitHub API to fetch the titles of issues from,
+		e.g. that of a :class:`~.StubGitHubServer`. If :py:obj:`None` the build is run offline.
+
+	:returns: The documentation source directory.
+	"""
+
+	directory = PathPlus(directory)
+	package_dir = directory / "src" / PACKAGE_NAME
+	package_dir.maybe_make(parents=True)
+	(package_dir / "__init__.py").write_clean('"""\nA synthetic package.\n"""')
+
+	for index in range(spec.modules):
+		(package_dir / f"module_{index}.py").write_clean(make_module(index, spec))
+
+	srcdir = directory / "doc-source"
+	(srcdir / "api").maybe_make(parents=True)
+	(srcdir / "usage").maybe_make(parents=True)
+
+	conf = StringList([
+			"# stdlib",
+			"import os",
+			"import sys",
+			'',
+			"sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))",
+			'',
+			"project = 'Synthetic'",
+			"extensions = [",
+			"\t\t'sphinx_toolbox',",
+			"\t\t'sphinx_toolbox.more_autodoc',",
+			"\t\t'sphinx_toolbox.more_autosummary',",
+			"\t\t]",
+			"github_username = 'sphinx-toolbox'",
+			"github_repository = 'synthetic'",
+			"github_issue_title_store = 'issue_titles.sqlite'",
+			])
+
+	if api_url is None:
+		conf.append("toolbox_offline = True")
+	else:
+		conf.append("github_issue_title_backend = 'rest'")
+		conf.append(f"github_api_url = {api_url!r}")
+		conf.append("github_issue_title_rate_limit = 0")
+
+	(srcdir / "conf.py").write_clean(str(conf))
+
+	modules = [f"{PACKAGE_NAME}.module_{index}" for index in range(spec.modules)]
+
+	api_index = StringList(["API Reference", "=============", '', f".. automodule:: {PACKAGE_NAME}", ''])
+	api_index.append(".. autosummary::")
+	api_index.blankline(ensure_single=True)
+	api_index.extend(f"\t{module}" for module in modules)
+	(srcdir / "api" / "index.rst").write_clean(str(api_index))
+
+	for module in modules:
+		(srcdir / "api" / f"{module}.rst").write_lines([
+				f":mod:`{module}`",
+				'=' * len(f":mod:`{module}`"),
+				'',
+				f".. automodule:: {module}",
+				"\t:members:",
+				"\t:undoc-members:",
+				"\t:show-inheritance:",
+				])
+
+	for index in range(spec.pages):
+		(srcdir / "usage" / f"page_{index}.rst").write_clean(make_usage_page(index, spec))
+
+	index_page = StringList(["Synthetic", "=========", '', ".. toctree::", ''])
+	index_page.append("\tapi/index")
+	index_page.extend(f"\tapi/{module}" for module in modules)
+	index_page.extend(f"\tusage/page_{index}" for index in range(spec.pages))
+	(srcdir / "index.rst").write_clean(str(index_page))
+
+	return srcdir
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+#
+#  server.py
+"""
+A local HTTP server which imitates the GitHub REST API, so issue titles can be fetched offline.
+"""
+
+# stdlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+__all__ = ["StubGitHubServer"]
+
+_issue_path = re.compile(r"^/repos/([^/]+)/([^/]+)/issues/(\d+)/?$")
+
+
+class _Handler(BaseHTTPRequestHandler):
+	server: "_Server"
+
+	def do_GET(self) -> None:  # noqa: D102
+		if self.server.latency:
+			time.sleep(self.server.latency)
+
+		with self.server.lock:
+			self.server.requests += 1
+
+		match = _issue_path.match(self.path)
+		if match is None:
+			self.send_error(404)
+			return
+
+		number = int(match.group(3))
+		body = json.dumps({
+				"number": number,
+				"title": f"Synthetic issue {number}",
+				"state": "closed" if number % 3 else "open",
+				}).encode("UTF-8")
+
+		self.send_response(200)
+		self.send_header("Content-Type", "application/json; charset=utf-8")
+		self.send_header("Content-Length", str(len(body)))
+		# Keep the responses out of the sphinx-toolbox HTTP cache.
+		self.send_header("Cache-Control", "no-store")
+		self.end_headers()
+		self.wfile.write(body)
+
+	def log_message(self, format: str, *args) -> None:  # noqa: A002  # pylint: disable=redefined-builtin
+		pass
+
+
+class _Server(ThreadingHTTPServer):
+	daemon_threads = True
+	latency: float = 0
+	requests: int = 0
+	lock: threading.Lock
+
+
+class StubGitHubServer:
+	"""
+	Serves ``/repos/<owner>/<name>/issues/<number>`` on a free port on the loopback interface.
+
+	Use as a context manager, which starts the server in a background thread on entry
+	and shuts it down on exit.
+
+	:param latency: The time, in seconds, to wait before responding to each request,
+		to simulate the round trip to GitHub.
+	"""
+
+	def __init__(self, latency: float = 0):
+		self.latency = latency
+		self._server: Optional[_Server] = None
+		self._thread: Optional[threading.Thread] = None
+
+	@property
+	def api_url(self) -> str:
+		"""
+		The base URL of the API, for :confval:`github_api_url`.
+		"""
+
+		if self._server is None:
+			raise RuntimeError("The server is not running.")
+
+		host, port = self._server.server_address[:2]
+		return f"http://{host}:{port}"
+
+	@property
+	def requests(self) -> int:
+		"""
+		The number of requests served so far.
+		"""
+
+		return 0 if self._server is None else self._server.requests
+
+	def __enter__(self) -> "StubGitHubServer":
+		self._server = _Server(("127.0.0.1", 0), _Handler)
+		self._server.latency = self.latency
+		self._server.lock = threading.Lock()
+		self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+		self._thread.start()
+		return self
+
+	def __exit__(self, *args) -> None:
+		assert self._server is not None and self._thread is not None
+		self._server.shutdown()
+		self._server.server_close()
+		self._thread.join()
@@ -27,32 +27,22 @@ Box of handy tools for Sphinx.
 #
 
 # stdlib
+import importlib
 import sys
+import types
+from typing import TYPE_CHECKING, Any, List
 
 # This all has to be up here so it's triggered first.
 if sys.version_info >= (3, 10):
-	# stdlib
-	import types
 	types.Union = types.UnionType
 
-# 3rd party
-from sphinx.application import Sphinx
-
-# this package
-from sphinx_toolbox import (  # noqa: F401
-		assets,
-		code,
-		config,
-		confval,
-		installation,
-		issues,
-		rest_example,
-		shields,
-		source,
-		utils,
-		wikipedia
-		)
-from sphinx_toolbox.cache import cache  # noqa: F401
+if TYPE_CHECKING:
+	# 3rd party
+	from apeye.rate_limiter import HTTPCache
+	from sphinx.application import Sphinx
+
+	# this package
+	from sphinx_toolbox.utils import SphinxExtMetadata
 
 __author__: str = "Dominic Davis-Foster"
 __copyright__: str = "2020 Dominic Davis-Foster"
@@ -62,8 +52,54 @@ __email__: str = "dominic@davis-foster.co.uk"
 
 __all__ = ["setup"]
 
+# Submodules which were historically imported with the package, and are now imported on first access.
+_lazy_submodules = frozenset({
+		"assets",
+		"code",
+		"config",
+		"confval",
+		"installation",
+		"issues",
+		"rest_example",
+		"shields",
+		"source",
+		"utils",
+		"wikipedia",
+		})
+
+
+class _PackageModule(types.ModuleType):
+	# Implements lazy attribute access without relying on module-level ``__getattr__`` (PEP 562),
+	# which requires Python 3.7.
+
+	@property
+	def cache(self) -> "HTTPCache":
+		"""
+		For backwards compatibility this is the HTTP cache itself, rather than the :mod:`sphinx_toolbox.cache` module.
+		"""
+
+		return importlib.import_module(f"{__name__}.cache").cache  # type: ignore[attr-defined]
+
+	@cache.setter
+	def cache(self, value: Any) -> None:
+		# The import system sets the ``sphinx_toolbox.cache`` submodule as an attribute of the package
+		# when it is first imported. Ignore it so this attribute remains the HTTP cache.
+		pass
+
+	def __getattr__(self, name: str) -> Any:
+		if name in _lazy_submodules:
+			return importlib.import_module(f"{__name__}.{name}")
 
-def setup(app: Sphinx) -> "utils.SphinxExtMetadata":
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+	def __dir__(self) -> List[str]:
+		return sorted({*super().__dir__(), *_lazy_submodules, "cache"})
+
+
+sys.modules[__name__].__class__ = _PackageModule
+
+
+def setup(app: "Sphinx") -> "SphinxExtMetadata":
 	"""
 	Setup :mod:`sphinx_toolbox`.
 
@@ -74,7 +110,10 @@ def setup(app: Sphinx) -> "utils.SphinxExtMetadata":
 	app.setup_extension("sphinx.ext.viewcode")
 	app.setup_extension("sphinx_toolbox.github")
 
-	app.connect("config-inited", config.validate_config, priority=850)
+	# this package
+	from sphinx_toolbox.config import validate_config
+
+	app.connect("config-inited", validate_config, priority=850)
 
 	# Setup standalone extensions
 	app.setup_extension("sphinx_toolbox.assets")
@@ -102,4 +141,5 @@ def setup(app: Sphinx) -> "utils.SphinxExtMetadata":
 	return {
 			"version": __version__,
 			"parallel_read_safe": True,
+			"parallel_write_safe": True,
 			}
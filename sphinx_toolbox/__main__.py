@@ -27,25 +27,327 @@ CLI entry point for sphinx-toolbox.
 #
 
 # stdlib
+import argparse
+import json
+import os
+import pickle
 import sys
+from datetime import datetime, timedelta
+from typing import List, Optional
 
 # this package
-from sphinx_toolbox import cache
+from sphinx_toolbox.cache import CACHE_BACKENDS, DEFAULT_CACHE_MAX_SIZE, configure_cache, get_cache_backend
 
-__all__ = ["clear_cache"]
+__all__ = [
+		"clear_cache",
+		"cache_stats",
+		"vacuum_cache",
+		"inspect_titles",
+		"prune_titles",
+		"export_titles",
+		"snapshot_titles",
+		"main",
+		]
 
 
-def clear_cache():
+def clear_cache(backend: str = "filesystem", cache_dir: Optional[str] = None) -> int:
 	"""
 	Clear any cached URLs.
+
+	.. versionchanged:: 2.19.0  Added the ``backend`` and ``cache_dir`` arguments.
+
+	:param backend: The name of the cache backend. One of :data:`~.CACHE_BACKENDS`.
+	:param cache_dir: The cache directory. Defaults to that used by :func:`~.configure_cache`.
+	"""
+
+	configure_cache(backend, cache_dir)
+	get_cache_backend().clear()
+
+	print("Cache cleared successfully.")
+	return 0
+
+
+def cache_stats(backend: str = "filesystem", cache_dir: Optional[str] = None) -> int:
+	"""
+	Print the size of the HTTP cache, and the hits, misses and bytes transferred by all builds which have used it.
+
+	.. versionadded:: 2.19.0
+
+	:param backend: The name of the cache backend. One of :data:`~.CACHE_BACKENDS`.
+	:param cache_dir: The cache directory. Defaults to that used by :func:`~.configure_cache`.
+	"""
+
+	configure_cache(backend, cache_dir)
+	cache_backend = get_cache_backend()
+	stats = cache_backend.total_stats()
+
+	print(f"Backend:       {cache_backend.name} ({cache_backend.location})")
+	print(f"Responses:     {len(cache_backend)}")
+	print(f"Size:          {cache_backend.size()} bytes")
+	print(f"Hits:          {stats.hits}")
+	print(f"Misses:        {stats.misses}")
+	print(f"Hit rate:      {stats.hit_rate:.1%}")
+	print(f"Bytes read:    {stats.bytes_read}")
+	print(f"Bytes written: {stats.bytes_written}")
+	print(f"Evictions:     {stats.evictions}")
+
+	return 0
+
+
+def vacuum_cache(
+		backend: str = "filesystem",
+		cache_dir: Optional[str] = None,
+		max_size: int = DEFAULT_CACHE_MAX_SIZE,
+		) -> int:
+	"""
+	Remove expired responses from the HTTP cache, and shrink it to no more than ``max_size`` bytes.
+
+	.. versionadded:: 2.19.0
+
+	:param backend: The name of the cache backend. One of :data:`~.CACHE_BACKENDS`.
+	:param cache_dir: The cache directory. Defaults to that used by :func:`~.configure_cache`.
+	:param max_size: The maximum total size of the stored responses, in bytes.
+	"""
+
+	configure_cache(backend, cache_dir, max_size)
+	cache_backend = get_cache_backend()
+	removed = cache_backend.vacuum()
+
+	print(f"Removed {removed} responses. The cache now uses {cache_backend.size()} bytes.")
+	return 0
+
+
+def inspect_titles(store: Optional[str] = None, repo: Optional[str] = None) -> int:
+	"""
+	Print the issue and pull request titles in the :class:`~.IssueTitleStore`.
+
+	.. versionadded:: 2.19.0
+
+	:param store: The filename of the store. Defaults to :func:`~.default_store_path`.
+	:param repo: If given, only show titles for this repository.
 	"""
 
-	if cache.clear():
-		print("Cache cleared successfully.")
-		return 0
+	# this package
+	from sphinx_toolbox.github.title_store import IssueTitleStore
+
+	with IssueTitleStore(store) as title_store:
+		count = 0
+
+		for entry in title_store.entries(repo):
+			fetched = datetime.fromtimestamp(entry.fetched).isoformat(' ', "seconds")
+			print(f"{entry.repo}#{entry.number}\t{entry.state or '?'}\t{fetched}\t{entry.title}")
+			count += 1
+
+		print(f"{count} titles in {title_store.path.as_posix()}")
+
+	return 0
+
+
+def prune_titles(store: Optional[str] = None, repo: Optional[str] = None, ttl: float = 4) -> int:
+	"""
+	Remove expired titles from the :class:`~.IssueTitleStore`.
+
+	.. versionadded:: 2.19.0
+
+	:param store: The filename of the store. Defaults to :func:`~.default_store_path`.
+	:param repo: If given, only remove titles for this repository.
+	:param ttl: The number of hours after which the titles of open issues and pull requests expire.
+	"""
+
+	# this package
+	from sphinx_toolbox.github.title_store import IssueTitleStore
+
+	with IssueTitleStore(store) as title_store:
+		removed = title_store.prune(timedelta(hours=ttl), repo)
+
+	print(f"Removed {removed} expired titles.")
+	return 0
+
+
+def export_titles(store: Optional[str] = None, repo: Optional[str] = None, output: Optional[str] = None) -> int:
+	"""
+	Export the titles in the :class:`~.IssueTitleStore` as JSON.
+
+	.. versionadded:: 2.19.0
+
+	:param store: The filename of the store. Defaults to :func:`~.default_store_path`.
+	:param repo: If given, only export titles for this repository.
+	:param output: The file to write the JSON to. Defaults to standard output.
+	"""
+
+	# this package
+	from sphinx_toolbox.github.title_store import IssueTitleStore, write_snapshot
+
+	with IssueTitleStore(store) as title_store:
+		entries = list(title_store.entries(repo))
+
+	if output is None:
+		json.dump([entry._asdict() for entry in entries], sys.stdout, indent=2)
+		print()
+	else:
+		write_snapshot(output, entries)
+
+	return 0
+
+
+def snapshot_titles(
+		doctreedir: str,
+		output: str,
+		store: Optional[str] = None,
+		backend: str = "html",
+		ttl: float = 4,
+		api_url: str = "https://api.github.com",
+		) -> int:
+	"""
+	Write a snapshot of the titles of all issues and pull requests referenced in a Sphinx project,
+	for use with :confval:`toolbox_offline_snapshot`.
+
+	Titles which are not in the :class:`~.IssueTitleStore` are fetched.
+
+	.. versionadded:: 2.19.0
+
+	:param doctreedir: The directory containing the project's pickled build environment, e.g. ``_build/doctrees``.
+	:param output: The file to write the snapshot to.
+	:param store: The filename of the store. Defaults to :func:`~.default_store_path`.
+	:param backend: The name of the backend used to fetch titles. One of :data:`~.issue_title_backends`.
+		The ``rest`` and ``graphql`` backends authenticate with the token in the ``GITHUB_TOKEN`` environment variable.
+	:param ttl: The number of hours after which the titles of open issues and pull requests expire.
+	:param api_url: The base URL of the GitHub API, used by the ``rest`` and ``graphql`` backends.
+
+	:raises ValueError: If the backend is unknown.
+	"""  # noqa: D400
+
+	# this package
+	from sphinx_toolbox.github.issues import _resolve_issues
+	from sphinx_toolbox.github.title_backends import issue_title_backends
+	from sphinx_toolbox.github.title_store import IssueTitleStore, issue_key, write_snapshot
+
+	if backend not in issue_title_backends:
+		raise ValueError(f"Unknown issue title backend {backend!r}.")
+
+	title_backend = issue_title_backends[backend](api_url=api_url)
+
+	with open(os.path.join(doctreedir, "environment.pickle"), "rb") as fp:
+		env = pickle.load(fp)
+
+	issue_urls = set().union(*getattr(env, "github_issue_urls", {}).values())
+
+	with IssueTitleStore(store) as title_store:
+		issues = _resolve_issues(issue_urls, title_store, title_backend, timedelta(hours=ttl))
+		entries = [title_store.get(issue_url) for issue_url in issue_urls if issues[issue_url] is not None]
+
+	write_snapshot(output, filter(None, entries))
+
+	missing = sorted({"{}#{}".format(*issue_key(url)) for url, issue in issues.items() if issue is None})
+	print(f"Wrote {len(issue_urls) - len(missing)} of {len(issue_urls)} titles to {output}.")
+	if missing:
+		print(f"Titles could not be found for: {', '.join(missing)}")
+
+	return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+	"""
+	CLI entry point.
+
+	With no arguments the HTTP cache is cleared.
+
+	.. versionadded:: 2.19.0
+
+	:param argv: The command line arguments. Defaults to :py:data:`sys.argv`.
+	"""
+
+	# this package
+	from sphinx_toolbox.github.title_backends import issue_title_backends
+
+	parser = argparse.ArgumentParser(prog="python3 -m sphinx_toolbox")
+	subparsers = parser.add_subparsers(dest="command")
+
+	for command, help_text in [
+			("clear", "Clear any cached URLs."),
+			("stats", "Show the size of the HTTP cache, and its hits and misses."),
+			("vacuum", "Remove expired responses from the HTTP cache, and shrink it to its maximum size."),
+			]:
+		subparser = subparsers.add_parser(command, help=help_text)
+		subparser.add_argument(
+				"--backend",
+				choices=CACHE_BACKENDS,
+				default="filesystem",
+				help="The cache backend to use.",
+				)
+		subparser.add_argument("--cache-dir", help="The cache directory to use.")
+
+		if command == "vacuum":
+			subparser.add_argument(
+					"--max-size",
+					type=int,
+					default=DEFAULT_CACHE_MAX_SIZE,
+					help="The maximum size of the cache, in bytes.",
+					)
+
+	for command, help_text in [
+			("inspect", "List the stored issue and pull request titles."),
+			("prune", "Remove expired issue and pull request titles."),
+			("export", "Export the stored issue and pull request titles as JSON."),
+			]:
+		subparser = subparsers.add_parser(command, help=help_text)
+		subparser.add_argument("repo", nargs='?', help="Only consider titles for this repository (owner/name).")
+		subparser.add_argument("--store", help="The issue title store to use.")
+
+		if command == "prune":
+			subparser.add_argument(
+					"--ttl",
+					type=float,
+					default=4,
+					help="The number of hours after which titles of open issues expire.",
+					)
+		elif command == "export":
+			subparser.add_argument("-o", "--output", help="The file to write the JSON to.")
+
+	snapshot_parser = subparsers.add_parser(
+			"snapshot",
+			help="Write a snapshot of the issue and pull request titles referenced in a project, for offline builds.",
+			)
+	snapshot_parser.add_argument("doctreedir", help="The project's doctree directory, e.g. _build/doctrees.")
+	snapshot_parser.add_argument("-o", "--output", required=True, help="The file to write the snapshot to.")
+	snapshot_parser.add_argument("--store", help="The issue title store to use.")
+	snapshot_parser.add_argument(
+			"--backend",
+			choices=sorted(issue_title_backends),
+			default="html",
+			help="The backend used to fetch titles. The API backends use the token in $GITHUB_TOKEN.",
+			)
+	snapshot_parser.add_argument(
+			"--api-url",
+			default="https://api.github.com",
+			help="The base URL of the GitHub API, for the rest and graphql backends.",
+			)
+	snapshot_parser.add_argument(
+			"--ttl",
+			type=float,
+			default=4,
+			help="The number of hours after which titles of open issues expire.",
+			)
+
+	args = parser.parse_args(argv)
+
+	if args.command == "clear":
+		return clear_cache(args.backend, args.cache_dir)
+	elif args.command == "stats":
+		return cache_stats(args.backend, args.cache_dir)
+	elif args.command == "vacuum":
+		return vacuum_cache(args.backend, args.cache_dir, args.max_size)
+	elif args.command == "inspect":
+		return inspect_titles(args.store, args.repo)
+	elif args.command == "prune":
+		return prune_titles(args.store, args.repo, args.ttl)
+	elif args.command == "export":
+		return export_titles(args.store, args.repo, args.output)
+	elif args.command == "snapshot":
+		return snapshot_titles(args.doctreedir, args.output, args.store, args.backend, args.ttl, args.api_url)
 	else:
-		return 1
+		return clear_cache()
 
 
 if __name__ == "__main__":
-	sys.exit(clear_cache())
+	sys.exit(main())
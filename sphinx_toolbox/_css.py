@@ -5,6 +5,32 @@
 Internal Sphinx extension to provide custom CSS.
 
 .. versionadded:: 2.7.0
+
+.. versionchanged:: 2.19.0
+
+	Extensions register their stylesheets with :func:`~.add_stylesheet`.
+	Each stylesheet is serialized once per build and only written if its content has changed.
+
+Configuration
+--------------
+
+.. confval:: toolbox_css_fingerprint
+	:type: :class:`bool`
+	:default: :py:obj:`False`
+
+	Include a hash of the content in the filenames of stylesheets, e.g. ``sphinx-toolbox.3f2a9c81d0.css``,
+	so they can be served with long-lived caching headers.
+
+	.. versionadded:: 2.19.0
+
+.. confval:: toolbox_css_bundle
+	:type: :class:`bool`
+	:default: :py:obj:`False`
+
+	Merge all stylesheets into a single minified file, ``css/sphinx-toolbox-bundle.css``,
+	to reduce the number of requests per page.
+
+	.. versionadded:: 2.19.0
 """
 #
 #  Copyright © 2020-2021 Dominic Davis-Foster <dominic@davis-foster.co.uk>
@@ -29,17 +55,34 @@ Internal Sphinx extension to provide custom CSS.
 #
 
 # stdlib
-from typing import MutableMapping, Optional
+import hashlib
+import posixpath
+import re
+from typing import Dict, List, Mapping, MutableMapping, NamedTuple, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 # 3rd party
 import dict2css
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.stringlist import StringList
+from domdf_python_tools.typing import PathLike
 from sphinx.application import Sphinx
+from sphinx.config import Config
 
 # this package
 from sphinx_toolbox.utils import SphinxExtMetadata, metadata_add_version
 
-__all__ = ["copy_asset_files", "setup"]
+__all__ = [
+		"Stylesheet",
+		"add_stylesheet",
+		"get_stylesheets",
+		"write_if_changed",
+		"write_stylesheet",
+		"register_stylesheets",
+		"write_stylesheets",
+		"copy_asset_files",
+		"setup",
+		]
 
 installation_styles: MutableMapping[str, dict2css.Style] = {
 		'div[id*="installation"] .sphinx-tabs-tab': {"color": "#2980b9"},
@@ -76,6 +119,252 @@ tweaks_sphinx_panels_tabs_styles: MutableMapping[str, dict2css.Style] = {
 		}
 
 
+code_styles: MutableMapping[str, dict2css.Style] = {
+		"div.code-cell.container div.prompt": {"color": "#307FC1"},
+		"div.output-cell.container div.prompt": {"color": "#BF5B3D"},
+		"div.code-cell.container div.prompt, div.output-cell.container div.prompt": {
+				"user-select": None,
+				"font-size": "13px",
+				"font-family": '"SFMono-Regular", Menlo, Consolas, Monaco, Liberation Mono, Lucida Console, monospace',
+				"border": None,
+				"padding": "11px 0 0",
+				"margin": "0 5px 0 0",
+				"box-shadow": None,
+				"wrap-option": None,
+				"white-space": "nowrap",
+				},
+		"div.code-cell.container, div.output-cell.container": {
+				"padding-top": "5px",
+				"display": "flex",
+				"align-items": "stretch",
+				"margin": 0,
+				},
+		"div.code-cell.container div.code-cell-code, div.output-cell.container div.output-cell-code": {
+				"width": "100%",
+				"padding-top": 0,
+				"margin-top": 0,
+				},
+		}
+
+toolbox_styles: MutableMapping[str, dict2css.Style] = {
+		"p.source-link": {"margin-bottom": 0},
+		"p.source-link + hr.docutils": {"margin-top": "10px"},
+		", ".join([
+				"p.sphinx-toolbox-extensions",
+				"div.sphinx-toolbox-extensions.highlight-python",
+				"div.sphinx-toolbox-extensions.highlight-python div.highlight",
+				]): {"margin-bottom": "10px"},
+		"div.rest-example.docutils.container": {
+				"padding-left": "5px",
+				"border-style": "dotted",
+				"border-width": "1px",
+				"border-color": "darkgray",
+				},
+		**installation_styles,
+		**shields_styles,
+		**regex_styles,
+		}
+
+#: The filename of the stylesheet written when :confval:`toolbox_css_bundle` is enabled.
+_bundle_filename = "css/sphinx-toolbox-bundle.css"
+
+_fingerprint_length = 10
+
+
+class Stylesheet(NamedTuple):
+	"""
+	A stylesheet registered with :func:`~.add_stylesheet`.
+
+	.. versionadded:: 2.19.0
+	"""
+
+	#: The filename of the stylesheet, relative to the ``_static`` directory.
+	filename: str
+
+	#: The styles to write to the stylesheet.
+	styles: Mapping[str, dict2css.Style]
+
+	#: Whether the stylesheet should be minified.
+	minify: bool = False
+
+
+class _StylesheetRegistry:
+
+	def __init__(self):
+		self.stylesheets: Dict[str, Stylesheet] = {}
+
+		# The filenames and content of the files to write, set on config-inited.
+		self.outputs: List[Tuple[str, str]] = []
+
+
+_registries: "WeakKeyDictionary[Sphinx, _StylesheetRegistry]" = WeakKeyDictionary()
+
+
+def _get_registry(app: Sphinx) -> _StylesheetRegistry:
+	if app not in _registries:
+		_registries[app] = _StylesheetRegistry()
+
+	return _registries[app]
+
+
+def add_stylesheet(
+		app: Sphinx,
+		filename: str,
+		styles: Mapping[str, dict2css.Style],
+		minify: bool = False,
+		) -> None:
+	"""
+	Register a stylesheet to be written to the HTML output and included in every page.
+
+	The extension calling this function must also set up :mod:`sphinx_toolbox._css`.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	:param filename: The filename of the stylesheet, relative to the ``_static`` directory.
+	:param styles: The styles to write to the stylesheet.
+	:param minify: Whether the stylesheet should be minified.
+	"""
+
+	_get_registry(app).stylesheets[filename] = Stylesheet(filename, styles, minify)
+
+
+def get_stylesheets(app: Sphinx) -> List[Stylesheet]:
+	"""
+	Returns the stylesheets registered for the given Sphinx application, in the order they were registered.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	"""
+
+	return list(_get_registry(app).stylesheets.values())
+
+
+def _serialize(styles: Mapping[str, dict2css.Style], minify: bool = False) -> str:
+	# Formatted as by dict2css.dump and PathPlus.write_clean
+	buffer = StringList(dict2css.dumps(styles, minify=minify))
+	buffer.blankline(ensure_single=True)
+	return str(buffer)
+
+
+def _fingerprint(filename: str, content: str) -> str:
+	stem, suffix = posixpath.splitext(filename)
+	digest = hashlib.sha256(content.encode("UTF-8")).hexdigest()[:_fingerprint_length]
+	return f"{stem}.{digest}{suffix}"
+
+
+def write_if_changed(filename: PathLike, content: str) -> bool:
+	"""
+	Write ``content`` to ``filename``, unless the file already has that content.
+
+	Leaving unchanged files alone preserves their modification times, and so any caches of them.
+
+	.. versionadded:: 2.19.0
+
+	:param filename:
+	:param content:
+
+	:returns: Whether the file was written.
+	"""
+
+	filename = PathPlus(filename)
+
+	if filename.is_file() and filename.read_text() == content:
+		return False
+
+	filename.parent.maybe_make(parents=True)
+	filename.write_text(content)
+	return True
+
+
+def write_stylesheet(filename: PathLike, styles: Mapping[str, dict2css.Style], minify: bool = False) -> bool:
+	"""
+	Serialize ``styles`` and write them to ``filename``, unless the file already has that content.
+
+	.. versionadded:: 2.19.0
+
+	:param filename:
+	:param styles:
+	:param minify: Whether the stylesheet should be minified.
+
+	:returns: Whether the file was written.
+	"""
+
+	return write_if_changed(filename, _serialize(styles, minify=minify))
+
+
+def register_stylesheets(app: Sphinx, config: Config) -> None:
+	"""
+	Serialize the stylesheets registered with :func:`~.add_stylesheet` and add them to the HTML output.
+
+	This function is connected to the :event:`config-inited` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	:param config:
+	"""
+
+	registry = _get_registry(app)
+	stylesheets = list(registry.stylesheets.values())
+
+	if not stylesheets:
+		registry.outputs = []
+		return
+
+	if config.toolbox_css_bundle:
+		content = ''.join(_serialize(sheet.styles, minify=True) for sheet in stylesheets)
+		outputs = [(_bundle_filename, content)]
+	else:
+		outputs = [(sheet.filename, _serialize(sheet.styles, minify=sheet.minify)) for sheet in stylesheets]
+
+	if config.toolbox_css_fingerprint:
+		outputs = [(_fingerprint(filename, content), content) for filename, content in outputs]
+
+	registry.outputs = outputs
+
+	for filename, _ in outputs:
+		app.add_css_file(filename)
+
+
+def write_stylesheets(app: Sphinx, exception: Optional[Exception] = None) -> None:
+	"""
+	Write the stylesheets registered with :func:`~.add_stylesheet` into the HTML build directory,
+	skipping any which have not changed.
+
+	When :confval:`toolbox_css_fingerprint` is enabled, outdated fingerprinted copies are removed.
+
+	This function is connected to the :event:`build-finished` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	:param exception: Any exception which occurred and caused Sphinx to abort.
+	"""  # noqa: D400
+
+	if exception:  # pragma: no cover
+		return
+
+	if app.builder is None or app.builder.format.lower() != "html":  # pragma: no cover
+		return
+
+	static_dir = PathPlus(app.outdir) / "_static"
+
+	for filename, content in _get_registry(app).outputs:
+		output_file = static_dir / filename
+		write_if_changed(output_file, content)
+
+		if app.config.toolbox_css_fingerprint:
+			stem, suffix = posixpath.splitext(posixpath.basename(filename))
+			stem = stem[:-_fingerprint_length - 1]
+			stale_re = re.compile(rf"{re.escape(stem)}\.[0-9a-f]{{{_fingerprint_length}}}{re.escape(suffix)}")
+
+			for sibling in output_file.parent.iterdir():
+				if sibling != output_file and stale_re.fullmatch(sibling.name):
+					sibling.unlink()
+
+
 def copy_asset_files(app: Sphinx, exception: Optional[Exception] = None):
 	"""
 	Copy additional stylesheets into the HTML build directory.
@@ -90,32 +379,7 @@ def copy_asset_files(app: Sphinx, exception: Optional[Exception] = None):
 	if app.builder is None or app.builder.format.lower() != "html":  # pragma: no cover
 		return
 
-	extensions_selector = ", ".join([
-			"p.sphinx-toolbox-extensions",
-			"div.sphinx-toolbox-extensions.highlight-python",
-			"div.sphinx-toolbox-extensions.highlight-python div.highlight",
-			])
-
-	rest_example_style = {
-			"padding-left": "5px",
-			"border-style": "dotted",
-			"border-width": "1px",
-			"border-color": "darkgray",
-			}
-
-	style: MutableMapping[str, dict2css.Style] = {
-			"p.source-link": {"margin-bottom": 0},
-			"p.source-link + hr.docutils": {"margin-top": "10px"},
-			extensions_selector: {"margin-bottom": "10px"},
-			"div.rest-example.docutils.container": rest_example_style,
-			**installation_styles,
-			**shields_styles,
-			**regex_styles,
-			}
-
-	css_static_dir = PathPlus(app.outdir) / "_static" / "css"
-	css_static_dir.maybe_make(parents=True)
-	dict2css.dump(style, css_static_dir / "sphinx-toolbox.css")
+	write_stylesheet(PathPlus(app.outdir) / "_static" / "css" / "sphinx-toolbox.css", toolbox_styles)
 
 
 @metadata_add_version
@@ -126,7 +390,12 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	:param app: The Sphinx application.
 	"""
 
-	app.add_css_file("css/sphinx-toolbox.css")
-	app.connect("build-finished", copy_asset_files)
+	app.add_config_value("toolbox_css_fingerprint", False, "html", types=[bool])
+	app.add_config_value("toolbox_css_bundle", False, "html", types=[bool])
+
+	add_stylesheet(app, "css/sphinx-toolbox.css", toolbox_styles)
+
+	app.connect("config-inited", register_stylesheets, priority=510)
+	app.connect("build-finished", write_stylesheets)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -53,6 +53,32 @@ Configuration
 
 	The directory in which to find assets for the :rst:role:`asset` role.
 
+.. confval:: assets_copy_mode
+	:type: :class:`str`
+	:required: False
+	:default: ``'copy'``
+
+	How asset files are placed in the output directory. One of:
+
+	* ``'copy'`` -- copy the file.
+	* ``'hardlink'`` -- create a hard link to the file, which takes no additional space.
+	  Falls back to copying if the output directory is on a different filesystem.
+	* ``'reflink'`` -- create a copy-on-write clone of the file, on filesystems which support it (Linux only).
+	  Falls back to copying otherwise.
+
+	.. versionadded:: 2.19.0
+
+.. confval:: assets_compare
+	:type: :class:`str`
+	:required: False
+	:default: ``'mtime'``
+
+	How to determine whether an asset file already in the output directory is up to date, in which case it is not copied again.
+	Either ``'mtime'``, which compares the size and modification time of the files,
+	or ``'hash'``, which compares their contents.
+
+	.. versionadded:: 2.19.0
+
 
 API Reference
 ---------------
@@ -81,10 +107,14 @@ API Reference
 #
 
 # stdlib
+import hashlib
+import os
 import pathlib
 import posixpath
 import shutil
-from typing import Dict, List, Sequence, Tuple
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 # 3rd party
 from docutils import nodes
@@ -93,7 +123,9 @@ from docutils.parsers.rst.states import Inliner
 from domdf_python_tools.paths import PathPlus
 from domdf_python_tools.utils import stderr_writer
 from sphinx.application import Sphinx
-from sphinx.util import split_explicit_title
+from sphinx.builders import Builder
+from sphinx.environment import BuildEnvironment
+from sphinx.util import logging, split_explicit_title
 from sphinx.writers.html import HTMLTranslator
 
 __all__ = [
@@ -101,12 +133,25 @@ __all__ = [
 		"AssetNode",
 		"visit_asset_node",
 		"depart_asset_node",
+		"AssetCopier",
+		"copy_asset",
+		"setup_asset_copier",
+		"join_asset_copier",
+		"collect_asset_files",
+		"purge_asset_files",
+		"merge_asset_files",
+		"schedule_asset_copies",
 		"setup",
 		]
 
 # this package
 from sphinx_toolbox.utils import SphinxExtMetadata, metadata_add_version
 
+logger = logging.getLogger(__name__)
+
+# The FICLONE ioctl request number on Linux.
+_FICLONE = 0x40049409
+
 
 class AssetNode(nodes.reference):
 	"""
@@ -157,35 +202,235 @@ def asset_role(
 	return [node], []
 
 
+def _file_hash(filename: str) -> bytes:
+	sha256 = hashlib.sha256()
+
+	with open(filename, "rb") as fp:
+		for chunk in iter(lambda: fp.read(2**20), b''):
+			sha256.update(chunk)
+
+	return sha256.digest()
+
+
+def _is_up_to_date(source: str, destination: str, compare: str) -> bool:
+	"""
+	Returns whether ``destination`` is an up-to-date copy of ``source``.
+
+	:param source:
+	:param destination:
+	:param compare: Either ``'mtime'`` or ``'hash'``.
+	"""
+
+	try:
+		dest_stat = os.stat(destination)
+	except FileNotFoundError:
+		return False
+
+	source_stat = os.stat(source)
+
+	if os.path.samestat(source_stat, dest_stat):
+		# Hard link to the source file
+		return True
+
+	if source_stat.st_size != dest_stat.st_size:
+		return False
+
+	if compare == "hash":
+		return _file_hash(source) == _file_hash(destination)
+
+	return source_stat.st_mtime_ns == dest_stat.st_mtime_ns
+
+
+def _reflink(source: str, destination: str) -> None:
+	# stdlib
+	import fcntl
+
+	with open(source, "rb") as src, open(destination, "wb") as dst:
+		fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+
+	shutil.copystat(source, destination)
+
+
+def copy_asset(source: str, destination: str, mode: str = "copy", compare: str = "mtime") -> bool:
+	"""
+	Copy an asset file to the output directory, unless an up-to-date copy is already there.
+
+	.. versionadded:: 2.19.0
+
+	:param source:
+	:param destination: The filename to copy the file to.
+	:param mode: One of ``'copy'``, ``'hardlink'`` or ``'reflink'``. See :confval:`assets_copy_mode`.
+	:param compare: Either ``'mtime'`` or ``'hash'``. See :confval:`assets_compare`.
+
+	:returns: Whether the file was copied.
+	"""
+
+	if _is_up_to_date(source, destination, compare):
+		return False
+
+	# Remove any existing file first, so an old hard link to the source file is never written through.
+	if os.path.lexists(destination):
+		os.unlink(destination)
+
+	if mode == "hardlink":
+		try:
+			os.link(source, destination)
+			return True
+		except OSError:
+			pass
+	elif mode == "reflink":
+		try:
+			_reflink(source, destination)
+			return True
+		except (ImportError, OSError):
+			if os.path.lexists(destination):
+				os.unlink(destination)
+
+	shutil.copy2(source, destination)
+	return True
+
+
+class AssetCopier:
+	"""
+	Copies the files linked to by :rst:role:`asset` roles to the output directory in a pool of background threads.
+
+	Each file is only copied once per build, and not at all if an up-to-date copy is already present.
+
+	.. versionadded:: 2.19.0
+
+	:param mode: One of ``'copy'``, ``'hardlink'`` or ``'reflink'``. See :confval:`assets_copy_mode`.
+	:param compare: Either ``'mtime'`` or ``'hash'``. See :confval:`assets_compare`.
+	:param max_workers: The maximum number of files to copy at once.
+	"""
+
+	def __init__(self, mode: str = "copy", compare: str = "mtime", max_workers: int = 4):
+		if mode not in {"copy", "hardlink", "reflink"}:
+			raise ValueError(f"Unknown asset copy mode {mode!r}")
+		if compare not in {"mtime", "hash"}:
+			raise ValueError(f"Unknown asset comparison {compare!r}")
+
+		self.mode = mode
+		self.compare = compare
+		self.max_workers = max_workers
+
+		#: Mapping of source files to their destinations, for the files seen so far in this build.
+		self.seen: Dict[str, str] = {}
+
+		#: The source files which were copied.
+		self.copied: List[str] = []
+
+		#: The source files which were already up to date.
+		self.skipped: List[str] = []
+
+		self._futures: Dict[str, Future] = {}
+		self._executor: Optional[ThreadPoolExecutor] = None
+		self._lock = threading.Lock()
+		self._pid = os.getpid()
+
+	def __repr__(self) -> str:
+		return f"{self.__class__.__name__}(mode={self.mode!r}, compare={self.compare!r})"
+
+	def _copy(self, source: str, destination: str) -> None:
+		copied = copy_asset(source, destination, self.mode, self.compare)
+
+		with self._lock:
+			(self.copied if copied else self.skipped).append(source)
+
+	def submit(self, source: str, destination: str) -> None:
+		"""
+		Schedule ``source`` to be copied to ``destination``, if it has not been already.
+
+		In parallel writer processes the file is copied immediately,
+		although :func:`~.schedule_asset_copies` normally submits every file before the write phase begins.
+
+		:param source:
+		:param destination:
+		"""
+
+		if os.getpid() != self._pid:
+			# In a parallel writer process the lock may have been held by a background thread
+			# when the process was forked, and the copies would be lost if the process exits first.
+			if source not in self.seen:
+				self.seen[source] = destination
+				copy_asset(source, destination, self.mode, self.compare)
+			return
+
+		with self._lock:
+			if source in self.seen:
+				return
+			self.seen[source] = destination
+
+		if self._executor is None:
+			self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="asset-copy")
+
+		self._futures[source] = self._executor.submit(self._copy, source, destination)
+
+	def join(self) -> Dict[str, BaseException]:
+		"""
+		Wait for all scheduled copies to finish.
+
+		:returns: A mapping of source files to the exceptions raised while copying them.
+		"""
+
+		errors: Dict[str, BaseException] = {}
+
+		for source, future in self._futures.items():
+			exception = future.exception()
+			if exception is not None:
+				errors[source] = exception
+
+		self._futures.clear()
+
+		if self._executor is not None:
+			self._executor.shutdown()
+			self._executor = None
+
+		return errors
+
+
+def _get_asset_copier(builder: Builder) -> AssetCopier:
+	copier = getattr(builder, "asset_copier", None)
+
+	if copier is None:
+		copier = builder.asset_copier = AssetCopier(  # type: ignore[attr-defined]
+				mode=getattr(builder.config, "assets_copy_mode", "copy"),
+				compare=getattr(builder.config, "assets_compare", "mtime"),
+				)
+
+	return copier
+
+
 def visit_asset_node(translator: HTMLTranslator, node: AssetNode):
 	"""
 	Visit an :class:`~.AssetNode`.
 
+	.. versionchanged:: 2.19.0
+
+		Files are copied in the background by the builder's :class:`~.AssetCopier`,
+		and only if the copy in the output directory is out of date.
+		They are normally submitted by :func:`~.schedule_asset_copies` before the write phase begins.
+
 	:param translator:
 	:param node: The node being visited.
 	"""
 
-	if not hasattr(translator, "_asset_node_seen_files"):
-		# Files that have already been seen
-		translator._asset_node_seen_files = []  # type: ignore
-
-	assets_out_dir = PathPlus(translator.builder.outdir) / "_assets"
-	assets_out_dir.maybe_make(parents=True)
-
-	source_file = PathPlus(translator.builder.confdir) / node["source_file"]
+	source_file = os.path.join(translator.builder.confdir, node["source_file"])
 
-	if source_file not in translator._asset_node_seen_files and source_file.is_file():  # type: ignore
-		# Avoid unnecessary copies of potentially large files.
-		translator._asset_node_seen_files.append(source_file)  # type: ignore
-		shutil.copy2(source_file, assets_out_dir)
-	elif not source_file.is_file():
+	if not os.path.isfile(source_file):
 		stderr_writer(
 				f"\x1b[31m{translator.builder.current_docname}: "
-				f"Asset file '{source_file}' not found.\x1b[39m"
+				f"Asset file '{PathPlus(source_file)}' not found.\x1b[39m"
 				)
 		translator.context.append('')
 		return
 
+	copier = _get_asset_copier(translator.builder)
+
+	if source_file not in copier.seen:
+		assets_out_dir = os.path.join(translator.builder.outdir, "_assets")
+		os.makedirs(assets_out_dir, exist_ok=True)
+		copier.submit(source_file, os.path.join(assets_out_dir, os.path.basename(source_file)))
+
 	# Create the HTML
 	current_uri = (pathlib.PurePosixPath('/') / translator.builder.current_docname).parent
 	refuri = posixpath.relpath(f"/_assets/{node['refuri']}", str(current_uri))
@@ -204,6 +449,156 @@ def depart_asset_node(translator: HTMLTranslator, node: AssetNode):
 	translator.body.append(translator.context.pop())
 
 
+def setup_asset_copier(app: Sphinx) -> None:
+	"""
+	Create the :class:`~.AssetCopier` for the build.
+
+	This function is connected to the :event:`builder-inited` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	"""
+
+	app.builder.asset_copier = AssetCopier(  # type: ignore[attr-defined]
+			mode=app.config.assets_copy_mode,
+			compare=app.config.assets_compare,
+			)
+
+
+def join_asset_copier(app: Sphinx, exception: Optional[Exception] = None) -> None:
+	"""
+	Wait for asset files to finish copying, and report any which could not be copied.
+
+	This function is connected to the :event:`build-finished` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	:param exception: Any exception which occurred and caused Sphinx to abort.
+	"""
+
+	copier: Optional[AssetCopier] = getattr(app.builder, "asset_copier", None)
+
+	if copier is None:
+		return
+
+	for source, error in copier.join().items():
+		logger.warning("Could not copy asset file %r: %s", source, error)
+
+
+def collect_asset_files(app: Sphinx, doctree: nodes.document) -> None:
+	"""
+	Record the asset files linked to from a document, so they can be copied ahead of the write phase.
+
+	This function is connected to the :event:`doctree-read` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	:param doctree:
+	"""
+
+	env = app.env
+
+	if not hasattr(env, "toolbox_asset_files"):
+		env.toolbox_asset_files = {}  # type: ignore[attr-defined]
+
+	files = {os.fspath(node["source_file"]) for node in doctree.traverse(AssetNode)}
+
+	if files:
+		env.toolbox_asset_files[env.docname] = files  # type: ignore[attr-defined]
+
+
+def purge_asset_files(app: Sphinx, env: BuildEnvironment, docname: str) -> None:
+	"""
+	Forget the asset files recorded for the given document.
+
+	This function is connected to the :event:`env-purge-doc` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	:param env: The Sphinx build environment.
+	:param docname: The name of the document to remove asset files for.
+	"""
+
+	if hasattr(env, "toolbox_asset_files"):
+		env.toolbox_asset_files.pop(docname, None)  # type: ignore[attr-defined]
+
+
+def merge_asset_files(
+		app: Sphinx,
+		env: BuildEnvironment,
+		docnames: Set[str],
+		other: BuildEnvironment,
+		) -> None:
+	"""
+	Merge the asset files recorded by a parallel reader process into the main build environment.
+
+	This function is connected to the :event:`env-merge-info` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	:param env: The main Sphinx build environment.
+	:param docnames: The names of the documents read by the other process.
+	:param other: The build environment from the other process.
+	"""
+
+	if not hasattr(env, "toolbox_asset_files"):
+		env.toolbox_asset_files = {}  # type: ignore[attr-defined]
+
+	other_files = getattr(other, "toolbox_asset_files", {})
+
+	for docname in docnames:
+		if docname in other_files:
+			env.toolbox_asset_files[docname] = other_files[docname]  # type: ignore[attr-defined]
+
+
+def schedule_asset_copies(app: Sphinx, env: BuildEnvironment) -> None:
+	"""
+	Submit every asset file linked to from the project to the builder's :class:`~.AssetCopier`,
+	before the write phase begins.
+
+	The write phase may be split across several processes,
+	so doing this beforehand ensures each file is only copied once,
+	and that :func:`~.visit_asset_node` never needs to copy files.
+	Files which are already up to date in the output directory aren't copied again.
+
+	If Sphinx is running in parallel, this waits for the files to be copied,
+	so no background threads are running when the writer processes are forked.
+
+	This function is connected to the :event:`env-updated` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	:param env: The Sphinx build environment.
+	"""  # noqa: D400
+
+	if app.builder.format != "html":
+		return
+
+	all_files: Dict[str, Set[str]] = getattr(env, "toolbox_asset_files", {})
+	if not all_files:
+		return
+
+	copier = _get_asset_copier(app.builder)
+	assets_out_dir = os.path.join(app.builder.outdir, "_assets")
+
+	for source_file in sorted(set().union(*all_files.values())):
+		source_file = os.path.join(app.confdir, source_file)
+
+		if os.path.isfile(source_file):
+			os.makedirs(assets_out_dir, exist_ok=True)
+			copier.submit(source_file, os.path.join(assets_out_dir, os.path.basename(source_file)))
+
+	if app.parallel > 1:
+		for source, error in copier.join().items():
+			logger.warning("Could not copy asset file %r: %s", source, error)
+
+
 @metadata_add_version
 def setup(app: Sphinx) -> SphinxExtMetadata:
 	"""
@@ -216,6 +611,14 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	app.add_role("asset", asset_role)
 	app.add_config_value("assets_dir", "./assets", "env", [str])
+	app.add_config_value("assets_copy_mode", "copy", '', [str])
+	app.add_config_value("assets_compare", "mtime", '', [str])
+	app.connect("builder-inited", setup_asset_copier)
+	app.connect("doctree-read", collect_asset_files)
+	app.connect("env-purge-doc", purge_asset_files)
+	app.connect("env-merge-info", merge_asset_files)
+	app.connect("env-updated", schedule_asset_copies)
+	app.connect("build-finished", join_asset_copier)
 	app.add_node(AssetNode, html=(visit_asset_node, depart_asset_node))
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
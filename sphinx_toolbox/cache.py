@@ -27,12 +27,283 @@ Caching functions.
 #
 
 # stdlib
+import atexit
+import functools
+import os
+import sys
+import types
 from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
 # 3rd party
-from apeye.rate_limiter import HTTPCache
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
 
-__all__ = ["cache"]
+if TYPE_CHECKING:
+	# 3rd party
+	from apeye.rate_limiter import HTTPCache
+	from requests.adapters import BaseAdapter  # nodep
 
-#: HTTP Cache that caches requests for up to 4 hours.
-cache = HTTPCache("sphinx-toolbox", expires_after=timedelta(hours=4))
+	# this package
+	from sphinx_toolbox.cache_backends import CacheBackend
+
+__all__ = [
+		"cache",
+		"CACHE_BACKENDS",
+		"CACHE_DIR_ENV_VAR",
+		"DEFAULT_CACHE_MAX_SIZE",
+		"OFFLINE_ENV_VAR",
+		"OfflineAdapter",
+		"configure_cache",
+		"get_cache_backend",
+		"is_offline",
+		"set_offline",
+		]
+
+cache: "HTTPCache"
+"""
+HTTP Cache that caches requests for up to 4 hours.
+
+.. versionchanged:: 2.19.0
+
+	The cache is now created the first time it is accessed,
+	so :mod:`requests` is only imported by builds which make network requests.
+
+.. versionchanged:: 2.19.0
+
+	Responses are stored in a size-bounded :class:`~.CacheBackend`, selected with :func:`~.configure_cache`.
+"""
+
+CACHE_BACKENDS = ("filesystem", "sqlite", "memory")
+"""
+The names of the backends which :data:`~.cache` can store responses in.
+
+See :data:`sphinx_toolbox.cache_backends.cache_backends` for the corresponding classes.
+
+.. versionadded:: 2.19.0
+"""
+
+CACHE_DIR_ENV_VAR = "SPHINX_TOOLBOX_CACHE_DIR"
+"""
+The name of an environment variable which, if set, relocates the ``sphinx-toolbox`` cache directory,
+e.g. to a directory which is cached between CI runs.
+
+.. versionadded:: 2.19.0
+"""
+
+DEFAULT_CACHE_MAX_SIZE = 50 * 1024 * 1024
+"""
+The default maximum size of the cached responses, in bytes.
+
+.. versionadded:: 2.19.0
+"""
+
+OFFLINE_ENV_VAR = "SPHINX_TOOLBOX_OFFLINE"
+"""
+The name of an environment variable which, if set to a true value such as ``1``,
+prevents ``sphinx-toolbox`` from making any network requests.
+
+.. versionadded:: 2.19.0
+"""
+
+_online_adapters: Dict[str, "BaseAdapter"] = {}
+_offline = False
+
+_cache_settings: Dict[str, Any] = {"backend": "filesystem", "cache_dir": None, "max_size": DEFAULT_CACHE_MAX_SIZE}
+_backend: Optional["CacheBackend"] = None
+_default_cache_dir: Optional[PathPlus] = None
+
+
+@functools.lru_cache(1)
+def _get_cache() -> "HTTPCache":
+	# 3rd party
+	from apeye.rate_limiter import HTTPCache
+
+	global _default_cache_dir
+
+	http_cache = HTTPCache("sphinx-toolbox", expires_after=timedelta(hours=4))
+	_default_cache_dir = http_cache.cache_dir
+	_apply_cache_settings(http_cache)
+	atexit.register(_close_backend)
+
+	return http_cache
+
+
+def _apply_cache_settings(http_cache: "HTTPCache") -> None:
+	"""
+	Relocate the cache and switch its backend in accordance with the settings from :func:`~.configure_cache`.
+
+	The backend is switched on the existing adapters,
+	so sessions and adapters which have already been obtained from the cache remain valid.
+	"""
+
+	# this package
+	from sphinx_toolbox.cache_backends import StrippingSerializer, cache_backends
+
+	global _backend
+
+	cache_dir = _cache_settings["cache_dir"] or os.environ.get(CACHE_DIR_ENV_VAR) or _default_cache_dir
+	http_cache.cache_dir = PathPlus(cache_dir)
+	http_cache.cache_dir.maybe_make(parents=True)
+
+	backend = cache_backends[_cache_settings["backend"]].from_cache_dir(
+			http_cache.cache_dir,
+			_cache_settings["max_size"],
+			)
+	serializer = StrippingSerializer()
+
+	for prefix in ("https://", "http://"):
+		# In offline mode the cache's adapters are set aside in favour of the OfflineAdapter.
+		adapter = _online_adapters.get(prefix, http_cache.session.adapters[prefix])
+		adapter.cache = adapter.controller.cache = backend  # type: ignore[attr-defined]
+		adapter.controller.serializer = serializer  # type: ignore[attr-defined]
+
+	_close_backend()
+	_backend = backend
+
+
+def _close_backend() -> None:
+	if _backend is not None:
+		_backend.close()
+
+
+def configure_cache(
+		backend: str = "filesystem",
+		cache_dir: Optional[PathLike] = None,
+		max_size: int = DEFAULT_CACHE_MAX_SIZE,
+		) -> None:
+	"""
+	Configure how and where :data:`~.cache` stores responses.
+
+	If the cache has not been created yet the settings take effect when it is.
+
+	.. versionadded:: 2.19.0
+
+	:param backend: The name of the backend to store responses in. One of :data:`~.CACHE_BACKENDS`.
+	:param cache_dir: The cache directory, which also contains the default :class:`~.IssueTitleStore`.
+		Defaults to the value of the :data:`~.CACHE_DIR_ENV_VAR` environment variable, if set,
+		or else the user's cache directory.
+	:param max_size: The maximum total size of the stored responses, in bytes.
+		The least recently used responses are evicted once the cache exceeds this size.
+
+	:raises ValueError: If the backend is unknown.
+	"""
+
+	if backend not in CACHE_BACKENDS:
+		raise ValueError(f"Unknown cache backend {backend!r}. Expected one of {', '.join(CACHE_BACKENDS)}.")
+
+	settings = {
+			"backend": backend,
+			"cache_dir": None if cache_dir is None else os.fspath(cache_dir),
+			"max_size": int(max_size),
+			}
+
+	if settings == _cache_settings:
+		return
+
+	_cache_settings.update(settings)
+
+	if _get_cache.cache_info().currsize:
+		_apply_cache_settings(_get_cache())
+
+
+def get_cache_backend() -> "CacheBackend":
+	"""
+	Returns the backend :data:`~.cache` stores responses in.
+
+	.. versionadded:: 2.19.0
+	"""
+
+	_get_cache()
+	assert _backend is not None
+	return _backend
+
+
+@functools.lru_cache(1)
+def _get_offline_adapter() -> Type["BaseAdapter"]:
+	# 3rd party
+	import requests  # nodep
+	from requests.adapters import BaseAdapter  # nodep
+
+	class OfflineAdapter(BaseAdapter):
+		"""
+		Requests transport adapter which refuses to send any requests.
+
+		Mounted on :data:`~.cache`'s session when ``sphinx-toolbox`` is in offline mode.
+
+		.. versionadded:: 2.19.0
+		"""
+
+		def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:  # noqa: D102
+			raise requests.exceptions.ConnectionError(
+					f"Not requesting {request.url} as sphinx-toolbox is in offline mode.",
+					request=request,
+					)
+
+		def close(self) -> None:  # noqa: D102
+			pass
+
+	OfflineAdapter.__qualname__ = "OfflineAdapter"
+	return OfflineAdapter
+
+
+class _CacheModule(types.ModuleType):
+	# Creates the lazy attributes on first access without relying on
+	# module-level ``__getattr__`` (PEP 562), which requires Python 3.7.
+
+	@property
+	def cache(self) -> "HTTPCache":  # noqa: D102
+		return _get_cache()
+
+	@property
+	def OfflineAdapter(self) -> Type["BaseAdapter"]:  # noqa: D102
+		return _get_offline_adapter()
+
+
+sys.modules[__name__].__class__ = _CacheModule
+
+
+def is_offline() -> bool:
+	"""
+	Returns whether ``sphinx-toolbox`` is in offline mode,
+	either due to :func:`~.set_offline` or the :data:`~.OFFLINE_ENV_VAR` environment variable.
+
+	.. versionadded:: 2.19.0
+	"""  # noqa: D400
+
+	return _offline or _offline_from_env()
+
+
+def _offline_from_env() -> bool:
+	return os.environ.get(OFFLINE_ENV_VAR, '').strip().lower() in {'1', "true", "yes", "on"}
+
+
+def set_offline(offline: bool = True) -> None:
+	"""
+	Enable or disable offline mode.
+
+	While in offline mode requests made with :data:`~.cache`'s session fail
+	with a :exc:`requests.exceptions.ConnectionError` without opening any sockets.
+	Offline mode cannot be disabled while the :data:`~.OFFLINE_ENV_VAR` environment variable is set.
+
+	.. versionadded:: 2.19.0
+
+	:param offline:
+	"""
+
+	global _offline
+
+	_offline = bool(offline)
+	offline = _offline or _offline_from_env()
+
+	if offline and not _online_adapters:
+		session = _get_cache().session
+		for prefix in ("https://", "http://"):
+			_online_adapters[prefix] = session.adapters[prefix]
+			session.mount(prefix, _get_offline_adapter()())
+
+	elif not offline and _online_adapters:
+		session = _get_cache().session
+		for prefix, adapter in _online_adapters.items():
+			session.mount(prefix, adapter)
+		_online_adapters.clear()
@@ -0,0 +1,949 @@
+#!/usr/bin/env python3
+#
+#  cache_backends.py
+"""
+Size-bounded stores for the responses cached by :data:`sphinx_toolbox.cache.cache`.
+
+.. versionadded:: 2.19.0
+
+The backend is selected with the :confval:`toolbox_cache_backend` configuration value.
+Each backend evicts the least recently used responses once the cache grows beyond
+:confval:`toolbox_cache_max_size`, and counts the hits, misses and bytes transferred, which can be shown with:
+
+.. prompt:: bash
+
+	python3 -m sphinx_toolbox stats --backend sqlite
+
+Responses are stored with a :class:`~.StrippingSerializer`,
+which discards the parts of GitHub issue pages and API responses which ``sphinx-toolbox`` does not use.
+"""
+#
+#  Copyright © 2022 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+#  MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+#  IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+#  DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+#  OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+# stdlib
+import abc
+import contextlib
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, ClassVar, Dict, Iterator, List, Optional, Pattern, Tuple, Type, Union
+from urllib.parse import urlsplit
+
+# 3rd party
+import msgpack  # type: ignore  # nodep
+from cachecontrol.cache import BaseCache  # nodep
+from cachecontrol.serialize import Serializer  # nodep
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from sphinx_toolbox.cache import DEFAULT_CACHE_MAX_SIZE
+
+__all__ = [
+		"CacheStats",
+		"CacheBackend",
+		"MemoryCache",
+		"SQLiteCache",
+		"FileSystemCache",
+		"cache_backends",
+		"StrippingSerializer",
+		"body_strippers",
+		"strip_issue_page",
+		"strip_issue_json",
+		]
+
+
+class CacheStats:
+	"""
+	Counts of the lookups made in a :class:`~.CacheBackend`, and the bytes transferred.
+	"""
+
+	#: The names of the counts.
+	fields: ClassVar[Tuple[str, ...]] = ("hits", "misses", "bytes_read", "bytes_written", "evictions")
+
+	def __init__(
+			self,
+			hits: int = 0,
+			misses: int = 0,
+			bytes_read: int = 0,
+			bytes_written: int = 0,
+			evictions: int = 0,
+			):
+
+		#: The number of lookups which found a response.
+		self.hits: int = hits
+
+		#: The number of lookups which did not find a response, including those which found an expired response.
+		self.misses: int = misses
+
+		#: The total size of the responses found, in bytes.
+		self.bytes_read: int = bytes_read
+
+		#: The total size of the responses stored, in bytes.
+		self.bytes_written: int = bytes_written
+
+		#: The number of responses evicted to keep the cache within its maximum size.
+		self.evictions: int = evictions
+
+	def __repr__(self) -> str:
+		counts = ", ".join(f"{name}={value!r}" for name, value in self.as_dict().items())
+		return f"{self.__class__.__name__}({counts})"
+
+	def __eq__(self, other) -> bool:
+		if isinstance(other, CacheStats):
+			return self.as_dict() == other.as_dict()
+
+		return NotImplemented
+
+	def __add__(self, other: "CacheStats") -> "CacheStats":
+		return CacheStats(*(getattr(self, name) + getattr(other, name) for name in self.fields))
+
+	def __sub__(self, other: "CacheStats") -> "CacheStats":
+		return CacheStats(*(getattr(self, name) - getattr(other, name) for name in self.fields))
+
+	@property
+	def hit_rate(self) -> float:
+		"""
+		The fraction of lookups which found a response.
+		"""
+
+		lookups = self.hits + self.misses
+		return self.hits / lookups if lookups else 0.0
+
+	def as_dict(self) -> Dict[str, int]:
+		"""
+		Returns the counts as a dictionary.
+		"""
+
+		return {name: getattr(self, name) for name in self.fields}
+
+
+def _expiry_time(expires: Union[int, datetime, None]) -> Optional[float]:
+	"""
+	Returns the time at which a response passed to :meth:`CacheBackend.set() <.CacheBackend.set>` expires,
+	as a POSIX timestamp, or :py:obj:`None` if it never expires.
+
+	:param expires: The number of seconds until the response expires, or the time at which it expires.
+	"""  # noqa: D400
+
+	if isinstance(expires, datetime):
+		if expires.tzinfo is None:
+			expires = expires.replace(tzinfo=timezone.utc)
+		return expires.timestamp()
+
+	if not expires:
+		return None
+
+	return time.time() + expires
+
+
+def _is_expired(expires: Optional[float], now: Optional[float] = None) -> bool:
+	return expires is not None and expires <= (time.time() if now is None else now)
+
+
+class CacheBackend(BaseCache, abc.ABC):
+	"""
+	Base class for size-bounded stores of cached HTTP responses, for use with :mod:`cachecontrol`.
+
+	Once the total size of the stored responses exceeds ``max_size``
+	the least recently used responses are evicted.
+
+	Subclasses must implement :meth:`~.CacheBackend.from_cache_dir`, :meth:`~.CacheBackend.delete`,
+	:meth:`~.CacheBackend.clear`, :meth:`~.CacheBackend.size`, :meth:`~.CacheBackend.remove_expired`
+	and :meth:`~.CacheBackend.__len__`, and the private ``_get``, ``_set`` and ``_evict`` methods.
+
+	:param max_size: The maximum total size of the stored responses, in bytes.
+	"""
+
+	#: The name of the backend, for :confval:`toolbox_cache_backend`.
+	name: ClassVar[str]
+
+	def __init__(self, max_size: int = DEFAULT_CACHE_MAX_SIZE):
+		self.max_size = max(0, int(max_size))
+
+		#: The lookups made and bytes transferred by this process.
+		self.stats = CacheStats()
+
+		self._saved_stats = CacheStats()
+		self._lock = threading.RLock()
+
+	@classmethod
+	@abc.abstractmethod
+	def from_cache_dir(cls, cache_dir: PathLike, max_size: int = DEFAULT_CACHE_MAX_SIZE) -> "CacheBackend":
+		"""
+		Returns a backend which stores responses in the given cache directory.
+
+		:param cache_dir:
+		:param max_size: The maximum total size of the stored responses, in bytes.
+		"""
+
+		raise NotImplementedError  # pragma: no cover
+
+	@property
+	def location(self) -> str:
+		"""
+		A description of where the responses are stored.
+		"""
+
+		return ":memory:"
+
+	def __repr__(self) -> str:
+		return f"{self.__class__.__name__}({self.location!r}, max_size={self.max_size!r})"
+
+	@abc.abstractmethod
+	def __len__(self) -> int:
+		"""
+		Returns the number of stored responses.
+		"""
+
+		raise NotImplementedError  # pragma: no cover
+
+	def get(self, key: str) -> Optional[bytes]:
+		"""
+		Returns the response stored with the given key,
+		or :py:obj:`None` if there is no such response or it has expired.
+
+		:param key:
+		"""  # noqa: D400
+
+		value = self._get(key)
+
+		with self._lock:
+			if value is None:
+				self.stats.misses += 1
+			else:
+				self.stats.hits += 1
+				self.stats.bytes_read += len(value)
+
+		return value
+
+	def set(  # noqa: A003  # pylint: disable=redefined-builtin
+			self,
+			key: str,
+			value: bytes,
+			expires: Union[int, datetime, None] = None,
+			) -> None:
+		"""
+		Store a response, evicting the least recently used responses if the cache is then too large.
+
+		:param key:
+		:param value: The serialized response.
+		:param expires: The number of seconds until the response expires, or the time at which it expires.
+		"""
+
+		self._set(key, value, _expiry_time(expires))
+
+		with self._lock:
+			self.stats.bytes_written += len(value)
+
+		if self._exceeds_max_size():
+			self.evict()
+
+	@abc.abstractmethod
+	def delete(self, key: str) -> None:
+		"""
+		Remove the response stored with the given key, if any.
+
+		:param key:
+		"""
+
+		raise NotImplementedError  # pragma: no cover
+
+	@abc.abstractmethod
+	def clear(self) -> None:
+		"""
+		Remove all stored responses.
+		"""
+
+		raise NotImplementedError  # pragma: no cover
+
+	@abc.abstractmethod
+	def size(self) -> int:
+		"""
+		Returns the total size of the stored responses, in bytes.
+		"""
+
+		raise NotImplementedError  # pragma: no cover
+
+	@abc.abstractmethod
+	def remove_expired(self) -> int:
+		"""
+		Remove expired responses.
+
+		:returns: The number of responses removed.
+		"""
+
+		raise NotImplementedError  # pragma: no cover
+
+	def evict(self, max_size: Optional[int] = None) -> int:
+		"""
+		Remove the least recently used responses until the cache is no larger than ``max_size``.
+
+		:param max_size: Defaults to the maximum size of the cache.
+
+		:returns: The number of responses removed.
+		"""
+
+		removed = self._evict(self.max_size if max_size is None else max_size)
+
+		with self._lock:
+			self.stats.evictions += removed
+
+		return removed
+
+	def vacuum(self) -> int:
+		"""
+		Remove expired responses, evict responses until the cache is within its maximum size,
+		and reclaim the space used by removed responses.
+
+		:returns: The number of responses removed.
+		"""  # noqa: D400
+
+		removed = self.remove_expired() + self.evict()
+		self._compact()
+		return removed
+
+	def total_stats(self) -> CacheStats:
+		"""
+		Returns the lookups made and bytes transferred by all processes which have used the cache,
+		including this one.
+		"""  # noqa: D400
+
+		self.save_stats()
+		return self._load_stats()
+
+	def save_stats(self) -> None:
+		"""
+		Add the lookups made since the stats were last saved to the totals stored alongside the responses.
+		"""
+
+		with self._lock:
+			unsaved = self.stats - self._saved_stats
+			self._saved_stats = self.stats + CacheStats()
+
+		if any(unsaved.as_dict().values()):
+			self._save_stats(unsaved)
+
+	def close(self) -> None:
+		"""
+		Save the stats and release any resources held by the backend.
+		"""
+
+		self.save_stats()
+
+	@abc.abstractmethod
+	def _get(self, key: str) -> Optional[bytes]:
+		raise NotImplementedError  # pragma: no cover
+
+	@abc.abstractmethod
+	def _set(self, key: str, value: bytes, expires: Optional[float]) -> None:
+		raise NotImplementedError  # pragma: no cover
+
+	@abc.abstractmethod
+	def _evict(self, max_size: int) -> int:
+		raise NotImplementedError  # pragma: no cover
+
+	def _exceeds_max_size(self) -> bool:
+		return self.size() > self.max_size
+
+	def _compact(self) -> None:
+		pass
+
+	def _load_stats(self) -> CacheStats:
+		return self.stats + CacheStats()
+
+	def _save_stats(self, stats: CacheStats) -> None:
+		pass
+
+
+class MemoryCache(CacheBackend):
+	"""
+	Stores responses in memory, for the lifetime of the process.
+
+	:param max_size: The maximum total size of the stored responses, in bytes.
+	"""
+
+	name: ClassVar[str] = "memory"
+
+	def __init__(self, max_size: int = DEFAULT_CACHE_MAX_SIZE):
+		super().__init__(max_size)
+		self._entries: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+		self._size = 0
+
+	@classmethod
+	def from_cache_dir(  # noqa: D102
+			cls,
+			cache_dir: PathLike,
+			max_size: int = DEFAULT_CACHE_MAX_SIZE,
+			) -> "MemoryCache":
+		return cls(max_size)
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def delete(self, key: str) -> None:  # noqa: D102
+		with self._lock:
+			self._remove(key)
+
+	def clear(self) -> None:  # noqa: D102
+		with self._lock:
+			self._entries.clear()
+			self._size = 0
+
+	def size(self) -> int:  # noqa: D102
+		return self._size
+
+	def remove_expired(self) -> int:  # noqa: D102
+		now = time.time()
+
+		with self._lock:
+			expired = [key for key, (_, expires) in self._entries.items() if _is_expired(expires, now)]
+			for key in expired:
+				self._remove(key)
+
+		return len(expired)
+
+	def _remove(self, key: str) -> None:
+		entry = self._entries.pop(key, None)
+		if entry is not None:
+			self._size -= len(entry[0])
+
+	def _get(self, key: str) -> Optional[bytes]:
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None:
+				return None
+
+			if _is_expired(entry[1]):
+				self._remove(key)
+				return None
+
+			self._entries.move_to_end(key)
+			return entry[0]
+
+	def _set(self, key: str, value: bytes, expires: Optional[float]) -> None:
+		with self._lock:
+			self._remove(key)
+			self._entries[key] = (value, expires)
+			self._size += len(value)
+
+	def _evict(self, max_size: int) -> int:
+		removed = 0
+
+		with self._lock:
+			while self._entries and self._size > max_size:
+				_, (value, _) = self._entries.popitem(last=False)
+				self._size -= len(value)
+				removed += 1
+
+		return removed
+
+
+class SQLiteCache(CacheBackend):
+	"""
+	Stores responses in a SQLite database, compressed with :mod:`zlib`.
+
+	The database can be shared by several processes, as SQLite serialises writes to it.
+
+	:param path: The filename of the database.
+	:param max_size: The maximum total size of the compressed responses, in bytes.
+	"""
+
+	name: ClassVar[str] = "sqlite"
+
+	def __init__(self, path: PathLike, max_size: int = DEFAULT_CACHE_MAX_SIZE):
+		super().__init__(max_size)
+		self.path = PathPlus(path)
+		self.path.parent.maybe_make(parents=True)
+
+		# The connection is shared by the threads fetching issue titles, with access serialised by ``_lock``.
+		self._connection = sqlite3.connect(os.fspath(self.path), timeout=30, check_same_thread=False)
+
+		with self._lock, self._connection:
+			self._connection.execute(
+					"CREATE TABLE IF NOT EXISTS responses ("
+					"key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+					"expires REAL, accessed REAL NOT NULL)"
+					)
+			self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+			self._connection.execute(
+					"CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+					)
+
+	@classmethod
+	def from_cache_dir(  # noqa: D102
+			cls,
+			cache_dir: PathLike,
+			max_size: int = DEFAULT_CACHE_MAX_SIZE,
+			) -> "SQLiteCache":
+		return cls(PathPlus(cache_dir) / "http_cache.sqlite", max_size)
+
+	@property
+	def location(self) -> str:  # noqa: D102
+		return self.path.as_posix()
+
+	def __len__(self) -> int:
+		with self._lock:
+			return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+	def delete(self, key: str) -> None:  # noqa: D102
+		with self._lock, self._connection:
+			self._connection.execute("DELETE FROM responses WHERE key = ?", (key, ))
+
+	def clear(self) -> None:  # noqa: D102
+		with self._lock, self._connection:
+			self._connection.execute("DELETE FROM responses")
+
+	def size(self) -> int:  # noqa: D102
+		with self._lock:
+			return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+	def remove_expired(self) -> int:  # noqa: D102
+		with self._lock, self._connection:
+			cursor = self._connection.execute(
+					"DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?",
+					(time.time(), ),
+					)
+			return cursor.rowcount
+
+	def close(self) -> None:  # noqa: D102
+		super().close()
+
+		with self._lock:
+			self._connection.close()
+
+	def _get(self, key: str) -> Optional[bytes]:
+		with self._lock, self._connection:
+			row = self._connection.execute("SELECT value, expires FROM responses WHERE key = ?", (key, )).fetchone()
+			if row is None:
+				return None
+
+			if _is_expired(row[1]):
+				self._connection.execute("DELETE FROM responses WHERE key = ?", (key, ))
+				return None
+
+			self._connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key))
+
+		return zlib.decompress(row[0])
+
+	def _set(self, key: str, value: bytes, expires: Optional[float]) -> None:
+		compressed = zlib.compress(value)
+
+		with self._lock, self._connection:
+			self._connection.execute(
+					"INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+					(key, compressed, len(compressed), expires, time.time()),
+					)
+
+	def _evict(self, max_size: int) -> int:
+		with self._lock, self._connection:
+			excess = self.size() - max_size
+			evicted = []
+
+			for key, size in self._connection.execute("SELECT key, size FROM responses ORDER BY accessed"):
+				if excess <= 0:
+					break
+
+				evicted.append((key, ))
+				excess -= size
+
+			self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+		return len(evicted)
+
+	def _compact(self) -> None:
+		with self._lock:
+			self._connection.execute("VACUUM")
+
+	def _load_stats(self) -> CacheStats:
+		with self._lock:
+			return CacheStats(**dict(self._connection.execute("SELECT name, value FROM stats")))
+
+	def _save_stats(self, stats: CacheStats) -> None:
+		with self._lock, self._connection:
+			for name, value in stats.as_dict().items():
+				self._connection.execute("INSERT OR IGNORE INTO stats VALUES (?, 0)", (name, ))
+				self._connection.execute("UPDATE stats SET value = value + ? WHERE name = ?", (value, name))
+
+
+@contextlib.contextmanager
+def _locked(lock_file: PathPlus) -> Iterator[None]:
+	"""
+	Hold an exclusive lock on ``lock_file``, which is created if necessary, for the duration of the ``with`` block.
+
+	:param lock_file:
+	"""
+
+	lock_file.parent.maybe_make(parents=True)
+
+	with open(lock_file, "a+b") as fp:
+		if os.name == "nt":  # pragma: no cover (!Windows)
+			# stdlib
+			import msvcrt
+
+			fp.seek(0)
+			msvcrt.locking(fp.fileno(), msvcrt.LK_LOCK, 1)  # type: ignore[attr-defined]
+			try:
+				yield
+			finally:
+				fp.seek(0)
+				msvcrt.locking(fp.fileno(), msvcrt.LK_UNLCK, 1)  # type: ignore[attr-defined]
+
+		else:  # pragma: no cover (Windows)
+			# stdlib
+			import fcntl
+
+			fcntl.flock(fp.fileno(), fcntl.LOCK_EX)
+			try:
+				yield
+			finally:
+				fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+
+
+class FileSystemCache(CacheBackend):
+	"""
+	Stores each response in its own file in a directory which can be shared by concurrent builds.
+
+	Responses are written atomically, and eviction is serialised between processes with a lock file,
+	so several builds can use the same directory at once, for example on a shared CI cache volume.
+	The modification time of each file records when the response was last used.
+
+	:param directory:
+	:param max_size: The maximum total size of the stored responses, in bytes.
+	"""
+
+	name: ClassVar[str] = "filesystem"
+
+	_header = struct.Struct(">d")
+
+	def __init__(self, directory: PathLike, max_size: int = DEFAULT_CACHE_MAX_SIZE):
+		super().__init__(max_size)
+		self.directory = PathPlus(directory)
+		self.directory.maybe_make(parents=True)
+
+		# The total size of the directory, as of the last scan, plus the size of responses stored since.
+		self._approximate_size: Optional[int] = None
+
+	@classmethod
+	def from_cache_dir(  # noqa: D102
+			cls,
+			cache_dir: PathLike,
+			max_size: int = DEFAULT_CACHE_MAX_SIZE,
+			) -> "FileSystemCache":
+		return cls(PathPlus(cache_dir) / "http", max_size)
+
+	@property
+	def location(self) -> str:  # noqa: D102
+		return self.directory.as_posix()
+
+	@property
+	def _lock_file(self) -> PathPlus:
+		return self.directory / ".lock"
+
+	@property
+	def _stats_file(self) -> PathPlus:
+		return self.directory / "stats.json"
+
+	def _path(self, key: str) -> PathPlus:
+		digest = hashlib.sha256(key.encode("UTF-8")).hexdigest()
+		return self.directory / digest[:2] / digest[2:]
+
+	def _entries(self) -> List[Tuple[PathPlus, os.stat_result]]:
+		entries = []
+
+		for path in self.directory.glob("??/*"):
+			if path.name.startswith(".tmp"):
+				continue
+
+			with contextlib.suppress(FileNotFoundError):
+				entries.append((path, path.stat()))
+
+		return entries
+
+	def __len__(self) -> int:
+		return len(self._entries())
+
+	def delete(self, key: str) -> None:  # noqa: D102
+		self._path(key).unlink(missing_ok=True)
+
+	def clear(self) -> None:  # noqa: D102
+		with self._lock, _locked(self._lock_file):
+			for path, _ in self._entries():
+				path.unlink(missing_ok=True)
+
+			self._approximate_size = 0
+
+	def size(self) -> int:  # noqa: D102
+		return sum(stat.st_size for _, stat in self._entries())
+
+	def remove_expired(self) -> int:  # noqa: D102
+		now = time.time()
+		removed = 0
+
+		with self._lock, _locked(self._lock_file):
+			for path, _ in self._entries():
+				header = b''
+				with contextlib.suppress(FileNotFoundError), path.open("rb") as fp:
+					header = fp.read(self._header.size)
+
+				if len(header) == self._header.size and _is_expired(self._read_expiry(header), now):
+					path.unlink(missing_ok=True)
+					removed += 1
+
+		return removed
+
+	def _read_expiry(self, header: bytes) -> Optional[float]:
+		expires = self._header.unpack(header)[0]
+		return expires or None
+
+	def _get(self, key: str) -> Optional[bytes]:
+		path = self._path(key)
+
+		try:
+			data = path.read_bytes()
+		except FileNotFoundError:
+			return None
+
+		if len(data) < self._header.size or _is_expired(self._read_expiry(data[:self._header.size])):
+			path.unlink(missing_ok=True)
+			return None
+
+		# Mark the response as recently used.
+		with contextlib.suppress(OSError):
+			os.utime(path)
+
+		return data[self._header.size:]
+
+	def _set(self, key: str, value: bytes, expires: Optional[float]) -> None:
+		path = self._path(key)
+		path.parent.maybe_make(parents=True)
+
+		fd, tmp_name = tempfile.mkstemp(prefix=".tmp", dir=path.parent)
+		try:
+			with os.fdopen(fd, "wb") as fp:
+				fp.write(self._header.pack(expires or 0))
+				fp.write(value)
+			os.replace(tmp_name, path)
+		except BaseException:
+			with contextlib.suppress(FileNotFoundError):
+				os.unlink(tmp_name)
+			raise
+
+		with self._lock:
+			if self._approximate_size is not None:
+				self._approximate_size += self._header.size + len(value)
+
+	def _exceeds_max_size(self) -> bool:
+		# Scanning the directory after every response would be slow,
+		# so it is only rescanned once the responses stored by this process may have filled the cache.
+		with self._lock:
+			if self._approximate_size is None:
+				self._approximate_size = self.size()
+
+			return self._approximate_size > self.max_size
+
+	def _evict(self, max_size: int) -> int:
+		with self._lock, _locked(self._lock_file):
+			entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+			size = sum(stat.st_size for _, stat in entries)
+			removed = 0
+
+			for path, stat in entries:
+				if size <= max_size:
+					break
+
+				path.unlink(missing_ok=True)
+				size -= stat.st_size
+				removed += 1
+
+			self._approximate_size = size
+
+		return removed
+
+	def _compact(self) -> None:
+		# Remove temporary files left behind by interrupted builds, and empty directories.
+		cutoff = time.time() - 3600
+
+		with self._lock, _locked(self._lock_file):
+			for path in self.directory.glob("??/.tmp*"):
+				with contextlib.suppress(FileNotFoundError):
+					if path.stat().st_mtime < cutoff:
+						path.unlink()
+
+			for path in self.directory.glob("??"):
+				with contextlib.suppress(OSError):
+					path.rmdir()
+
+	def _load_stats(self) -> CacheStats:
+		with self._lock, _locked(self._lock_file):
+			return self._read_stats_file()
+
+	def _read_stats_file(self) -> CacheStats:
+		try:
+			counts = self._stats_file.load_json()
+		except (FileNotFoundError, ValueError):
+			return CacheStats()
+
+		return CacheStats(**{name: int(counts.get(name, 0)) for name in CacheStats.fields})
+
+	def _save_stats(self, stats: CacheStats) -> None:
+		with self._lock, _locked(self._lock_file):
+			totals = self._read_stats_file() + stats
+			tmp_file = self._stats_file.with_suffix(".json.tmp")
+			tmp_file.write_text(json.dumps(totals.as_dict()))
+			os.replace(tmp_file, self._stats_file)
+
+
+#: Mapping of :confval:`toolbox_cache_backend` names to backend classes.
+cache_backends: Dict[str, Type[CacheBackend]] = {
+		MemoryCache.name: MemoryCache,
+		SQLiteCache.name: SQLiteCache,
+		FileSystemCache.name: FileSystemCache,
+		}
+
+_title_span = re.compile(rb'<span[^>]*\bclass="(?:[^"]*\s)?js-issue-title(?:\s[^"]*)?"[^>]*>.*?</span>', re.DOTALL)
+_state_span = re.compile(rb'<span[^>]*\bclass="(?:[^"]*\s)?State(?:\s[^"]*)?"[^>]*>.*?</span>', re.DOTALL)
+
+
+def strip_issue_page(body: bytes) -> Optional[bytes]:
+	"""
+	Reduce the HTML page of a GitHub issue or pull request to the elements containing its title and state.
+
+	:param body:
+
+	:returns: The reduced page, or :py:obj:`None` if the title could not be found.
+	"""
+
+	title = _title_span.search(body)
+	if title is None:
+		return None
+
+	state = _state_span.search(body)
+	elements = title.group(0) + (b'' if state is None else state.group(0))
+
+	return b"<html><body>" + elements + b"</body></html>"
+
+
+def strip_issue_json(body: bytes) -> Optional[bytes]:
+	"""
+	Reduce a GitHub REST API response for an issue or pull request to its title and state.
+
+	:param body:
+
+	:returns: The reduced response, or :py:obj:`None` if it is not an issue.
+	"""
+
+	try:
+		issue = json.loads(body)
+	except ValueError:
+		return None
+
+	if not isinstance(issue, dict) or "title" not in issue:
+		return None
+
+	stripped = {"title": issue["title"], "state": issue.get("state")}
+
+	if issue.get("pull_request") is not None:
+		stripped["pull_request"] = {"merged_at": issue["pull_request"].get("merged_at")}
+
+	return json.dumps(stripped).encode("UTF-8")
+
+
+#: List of patterns matching the paths of URLs, and the functions which strip the responses from them.
+#: Each function returns :py:obj:`None` if it cannot strip the response, in which case the next is tried.
+body_strippers: List[Tuple[Pattern[str], Callable[[bytes], Optional[bytes]]]] = [
+		(re.compile(r"^/repos/[^/]+/[^/]+/issues/\d+/?$"), strip_issue_json),
+		(re.compile(r"^/[^/]+/[^/]+/(?:issues|pull)/\d+/?$"), strip_issue_page),
+		]
+
+
+def _decode_body(body: bytes, content_encoding: str) -> Optional[bytes]:
+	"""
+	Decompress a response body, returning :py:obj:`None` if the encoding is not supported.
+	"""
+
+	try:
+		if content_encoding in {'', "identity"}:
+			return body
+		elif content_encoding == "gzip":
+			return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+		elif content_encoding == "deflate":
+			try:
+				return zlib.decompress(body)
+			except zlib.error:
+				return zlib.decompress(body, -zlib.MAX_WBITS)
+	except zlib.error:
+		pass
+
+	return None
+
+
+class StrippingSerializer(Serializer):
+	"""
+	:mod:`cachecontrol` serializer which reduces successful responses to the parts used by ``sphinx-toolbox``,
+	using the functions in :data:`~.body_strippers`.
+
+	Stripped responses are stored uncompressed, without their ``Content-Encoding`` header.
+	Responses which no function can strip are stored unchanged.
+	"""  # noqa: D400
+
+	def dumps(self, request, response, body: Optional[bytes] = None) -> bytes:  # noqa: D102
+		data = super().dumps(request, response, body)
+
+		path = urlsplit(request.url or '').path
+		strippers = [strip for pattern, strip in body_strippers if pattern.search(path)]
+		if not strippers or response.status != 200:
+			return data
+
+		version, _, payload = data.partition(b',')
+		cached = msgpack.loads(payload, raw=False)
+		headers: Dict[str, str] = cached["response"]["headers"]
+		content_encoding = next((v for k, v in headers.items() if k.lower() == "content-encoding"), '')
+
+		decoded = _decode_body(cached["response"]["body"], content_encoding.strip().lower())
+		if decoded is None:
+			return data
+
+		for strip in strippers:
+			stripped = strip(decoded)
+			if stripped is not None:
+				break
+		else:
+			return data
+
+		excluded = {"content-encoding", "content-length", "transfer-encoding"}
+		headers = {k: v for k, v in headers.items() if k.lower() not in excluded}
+		headers["Content-Length"] = str(len(stripped))
+
+		cached["response"]["body"] = stripped
+		cached["response"]["headers"] = headers
+
+		return b','.join([version, msgpack.dumps(cached, use_bin_type=True)])
@@ -149,10 +149,9 @@ API Reference
 #
 
 # stdlib
-from typing import List, MutableMapping, Optional
+from typing import List, Optional
 
 # 3rd party
-import dict2css
 import docutils.nodes
 import docutils.statemachine
 import sphinx.directives.code
@@ -167,6 +166,7 @@ from sphinx.writers.html import HTMLTranslator
 from sphinx.writers.latex import LaTeXTranslator
 
 # this package
+from sphinx_toolbox import _css
 from sphinx_toolbox.utils import OptionSpec, SphinxExtMetadata, metadata_add_version
 
 __all__ = [
@@ -346,6 +346,11 @@ def copy_asset_files(app: Sphinx, exception: Optional[Exception] = None):
 
 	.. versionadded:: 2.6.0
 
+	.. versionchanged:: 2.19.0
+
+		The file is only written if its content has changed.
+		When the extension is enabled the stylesheet is instead written by :mod:`sphinx_toolbox._css`.
+
 	:param app: The Sphinx application.
 	:param exception: Any exception which occurred and caused Sphinx to abort.
 	"""
@@ -356,43 +361,7 @@ def copy_asset_files(app: Sphinx, exception: Optional[Exception] = None):
 	if app.builder is None or app.builder.format.lower() != "html":  # pragma: no cover
 		return
 
-	prompt_style: dict2css.Style = {
-			"user-select": None,
-			"font-size": "13px",
-			"font-family": '"SFMono-Regular", Menlo, Consolas, Monaco, Liberation Mono, Lucida Console, monospace',
-			"border": None,
-			"padding": "11px 0 0",
-			"margin": "0 5px 0 0",
-			"box-shadow": None,
-			"wrap-option": None,
-			"white-space": "nowrap",
-			}
-
-	container_style: dict2css.Style = {
-			"padding-top": "5px",
-			"display": "flex",
-			"align-items": "stretch",
-			"margin": 0,
-			}
-
-	code_style_string = "div.code-cell.container div.code-cell-code, div.output-cell.container div.output-cell-code"
-	code_style: dict2css.Style = {
-			"width": "100%",
-			"padding-top": 0,
-			"margin-top": 0,
-			}
-
-	style: MutableMapping[str, dict2css.Style] = {
-			"div.code-cell.container div.prompt": {"color": "#307FC1"},
-			"div.output-cell.container div.prompt": {"color": "#BF5B3D"},
-			"div.code-cell.container div.prompt, div.output-cell.container div.prompt": prompt_style,
-			"div.code-cell.container, div.output-cell.container": container_style,
-			code_style_string: code_style,
-			}
-
-	static_dir = PathPlus(app.outdir) / "_static"
-	static_dir.maybe_make(parents=True)
-	dict2css.dump(style, static_dir / "sphinx-toolbox-code.css")
+	_css.write_stylesheet(PathPlus(app.outdir) / "_static" / "sphinx-toolbox-code.css", _css.code_styles)
 
 
 def configure(app: Sphinx, config: Config):
@@ -442,8 +411,9 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 			latex=(visit_prompt_latex, lambda *args, **kwargs: None)
 			)
 
+	app.setup_extension("sphinx_toolbox._css")
+
 	app.connect("config-inited", configure)
-	app.add_css_file("sphinx-toolbox-code.css")
-	app.connect("build-finished", copy_asset_files)
+	_css.add_stylesheet(app, "sphinx-toolbox-code.css", _css.code_styles)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -185,4 +185,5 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	return {
 			"parallel_read_safe": True,
+			"parallel_write_safe": True,
 			}
@@ -27,16 +27,19 @@ Internal configuration for ``sphinx-toolbox``.
 #
 
 # stdlib
-from typing import List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 # 3rd party
-from apeye.requests_url import RequestsURL
 from sphinx.application import Sphinx
 from sphinx.config import Config
 
 # this package
 from sphinx_toolbox.utils import add_nbsp_substitution
 
+if TYPE_CHECKING:
+	# 3rd party
+	from apeye.requests_url import RequestsURL
+
 __all__ = ["MissingOptionError", "InvalidOptionError", "validate_config", "ToolboxConfig"]
 
 
@@ -79,16 +82,49 @@ class ToolboxConfig(Config):
 	"""
 
 	#: The complete URL of the repository on GitHub.
-	github_url: RequestsURL
+	github_url: "RequestsURL"
 
 	#: The base URL for the source code on GitHub.
-	github_source_url: RequestsURL
+	github_source_url: "RequestsURL"
 
 	#: The base URL for the issues on GitHub.
-	github_issues_url: RequestsURL
+	github_issues_url: "RequestsURL"
 
 	#: The base URL for the pull requests on GitHub.
-	github_pull_url: RequestsURL
+	github_pull_url: "RequestsURL"
+
+	#: The maximum number of issue and pull request titles to fetch from GitHub at once.
+	github_issue_title_workers: int
+
+	#: The maximum number of requests per second made to each host when fetching issue and pull request titles.
+	github_issue_title_rate_limit: float
+
+	#: The number of hours after which the stored titles of open issues and pull requests are fetched again.
+	github_issue_title_ttl: float
+
+	#: The filename of the database in which to store issue and pull request titles, relative to ``conf.py``.
+	github_issue_title_store: Optional[str]
+
+	#: The backend used to fetch the titles of issues and pull requests.
+	github_issue_title_backend: Any
+
+	#: The base URL of the GitHub API.
+	github_api_url: str
+
+	#: Build without making any network requests.
+	toolbox_offline: bool
+
+	#: The filename of a snapshot of issue and pull request titles to use in offline mode.
+	toolbox_offline_snapshot: Optional[str]
+
+	#: The backend to cache HTTP responses in.
+	toolbox_cache_backend: str
+
+	#: The directory to cache HTTP responses in, relative to ``conf.py``.
+	toolbox_cache_dir: Optional[str]
+
+	#: The maximum total size of the cached HTTP responses, in bytes.
+	toolbox_cache_max_size: int
 
 	#: List of required Conda channels.
 	conda_channels: List[str]
@@ -96,6 +132,21 @@ class ToolboxConfig(Config):
 	#: The directory in which to find assets for the :rst:role:`asset` role.
 	assets_dir: str
 
+	#: How asset files are placed in the output directory: ``'copy'``, ``'hardlink'`` or ``'reflink'``.
+	assets_copy_mode: str
+
+	#: How to determine whether an asset file in the output directory is up to date: ``'mtime'`` or ``'hash'``.
+	assets_compare: str
+
+	#: Whether the stylesheets added by ``sphinx-toolbox`` have a content hash in their filenames.
+	toolbox_css_fingerprint: bool
+
+	#: Whether the stylesheets added by ``sphinx-toolbox`` are combined into a single minified file.
+	toolbox_css_bundle: bool
+
+	#: Whether to profile ``sphinx-toolbox``, or the filename of the report.
+	toolbox_profile: Union[bool, str]
+
 	docutils_tab_width: int
 	"""
 	The tab size used by docutils.
@@ -105,6 +156,9 @@ class ToolboxConfig(Config):
 	#: The Wikipedia language to use for :rst:role:`wikipedia` roles.
 	wikipedia_lang: str
 
+	#: Additional replacements for :func:`sphinx_toolbox.latex.replace_unknown_unicode` to make in the LaTeX output.
+	latex_unicode_replacements: Dict[str, str]
+
 	#: A string of reStructuredText that will be included at the beginning of every source file that is read.
 	rst_prolog: str
 
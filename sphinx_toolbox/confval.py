@@ -244,4 +244,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	register_confval(app)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
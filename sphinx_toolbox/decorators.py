@@ -150,4 +150,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	app.add_role_to_domain("py", "deco", PyDecoXRefRole())
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -216,5 +216,6 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	app.add_directive("documentation-summary", DocumentationSummaryDirective)
 	app.add_config_value("documentation_summary", None, "env", types=[str, None])
 	app.connect("env-purge-doc", summary_node_purger.purge_nodes)
+	app.connect("env-merge-info", summary_node_purger.merge_nodes)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
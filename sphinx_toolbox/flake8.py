@@ -131,7 +131,7 @@ class Flake8CodesDirective(SphinxDirective):
 		table_node = nodes.paragraph(rawsource=content)
 		self.state.nested_parse(view, self.content_offset, table_node)
 
-		table_node_purger.add_node(self.env, table_node, targetnode, self.lineno)
+		table_node_purger.add_node(self.env, table_node, targetnode, self.lineno, modules=[plugin])
 
 		return [table_node]
 
@@ -145,6 +145,8 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	"""
 
 	app.add_directive("flake8-codes", Flake8CodesDirective)
+	app.connect("env-get-outdated", table_node_purger.get_outdated_docnames)
 	app.connect("env-purge-doc", table_node_purger.purge_nodes)
+	app.connect("env-merge-info", table_node_purger.merge_nodes)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
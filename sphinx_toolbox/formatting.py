@@ -224,4 +224,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 			latex=(latex_visit_iabbr_node, latex_depart_iabbr_node),
 			)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -25,6 +25,127 @@ Configuration
 
 	The GitHub repository this documentation corresponds to.
 
+.. confval:: github_issue_title_workers
+	:type: :class:`int`
+	:default: ``8``
+
+	The maximum number of issue and pull request titles to fetch from GitHub at once.
+
+	.. versionadded:: 2.19.0
+
+.. confval:: github_issue_title_rate_limit
+	:type: :class:`float`
+	:default: ``5``
+
+	The maximum number of requests per second made to each host when fetching issue and pull request titles.
+	Set to ``0`` to disable rate limiting.
+
+	.. versionadded:: 2.19.0
+
+.. confval:: github_issue_title_backend
+	:type: :class:`str`
+	:default: ``'html'``
+
+	The backend used to fetch the titles of issues and pull requests.
+	One of ``'html'``, ``'rest'`` or ``'graphql'``,
+	or a subclass of :class:`~sphinx_toolbox.github.title_backends.IssueTitleBackend`.
+	See :mod:`sphinx_toolbox.github.title_backends` for details.
+
+	.. versionadded:: 2.19.0
+
+.. confval:: github_api_url
+	:type: :class:`str`
+	:default: ``'https://api.github.com'``
+
+	The base URL of the GitHub API, used by the ``'rest'`` and ``'graphql'`` issue title backends.
+
+	.. versionadded:: 2.19.0
+
+.. confval:: github_issue_title_ttl
+	:type: :class:`int`
+	:default: ``4``
+
+	The number of hours after which the stored titles of open issues and pull requests are fetched again.
+	The titles of closed issues and merged pull requests never expire.
+
+	.. versionadded:: 2.19.0
+
+.. confval:: github_issue_title_store
+	:type: :class:`str`
+	:default: :py:obj:`None`
+
+	The filename of the database in which to store issue and pull request titles, relative to ``conf.py``.
+	Defaults to a database in the ``sphinx-toolbox`` cache directory, which is shared between projects.
+
+	.. versionadded:: 2.19.0
+
+.. confval:: toolbox_offline
+	:type: :class:`bool`
+	:default: :py:obj:`False`
+
+	Build without making any network requests.
+	The titles of issues and pull requests are then read from the :confval:`toolbox_offline_snapshot`.
+
+	Offline mode can also be enabled by setting the ``SPHINX_TOOLBOX_OFFLINE`` environment variable to ``1``.
+
+	.. versionadded:: 2.19.0
+
+.. confval:: toolbox_offline_snapshot
+	:type: :class:`str`
+	:default: :py:obj:`None`
+
+	The filename of a snapshot of issue and pull request titles to use in offline mode, relative to ``conf.py``.
+
+	Snapshots can be created on a machine with network access after building the documentation:
+
+	.. prompt:: bash
+
+		python3 -m sphinx_toolbox snapshot _build/doctrees --output issue_titles.json
+
+	.. versionadded:: 2.19.0
+
+.. confval:: toolbox_cache_backend
+	:type: :class:`str`
+	:default: ``'filesystem'``
+
+	Where to cache the responses to requests made by ``sphinx-toolbox``, such as those fetching issue titles.
+	One of:
+
+	* ``'filesystem'`` -- one file per response, in a directory which can be shared by concurrent builds.
+	* ``'sqlite'`` -- a SQLite database, with the responses compressed.
+	* ``'memory'`` -- in memory, for the duration of the build.
+
+	Only the parts of the responses which ``sphinx-toolbox`` uses are stored.
+
+	.. versionadded:: 2.19.0
+
+.. confval:: toolbox_cache_dir
+	:type: :class:`str`
+	:default: :py:obj:`None`
+
+	The directory to cache responses in, relative to ``conf.py``,
+	which also contains the default :confval:`github_issue_title_store`.
+	Defaults to the value of the ``SPHINX_TOOLBOX_CACHE_DIR`` environment variable, if set,
+	or else the user's cache directory.
+
+	.. versionadded:: 2.19.0
+
+.. confval:: toolbox_cache_max_size
+	:type: :class:`int`
+	:default: ``52428800`` (50 MiB)
+
+	The maximum total size of the cached responses, in bytes.
+	The least recently used responses are evicted once the cache exceeds this size.
+
+	The cache can be inspected and shrunk with:
+
+	.. prompt:: bash
+
+		python3 -m sphinx_toolbox stats --backend sqlite
+		python3 -m sphinx_toolbox vacuum --backend sqlite
+
+	.. versionadded:: 2.19.0
+
 
 Usage
 ------
@@ -125,12 +246,29 @@ Caching
 
 HTTP requests to obtain issue/pull request titles are cached for four hours.
 
+The titles themselves are kept in a persistent store (see :mod:`sphinx_toolbox.github.title_store`)
+so they need not be requested again on subsequent builds.
+The titles of closed issues and merged pull requests are kept indefinitely,
+while those of open issues are refreshed after :confval:`github_issue_title_ttl` hours.
+
+The titles of all issues and pull requests referenced in the documents being written
+are fetched concurrently once the documents have been read,
+rather than one at a time as each page is written.
+
 To clear the cache manually, run:
 
 .. prompt:: bash
 
 	python3 -m sphinx_toolbox
 
+The store of issue titles can be examined and maintained with the following commands:
+
+.. prompt:: bash
+
+	python3 -m sphinx_toolbox inspect [REPO]
+	python3 -m sphinx_toolbox prune [--ttl HOURS]
+	python3 -m sphinx_toolbox export [--output FILENAME]
+
 
 
 API Reference
@@ -179,20 +317,28 @@ a :exc:`~.MissingOptionError` will be raised.
 #  OR OTHER DEALINGS IN THE SOFTWARE.
 #
 
+# stdlib
+import os
+
 # 3rd party
 from sphinx.application import Sphinx
 from sphinx.domains import Domain
 from sphinx.environment import BuildEnvironment
 
 # this package
-from sphinx_toolbox.config import MissingOptionError, ToolboxConfig
+from sphinx_toolbox.cache import CACHE_BACKENDS, DEFAULT_CACHE_MAX_SIZE, configure_cache, set_offline
+from sphinx_toolbox.config import InvalidOptionError, MissingOptionError, ToolboxConfig
 from sphinx_toolbox.github.issues import (
 		IssueNode,
 		_depart_issue_node_latex,
 		_visit_issue_node_latex,
+		collect_issue_urls,
 		depart_issue_node,
 		issue_role,
+		merge_issue_urls,
+		prefetch_issue_titles,
 		pull_role,
+		purge_issue_urls,
 		visit_issue_node
 		)
 from sphinx_toolbox.github.repos_and_users import (
@@ -204,6 +350,7 @@ from sphinx_toolbox.github.repos_and_users import (
 		user_role,
 		visit_github_object_link_node
 		)
+from sphinx_toolbox.github.title_backends import IssueTitleBackend
 from sphinx_toolbox.utils import SphinxExtMetadata, make_github_url, metadata_add_version
 
 _ = BuildEnvironment
@@ -227,6 +374,39 @@ class GitHubDomain(Domain):
 			}
 
 
+def _configure_cache(app: Sphinx, config: ToolboxConfig):
+	"""
+	Configure the HTTP cache in accordance with :confval:`toolbox_cache_backend`,
+	:confval:`toolbox_cache_dir` and :confval:`toolbox_cache_max_size`.
+
+	:param app: The Sphinx application.
+	:param config:
+	:type config: :class:`~sphinx.config.Config`
+	"""  # noqa: D400
+
+	if config.toolbox_cache_backend not in CACHE_BACKENDS:
+		raise InvalidOptionError(f"Unknown cache backend {config.toolbox_cache_backend!r}.")
+
+	if config.toolbox_cache_dir:
+		cache_dir = os.path.join(app.confdir, config.toolbox_cache_dir)
+	else:
+		cache_dir = None
+
+	configure_cache(config.toolbox_cache_backend, cache_dir, config.toolbox_cache_max_size)
+
+
+def _configure_offline_mode(app: Sphinx, config: ToolboxConfig):
+	"""
+	Enable or disable offline mode in accordance with :confval:`toolbox_offline`.
+
+	:param app: The Sphinx application.
+	:param config:
+	:type config: :class:`~sphinx.config.Config`
+	"""
+
+	set_offline(config.toolbox_offline)
+
+
 def validate_config(app: Sphinx, config: ToolboxConfig):
 	"""
 	Validate the provided configuration values.
@@ -265,11 +445,30 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	"""
 
 	app.connect("config-inited", validate_config, priority=850)
+	app.connect("config-inited", _configure_cache)
+	app.connect("config-inited", _configure_offline_mode)
 
 	app.add_config_value("github_username", None, "env", types=[str])
 	app.add_config_value("github_repository", None, "env", types=[str])
+	app.add_config_value("github_issue_title_workers", 8, '', types=[int])
+	app.add_config_value("github_issue_title_rate_limit", 5, '', types=[int, float])
+	app.add_config_value("github_issue_title_ttl", 4, '', types=[int, float])
+	app.add_config_value("github_issue_title_backend", "html", '', types=[str, type, IssueTitleBackend])
+	app.add_config_value("github_api_url", "https://api.github.com", '', types=[str])
+	app.add_config_value("toolbox_offline", False, '', types=[bool])
+	app.add_config_value("toolbox_offline_snapshot", None, '', types=[str, None])
+	app.add_config_value("github_issue_title_store", None, '', types=[str, None])
+	app.add_config_value("toolbox_cache_backend", "filesystem", '', types=[str])
+	app.add_config_value("toolbox_cache_dir", None, '', types=[str, None])
+	app.add_config_value("toolbox_cache_max_size", DEFAULT_CACHE_MAX_SIZE, '', types=[int])
 	app.add_domain(GitHubDomain)
 
+	# Fetch issue titles concurrently before the write phase
+	app.connect("doctree-read", collect_issue_urls)
+	app.connect("env-purge-doc", purge_issue_urls)
+	app.connect("env-merge-info", merge_issue_urls)
+	app.connect("env-updated", prefetch_issue_titles)
+
 	# Custom node for issues and PRs
 	app.add_node(
 			IssueNode,
@@ -282,4 +481,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 			latex=(_visit_github_object_link_node_latex, _depart_github_object_link_node_latex)
 			)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -34,21 +34,26 @@ Roles and nodes for GitHub issues and Pull Requests.
 
 # stdlib
 import warnings
-from typing import Any, Dict, List, Optional, Tuple, Union
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 # 3rd party
-import requests  # nodep
 from apeye.url import URL
-from bs4 import BeautifulSoup  # type: ignore
 from docutils import nodes
 from docutils.nodes import system_message
 from docutils.parsers.rst.states import Inliner
+from domdf_python_tools.paths import PathPlus
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx.util import logging
 from sphinx.util.nodes import split_explicit_title
 from sphinx.writers.html import HTMLTranslator
 from sphinx.writers.latex import LaTeXTranslator
 
 # this package
-from sphinx_toolbox.cache import cache
+from sphinx_toolbox.cache import is_offline
+from sphinx_toolbox.github.title_backends import IssueInfo, IssueTitleBackend, _get_issue, get_issue_title_backend
+from sphinx_toolbox.github.title_store import IssueTitleStore, issue_key, read_snapshot
 from sphinx_toolbox.utils import make_github_url
 
 __all__ = [
@@ -59,8 +64,14 @@ __all__ = [
 		"visit_issue_node",
 		"depart_issue_node",
 		"get_issue_title",
+		"collect_issue_urls",
+		"purge_issue_urls",
+		"merge_issue_urls",
+		"prefetch_issue_titles",
 		]
 
+logger = logging.getLogger(__name__)
+
 
 class IssueNode(nodes.reference):
 	"""
@@ -258,11 +269,22 @@ def visit_issue_node(translator: HTMLTranslator, node: IssueNode):
 	If the node points to a valid issue / pull request,
 	add a tooltip giving the title of the issue / pull request and a hyperlink to the page on GitHub.
 
+	.. versionchanged:: 2.19.0
+
+		The title is taken from the titles fetched by :func:`~.prefetch_issue_titles`,
+		and is only fetched while writing if the titles weren't prefetched.
+
 	:param translator:
 	:param node: The node being visited.
 	"""
 
-	issue_title = get_issue_title(node.issue_url)
+	issue_titles = getattr(getattr(translator, "builder", None), "github_issue_titles", None)
+
+	if issue_titles is None:
+		issue_title = get_issue_title(node.issue_url)
+	else:
+		# Never make requests while writing, as the write phase may be split across processes.
+		issue_title = issue_titles.get(node.issue_url)
 
 	if issue_title:
 		node.has_tooltip = True
@@ -316,16 +338,231 @@ def get_issue_title(issue_url: str) -> Optional[str]:
 	Returns the title of the issue with the given url,
 	or :py:obj:`None` if the issue isn't found.
 
+	.. versionchanged:: 2.19.0
+
+		Returns :py:obj:`None` without making a request in offline mode.
+
 	:param issue_url:
 	"""  # noqa: D400
 
-	try:
-		r = cache.session.get(issue_url, timeout=30)
-	except requests.exceptions.RequestException:
+	if is_offline():
+		return None
+
+	# this package
+	from sphinx_toolbox.cache import cache
+
+	issue = _get_issue(cache.session, issue_url)
+
+	if issue is None:
 		return None
 
-	if r.status_code == 200:
-		soup = BeautifulSoup(r.content, "html5lib")
-		return soup.find_all("span", attrs={"class": "js-issue-title"})[0].contents[0].strip().strip()
+	return issue.title
+
+
+def collect_issue_urls(app: Sphinx, doctree: nodes.document) -> None:
+	"""
+	Record the URLs of the issues and pull requests referenced in a document,
+	so their titles can be fetched ahead of the write phase.
+
+	This function is connected to the :event:`doctree-read` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	:param doctree:
+	"""  # noqa: D400
+
+	env = app.env
+
+	if not hasattr(env, "github_issue_urls"):
+		env.github_issue_urls = {}  # type: ignore[attr-defined]
+
+	urls = {node.issue_url for node in doctree.traverse(IssueNode)}
+
+	if urls:
+		env.github_issue_urls[env.docname] = urls  # type: ignore[attr-defined]
+
+
+def purge_issue_urls(app: Sphinx, env: BuildEnvironment, docname: str) -> None:
+	"""
+	Forget the issue URLs recorded for the given document.
+
+	This function is connected to the :event:`env-purge-doc` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	:param env: The Sphinx build environment.
+	:param docname: The name of the document to remove URLs for.
+	"""
+
+	if hasattr(env, "github_issue_urls"):
+		env.github_issue_urls.pop(docname, None)  # type: ignore[attr-defined]
+
+
+def merge_issue_urls(
+		app: Sphinx,
+		env: BuildEnvironment,
+		docnames: Set[str],
+		other: BuildEnvironment,
+		) -> None:
+	"""
+	Merge the issue URLs recorded by a parallel reader process into the main build environment.
+
+	This function is connected to the :event:`env-merge-info` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	:param env: The main Sphinx build environment.
+	:param docnames: The names of the documents read by the other process.
+	:param other: The build environment from the other process.
+	"""
+
+	if not hasattr(env, "github_issue_urls"):
+		env.github_issue_urls = {}  # type: ignore[attr-defined]
+
+	other_urls = getattr(other, "github_issue_urls", {})
+
+	for docname in docnames:
+		if docname in other_urls:
+			env.github_issue_urls[docname] = other_urls[docname]  # type: ignore[attr-defined]
+
+
+def prefetch_issue_titles(app: Sphinx, env: BuildEnvironment) -> None:
+	"""
+	Fetch the titles of all issues and pull requests referenced in the project, ahead of the write phase.
+
+	Titles are fetched for every document, not only those which are outdated,
+	as Sphinx may write other documents too, and the write phase may be split across processes.
+	Titles are read from the :class:`~.IssueTitleStore` where possible.
+	The remaining titles are requested from the :confval:`github_issue_title_backend`,
+	with up to :confval:`github_issue_title_workers` requests in flight at once
+	and no more than :confval:`github_issue_title_rate_limit` requests per second to each host,
+	and then added to the store.
+	The titles are stored on the builder, where :func:`~.visit_issue_node` looks them up.
+
+	In offline mode (see :confval:`toolbox_offline`) the titles are instead read from
+	the :confval:`toolbox_offline_snapshot`, and no requests are made.
+
+	This function is connected to the :event:`env-updated` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	:param env: The Sphinx build environment.
+	"""
+
+	if app.builder.format != "html":
+		return
+
+	all_issue_urls: Dict[str, Set[str]] = getattr(env, "github_issue_urls", {})
+	if not all_issue_urls:
+		return
+
+	issue_titles: Dict[str, Optional[str]] = getattr(app.builder, "github_issue_titles", {})
+	app.builder.github_issue_titles = issue_titles  # type: ignore[attr-defined]
+
+	issue_urls = set().union(*all_issue_urls.values()).difference(issue_titles)
+
+	if is_offline():
+		_read_offline_titles(app, issue_urls, issue_titles)
+		return
+
+	if not issue_urls:
+		return
+
+	with IssueTitleStore(_get_store_path(app)) as store:
+		issues = _resolve_issues(
+				issue_urls,
+				store,
+				get_issue_title_backend(app),
+				timedelta(hours=app.config.github_issue_title_ttl),
+				)
+
+	for issue_url, issue in issues.items():
+		issue_titles[issue_url] = None if issue is None else issue.title
+
+
+def _resolve_issues(
+		issue_urls: Iterable[str],
+		store: IssueTitleStore,
+		backend: IssueTitleBackend,
+		ttl: timedelta,
+		) -> Dict[str, Optional[IssueInfo]]:
+	"""
+	Returns the titles and states of the given issues,
+	reading them from the store where possible and otherwise fetching them with the given backend.
+
+	:param issue_urls:
+	:param store:
+	:param backend:
+	:param ttl: The maximum age of stored titles for issues which are not closed.
+	"""  # noqa: D400
+
+	issues: Dict[str, Optional[IssueInfo]] = {}
+	to_fetch = []
+
+	for issue_url in sorted(issue_urls):
+		entry = store.get(issue_url)
+		if entry is not None and not entry.is_expired(ttl):
+			issues[issue_url] = IssueInfo(entry.title, entry.state)
+		else:
+			to_fetch.append(issue_url)
+
+	if to_fetch:
+		logger.info(f"fetching titles for {len(to_fetch)} GitHub issues and pull requests... ", nonl=True)
+
+		fetched = backend.fetch(to_fetch)
+
+		for issue_url in to_fetch:
+			issue = issues[issue_url] = fetched.get(issue_url)
+			if issue is not None:
+				store.set(issue_url, issue.title, issue.state)
+
+		logger.info("done")
+
+	return issues
+
+
+def _read_offline_titles(app: Sphinx, issue_urls: Set[str], issue_titles: Dict[str, Optional[str]]) -> None:
+	"""
+	Read the titles of the given issues from the :confval:`toolbox_offline_snapshot` into ``issue_titles``.
+
+	:param app: The Sphinx application.
+	:param issue_urls:
+	:param issue_titles:
+	"""
+
+	if app.config.toolbox_offline_snapshot:
+		snapshot = read_snapshot(PathPlus(app.confdir) / app.config.toolbox_offline_snapshot)
+	else:
+		snapshot = {}
+
+	missing = 0
+
+	for issue_url in issue_urls:
+		entry = snapshot.get(issue_key(issue_url))
+		if entry is None:
+			issue_titles[issue_url] = None
+			missing += 1
+		else:
+			issue_titles[issue_url] = entry.title
+
+	logger.info(
+			f"offline mode: read {len(issue_urls) - missing} of {len(issue_urls)} "
+			f"GitHub issue and pull request titles from the snapshot ({missing} missing)"
+			)
+
+
+def _get_store_path(app: Sphinx) -> Optional[PathPlus]:
+	"""
+	Returns the location of the :class:`~.IssueTitleStore` configured with :confval:`github_issue_title_store`.
+
+	:param app: The Sphinx application.
+	"""
+
+	if not app.config.github_issue_title_store:
+		return None
 
-	return None
+	return PathPlus(app.confdir) / app.config.github_issue_title_store
@@ -33,7 +33,6 @@ from typing import Any, Dict, List, Tuple, Union
 
 # 3rd party
 from apeye.url import URL
-from bs4 import BeautifulSoup  # type: ignore
 from docutils import nodes
 from docutils.nodes import system_message
 from docutils.parsers.rst.states import Inliner
@@ -42,7 +41,7 @@ from sphinx.writers.html import HTMLTranslator
 from sphinx.writers.latex import LaTeXTranslator
 
 # this package
-from sphinx_toolbox.utils import GITHUB_COM, make_github_url
+from sphinx_toolbox.utils import _get_github_com, make_github_url
 
 __all__ = [
 		"GitHubObjectLinkNode",
@@ -180,13 +179,13 @@ def user_role(
 		refnode = nodes.reference(
 				text,
 				text,
-				refuri=str(GITHUB_COM / username),
+				refuri=str(_get_github_com() / username),
 				)
 
 	else:
 		refnode = GitHubObjectLinkNode(
 				name=f"@{username}",
-				refuri=GITHUB_COM / username,
+				refuri=_get_github_com() / username,
 				)
 
 	return [refnode], messages
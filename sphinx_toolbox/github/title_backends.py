@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+#
+#  title_backends.py
+"""
+Backends for fetching the titles of GitHub issues and pull requests.
+
+.. versionadded:: 2.19.0
+
+The backend is selected with the :confval:`github_issue_title_backend` configuration value.
+The following backends are available:
+
+* ``'html'`` (:class:`~.HTMLBackend`) -- scrapes the title from the issue's page on GitHub. This is the default.
+* ``'rest'`` (:class:`~.RESTBackend`) -- uses the GitHub REST API, with conditional requests.
+* ``'graphql'`` (:class:`~.GraphQLBackend`) -- uses the GitHub GraphQL API,
+  fetching up to 100 titles per repository in each request.
+
+The API backends authenticate with the token in the ``GITHUB_TOKEN`` environment variable, if set.
+The GraphQL API always requires a token.
+"""
+#
+#  Copyright © 2022 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+#  MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+#  IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+#  DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+#  OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+# stdlib
+import abc
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+		TYPE_CHECKING,
+		Callable,
+		Dict,
+		Iterable,
+		List,
+		NamedTuple,
+		Optional,
+		Tuple,
+		Type,
+		TypeVar,
+		Union
+		)
+
+# 3rd party
+from apeye.url import URL
+from sphinx.application import Sphinx
+
+# this package
+from sphinx_toolbox.cache import is_offline
+from sphinx_toolbox.config import InvalidOptionError
+
+if TYPE_CHECKING:
+	# 3rd party
+	import requests  # nodep
+	from apeye.rate_limiter import RateLimitAdapter
+
+__all__ = [
+		"IssueInfo",
+		"IssueTitleBackend",
+		"HTMLBackend",
+		"RESTBackend",
+		"GraphQLBackend",
+		"issue_title_backends",
+		"get_issue_title_backend",
+		]
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+class IssueInfo(NamedTuple):
+	"""
+	The title and state of a GitHub issue or pull request.
+	"""
+
+	#: The title of the issue or pull request.
+	title: str
+
+	#: The state of the issue or pull request, e.g. ``'open'``, ``'closed'`` or ``'merged'``, if known.
+	state: Optional[str] = None
+
+
+class _HostRateLimiter:
+	"""
+	Thread-safe rate limiter allowing no more than ``rate`` requests per second to each host.
+
+	:param rate: The maximum number of requests per second. ``0`` disables rate limiting.
+	"""
+
+	def __init__(self, rate: float):
+		self.min_interval = 1 / rate if rate > 0 else 0.0
+		self._lock = threading.Lock()
+		self._next_slot: Dict[str, float] = {}
+
+	def wait(self, url: str) -> None:
+		"""
+		Block until a request may be made to the host of the given URL.
+
+		:param url:
+		"""
+
+		if not self.min_interval:
+			return
+
+		host = URL(url).netloc
+
+		with self._lock:
+			now = time.monotonic()
+			slot = max(now, self._next_slot.get(host, now))
+			self._next_slot[host] = slot + self.min_interval
+
+		if slot > now:
+			time.sleep(slot - now)
+
+
+@functools.lru_cache(1)
+def _host_rate_limit_adapter() -> Type["RateLimitAdapter"]:
+	"""
+	Returns the :class:`~._HostRateLimitAdapter` class.
+
+	The class is created on first use,
+	as :mod:`apeye.rate_limiter` imports :mod:`requests` and :mod:`cachecontrol`.
+	"""
+
+	# 3rd party
+	from apeye.rate_limiter import RateLimitAdapter
+	from cachecontrol import CacheControlAdapter  # nodep
+
+	class _HostRateLimitAdapter(RateLimitAdapter):
+		"""
+		Variant of :class:`apeye.rate_limiter.RateLimitAdapter` which limits the rate of requests per host,
+		rather than globally, so requests can be made from several threads at once.
+
+		Responses served from the cache are not rate limited.
+		"""  # noqa: D400
+
+		def __init__(self, limiter: _HostRateLimiter, **kwargs):
+			super().__init__(**kwargs)
+			self.limiter = limiter
+
+		def rate_limited_send(  # type: ignore[override]
+				self,
+				request: "requests.PreparedRequest",
+				**kwargs,
+				) -> "requests.Response":
+			self.limiter.wait(request.url or '')
+			return super(CacheControlAdapter, self).send(request, **kwargs)  # lgtm [py/super-not-enclosing-class]
+
+	return _HostRateLimitAdapter
+
+
+def _make_session(rate_limit: float, pool_size: int) -> "requests.Session":
+	"""
+	Returns a session which shares the cache backend, expiry and serializer of :data:`sphinx_toolbox.cache.cache`,
+	but applies a per-host rate limit which is safe to use from multiple threads.
+
+	:param rate_limit: The maximum number of requests per second to each host.
+	:param pool_size: The number of connections to keep open to each host.
+	"""  # noqa: D400
+
+	# 3rd party
+	import requests  # nodep
+
+	# this package
+	from sphinx_toolbox.cache import OfflineAdapter, cache
+
+	session = requests.Session()
+
+	if is_offline():
+		session.mount("http://", OfflineAdapter())
+		session.mount("https://", OfflineAdapter())
+		return session
+
+	cache_adapter = cache.session.get_adapter("https://")
+	adapter = _host_rate_limit_adapter()(
+			_HostRateLimiter(rate_limit),
+			cache=cache_adapter.cache,
+			heuristic=cache_adapter.heuristic,
+			serializer=cache_adapter.controller.serializer,
+			pool_connections=pool_size,
+			pool_maxsize=pool_size,
+			)
+
+	session.mount("http://", adapter)
+	session.mount("https://", adapter)
+	return session
+
+
+def _get_issue(session: "requests.Session", issue_url: str) -> Optional[IssueInfo]:
+	"""
+	Returns the title and state of the issue with the given url,
+	or :py:obj:`None` if the issue isn't found or its title can't be found in the page.
+
+	:param session:
+	:param issue_url:
+	"""  # noqa: D400
+
+	# 3rd party
+	import requests  # nodep
+	from bs4 import BeautifulSoup  # type: ignore
+
+	try:
+		r = session.get(issue_url, timeout=30)
+	except requests.exceptions.RequestException:
+		return None
+
+	if r.status_code == 200:
+		soup = BeautifulSoup(r.content, "html5lib")
+
+		# e.g. a login page, or a redesign of the issue page.
+		title_span = soup.find("span", attrs={"class": "js-issue-title"})
+		if title_span is None:
+			return None
+
+		title = title_span.get_text().strip()
+
+		state_span = soup.find("span", attrs={"class": "State"})
+		if state_span is None:
+			return IssueInfo(title)
+
+		return IssueInfo(title, state_span.get_text().strip().lower())
+
+	return None
+
+
+def _split_issue_url(issue_url: str) -> Tuple[str, str, int]:
+	"""
+	Returns the repository owner, repository name and issue number for the given issue or pull request URL.
+
+	:param issue_url:
+	"""
+
+	*_, owner, name, _, number = URL(issue_url).path.parts
+	return owner, name, int(number)
+
+
+class IssueTitleBackend(abc.ABC):
+	"""
+	Base class for backends which fetch the titles of GitHub issues and pull requests.
+
+	Subclasses must implement :meth:`~.IssueTitleBackend.fetch`.
+
+	:param max_workers: The maximum number of concurrent requests.
+	:param rate_limit: The maximum number of requests per second to each host. ``0`` disables rate limiting.
+	:param api_url: The base URL of the GitHub API.
+	:param token: The token to authenticate with.
+		Defaults to the value of the ``GITHUB_TOKEN`` environment variable, if set.
+	"""
+
+	#: The environment variable to read the authentication token from.
+	token_env_var: str = "GITHUB_TOKEN"
+
+	def __init__(
+			self,
+			max_workers: int = 8,
+			rate_limit: float = 5,
+			api_url: Union[str, URL] = "https://api.github.com",
+			token: Optional[str] = None,
+			):
+		self.max_workers = max(1, int(max_workers))
+		self.rate_limit = rate_limit
+		self.api_url = URL(api_url)
+		self.token = token or os.environ.get(self.token_env_var) or None
+
+	def __repr__(self) -> str:
+		return f"{self.__class__.__name__}(max_workers={self.max_workers!r}, api_url={str(self.api_url)!r})"
+
+	@property
+	def headers(self) -> Dict[str, str]:
+		"""
+		HTTP headers to send with API requests.
+		"""
+
+		if self.token:
+			return {"Authorization": f"bearer {self.token}"}
+		else:
+			return {}
+
+	@abc.abstractmethod
+	def fetch(self, issue_urls: Iterable[str]) -> Dict[str, Optional[IssueInfo]]:
+		"""
+		Fetch the titles and states of the given issues and pull requests.
+
+		:param issue_urls:
+
+		:return: A mapping of issue URLs to their titles and states (or :py:obj:`None` if the issue was not found).
+		"""
+
+		raise NotImplementedError  # pragma: no cover
+
+	def _map(
+			self,
+			session: "requests.Session",
+			func: Callable[["requests.Session", _T], _R],
+			items: List[_T],
+			) -> List[_R]:
+		"""
+		Call ``func`` for each of ``items`` in a pool of up to :attr:`~.max_workers` threads.
+		"""
+
+		with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items)) or 1) as executor:
+			return list(executor.map(lambda item: func(session, item), items))
+
+
+class HTMLBackend(IssueTitleBackend):
+	"""
+	Fetches the titles of issues and pull requests by scraping their pages on GitHub.
+	"""
+
+	def fetch(self, issue_urls: Iterable[str]) -> Dict[str, Optional[IssueInfo]]:  # noqa: D102
+		issue_urls = sorted(issue_urls)
+
+		with _make_session(self.rate_limit, self.max_workers) as session:
+			return dict(zip(issue_urls, self._map(session, _get_issue, issue_urls)))
+
+
+class RESTBackend(IssueTitleBackend):
+	"""
+	Fetches the titles of issues and pull requests with the
+	`GitHub REST API <https://docs.github.com/en/rest/issues/issues#get-an-issue>`_.
+
+	Responses are cached along with their ``ETag`` header,
+	so once a response expires from the cache it is revalidated with an ``If-None-Match`` request.
+	GitHub does not count such requests against the API rate limit if the issue hasn't changed.
+	"""  # noqa: D400
+
+	def fetch(self, issue_urls: Iterable[str]) -> Dict[str, Optional[IssueInfo]]:  # noqa: D102
+		issue_urls = sorted(issue_urls)
+
+		with _make_session(self.rate_limit, self.max_workers) as session:
+			return dict(zip(issue_urls, self._map(session, self._get_issue, issue_urls)))
+
+	def _get_issue(self, session: "requests.Session", issue_url: str) -> Optional[IssueInfo]:
+		owner, name, number = _split_issue_url(issue_url)
+		api_url = self.api_url / "repos" / owner / name / "issues" / str(number)
+
+		# 3rd party
+		import requests  # nodep
+
+		try:
+			r = session.get(str(api_url), headers=self.headers, timeout=30)
+		except requests.exceptions.RequestException:
+			return None
+
+		if r.status_code != 200:
+			return None
+
+		try:
+			issue = r.json()
+			state = issue.get("state")
+
+			if (issue.get("pull_request") or {}).get("merged_at"):
+				state = "merged"
+
+			return IssueInfo(issue["title"], state)
+		except (ValueError, KeyError, TypeError, AttributeError):
+			# The response isn't an issue, e.g. it was served by a proxy or captive portal.
+			return None
+
+
+class GraphQLBackend(IssueTitleBackend):
+	"""
+	Fetches the titles of issues and pull requests with the
+	`GitHub GraphQL API <https://docs.github.com/en/graphql>`_.
+
+	Up to :attr:`~.GraphQLBackend.batch_size` titles are requested from each repository at once,
+	using aliased ``issueOrPullRequest`` fields.
+	"""  # noqa: D400
+
+	#: The maximum number of issues and pull requests to request at once.
+	batch_size: int = 100
+
+	def fetch(self, issue_urls: Iterable[str]) -> Dict[str, Optional[IssueInfo]]:  # noqa: D102
+		repositories: Dict[Tuple[str, str], Dict[int, List[str]]] = defaultdict(lambda: defaultdict(list))
+
+		for issue_url in sorted(issue_urls):
+			owner, name, number = _split_issue_url(issue_url)
+			repositories[(owner, name)][number].append(issue_url)
+
+		batches = []
+		for (owner, name), issues in repositories.items():
+			numbers = sorted(issues)
+			for idx in range(0, len(numbers), self.batch_size):
+				batches.append((owner, name, numbers[idx:idx + self.batch_size]))
+
+		results: Dict[str, Optional[IssueInfo]] = {}
+
+		with _make_session(self.rate_limit, self.max_workers) as session:
+			for (owner, name, _), batch_results in zip(batches, self._map(session, self._get_batch, batches)):
+				for number, info in batch_results.items():
+					for issue_url in repositories[(owner, name)][number]:
+						results[issue_url] = info
+
+		return results
+
+	@staticmethod
+	def _make_query(owner: str, name: str, numbers: Iterable[int]) -> str:
+		fields = ' '.join(
+				f"i{number}: issueOrPullRequest(number: {number:d}) "
+				"{ ... on Issue { title state } ... on PullRequest { title state } }" for number in numbers
+				)
+
+		return f"query {{ repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ {fields} }} }}"
+
+	def _get_batch(
+			self,
+			session: "requests.Session",
+			batch: Tuple[str, str, List[int]],
+			) -> Dict[int, Optional[IssueInfo]]:
+		owner, name, numbers = batch
+		results: Dict[int, Optional[IssueInfo]] = dict.fromkeys(numbers)
+
+		# 3rd party
+		import requests  # nodep
+
+		try:
+			r = session.post(
+					str(self.api_url / "graphql"),
+					json={"query": self._make_query(owner, name, numbers)},
+					headers=self.headers,
+					timeout=30,
+					)
+		except requests.exceptions.RequestException:
+			return results
+
+		if r.status_code != 200:
+			return results
+
+		try:
+			repository = (r.json().get("data") or {}).get("repository") or {}
+		except (ValueError, AttributeError):
+			return results
+
+		for number in numbers:
+			try:
+				issue = repository.get(f"i{number}")
+				if issue:
+					results[number] = IssueInfo(issue["title"], issue["state"].lower())
+			except (KeyError, TypeError, AttributeError):
+				continue
+
+		return results
+
+
+#: Mapping of backend names, for :confval:`github_issue_title_backend`, to backend classes.
+issue_title_backends: Dict[str, Type[IssueTitleBackend]] = {
+		"html": HTMLBackend,
+		"rest": RESTBackend,
+		"graphql": GraphQLBackend,
+		}
+
+
+def get_issue_title_backend(app: Sphinx) -> IssueTitleBackend:
+	"""
+	Returns the backend configured with :confval:`github_issue_title_backend`.
+
+	:param app: The Sphinx application.
+
+	:raises: :exc:`~.InvalidOptionError` if the backend is unknown.
+	"""
+
+	backend = app.config.github_issue_title_backend
+
+	if isinstance(backend, IssueTitleBackend):
+		return backend
+
+	if isinstance(backend, str):
+		if backend.lower() not in issue_title_backends:
+			raise InvalidOptionError(f"Unknown issue title backend {backend!r}.")
+		backend = issue_title_backends[backend.lower()]
+
+	if not (isinstance(backend, type) and issubclass(backend, IssueTitleBackend)):
+		raise InvalidOptionError(f"Invalid issue title backend {backend!r}.")
+
+	return backend(
+			max_workers=app.config.github_issue_title_workers,
+			rate_limit=app.config.github_issue_title_rate_limit,
+			api_url=app.config.github_api_url,
+			)
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+#
+#  title_store.py
+"""
+Persistent store for the titles of GitHub issues and pull requests.
+
+.. versionadded:: 2.19.0
+
+Titles are kept in a SQLite database alongside the HTTP cache,
+keyed by repository and issue number.
+The titles of closed issues and merged pull requests never expire,
+while those of open issues are refreshed once they are older than :confval:`github_issue_title_ttl`.
+"""
+#
+#  Copyright © 2022 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+#  MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+#  IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+#  DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+#  OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+# stdlib
+import json
+import os
+import sqlite3
+import time
+from datetime import timedelta
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# 3rd party
+from apeye.url import URL
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+__all__ = [
+		"FINAL_STATES",
+		"IssueTitleEntry",
+		"IssueTitleStore",
+		"default_store_path",
+		"issue_key",
+		"read_snapshot",
+		"write_snapshot",
+		]
+
+#: Issue states for which the title is considered final, and so never expires.
+FINAL_STATES = frozenset({"closed", "merged"})
+
+
+class IssueTitleEntry(NamedTuple):
+	"""
+	An entry in the :class:`~.IssueTitleStore`.
+	"""
+
+	#: The repository the issue belongs to, e.g. ``'sphinx-toolbox/sphinx-toolbox'``.
+	repo: str
+
+	#: The number of the issue or pull request.
+	number: int
+
+	#: The title of the issue or pull request.
+	title: str
+
+	#: The state of the issue or pull request, e.g. ``'open'`` or ``'closed'``, if known.
+	state: Optional[str]
+
+	#: The time the title was fetched, in seconds since the epoch.
+	fetched: float
+
+	def is_expired(self, ttl: timedelta, now: Optional[float] = None) -> bool:
+		"""
+		Returns whether the entry should be fetched again.
+
+		:param ttl: The maximum age of entries for issues which are not closed.
+		:param now: The current time, in seconds since the epoch. Defaults to :func:`time.time`.
+		"""
+
+		if self.state in FINAL_STATES:
+			return False
+
+		if now is None:
+			now = time.time()
+
+		return now - self.fetched > ttl.total_seconds()
+
+
+def default_store_path() -> PathPlus:
+	"""
+	Returns the default location of the issue title store, in the ``sphinx-toolbox`` cache directory.
+	"""
+
+	# this package
+	from sphinx_toolbox.cache import cache
+
+	return cache.cache_dir / "issue_titles.sqlite"
+
+
+def issue_key(issue_url: str) -> Tuple[str, int]:
+	"""
+	Returns the repository and issue number for the given issue or pull request URL.
+
+	The repository is given as ``owner/name`` for repositories on GitHub.com,
+	and includes the host for those elsewhere.
+
+	:param issue_url:
+	"""
+
+	url = URL(issue_url)
+	repo = url.parent.parent
+
+	if repo.netloc == "github.com":
+		return str(repo.path).strip('/'), int(url.name)
+	else:
+		return f"{repo.netloc}{repo.path}".rstrip('/'), int(url.name)
+
+
+class IssueTitleStore:
+	"""
+	SQLite-backed store for the titles of GitHub issues and pull requests.
+
+	:param path: The filename of the database. Defaults to :func:`~.default_store_path`.
+	"""
+
+	def __init__(self, path: Optional[PathLike] = None):
+		if path is None:
+			path = default_store_path()
+
+		self.path = PathPlus(path)
+		self.path.parent.maybe_make(parents=True)
+
+		self._connection = sqlite3.connect(os.fspath(self.path))
+		self._connection.execute(
+				"CREATE TABLE IF NOT EXISTS issue_titles ("
+				"repo TEXT NOT NULL, number INTEGER NOT NULL, title TEXT NOT NULL, state TEXT, fetched REAL NOT NULL, "
+				"PRIMARY KEY (repo, number))"
+				)
+
+	def __repr__(self) -> str:
+		return f"{self.__class__.__name__}({self.path.as_posix()!r})"
+
+	def __enter__(self) -> "IssueTitleStore":
+		return self
+
+	def __exit__(self, *args) -> None:
+		self.close()
+
+	def __len__(self) -> int:
+		return self._connection.execute("SELECT COUNT(*) FROM issue_titles").fetchone()[0]
+
+	def close(self) -> None:
+		"""
+		Close the underlying database connection.
+		"""
+
+		self._connection.close()
+
+	def get(self, issue_url: str) -> Optional[IssueTitleEntry]:
+		"""
+		Returns the entry for the given issue or pull request, or :py:obj:`None` if it is not in the store.
+
+		:param issue_url:
+		"""
+
+		row = self._connection.execute(
+				"SELECT repo, number, title, state, fetched FROM issue_titles WHERE repo = ? AND number = ?",
+				issue_key(issue_url),
+				).fetchone()
+
+		if row is None:
+			return None
+
+		return IssueTitleEntry(*row)
+
+	def set(self, issue_url: str, title: str, state: Optional[str] = None) -> None:  # noqa: A003  # pylint: disable=redefined-builtin
+		"""
+		Store the title of the given issue or pull request.
+
+		:param issue_url:
+		:param title:
+		:param state: The state of the issue or pull request, e.g. ``'open'`` or ``'closed'``, if known.
+		"""
+
+		with self._connection:
+			self._connection.execute(
+					"INSERT OR REPLACE INTO issue_titles VALUES (?, ?, ?, ?, ?)",
+					(*issue_key(issue_url), title, state, time.time()),
+					)
+
+	def entries(self, repo: Optional[str] = None) -> Iterator[IssueTitleEntry]:
+		"""
+		Iterate over the entries in the store.
+
+		:param repo: If given, only return entries for this repository.
+		"""
+
+		query = "SELECT repo, number, title, state, fetched FROM issue_titles"
+
+		if repo is None:
+			rows = self._connection.execute(f"{query} ORDER BY repo, number")
+		else:
+			rows = self._connection.execute(f"{query} WHERE repo = ? ORDER BY number", (repo, ))
+
+		for row in rows:
+			yield IssueTitleEntry(*row)
+
+	def prune(self, ttl: timedelta, repo: Optional[str] = None) -> int:
+		"""
+		Remove expired entries from the store.
+
+		:param ttl: The maximum age of entries for issues which are not closed.
+			Use ``timedelta(0)`` to remove all such entries.
+		:param repo: If given, only remove entries for this repository.
+
+		:returns: The number of entries removed.
+		"""
+
+		now = time.time()
+		expired: List[Tuple[str, int]] = [
+				(entry.repo, entry.number) for entry in self.entries(repo) if entry.is_expired(ttl, now)
+				]
+
+		with self._connection:
+			self._connection.executemany("DELETE FROM issue_titles WHERE repo = ? AND number = ?", expired)
+
+		return len(expired)
+
+
+def write_snapshot(filename: PathLike, entries: Iterable[IssueTitleEntry]) -> None:
+	"""
+	Write a snapshot of issue titles to a JSON file, for use with :confval:`toolbox_offline_snapshot`.
+
+	.. versionadded:: 2.19.0
+
+	:param filename:
+	:param entries:
+	"""
+
+	data = [entry._asdict() for entry in sorted(set(entries))]
+	PathPlus(filename).write_clean(json.dumps(data, indent=2))
+
+
+def read_snapshot(filename: PathLike) -> Dict[Tuple[str, int], IssueTitleEntry]:
+	"""
+	Read a snapshot of issue titles written by :func:`~.write_snapshot`.
+
+	.. versionadded:: 2.19.0
+
+	:param filename:
+
+	:returns: A mapping of repositories and issue numbers (as returned by :func:`~.issue_key`) to their entries.
+	"""
+
+	entries = (IssueTitleEntry(**entry) for entry in json.loads(PathPlus(filename).read_text()))
+	return {(entry.repo, entry.number): entry for entry in entries}
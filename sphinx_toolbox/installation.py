@@ -170,7 +170,6 @@ import warnings
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # 3rd party
-import dict2css
 import sphinx.environment
 from docutils import nodes
 from docutils.parsers.rst import directives
@@ -203,26 +202,12 @@ __all__ = [
 		]
 
 
-class _Purger(Purger):
-
-	def purge_nodes(self, app: Sphinx, env: BuildEnvironment, docname: str) -> None:  # pragma: no cover
-		"""
-		Remove all redundant nodes.
-
-		:param app: The Sphinx application.
-		:param env: The Sphinx build environment.
-		:param docname: The name of the document to remove nodes for.
-		"""
-
-		if not hasattr(env, self.attr_name):
-			return
-
-		setattr(env, self.attr_name, [])
-
-
-installation_node_purger = _Purger("all_installation_node_nodes")
+installation_node_purger = Purger("all_installation_node_nodes")
 extensions_node_purger = Purger("all_extensions_node_nodes")
 
+# The output of the installation directive depends on these, and on the builder format.
+_config_dependencies = ("conda_channels", "github_username", "github_repository")
+
 
 class Sources(List[Tuple[str, str, Callable, Callable, Optional[Dict[str, Callable]]]]):
 	"""
@@ -461,7 +446,14 @@ class InstallationDirective(SphinxDirective):
 
 		installation_node = nodes.paragraph(rawsource=content)  # type: ignore
 		self.state.nested_parse(view, self.content_offset, installation_node)  # type: ignore
-		installation_node_purger.add_node(self.env, installation_node, targetnode, self.lineno)
+		installation_node_purger.add_node(
+				self.env,
+				installation_node,
+				targetnode,
+				self.lineno,
+				config_values=_config_dependencies,
+				builder=True,
+				)
 
 		return [targetnode, installation_node]
 
@@ -486,13 +478,27 @@ class InstallationDirective(SphinxDirective):
 			section = nodes.section(ids=[f"{targetid}-{section_id}"])
 			section += nodes.title(tab_name, tab_name)
 			nodes_to_return.append(section)
-			installation_node_purger.add_node(self.env, section, targetnode, self.lineno)
+			installation_node_purger.add_node(
+					self.env,
+					section,
+					targetnode,
+					self.lineno,
+					config_values=_config_dependencies,
+					builder=True,
+					)
 
 			view = ViewList(tab_content)
 			paragraph_node = nodes.paragraph(rawsource=tab_content)  # type: ignore
 			self.state.nested_parse(view, self.content_offset, paragraph_node)  # type: ignore
 			nodes_to_return.append(paragraph_node)
-			installation_node_purger.add_node(self.env, paragraph_node, targetnode, self.lineno)
+			installation_node_purger.add_node(
+					self.env,
+					paragraph_node,
+					targetnode,
+					self.lineno,
+					config_values=_config_dependencies,
+					builder=True,
+					)
 
 		return nodes_to_return
 
@@ -634,12 +640,69 @@ class ExtensionsDirective(SphinxDirective):
 		return [targetnode, extensions_node]
 
 
+_installation_js = [
+		"// Based on https://github.com/executablebooks/sphinx-tabs/blob/master/sphinx_tabs/static/tabs.js",
+		"// Copyright (c) 2017 djungelorm",
+		"// MIT Licensed",
+		'',
+		"function deselectTabset(target) {",
+		"  const parent = target.parentNode;",
+		"  const grandparent = parent.parentNode;",
+		'',
+		'  if (parent.parentNode.parentNode.getAttribute("id").startsWith("installation")) {',
+		'',
+		"    // Hide all tabs in current tablist, but not nested",
+		"    Array.from(parent.children).forEach(t => {",
+		'      if (t.getAttribute("name") !== target.getAttribute("name")) {',
+		'        t.setAttribute("aria-selected", "false");',
+		"      }",
+		"    });",
+		'',
+		"    // Hide all associated panels",
+		"    Array.from(grandparent.children).slice(1).forEach(p => {  // Skip tablist",
+		'      if (p.getAttribute("name") !== target.getAttribute("name")) {',
+		'        p.setAttribute("hidden", "false")',
+		"      }",
+		"    });",
+		"  }",
+		'',
+		"  else {",
+		"    // Hide all tabs in current tablist, but not nested",
+		"    Array.from(parent.children).forEach(t => {",
+		'      t.setAttribute("aria-selected", "false");',
+		"    });",
+		'',
+		"    // Hide all associated panels",
+		"    Array.from(grandparent.children).slice(1).forEach(p => {  // Skip tablist",
+		'      p.setAttribute("hidden", "true")',
+		"    });",
+		"  }",
+		'',
+		'}',
+		'',
+		"// Compatibility with sphinx-tabs 2.1.0 and later",
+		"function deselectTabList(tab) {deselectTabset(tab)}",
+		'',
+		]
+
+
+def _write_js_file(static_dir: PathPlus) -> None:
+	buffer = StringList(_installation_js)
+	buffer.blankline(ensure_single=True)
+	_css.write_if_changed(static_dir / "sphinx_toolbox_installation.js", str(buffer))
+
+
 def copy_asset_files(app: Sphinx, exception: Optional[Exception] = None):
 	"""
 	Copy additional stylesheets into the HTML build directory.
 
 	.. versionadded:: 1.2.0
 
+	.. versionchanged:: 2.19.0
+
+		Files are only written if their content has changed.
+		When the extension is enabled the stylesheet is instead written by :mod:`sphinx_toolbox._css`.
+
 	:param app: The Sphinx application.
 	:param exception: Any exception which occurred and caused Sphinx to abort.
 	"""
@@ -651,57 +714,21 @@ def copy_asset_files(app: Sphinx, exception: Optional[Exception] = None):
 		return
 
 	static_dir = PathPlus(app.outdir) / "_static"
-	static_dir.maybe_make(parents=True)
-	dict2css.dump(_css.installation_styles, static_dir / "sphinx_toolbox_installation.css", minify=True)
+	_css.write_stylesheet(static_dir / "sphinx_toolbox_installation.css", _css.installation_styles, minify=True)
+	_write_js_file(static_dir)
 
-	(static_dir / "sphinx_toolbox_installation.js").write_lines([
-			"// Based on https://github.com/executablebooks/sphinx-tabs/blob/master/sphinx_tabs/static/tabs.js",
-			"// Copyright (c) 2017 djungelorm",
-			"// MIT Licensed",
-			'',
-			"function deselectTabset(target) {",
-			"  const parent = target.parentNode;",
-			"  const grandparent = parent.parentNode;",
-			'',
-			'  if (parent.parentNode.parentNode.getAttribute("id").startsWith("installation")) {',
-			'',
-			"    // Hide all tabs in current tablist, but not nested",
-			"    Array.from(parent.children).forEach(t => {",
-			'      if (t.getAttribute("name") !== target.getAttribute("name")) {',
-			'        t.setAttribute("aria-selected", "false");',
-			"      }",
-			"    });",
-			'',
-			"    // Hide all associated panels",
-			"    Array.from(grandparent.children).slice(1).forEach(p => {  // Skip tablist",
-			'      if (p.getAttribute("name") !== target.getAttribute("name")) {',
-			'        p.setAttribute("hidden", "false")',
-			"      }",
-			"    });",
-			"  }",
-			'',
-			"  else {",
-			"    // Hide all tabs in current tablist, but not nested",
-			"    Array.from(parent.children).forEach(t => {",
-			'      t.setAttribute("aria-selected", "false");',
-			"    });",
-			'',
-			"    // Hide all associated panels",
-			"    Array.from(grandparent.children).slice(1).forEach(p => {  // Skip tablist",
-			'      p.setAttribute("hidden", "true")',
-			"    });",
-			"  }",
-			'',
-			'}',
-			'',
-			"// Compatibility with sphinx-tabs 2.1.0 and later",
-			"function deselectTabList(tab) {deselectTabset(tab)}",
-			'',
-			])
+
+def _copy_js_file(app: Sphinx, exception: Optional[Exception] = None) -> None:
+	if exception:  # pragma: no cover
+		return
+
+	if app.builder is None or app.builder.format.lower() != "html":  # pragma: no cover
+		return
+
+	_write_js_file(PathPlus(app.outdir) / "_static")
 
 
 def _on_config_inited(app: Sphinx, config: Config):
-	app.add_css_file("sphinx_toolbox_installation.css")
 	app.add_js_file("sphinx_toolbox_installation.js")
 
 
@@ -727,14 +754,17 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	# Instructions for installing a python package
 	app.add_directive("installation", InstallationDirective)
 	app.connect("env-get-outdated", installation_node_purger.get_outdated_docnames)
-	# app.connect("env-purge-doc", installation_node_purger.purge_nodes)
+	app.connect("env-purge-doc", installation_node_purger.purge_nodes)
+	app.connect("env-merge-info", installation_node_purger.merge_nodes)
 
 	# Instructions for enabling a sphinx extension
 	app.add_directive("extensions", ExtensionsDirective)
 	app.connect("env-purge-doc", extensions_node_purger.purge_nodes)
+	app.connect("env-merge-info", extensions_node_purger.merge_nodes)
 
 	# Ensure this happens after tabs.js has been added
 	app.connect("config-inited", _on_config_inited, priority=510)
-	app.connect("build-finished", copy_asset_files)
+	app.connect("build-finished", _copy_js_file)
+	_css.add_stylesheet(app, "sphinx_toolbox_installation.css", _css.installation_styles, minify=True)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
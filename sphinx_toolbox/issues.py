@@ -66,7 +66,9 @@ the user tries to navigate to an issue with that same number.
 Caching
 -----------
 
-HTTP requests to obtain issue/pull request titles are cached for four hours.
+HTTP requests to obtain issue/pull request titles are cached for four hours,
+and the titles themselves are kept in a persistent store.
+See the :mod:`sphinx_toolbox.github` documentation for more details.
 
 To clear the cache manually, run:
 
@@ -208,4 +210,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	app.add_role("pr", pull_role)
 	app.add_role("pull", pull_role)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
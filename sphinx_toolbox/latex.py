@@ -117,6 +117,17 @@ Usage
 	\end{multicols}
 
 
+.. confval:: latex_unicode_replacements
+	:type: :class:`dict`\[:class:`str`, :class:`str`\]
+	:default: ``{}``
+
+	Additional replacements for :func:`~.replace_unknown_unicode` to make in the LaTeX output,
+	mapping characters (or strings, which must not span multiple lines) to their LaTeX equivalents.
+	These take precedence over the built-in replacements.
+
+	.. versionadded:: 2.19.0
+
+
 .. latex:vspace:: -20px
 
 API Reference
@@ -174,10 +185,11 @@ API Reference
 #
 
 # stdlib
+import functools
 import os
 import re
 from textwrap import dedent
-from typing import Any, Optional, cast
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, cast
 
 # 3rd party
 import sphinx
@@ -193,13 +205,20 @@ from sphinx.config import Config
 from sphinx.domains import Domain
 from sphinx.environment import BuildEnvironment
 from sphinx.locale import __
-from sphinx.util import progress_message
+from sphinx.util import logging, progress_message
+from sphinx.util.console import bold  # type: ignore[attr-defined]
 from sphinx.util.docutils import SphinxDirective, SphinxFileOutput
 from sphinx.util.nodes import process_only_nodes
+from sphinx.util.parallel import ParallelTasks, parallel_available
 from sphinx.writers.latex import LaTeXTranslator, LaTeXWriter
 
+# this package
+from sphinx_toolbox.utils import SphinxExtMetadata, metadata_add_version
+
 _ = BuildEnvironment
 
+logger = logging.getLogger(__name__)
+
 __all__ = [
 		"use_package",
 		"visit_footnote",
@@ -397,6 +416,74 @@ class LaTeXDomain(Domain):
 			"vspace": VSpaceDirective,
 			}
 
+	def merge_domaindata(self, docnames: List[str], otherdata: Dict) -> None:  # noqa: D102
+		# The domain does not store any data, so there is nothing to merge from parallel reading processes.
+		pass
+
+
+_default_unicode_replacements = {
+		'♠': r' $\spadesuit$ ',
+		'♥': r' $\heartsuit$ ',
+		'♦': r' $\diamondsuit$ ',
+		'♣': r' $\clubsuit$ ',
+		'\u200b': r'\hspace{0pt}',  # Zero width space
+		'μ': r"\textmu{}",
+		'≡': r" $\equiv$ ",
+		'≈': r" $\approx$ ",
+		'≥': r" $\geq$ ",
+		'≤': r" $\leq$ ",
+		}
+
+
+def _make_unicode_replacer(replacements: Mapping[str, str]) -> Callable[[str], str]:
+	"""
+	Returns a function which makes all of the given replacements in a single pass over a string.
+
+	:param replacements:
+	"""
+
+	pattern = re.compile('|'.join(map(re.escape, sorted(filter(None, replacements), key=len, reverse=True))))
+	return lambda text: pattern.sub(lambda match: replacements[match.group(0)], text)
+
+
+def _replace_unicode_in_file(filename: PathPlus, replace: Callable[[str], str], chunk_size: int = 2**20) -> None:
+	"""
+	Make the replacements in the given file, reading and writing it in chunks of about ``chunk_size`` characters.
+
+	As with :meth:`PathPlus.write_clean() <domdf_python_tools.paths.PathPlus.write_clean>`,
+	trailing whitespace is removed from each line and the file ends with a single newline.
+
+	:param filename:
+	:param replace: A function, as returned by :func:`~._make_unicode_replacer`.
+	:param chunk_size:
+	"""
+
+	tmp_filename = filename.with_name(f"{filename.name}.tmp")
+
+	# Newlines at the end of the previous chunk, which are only written if more content follows.
+	pending_newlines = 0
+
+	with filename.open(encoding="UTF-8") as infile, tmp_filename.open('w', encoding="UTF-8") as outfile:
+		while True:
+			chunk = ''.join(infile.readlines(chunk_size))
+			if not chunk:
+				break
+
+			chunk = '\n'.join([line.rstrip() for line in replace(chunk).split('\n')])
+			content = chunk.rstrip('\n')
+
+			if content:
+				outfile.write('\n' * pending_newlines)
+				outfile.write(content)
+				pending_newlines = len(chunk) - len(content)
+			else:
+				pending_newlines += len(chunk)
+
+		if outfile.tell():
+			outfile.write('\n')
+
+	os.replace(tmp_filename, filename)
+
 
 def replace_unknown_unicode(app: Sphinx, exception: Optional[Exception] = None):
 	r"""
@@ -417,6 +504,8 @@ def replace_unknown_unicode(app: Sphinx, exception: Optional[Exception] = None):
 		* ≥ -- \geq (new in version 2.13.0)
 		* ≤ -- \leq (new in version 2.13.0)
 
+		Additional replacements can be given with the :confval:`latex_unicode_replacements` configuration value.
+
 	This function can be hooked into the :event:`build-finished` event as follows:
 
 	.. code-block:: python
@@ -425,6 +514,13 @@ def replace_unknown_unicode(app: Sphinx, exception: Optional[Exception] = None):
 
 	.. versionadded:: 2.9.0
 
+	.. versionchanged:: 2.19.0
+
+		* All documents in :confval:`latex_documents` are processed, not just the first.
+		* Files are processed in a single streaming pass,
+		  and in parallel when Sphinx is run with ``-j``.
+		* Added support for :confval:`latex_unicode_replacements`.
+
 	:param app: The Sphinx application.
 	:param exception: Any exception which occurred and caused Sphinx to abort.
 	"""
@@ -436,22 +532,34 @@ def replace_unknown_unicode(app: Sphinx, exception: Optional[Exception] = None):
 		return
 
 	builder = cast(LaTeXBuilder, app.builder)
-	output_file = PathPlus(builder.outdir) / f"{builder.titles[0][1].lower()}.tex"
+	outdir = PathPlus(builder.outdir)
 
-	output_content = output_file.read_text()
+	output_files = []
+	for entry in builder.document_data:
+		output_file = outdir / entry[1]
+		if output_file.is_file() and output_file not in output_files:
+			output_files.append(output_file)
 
-	output_content = output_content.replace('♠', r' $\spadesuit$ ')
-	output_content = output_content.replace('♥', r' $\heartsuit$ ')
-	output_content = output_content.replace('♦', r' $\diamondsuit$ ')
-	output_content = output_content.replace('♣', r' $\clubsuit$ ')
-	output_content = output_content.replace('\u200b', r'\hspace{0pt}')  # Zero width space
-	output_content = output_content.replace('μ', r"\textmu{}")
-	output_content = output_content.replace('≡', r" $\equiv$ ")
-	output_content = output_content.replace('≈', r" $\approx$ ")
-	output_content = output_content.replace('≥', r" $\geq$ ")
-	output_content = output_content.replace('≤', r" $\leq$ ")
+	if not output_files:
+		return
 
-	output_file.write_clean(output_content)
+	replacements = {
+			**_default_unicode_replacements,
+			**(getattr(app.config, "latex_unicode_replacements", None) or {}),
+			}
+	replace = _make_unicode_replacer(replacements)
+
+	if app.parallel > 1 and parallel_available and len(output_files) > 1:
+		# The replacement is CPU-bound, so the files are processed in separate processes.
+		tasks = ParallelTasks(min(app.parallel, len(output_files)))
+
+		for output_file in output_files:
+			tasks.add_task(functools.partial(_replace_unicode_in_file, replace=replace), output_file)
+
+		tasks.join()
+	else:
+		for output_file in output_files:
+			_replace_unicode_in_file(output_file, replace)
 
 
 def better_header_layout(
@@ -525,7 +633,18 @@ class PatchedLaTeXBuilder(LaTeXBuilder):
 	# TODO: respect toctree caption for LaTeX table of contents too
 	# \addto\captionsenglish{\renewcommand{\contentsname}{Documentation}}
 
+	#: Documents in :confval:`latex_documents` are written in parallel when Sphinx is run with ``-j``.
+	allow_parallel = True
+
 	def write(self, *ignored: Any) -> None:
+		"""
+		Write the documents in :confval:`latex_documents`.
+
+		.. versionchanged:: 2.19.0
+
+			When Sphinx is run with ``-j N`` the documents are assembled and written in up to ``N`` processes.
+		"""
+
 		assert self.env is not None
 
 		docwriter = LaTeXWriter(self)
@@ -543,51 +662,102 @@ class PatchedLaTeXBuilder(LaTeXBuilder):
 		self.init_document_data()
 		self.write_stylesheet()
 
-		for entry in self.document_data:
-			docname, targetname, title, author, themename = entry[:5]
-			theme = self.themes.get(themename)
-			toctree_only = False
-			if len(entry) > 5:
-				toctree_only = entry[5]
-			destination = SphinxFileOutput(
-					destination_path=os.path.join(self.outdir, targetname),
-					encoding="utf-8",
-					overwrite_if_changed=True
+		if self.parallel_ok and len(self.document_data) > 1:
+			self._write_documents_parallel(docwriter, docsettings)
+		else:
+			for entry in self.document_data:
+				self.write_document(entry, docwriter, docsettings)
+
+	def write_document(self, entry: Sequence[Any], docwriter: LaTeXWriter, docsettings: Any) -> None:
+		"""
+		Assemble and write the document for a single entry in :confval:`latex_documents`.
+
+		.. versionadded:: 2.19.0
+
+		:param entry:
+		:param docwriter:
+		:param docsettings:
+		"""
+
+		assert self.env is not None
+
+		docname, targetname, title, author, themename = entry[:5]
+		theme = self.themes.get(themename)
+		toctree_only = False
+		if len(entry) > 5:
+			toctree_only = entry[5]
+		destination = SphinxFileOutput(
+				destination_path=os.path.join(self.outdir, targetname),
+				encoding="utf-8",
+				overwrite_if_changed=True
+				)
+		with progress_message(__("processing %s") % targetname):
+			doctree = self.env.get_doctree(docname)
+			process_only_nodes(doctree, self.tags)
+			toctree = next(iter(doctree.traverse(addnodes.toctree)), None)
+			if toctree and toctree.get("maxdepth") > 0:
+				tocdepth = toctree.get("maxdepth")
+			else:
+				tocdepth = None
+
+			doctree = self.assemble_doctree(
+					docname,
+					toctree_only,
+					appendices=(self.config.latex_appendices if theme.name != "howto" else [])
 					)
-			with progress_message(__("processing %s") % targetname):
-				doctree = self.env.get_doctree(docname)
-				process_only_nodes(doctree, self.tags)
-				toctree = next(iter(doctree.traverse(addnodes.toctree)), None)
-				if toctree and toctree.get("maxdepth") > 0:
-					tocdepth = toctree.get("maxdepth")
-				else:
-					tocdepth = None
-
-				doctree = self.assemble_doctree(
-						docname,
-						toctree_only,
-						appendices=(self.config.latex_appendices if theme.name != "howto" else [])
-						)
-				doctree["docclass"] = theme.docclass
-				doctree["contentsname"] = self.get_contentsname(docname)
-				doctree["tocdepth"] = tocdepth
-				self.post_process_images(doctree)
-				self.update_doc_context(title, author, theme)
-
-				if hasattr(self, "update_context"):  # pragma: no cover
-					# Only present in newer Sphinx versions
-					self.update_context()
-
-			with progress_message(__("writing")):
-				docsettings._author = author
-				docsettings._title = title
-				docsettings._contentsname = doctree["contentsname"]
-				docsettings._docname = docname
-				docsettings._docclass = theme.name
-
-				doctree.settings = docsettings
-				docwriter.theme = theme
-				docwriter.write(doctree, destination)
+			doctree["docclass"] = theme.docclass
+			doctree["contentsname"] = self.get_contentsname(docname)
+			doctree["tocdepth"] = tocdepth
+			self.post_process_images(doctree)
+			self.update_doc_context(title, author, theme)
+
+			if hasattr(self, "update_context"):  # pragma: no cover
+				# Only present in newer Sphinx versions
+				self.update_context()
+
+		with progress_message(__("writing")):
+			docsettings._author = author
+			docsettings._title = title
+			docsettings._contentsname = doctree["contentsname"]
+			docsettings._docname = docname
+			docsettings._docclass = theme.name
+
+			doctree.settings = docsettings
+			docwriter.theme = theme
+			docwriter.write(doctree, destination)
+
+	def _write_documents_parallel(self, docwriter: LaTeXWriter, docsettings: Any) -> None:
+		"""
+		Write the documents in :confval:`latex_documents` in a pool of processes.
+
+		The images referenced by each document are collected from the worker processes
+		and merged in the order of :confval:`latex_documents`, ready to be copied by :meth:`~.finish`.
+
+		:param docwriter:
+		:param docsettings:
+		"""
+
+		images: Dict[int, Dict[str, str]] = {}
+
+		def write_process(index: int) -> Dict[str, str]:
+			# Only the images found by this process are returned to the main process.
+			self.images = {}
+			self.write_document(self.document_data[index], docwriter, docsettings)
+			return self.images
+
+		def on_written(index: int, result: Dict[str, str]) -> None:
+			images[index] = result
+
+		tasks = ParallelTasks(min(self.app.parallel, len(self.document_data)))
+
+		for index in range(len(self.document_data)):
+			tasks.add_task(write_process, index, on_written)
+
+		logger.info(bold(__("waiting for workers...")))
+		tasks.join()
+
+		for index in sorted(images):
+			self.images.update(images[index])
 
 
 def configure(app: Sphinx, config: Config):
@@ -609,7 +779,8 @@ def configure(app: Sphinx, config: Config):
 		config.latex_elements["preamble"] = f"{latex_preamble}\n{command_string}"
 
 
-def setup(app: Sphinx):
+@metadata_add_version
+def setup(app: Sphinx) -> SphinxExtMetadata:
 	"""
 	Setup :mod:`sphinx_toolbox.latex`.
 
@@ -628,4 +799,8 @@ def setup(app: Sphinx):
 
 	app.add_builder(PatchedLaTeXBuilder, override=True)
 
+	app.add_config_value("latex_unicode_replacements", {}, '', types=[dict])
+
 	app.connect("config-inited", configure)
+
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
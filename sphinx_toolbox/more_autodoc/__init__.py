@@ -99,4 +99,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	app.setup_extension("sphinx_toolbox.more_autodoc.overloads")
 	app.setup_extension("sphinx_toolbox.more_autodoc.generic_bases")
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -134,4 +134,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	app.setup_extension("sphinx.ext.autodoc")
 
-	return {"version": sphinx_toolbox.__version__, "parallel_read_safe": True}
+	return {"version": sphinx_toolbox.__version__, "parallel_read_safe": True, "parallel_write_safe": True}
@@ -125,6 +125,7 @@ from sphinx.application import Sphinx
 from sphinx.deprecation import RemovedInSphinx50Warning
 from sphinx.domains import ObjType
 from sphinx.domains.python import PyClasslike, PyXRefRole
+from sphinx.errors import PycodeError
 from sphinx.ext.autodoc import ClassDocumenter, Documenter, Options
 from sphinx.ext.autodoc.directive import DocumenterBridge
 from sphinx.locale import _
@@ -132,7 +133,7 @@ from sphinx.pycode import ModuleAnalyzer
 
 # this package
 from sphinx_toolbox.more_autodoc import ObjectMembers
-from sphinx_toolbox.more_autodoc.typehints import format_annotation
+from sphinx_toolbox.more_autodoc.typehints import format_annotation, type_hints_cache
 from sphinx_toolbox.utils import (
 		Param,
 		SphinxExtMetadata,
@@ -140,6 +141,7 @@ from sphinx_toolbox.utils import (
 		add_nbsp_substitution,
 		allow_subclass_add,
 		baseclass_is_private,
+		get_module_attribute_docs,
 		is_namedtuple,
 		metadata_add_version,
 		parse_parameters
@@ -281,7 +283,7 @@ class NamedTupleDocumenter(ClassDocumenter):
 		:param want_all:
 		"""
 
-		all_hints = get_type_hints(self.object)
+		all_hints = type_hints_cache.get_type_hints(self.object)
 		class_hints = {k: all_hints[k] for k in self.object._fields if k in all_hints}
 
 		# TODO: need a better way to partially resolve type hints, and warn about failures
@@ -336,18 +338,24 @@ class NamedTupleDocumenter(ClassDocumenter):
 		member_docstrings: Dict[str, List[str]]
 
 		try:
-			namedtuple_source = textwrap.dedent(inspect.getsource(self.object))
+			# Reuse the analysis of the whole module rather than parsing the class's source again.
+			module_docs = get_module_attribute_docs(self.object.__module__)
+			member_docstrings = module_docs.by_namespace[self.object.__qualname__]
 
-			# Mapping of member names to docstrings (as list of strings)
-			member_docstrings = {
-					k[1]: v
-					for k,
-					v in ModuleAnalyzer.for_string(namedtuple_source, self.object.__module__
-													).find_attr_docs().items()
-					}
+		except (PycodeError, KeyError, AttributeError):
+			try:
+				namedtuple_source = textwrap.dedent(inspect.getsource(self.object))
 
-		except (TypeError, OSError):
-			member_docstrings = {}
+				# Mapping of member names to docstrings (as list of strings)
+				member_docstrings = {
+						k[1]: v
+						for k,
+						v in ModuleAnalyzer.for_string(namedtuple_source, self.object.__module__
+														).find_attr_docs().items()
+						}
+
+			except (TypeError, OSError):
+				member_docstrings = {}
 
 		# set sourcename and add content from attribute documentation
 		sourcename = self.get_sourcename()
@@ -380,7 +388,7 @@ class NamedTupleDocumenter(ClassDocumenter):
 				doc = [getattr(self.object, field).__doc__]
 
 			# Prefer annotations over docstring types
-			type_hints = get_type_hints(self.object)
+			type_hints = type_hints_cache.get_type_hints(self.object)
 			if type_hints:
 				if field in type_hints:
 					arg_type = format_annotation(type_hints[field])
@@ -429,5 +437,6 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	allow_subclass_add(app, NamedTupleDocumenter)
 
 	app.connect("config-inited", lambda _, config: add_nbsp_substitution(config))
+	app.connect("build-finished", type_hints_cache.clear)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
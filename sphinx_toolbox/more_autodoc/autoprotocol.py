@@ -140,7 +140,6 @@ from sphinx.application import Sphinx
 from sphinx.domains import ObjType
 from sphinx.domains.python import PyClasslike, PyXRefRole
 from sphinx.ext.autodoc import (
-		INSTANCEATTR,
 		ClassDocumenter,
 		Documenter,
 		Options,
@@ -149,7 +148,7 @@ from sphinx.ext.autodoc import (
 		)
 from sphinx.ext.autodoc.directive import DocumenterBridge
 from sphinx.locale import _
-from sphinx.util.inspect import getdoc, safe_getattr
+from sphinx.util.inspect import getdoc
 
 # this package
 from sphinx_toolbox.more_autodoc import ObjectMembers
@@ -158,8 +157,9 @@ from sphinx_toolbox.utils import (
 		SphinxExtMetadata,
 		add_fallback_css_class,
 		allow_subclass_add,
-		filter_members_warning,
+		filter_object_members,
 		flag,
+		get_class_namespace,
 		metadata_add_version
 		)
 
@@ -314,61 +314,29 @@ class ProtocolDocumenter(ClassDocumenter):
 		:param want_all:
 		"""
 
-		ret = []
+		base = self.object.__base__
+		base_namespace = get_class_namespace(base)
+		excluded_members = self.options.get("exclude-protocol-members", [])
 
-		# process members and determine which to skip
-		for (membername, member) in members:
-			# if isattr is True, the member is documented as an attribute
-
-			if safe_getattr(member, "__sphinx_mock__", False):
-				# mocked module or object
-				keep = False  # pragma: no cover
-
-			elif (
-					self.options.get("exclude-protocol-members", [])
-					and membername in self.options["exclude-protocol-members"]
-					):
+		def keep(membername: str, member: Any) -> bool:
+			if excluded_members and membername in excluded_members:
 				# remove members given by exclude-protocol-members
-				keep = False  # pragma: no cover
+				return False  # pragma: no cover
 
 			elif membername.startswith('_') and not (membername.startswith("__") and membername.endswith("__")):
-				keep = False
+				return False
 
 			elif membername not in globally_excluded_methods:
 				# Magic method you wouldn't overload, or private method.
-				if membername in dir(self.object.__base__):
-					keep = member is not getattr(self.object.__base__, membername)
+				if membername in base_namespace:
+					return member is not getattr(base, membername)
 				else:
-					keep = True
+					return True
 
 			else:
-				keep = False
-
-			# give the user a chance to decide whether this member
-			# should be skipped
-			if self.env.app:
-				# let extensions preprocess docstrings
-				try:
-					skip_user = self.env.app.emit_firstresult(
-							"autodoc-skip-member",
-							self.objtype,
-							membername,
-							member,
-							not keep,
-							self.options,
-							)
-
-					if skip_user is not None:
-						keep = not skip_user
-
-				except Exception as exc:
-					filter_members_warning(member, exc)
-					keep = False
-
-			if keep:
-				ret.append((membername, member, member is INSTANCEATTR))
+				return False
 
-		return ret
+		return filter_object_members(self, members, keep)
 
 
 @metadata_add_version
@@ -386,4 +354,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	allow_subclass_add(app, ProtocolDocumenter)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
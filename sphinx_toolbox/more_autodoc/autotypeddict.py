@@ -127,7 +127,7 @@ API Reference
 #
 
 # stdlib
-from typing import Any, Callable, Dict, List, Tuple, Type, get_type_hints
+from typing import Any, Callable, Dict, List, Tuple, Type
 
 # 3rd party
 import docutils.statemachine
@@ -135,20 +135,20 @@ from domdf_python_tools.stringlist import StringList
 from sphinx.application import Sphinx
 from sphinx.domains import ObjType
 from sphinx.domains.python import PyClasslike, PyXRefRole
-from sphinx.ext.autodoc import INSTANCEATTR, ClassDocumenter, Documenter, Options
+from sphinx.ext.autodoc import ClassDocumenter, Documenter, Options
 from sphinx.locale import _
-from sphinx.pycode import ModuleAnalyzer
 from sphinx.util.inspect import safe_getattr
 
 # this package
 from sphinx_toolbox.more_autodoc import ObjectMembers
-from sphinx_toolbox.more_autodoc.typehints import format_annotation
+from sphinx_toolbox.more_autodoc.typehints import format_annotation, type_hints_cache
 from sphinx_toolbox.utils import (
 		SphinxExtMetadata,
 		add_fallback_css_class,
 		allow_subclass_add,
-		filter_members_warning,
+		filter_object_members,
 		flag,
+		get_module_attribute_docs,
 		metadata_add_version
 		)
 
@@ -238,7 +238,7 @@ class TypedDictDocumenter(ClassDocumenter):
 		# set sourcename and add content from attribute documentation
 		sourcename = self.get_sourcename()
 		if self.analyzer:
-			attr_docs = self.analyzer.find_attr_docs()
+			attr_docs = get_module_attribute_docs(self.real_modname).attr_docs
 			if self.objpath:
 				key = ('.'.join(self.objpath[:-1]), self.objpath[-1])
 				if key in attr_docs:
@@ -289,14 +289,11 @@ class TypedDictDocumenter(ClassDocumenter):
 		documenters = super().sort_members(documenters, order)
 
 		# Mapping of key names to docstrings (as list of strings)
-		docstrings = {
-				k[1]: v
-				for k, v in ModuleAnalyzer.for_module(self.object.__module__).find_attr_docs().items()
-				}
+		docstrings = get_module_attribute_docs(self.object.__module__).by_name
 
 		required_keys = []
 		optional_keys = []
-		types = get_type_hints(self.object)
+		types = type_hints_cache.get_type_hints(self.object)
 
 		for d in documenters:
 			name = d[0].name.split('.')[-1]
@@ -359,45 +356,7 @@ class TypedDictDocumenter(ClassDocumenter):
 		:param want_all:
 		"""
 
-		ret = []
-
-		# process members and determine which to skip
-		for (membername, member) in members:
-			# if isattr is True, the member is documented as an attribute
-
-			if safe_getattr(member, "__sphinx_mock__", False):
-				# mocked module or object
-				keep = False
-			elif membername.startswith('_'):
-				keep = False
-			else:
-				keep = True
-
-			# give the user a chance to decide whether this member
-			# should be skipped
-			if self.env.app:
-				# let extensions preprocess docstrings
-				try:
-					skip_user = self.env.app.emit_firstresult(
-							"autodoc-skip-member",
-							self.objtype,
-							membername,
-							member,
-							not keep,
-							self.options,
-							)
-
-					if skip_user is not None:
-						keep = not skip_user
-
-				except Exception as exc:
-					filter_members_warning(member, exc)
-					keep = False
-
-			if keep:
-				ret.append((membername, member, member is INSTANCEATTR))
-
-		return ret
+		return filter_object_members(self, members, lambda membername, member: not membername.startswith('_'))
 
 
 @metadata_add_version
@@ -412,7 +371,8 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	app.add_directive_to_domain("py", "typeddict", PyClasslike)
 	app.add_role_to_domain("py", "typeddict", PyXRefRole())
 	app.connect("object-description-transform", add_fallback_css_class({"typeddict": "class"}))
+	app.connect("build-finished", type_hints_cache.clear)
 
 	allow_subclass_add(app, TypedDictDocumenter)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -173,7 +173,7 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 			types=[bool],
 			)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
 
 
 class Example(List[Tuple[str, float, List[str]]]):
@@ -103,4 +103,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	automodule_add_nodocstring(app)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
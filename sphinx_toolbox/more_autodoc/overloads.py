@@ -456,4 +456,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 			ENUM("top", "bottom", "signature"),  # top (of body), bottom (of body)
 			)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -7,6 +7,20 @@ Specialized Documenter for regular expression variables, similar to :rst:dir:`au
 .. versionadded:: 1.2.0
 .. extensions:: sphinx_toolbox.more_autodoc.regex
 
+Configuration
+--------------
+
+.. confval:: regex_render_cache_size
+	:type: :class:`int`
+	:default: 16384
+
+	The maximum number of rendered patterns to keep in :data:`~.regex_render_cache`.
+
+	Each pattern is rendered once per output format, so this should be at least
+	as large as the number of distinct regular expressions in the documentation.
+
+	.. versionadded:: 2.19.0
+
 Usage
 -------
 
@@ -138,25 +152,31 @@ from sre_constants import (
 		SUBPATTERN
 		)
 from textwrap import dedent
-from typing import Any, Callable, List, Optional, Pattern, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Set, Tuple
 
 # 3rd party
-import dict2css
 from docutils import nodes
 from docutils.nodes import Node, system_message
 from domdf_python_tools.paths import PathPlus
 from domdf_python_tools.stringlist import StringList
 from sphinx.application import Sphinx
 from sphinx.config import Config
+from sphinx.environment import BuildEnvironment
 from sphinx.ext.autodoc import UNINITIALIZED_ATTR, ModuleDocumenter
 from sphinx.util import texescape
 from sphinx.util.docutils import SphinxRole
 from sphinx.writers.html import HTMLTranslator
 
 # this package
-from sphinx_toolbox import _css
+from sphinx_toolbox import __version__, _css
 from sphinx_toolbox.more_autodoc.variables import VariableDocumenter
-from sphinx_toolbox.utils import SphinxExtMetadata, add_nbsp_substitution, flag, metadata_add_version
+from sphinx_toolbox.utils import (
+		SphinxExtMetadata,
+		add_nbsp_substitution,
+		flag,
+		get_module_attribute_docs,
+		metadata_add_version
+		)
 
 __all__ = [
 		"RegexDocumenter",
@@ -169,6 +189,10 @@ __all__ = [
 		"span",
 		"latex_textcolor",
 		"copy_asset_files",
+		"regex_render_cache",
+		"load_render_cache",
+		"render_regex_nodes",
+		"merge_render_cache",
 		"setup",
 		]
 
@@ -220,7 +244,7 @@ class RegexDocumenter(VariableDocumenter):
 		sourcename = self.get_sourcename()
 
 		if self.analyzer:
-			attr_docs = self.analyzer.find_attr_docs()
+			attr_docs = get_module_attribute_docs(self.real_modname).attr_docs
 			if self.objpath:
 				key = ('.'.join(self.objpath[:-1]), self.objpath[-1])
 				if key in attr_docs:
@@ -358,6 +382,46 @@ def no_formatting(value: Any) -> str:
 	return str(value)
 
 
+#: Cache of patterns rendered by :meth:`RegexParser.parse_pattern`,
+#: keyed by the pattern, its flags and the qualified name of the parser class.
+#:
+#: The cache is shared by all documents and persisted in the build environment between builds.
+#: Once it holds more than :confval:`regex_render_cache_size` patterns the least recently used are discarded.
+#:
+#: .. versionadded:: 2.19.0
+regex_render_cache: Dict[Tuple[str, int, str], str] = {}
+
+_render_cache_max_size = 16384
+
+_at_codes = {
+		AT_BEGINNING: '^',
+		AT_END: '$',
+		AT_BEGINNING_STRING: r"\A",
+		AT_BOUNDARY: r"\b",
+		AT_NON_BOUNDARY: r"\B",
+		AT_END_STRING: r"\Z",
+		}
+
+_category_codes = {
+		CATEGORY_DIGIT: r"\d",
+		CATEGORY_NOT_DIGIT: r"\D",
+		CATEGORY_SPACE: r"\s",
+		CATEGORY_NOT_SPACE: r"\S",
+		CATEGORY_WORD: r"\w",
+		CATEGORY_NOT_WORD: r"\W",
+		}
+
+
+def _qualified_name(cls: type) -> str:
+	return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _trim_render_cache() -> None:
+	# Discard the least recently used patterns from the start of the cache.
+	while len(regex_render_cache) > _render_cache_max_size:
+		del regex_render_cache[next(iter(regex_render_cache))]
+
+
 class RegexParser:
 	r"""
 	Parser for regular expressions that outputs coloured output.
@@ -395,128 +459,27 @@ class RegexParser:
 		"""
 		Parse the given regular expression and return the formatted pattern.
 
+		.. versionchanged:: 2.19.0
+
+			The output is cached by pattern, flags and parser class. See :data:`~.regex_render_cache`.
+
 		:param regex:
 		"""
 
-		buf = []
-
-		def _parse_pattern(pattern):
-
-			for what, content in pattern:
-				# print(what, content)
-
-				if what is AT:
-					if content is AT_BEGINNING:
-						buf.append(type(self).AT_COLOUR('^'))
-						continue
-					elif content is AT_END:
-						buf.append(type(self).AT_COLOUR('$'))
-						continue
-					elif content is AT_BEGINNING_STRING:
-						buf.append(type(self).AT_COLOUR(r"\A"))
-						continue
-					elif content is AT_BOUNDARY:
-						buf.append(type(self).AT_COLOUR(r"\b"))
-						continue
-					elif content is AT_NON_BOUNDARY:
-						buf.append(type(self).AT_COLOUR(r"\B"))
-						continue
-					elif content is AT_END_STRING:
-						buf.append(type(self).AT_COLOUR(r"\Z"))
-						continue
-
-				if what is SUBPATTERN:
-					buf.append(type(self).SUBPATTERN_COLOUR('('))
-					group, add_flags, del_flags, subpattern = content
-					# print(group, add_flags, del_flags)
-					_parse_pattern(subpattern)
-					buf.append(type(self).SUBPATTERN_COLOUR(')'))
-					continue
-
-				if what is LITERAL:
-					# TODO: escape characters that have meaning to avoid ambiguity
-					buf.append(type(self).LITERAL_COLOUR(chr(content)))
-					continue
-
-				if what is IN:
-					if len(content) > 1 or content[0][0] is RANGE:
-						buf.append(type(self).IN_COLOUR('['))
-
-					_parse_pattern(content)
-
-					if len(content) > 1 or content[0][0] is RANGE:
-						buf.append(type(self).IN_COLOUR(']'))
-					continue
-
-				if what is MAX_REPEAT or what is MIN_REPEAT:
-					min_, max_, item = content
-					_parse_pattern(item)
-
-					if min_ == 0 and max_ is MAXREPEAT:
-						buf.append(type(self).REPEAT_COLOUR('*'))
-					elif min_ == 1 and max_ is MAXREPEAT:
-						buf.append(type(self).REPEAT_COLOUR('+'))
-					elif min_ == 0 and max_ == 1:
-						buf.append(type(self).REPEAT_COLOUR('?'))
-					elif min_ == max_:
-						buf.append(type(self).REPEAT_BRACE_COLOUR('{'))
-						buf.append(type(self).REPEAT_COLOUR(str(min_)))
-						buf.append(type(self).REPEAT_BRACE_COLOUR('}'))
-					else:
-						buf.append(type(self).REPEAT_BRACE_COLOUR('{'))
-						buf.append(type(self).REPEAT_COLOUR(str(min_)))
-						buf.append(type(self).LITERAL_COLOUR(','))
-						buf.append(type(self).REPEAT_COLOUR(str(max_)))
-						buf.append(type(self).REPEAT_BRACE_COLOUR('}'))
-					if what is MIN_REPEAT:
-						buf.append(type(self).REPEAT_COLOUR('?'))
-
-					continue
-				#
-				# if what is MIN_REPEAT:
-				# 	min_, max_, item = content
-				# 	_parse_pattern(item)
-				# 	print(min_, max_, item)
-				# 	input(">>>")
-
-				if what is CATEGORY:
-					if content is CATEGORY_DIGIT:
-						buf.append(type(self).CATEGORY_COLOUR(r"\d"))
-						continue
-					elif content is CATEGORY_NOT_DIGIT:
-						buf.append(type(self).CATEGORY_COLOUR(r"\D"))
-						continue
-					elif content is CATEGORY_SPACE:
-						buf.append(type(self).CATEGORY_COLOUR(r"\s"))
-						continue
-					elif content is CATEGORY_NOT_SPACE:
-						buf.append(type(self).CATEGORY_COLOUR(r"\S"))
-						continue
-					elif content is CATEGORY_WORD:
-						buf.append(type(self).CATEGORY_COLOUR(r"\w"))
-						continue
-					elif content is CATEGORY_NOT_WORD:
-						buf.append(type(self).CATEGORY_COLOUR(r"\W"))
-						continue
-
-				if what is BRANCH:
-					for branch in content[1]:
-						_parse_pattern(branch)
-						buf.append(type(self).BRANCH_COLOUR('|'))
-					buf.pop(-1)
-					continue
-
-				if what is RANGE:
-					buf.append(type(self).LITERAL_COLOUR(chr(content[0])))
-					buf.append(type(self).AT_COLOUR('-'))
-					buf.append(type(self).LITERAL_COLOUR(chr(content[1])))
-					continue
-
-				if what is ANY:
-					buf.append(type(self).ANY_COLOUR('.'))
-					continue
+		key = (regex.pattern, regex.flags, _qualified_name(type(self)))
 
-				print(what, content)  # pragma: no cover
+		try:
+			# Move the pattern to the end, so the least recently used patterns are discarded first.
+			rendered = regex_render_cache[key] = regex_render_cache.pop(key)
+		except KeyError:
+			rendered = regex_render_cache[key] = self._render(regex)
+			_trim_render_cache()
+
+		return rendered
+
+	def _render(self, regex: Pattern) -> str:
+		cls = type(self)
+		buf: List[str] = []
 
 		pattern = regex.pattern.replace('\t', r"\t")
 
@@ -538,28 +501,118 @@ class RegexParser:
 				tokens.pop(-1)
 
 		if leading_spaces:
-			buf.append(type(self).IN_COLOUR('['))
-			buf.append(type(self).LITERAL_COLOUR(' '))
-			buf.append(type(self).IN_COLOUR(']'))
+			buf.append(cls.IN_COLOUR('['))
+			buf.append(cls.LITERAL_COLOUR(' '))
+			buf.append(cls.IN_COLOUR(']'))
 			if leading_spaces > 1:
-				buf.append(type(self).REPEAT_BRACE_COLOUR('{'))
-				buf.append(type(self).REPEAT_COLOUR(str(leading_spaces)))
-				buf.append(type(self).REPEAT_BRACE_COLOUR('}'))
+				buf.append(cls.REPEAT_BRACE_COLOUR('{'))
+				buf.append(cls.REPEAT_COLOUR(str(leading_spaces)))
+				buf.append(cls.REPEAT_BRACE_COLOUR('}'))
 
-		_parse_pattern(tokens)
+		self._render_tokens(tokens, buf)
 
 		if trailing_spaces == 1:
-			buf.append(type(self).IN_COLOUR('['))
-			buf.append(type(self).LITERAL_COLOUR(' '))
-			buf.append(type(self).IN_COLOUR(']'))
+			buf.append(cls.IN_COLOUR('['))
+			buf.append(cls.LITERAL_COLOUR(' '))
+			buf.append(cls.IN_COLOUR(']'))
 		elif trailing_spaces > 1:
-			buf.append(type(self).LITERAL_COLOUR(' '))
-			buf.append(type(self).REPEAT_BRACE_COLOUR('{'))
-			buf.append(type(self).REPEAT_COLOUR(str(trailing_spaces)))
-			buf.append(type(self).REPEAT_BRACE_COLOUR('}'))
+			buf.append(cls.LITERAL_COLOUR(' '))
+			buf.append(cls.REPEAT_BRACE_COLOUR('{'))
+			buf.append(cls.REPEAT_COLOUR(str(trailing_spaces)))
+			buf.append(cls.REPEAT_BRACE_COLOUR('}'))
 
 		return ''.join(buf)
 
+	def _render_tokens(self, tokens: Iterable[Tuple[Any, Any]], buf: List[str]) -> None:
+		dispatch = self._dispatch
+
+		for what, content in tokens:
+			if what in dispatch:
+				dispatch[what](self, content, buf)
+			else:
+				print(what, content)  # pragma: no cover
+
+	def _render_at(self, content: Any, buf: List[str]) -> None:
+		buf.append(type(self).AT_COLOUR(_at_codes[content]))
+
+	def _render_subpattern(self, content: Any, buf: List[str]) -> None:
+		group, add_flags, del_flags, subpattern = content
+		buf.append(type(self).SUBPATTERN_COLOUR('('))
+		self._render_tokens(subpattern, buf)
+		buf.append(type(self).SUBPATTERN_COLOUR(')'))
+
+	def _render_literal(self, content: Any, buf: List[str]) -> None:
+		# TODO: escape characters that have meaning to avoid ambiguity
+		buf.append(type(self).LITERAL_COLOUR(chr(content)))
+
+	def _render_in(self, content: Any, buf: List[str]) -> None:
+		brackets = len(content) > 1 or content[0][0] is RANGE
+
+		if brackets:
+			buf.append(type(self).IN_COLOUR('['))
+
+		self._render_tokens(content, buf)
+
+		if brackets:
+			buf.append(type(self).IN_COLOUR(']'))
+
+	def _render_repeat(self, content: Any, buf: List[str]) -> None:
+		cls = type(self)
+		min_, max_, item = content
+		self._render_tokens(item, buf)
+
+		if min_ == 0 and max_ is MAXREPEAT:
+			buf.append(cls.REPEAT_COLOUR('*'))
+		elif min_ == 1 and max_ is MAXREPEAT:
+			buf.append(cls.REPEAT_COLOUR('+'))
+		elif min_ == 0 and max_ == 1:
+			buf.append(cls.REPEAT_COLOUR('?'))
+		elif min_ == max_:
+			buf.append(cls.REPEAT_BRACE_COLOUR('{'))
+			buf.append(cls.REPEAT_COLOUR(str(min_)))
+			buf.append(cls.REPEAT_BRACE_COLOUR('}'))
+		else:
+			buf.append(cls.REPEAT_BRACE_COLOUR('{'))
+			buf.append(cls.REPEAT_COLOUR(str(min_)))
+			buf.append(cls.LITERAL_COLOUR(','))
+			buf.append(cls.REPEAT_COLOUR(str(max_)))
+			buf.append(cls.REPEAT_BRACE_COLOUR('}'))
+
+	def _render_min_repeat(self, content: Any, buf: List[str]) -> None:
+		self._render_repeat(content, buf)
+		buf.append(type(self).REPEAT_COLOUR('?'))
+
+	def _render_category(self, content: Any, buf: List[str]) -> None:
+		buf.append(type(self).CATEGORY_COLOUR(_category_codes[content]))
+
+	def _render_branch(self, content: Any, buf: List[str]) -> None:
+		for branch in content[1]:
+			self._render_tokens(branch, buf)
+			buf.append(type(self).BRANCH_COLOUR('|'))
+		buf.pop(-1)
+
+	def _render_range(self, content: Any, buf: List[str]) -> None:
+		buf.append(type(self).LITERAL_COLOUR(chr(content[0])))
+		buf.append(type(self).AT_COLOUR('-'))
+		buf.append(type(self).LITERAL_COLOUR(chr(content[1])))
+
+	def _render_any(self, content: Any, buf: List[str]) -> None:
+		buf.append(type(self).ANY_COLOUR('.'))
+
+	# Maps ``sre_parse`` opcodes to the functions which render them.
+	_dispatch: Dict[Any, Callable[["RegexParser", Any, List[str]], None]] = {
+			AT: _render_at,
+			SUBPATTERN: _render_subpattern,
+			LITERAL: _render_literal,
+			IN: _render_in,
+			MAX_REPEAT: _render_repeat,
+			MIN_REPEAT: _render_min_repeat,
+			CATEGORY: _render_category,
+			BRANCH: _render_branch,
+			RANGE: _render_range,
+			ANY: _render_any,
+			}
+
 
 def span(css_class: str) -> Callable[[Any], str]:
 	"""
@@ -631,13 +684,19 @@ class HTMLRegexParser(RegexParser):
 		:param regex:
 		"""
 
-		return dedent(
-				f"""
-		<code class="docutils literal notranslate regex">
-		{super().parse_pattern(regex)}
-		</code>
-		"""
-				)
+		rendered = super().parse_pattern(regex)
+
+		if '\n' in rendered:
+			return dedent(
+					f"""
+			<code class="docutils literal notranslate regex">
+			{rendered}
+			</code>
+			"""
+					)
+
+		# Equivalent to the above, without the cost of dedent.
+		return f'\n<code class="docutils literal notranslate regex">\n{rendered}\n</code>\n'
 
 
 class LaTeXRegexParser(RegexParser):
@@ -814,14 +873,100 @@ def copy_asset_files(app: Sphinx, exception: Optional[Exception] = None):
 		return
 
 	static_dir = PathPlus(app.outdir) / "_static"
-	static_dir.maybe_make(parents=True)
-	dict2css.dump(_css.regex_styles, static_dir / "regex.css", minify=True)
+	_css.write_stylesheet(static_dir / "regex.css", _css.regex_styles, minify=True)
 
 
 regex_parser = HTMLRegexParser()
 latex_regex_parser = LaTeXRegexParser()
 
 
+def load_render_cache(app: Sphinx) -> None:
+	"""
+	Restore :data:`~.regex_render_cache` from the build environment,
+	and store it there so it is pickled along with the environment.
+
+	Patterns rendered by a different version of ``sphinx-toolbox`` are discarded,
+	as the markup may have changed.
+	The size of the cache is limited by :confval:`regex_render_cache_size`.
+
+	This function is connected to the :event:`builder-inited` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	"""  # noqa: D400
+
+	global _render_cache_max_size
+	_render_cache_max_size = app.config.regex_render_cache_size
+
+	env_cache = getattr(app.env, "regex_render_cache", None)
+
+	if getattr(app.env, "regex_render_cache_version", None) != __version__:
+		env_cache = None
+
+	if env_cache is not None and env_cache is not regex_render_cache:
+		regex_render_cache.update(env_cache)
+		_trim_render_cache()
+
+	app.env.regex_render_cache = regex_render_cache  # type: ignore[attr-defined]
+	app.env.regex_render_cache_version = __version__  # type: ignore[attr-defined]
+
+
+def render_regex_nodes(app: Sphinx, doctree: nodes.document) -> None:
+	"""
+	Render the regular expressions in a document during the read phase,
+	so the output is cached in the build environment for the write phase.
+
+	Only the parser for the current builder's output format is used.
+
+	This function is connected to the :event:`doctree-read` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	:param doctree:
+	"""  # noqa: D400
+
+	parser: RegexParser
+
+	if app.builder.format == "html":
+		parser = regex_parser
+	elif app.builder.format == "latex":
+		parser = latex_regex_parser
+	else:
+		return
+
+	for node in doctree.traverse(RegexNode):
+		parser.parse_pattern(node.pattern)
+
+
+def merge_render_cache(
+		app: Sphinx,
+		env: BuildEnvironment,
+		docnames: Set[str],
+		other: BuildEnvironment,
+		) -> None:
+	"""
+	Merge the patterns rendered by a parallel reader process into :data:`~.regex_render_cache`.
+
+	This function is connected to the :event:`env-merge-info` event.
+
+	.. versionadded:: 2.19.0
+
+	:param app: The Sphinx application.
+	:param env: The main Sphinx build environment.
+	:param docnames: The names of the documents read by the other process.
+	:param other: The build environment from the other process.
+	"""
+
+	if getattr(other, "regex_render_cache_version", None) == __version__:
+		regex_render_cache.update(getattr(other, "regex_render_cache", {}))
+		_trim_render_cache()
+
+	env.regex_render_cache = regex_render_cache  # type: ignore[attr-defined]
+	env.regex_render_cache_version = __version__  # type: ignore[attr-defined]
+
+
 def configure(app: Sphinx, config: Config):
 	"""
 	Configure :mod:`sphinx_toolbox.code`.
@@ -862,7 +1007,12 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	app.setup_extension("sphinx.ext.autodoc")
 	app.setup_extension("sphinx_toolbox._css")
 
+	app.add_config_value("regex_render_cache_size", 16384, '', types=[int])
+
 	app.connect("config-inited", configure)
+	app.connect("builder-inited", load_render_cache)
+	app.connect("doctree-read", render_regex_nodes)
+	app.connect("env-merge-info", merge_render_cache)
 
 	app.add_autodocumenter(RegexDocumenter)
 
@@ -873,4 +1023,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 			latex=(visit_regex_node_latex, depart_regex_node_latex)
 			)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -149,4 +149,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	app.connect("autodoc-process-docstring", sourcelinks_process_docstring)
 	app.add_config_value("autodoc_show_sourcelink", False, "env", [bool])
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
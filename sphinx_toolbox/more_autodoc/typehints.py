@@ -115,11 +115,26 @@ import json
 import operator
 import re
 import sys
+import threading
 import types
+from collections import OrderedDict
 from contextlib import suppress
 from tempfile import TemporaryDirectory
 from types import FunctionType, ModuleType
-from typing import Any, AnyStr, Callable, Dict, List, NewType, Optional, Tuple, Type, TypeVar, get_type_hints
+from typing import (
+		Any,
+		AnyStr,
+		Callable,
+		Dict,
+		List,
+		NamedTuple,
+		NewType,
+		Optional,
+		Tuple,
+		Type,
+		TypeVar,
+		get_type_hints
+		)
 
 # 3rd party
 from domdf_python_tools.stringlist import DelimitedList
@@ -200,6 +215,8 @@ __all__ = [
 		"process_docstring",
 		"format_annotation",
 		"get_all_type_hints",
+		"TypeHintsCache",
+		"type_hints_cache",
 		"docstring_hooks",
 		"setup",
 		"get_annotation_module",
@@ -291,6 +308,98 @@ class Class(ObjectAlias):
 	_alias_type = "class"
 
 
+class _CacheInfo(NamedTuple):
+	hits: int
+	misses: int
+	maxsize: int
+	currsize: int
+
+
+class _AnnotationCache:
+	"""
+	Bounded LRU cache for :func:`~.format_annotation`.
+
+	Annotations are keyed on their type and value, recursing into their arguments,
+	so that e.g. ``Union[int, str]`` and ``Union[str, int]`` (which compare equal) are cached separately.
+	Unhashable annotations are not cached.
+
+	:param maxsize: The maximum number of formatted annotations to keep.
+	"""
+
+	def __init__(self, maxsize: int = 4096):
+		self.maxsize = maxsize
+		self.hits = 0
+		self.misses = 0
+		self._cache: "OrderedDict[Tuple, str]" = OrderedDict()
+		self._lock = threading.Lock()
+
+	@classmethod
+	def make_key(cls, annotation: Any) -> Tuple:
+		args = getattr(annotation, "__args__", None)
+
+		if isinstance(args, tuple) and args:
+			return (type(annotation), annotation, tuple(cls.make_key(arg) for arg in args))
+
+		return (type(annotation), annotation)
+
+	def __call__(self, annotation: Any, fully_qualified: bool) -> str:
+		try:
+			key = (self.make_key(annotation), fully_qualified)
+			hash(key)
+		except TypeError:
+			# Unhashable annotation
+			self.misses += 1
+			return _format_annotation(annotation, fully_qualified)
+
+		with self._lock:
+			if key in self._cache:
+				self.hits += 1
+				self._cache.move_to_end(key)
+				return self._cache[key]
+
+		self.misses += 1
+		formatted = _format_annotation(annotation, fully_qualified)
+
+		with self._lock:
+			self._cache[key] = formatted
+			if len(self._cache) > self.maxsize:
+				self._cache.popitem(last=False)
+
+		return formatted
+
+	def cache_info(self) -> _CacheInfo:
+		return _CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+	def cache_clear(self) -> None:
+		with self._lock:
+			self._cache.clear()
+			self.hits = self.misses = 0
+
+
+_annotation_cache = _AnnotationCache()
+
+# Objects which are always formatted the same way, mapped to their role and name.
+_special_annotations: Dict[Any, Tuple[str, str]] = {
+		itertools.cycle: ("func", "itertools.cycle"),
+		types.GetSetDescriptorType: ("py:data", "types.GetSetDescriptorType"),
+		types.MemberDescriptorType: ("py:data", "types.MemberDescriptorType"),
+		types.MappingProxyType: ("py:class", "types.MappingProxyType"),
+		types.ModuleType: ("py:class", "types.ModuleType"),
+		types.FunctionType: ("py:data", "types.FunctionType"),
+		types.BuiltinFunctionType: ("py:data", "types.BuiltinFunctionType"),
+		types.MethodType: ("py:data", "types.MethodType"),
+		MethodDescriptorType: ("py:data", "types.MethodDescriptorType"),
+		ClassMethodDescriptorType: ("py:data", "types.ClassMethodDescriptorType"),
+		MethodWrapperType: ("py:data", "types.MethodWrapperType"),
+		WrapperDescriptorType: ("py:data", "types.WrapperDescriptorType"),
+		type(re.compile('')): ("py:class", "typing.Pattern"),
+		TemporaryDirectory: ("py:obj", "tempfile.TemporaryDirectory"),
+		}
+
+if sys.version_info >= (3, 10):  # pragma: no cover (<py310)
+	_special_annotations[types.UnionType] = ("py:data", "types.UnionType")
+
+
 def format_annotation(annotation, fully_qualified: bool = False) -> str:
 	"""
 	Format a type annotation.
@@ -302,8 +411,21 @@ def format_annotation(annotation, fully_qualified: bool = False) -> str:
 	:rtype:
 
 	.. versionchanged:: 2.13.0  Added support for :py:obj:`True` and :py:obj:`False`
+	.. versionchanged:: 2.19.0
+
+		The formatted annotations are cached, as the same annotations tend to be formatted many times in a project.
+		Use ``format_annotation.cache_info()`` to see the number of cache hits and misses,
+		and ``format_annotation.cache_clear()`` to empty the cache.
 	"""
 
+	return _annotation_cache(annotation, fully_qualified)
+
+
+format_annotation.cache_info = _annotation_cache.cache_info  # type: ignore[attr-defined]
+format_annotation.cache_clear = _annotation_cache.cache_clear  # type: ignore[attr-defined]
+
+
+def _format_annotation(annotation, fully_qualified: bool = False) -> str:
 	prefix = '' if fully_qualified else '~'
 
 	# Special cases
@@ -313,40 +435,14 @@ def format_annotation(annotation, fully_qualified: bool = False) -> str:
 		return f":py:obj:`{annotation}`"
 	elif annotation is Ellipsis:
 		return "..."
-	elif annotation is itertools.cycle:
-		return f":func:`{prefix}itertools.cycle`"
-	elif annotation is types.GetSetDescriptorType:  # noqa: E721
-		return f":py:data:`{prefix}types.GetSetDescriptorType`"
-	elif annotation is types.MemberDescriptorType:  # noqa: E721
-		return f":py:data:`{prefix}types.MemberDescriptorType`"
-	elif annotation is types.MappingProxyType:  # noqa: E721
-		return f":py:class:`{prefix}types.MappingProxyType`"
-	elif annotation is types.ModuleType:  # noqa: E721
-		return f":py:class:`{prefix}types.ModuleType`"
-	elif annotation is types.FunctionType:  # noqa: E721
-		return f":py:data:`{prefix}types.FunctionType`"
-	elif annotation is types.BuiltinFunctionType:  # noqa: E721
-		return f":py:data:`{prefix}types.BuiltinFunctionType`"
-	elif annotation is types.MethodType:  # noqa: E721
-		return f":py:data:`{prefix}types.MethodType`"
-	elif annotation is MethodDescriptorType:
-		return f":py:data:`{prefix}types.MethodDescriptorType`"
-	elif annotation is ClassMethodDescriptorType:
-		return f":py:data:`{prefix}types.ClassMethodDescriptorType`"
-	elif annotation is MethodWrapperType:
-		return f":py:data:`{prefix}types.MethodWrapperType`"
-	elif annotation is WrapperDescriptorType:
-		return f":py:data:`{prefix}types.WrapperDescriptorType`"
 	elif isinstance(annotation, ForwardRef):
 		# Unresolved forward ref
 		return f":py:obj:`{prefix}.{annotation.__forward_arg__}`"
-	elif annotation is type(re.compile('')):  # noqa: E721
-		return f":py:class:`{prefix}typing.Pattern`"
-	elif annotation is TemporaryDirectory:
-		return f":py:obj:`{prefix}tempfile.TemporaryDirectory`"
-	elif sys.version_info >= (3, 10):  # pragma: no cover (<py310)
-		if annotation is types.UnionType:  # noqa: E721
-			return f":py:data:`{prefix}types.UnionType`"
+
+	with suppress(TypeError):  # Unhashable
+		if annotation in _special_annotations:
+			role, name = _special_annotations[annotation]
+			return f":{role}:`{prefix}{name}`"
 
 	try:
 		module = get_annotation_module(annotation)
@@ -689,70 +785,133 @@ def process_docstring(
 	for hook, priority in sorted(docstring_hooks, key=operator.itemgetter(1)):
 		obj = hook(obj)
 
-	if callable(obj):
-		obj = inspect.unwrap(obj)
-		type_hints = get_all_type_hints(obj, name, original_obj)
+	if not callable(obj):
+		return
 
-		for argname, annotation in type_hints.items():
-			if argname == "return":
-				continue  # this is handled separately later
+	obj = inspect.unwrap(obj)
+	type_hints = get_all_type_hints(obj, name, original_obj)
+	fields = _index_docstring_fields(lines)
 
-			argname = escape_trailing__(argname)
+	# Lines to insert before the line with the given index, and to add at the end.
+	insertions: Dict[int, List[str]] = {}
+	trailer: List[str] = []
 
-			formatted_annotation = format_annotation(
-					annotation,
-					fully_qualified=app.config.typehints_fully_qualified,
-					)
+	for argname, annotation in type_hints.items():
+		if argname == "return":
+			continue  # this is handled separately later
 
-			searchfor = [f":{field} {argname}:" for field in ("param", "parameter", "arg", "argument")]
-			insert_index = None
+		argname = escape_trailing__(argname)
 
-			for i, line in enumerate(lines):
-				if any(line.startswith(search_string) for search_string in searchfor):
-					insert_index = i
-					break
+		formatted_annotation = format_annotation(
+				annotation,
+				fully_qualified=app.config.typehints_fully_qualified,
+				)
 
-			if insert_index is None and app.config.always_document_param_types:
-				lines.append(f":param {argname}:")
-				insert_index = len(lines)
+		type_line = f":type {argname}: {formatted_annotation}"
 
-			if insert_index is not None:
-				lines.insert(insert_index, f":type {argname}: {formatted_annotation}")
+		if argname in fields.params:
+			insertions.setdefault(fields.params[argname], []).append(type_line)
+		elif app.config.always_document_param_types:
+			trailer.append(f":param {argname}:")
+			trailer.append(type_line)
 
-		if "return" in type_hints and not inspect.isclass(original_obj):
-			# This avoids adding a return type for data class __init__ methods
-			if what == "method" and name.endswith(".__init__"):
-				return
+	rtype_index: Optional[int] = None  # None to omit, len(lines) for the end
+	drop_index: Optional[int] = None
 
-			formatted_annotation = format_annotation(
-					type_hints["return"],
-					fully_qualified=app.config.typehints_fully_qualified,
-					)
+	# This avoids adding a return type for data class __init__ methods
+	if (
+			"return" in type_hints and not inspect.isclass(original_obj)
+			and not (what == "method" and name.endswith(".__init__"))
+			):
 
-			insert_index = len(lines)
-			for i, line in enumerate(lines):
-				if line.startswith(":rtype:"):
-					if line[7:].strip():
-						insert_index = None
-					else:
-						insert_index = i
-						lines.pop(i)
+		if fields.rtype is not None:
+			if not fields.rtype_given:
+				# An empty :rtype: marks where the return type should go.
+				rtype_index = drop_index = fields.rtype
+		elif fields.returns is not None:
+			rtype_index = fields.returns
+		else:
+			rtype_index = len(lines)
 
-					break
+		formatted_annotation = format_annotation(
+				type_hints["return"],
+				fully_qualified=app.config.typehints_fully_qualified,
+				)
+
+		if rtype_index is not None and app.config.typehints_document_rtype:
+			# Whether the return type ends up as the last line (the empty :rtype: is removed).
+			at_end = rtype_index == len(lines) or (rtype_index == len(lines) - 1 == drop_index and not trailer)
+
+			if at_end:
+				# Ensure that :rtype: doesn't get joined with a paragraph of text, which
+				# prevents it being interpreted.
+				trailer.append('')
+
+			if not (formatted_annotation == ":py:obj:`None`" and app.config.hide_none_rtype):
+				if at_end:
+					trailer.append(f":rtype: {formatted_annotation}")
+				else:
+					insertions.setdefault(rtype_index, []).append(f":rtype: {formatted_annotation}")
+
+	if not insertions and not trailer and drop_index is None:
+		return
+
+	new_lines: List[str] = []
+
+	for idx, line in enumerate(lines):
+		if idx in insertions:
+			new_lines.extend(insertions[idx])
+		if idx != drop_index:
+			new_lines.append(line)
+
+	new_lines.extend(trailer)
+	lines[:] = new_lines
+
+
+class _DocstringFields(NamedTuple):
+	#: Mapping of parameter names to the index of the first line documenting them.
+	params: Dict[str, int]
+
+	#: The index of the first ``:rtype:`` line.
+	rtype: Optional[int]
+
+	#: Whether the first ``:rtype:`` line gives a type.
+	rtype_given: bool
+
+	#: The index of the last ``:return:`` or ``:returns:`` line before the first ``:rtype:`` line.
+	returns: Optional[int]
 
-				elif line.startswith(":return:") or line.startswith(":returns:"):
-					insert_index = i
 
-			if insert_index is not None and app.config.typehints_document_rtype:
+_param_field_re = re.compile(r":(?:param|parameter|arg|argument) ([^:]*):")
 
-				if insert_index == len(lines):
-					# Ensure that :rtype: doesn't get joined with a paragraph of text, which
-					# prevents it being interpreted.
-					lines.append('')
-					insert_index += 1
 
-				if not (formatted_annotation == ":py:obj:`None`" and app.config.hide_none_rtype):
-					lines.insert(insert_index, f":rtype: {formatted_annotation}")
+def _index_docstring_fields(lines: List[str]) -> _DocstringFields:
+	"""
+	Find the positions of the parameter and return type fields in the docstring, in a single pass.
+
+	:param lines: List of strings representing the current contents of the docstring.
+	"""
+
+	params: Dict[str, int] = {}
+	rtype: Optional[int] = None
+	rtype_given = False
+	returns: Optional[int] = None
+
+	for idx, line in enumerate(lines):
+		if not line.startswith(':'):
+			continue
+
+		m = _param_field_re.match(line)
+		if m is not None:
+			params.setdefault(m.group(1), idx)
+		elif rtype is None:
+			if line.startswith(":rtype:"):
+				rtype = idx
+				rtype_given = bool(line[7:].strip())
+			elif line.startswith(":return:") or line.startswith(":returns:"):
+				returns = idx
+
+	return _DocstringFields(params, rtype, rtype_given, returns)
 
 
 def _class_get_type_hints(obj, globalns=None, localns=None):
@@ -784,6 +943,103 @@ def _class_get_type_hints(obj, globalns=None, localns=None):
 			localns = {**sys.modules[klasse.__module__].__dict__, **localns}
 
 
+class _TypeHintsEntry(NamedTuple):
+	obj: Any
+	module: Optional[ModuleType]
+	annotations: Any
+	hints: Dict[str, Any]
+	exception_type: Optional[Type[BaseException]]
+	exception_args: Tuple[Any, ...]
+
+
+class TypeHintsCache:
+	"""
+	Build-scoped cache of resolved type hints, shared by the documenters in :mod:`sphinx_toolbox.more_autodoc`.
+
+	Entries are keyed on the identity and qualified name of the object.
+	They are discarded if the object's module has been re-imported,
+	or its ``__annotations__`` replaced, since the hints were resolved.
+	Errors from resolving the hints (such as a :exc:`NameError` for a forward reference which can't be resolved)
+	are cached too, and a new instance of the exception is raised on subsequent lookups.
+
+	.. versionadded:: 2.19.0
+	"""
+
+	def __init__(self):
+		self._cache: Dict[Tuple[int, str, str], _TypeHintsEntry] = {}
+
+	def __len__(self) -> int:
+		return len(self._cache)
+
+	def get_type_hints(self, obj: Any) -> Dict[str, Any]:
+		"""
+		Returns the type hints for the object, as returned by :func:`typing.get_type_hints`.
+
+		:param obj:
+		"""
+
+		return self._resolve(obj, "get_type_hints", get_type_hints)
+
+	def class_get_type_hints(self, obj: Any) -> Dict[str, Any]:
+		"""
+		Returns the type hints for the object.
+
+		For classes, this resolves the type hints of the ``__init__`` method,
+		using the global namespaces of the modules where the class and its parents were defined
+		until all forward references can be resolved.
+
+		:param obj:
+		"""
+
+		return self._resolve(obj, "class_get_type_hints", _class_get_type_hints)
+
+	def clear(self, *args) -> None:
+		"""
+		Empty the cache.
+
+		This function is connected to the :event:`build-finished` event.
+		"""
+
+		self._cache.clear()
+
+	def _resolve(self, obj: Any, kind: str, resolver: Callable[[Any], Dict[str, Any]]) -> Dict[str, Any]:
+		qualname = getattr(obj, "__qualname__", '')
+		module_name = getattr(obj, "__module__", None)
+		key = (id(obj), qualname if isinstance(qualname, str) else '', kind)
+		module = sys.modules.get(module_name) if isinstance(module_name, str) else None
+
+		# The hints for classes come from the ``__init__`` method, which ``backfill_type_hints`` may annotate.
+		annotations = (
+				getattr(obj, "__annotations__", None),
+				getattr(getattr(obj, "__init__", None), "__annotations__", None) if inspect.isclass(obj) else None,
+				)
+
+		entry = self._cache.get(key)
+
+		if (
+				entry is None or entry.obj is not obj or entry.module is not module
+				or not all(a is b for a, b in zip(entry.annotations, annotations))
+				):
+			try:
+				entry = _TypeHintsEntry(obj, module, annotations, resolver(obj), None, ())
+			except (NameError, TypeError, KeyError, AttributeError, RecursionError) as exc:
+				# Store the type and arguments rather than the exception itself,
+				# which would hold on to (and extend) the traceback of every lookup.
+				entry = _TypeHintsEntry(obj, module, annotations, {}, type(exc), exc.args)
+
+			self._cache[key] = entry
+
+		if entry.exception_type is not None:
+			raise entry.exception_type(*entry.exception_args)
+
+		# Copy, as some callers modify the returned dictionary.
+		return dict(entry.hints)
+
+
+#: The :class:`~.TypeHintsCache` shared by the documenters in :mod:`sphinx_toolbox.more_autodoc`.
+type_hints_cache = TypeHintsCache()
+
+
 def get_all_type_hints(obj: Any, name: str, original_obj) -> Dict[str, Any]:
 	"""
 	Returns the resolved type hints for the given objects.
@@ -804,9 +1060,9 @@ def get_all_type_hints(obj: Any, name: str, original_obj) -> Dict[str, Any]:
 
 	try:
 		if inspect.isclass(original_obj):
-			rv = _class_get_type_hints(original_obj)
+			rv = type_hints_cache.class_get_type_hints(original_obj)
 		else:
-			rv = get_type_hints(obj)
+			rv = type_hints_cache.get_type_hints(obj)
 
 	except (AttributeError, TypeError, RecursionError) as exc:
 		# Introspecting a slot wrapper will raise TypeError, and some recursive type
@@ -837,9 +1093,9 @@ def get_all_type_hints(obj: Any, name: str, original_obj) -> Dict[str, Any]:
 
 	try:
 		if inspect.isclass(original_obj):
-			rv = _class_get_type_hints(original_obj)
+			rv = type_hints_cache.class_get_type_hints(original_obj)
 		else:
-			rv = get_type_hints(obj)
+			rv = type_hints_cache.get_type_hints(obj)
 	except (AttributeError, TypeError):
 		pass
 	except NameError as exc:
@@ -870,5 +1126,6 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	app.setup_extension("sphinx_autodoc_typehints")
 
 	app.add_config_value("hide_none_rtype", False, "env", [bool])
+	app.connect("build-finished", type_hints_cache.clear)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
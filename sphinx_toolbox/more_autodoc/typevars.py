@@ -357,7 +357,7 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	app.connect("config-inited", validate_config, priority=850)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
 
 
 class _TypeVar(Protocol):
@@ -99,7 +99,7 @@ import importlib
 import sys
 import warnings
 from contextlib import suppress
-from typing import Any, List, Optional, cast, get_type_hints
+from typing import Any, List, Optional, cast
 
 # 3rd party
 import sphinx
@@ -122,15 +122,20 @@ from sphinx.ext.autodoc import (
 		mock
 		)
 from sphinx.ext.autodoc.directive import DocumenterBridge
-from sphinx.pycode import ModuleAnalyzer
 from sphinx.util import inspect
 from sphinx.util.docstrings import prepare_docstring
 from sphinx.util.inspect import ForwardRef, object_description, safe_getattr
 
 # this package
 from sphinx_toolbox._data_documenter import DataDocumenter
-from sphinx_toolbox.more_autodoc.typehints import format_annotation
-from sphinx_toolbox.utils import SphinxExtMetadata, add_nbsp_substitution, flag, metadata_add_version
+from sphinx_toolbox.more_autodoc.typehints import format_annotation, type_hints_cache
+from sphinx_toolbox.utils import (
+		SphinxExtMetadata,
+		add_nbsp_substitution,
+		flag,
+		get_module_attribute_docs,
+		metadata_add_version
+		)
 
 __all__ = [
 		"VariableDocumenter",
@@ -151,7 +156,7 @@ def get_variable_type(documenter: Documenter) -> str:
 	"""
 
 	try:
-		annotations = get_type_hints(documenter.parent)
+		annotations = type_hints_cache.get_type_hints(documenter.parent)
 	except NameError:
 		# Failed to evaluate ForwardRef (maybe TYPE_CHECKING)
 		annotations = safe_getattr(documenter.parent, "__annotations__", {})
@@ -336,8 +341,7 @@ class TypedAttributeDocumenter(DocstringStripSignatureMixin, ClassLevelDocumente
 		"""
 
 		try:
-			analyzer = ModuleAnalyzer.for_module(self.modname)
-			attr_docs = analyzer.find_attr_docs()
+			attr_docs = get_module_attribute_docs(self.modname).attr_docs
 			if self.objpath:
 				key = ('.'.join(self.objpath[:-1]), self.objpath[-1])
 				if key in attr_docs:
@@ -675,5 +679,6 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	app.add_autodocumenter(SlotsAttributeDocumenter, override=True)
 
 	app.connect("config-inited", lambda _, config: add_nbsp_substitution(config))
+	app.connect("build-finished", type_hints_cache.clear)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -147,7 +147,7 @@ API Reference
 import inspect
 import operator
 import re
-from typing import Any, List, Optional, Tuple, Type
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type
 
 # 3rd party
 import autodocsumm  # type: ignore
@@ -193,6 +193,49 @@ __all__ = [
 		]
 
 
+# Mapping of (member id, parent id, object name, autodoc_inherit_docstrings) to
+# (member, parent, docstring, metadata), for the duration of the build.
+_member_doc_cache: Dict[Tuple[int, int, str, bool], Tuple[Any, Any, Optional[str], Dict[str, str]]] = {}
+
+
+def _clear_member_doc_cache(*args) -> None:
+	_member_doc_cache.clear()
+
+
+def _index_mro(
+		obj: Type,
+		inherited_members: Optional[str],
+		get_attr: Callable[..., Any],
+		) -> Tuple[Optional[int], Dict[str, int]]:
+	"""
+	Walk the MRO of a class once, recording where each member is first defined or annotated.
+
+	:param obj: The class.
+	:param inherited_members: The value of the ``inherited-members`` option.
+	:param get_attr: The documenter's attribute getter.
+
+	:returns: The position in the MRO of the superclass given by the ``inherited-members`` option
+		(or :py:obj:`None` if it isn't in the MRO), and a mapping of member names to the position in the MRO
+		of the first class which defines or annotates that member. Positions after the superclass are omitted.
+	"""
+
+	defined_in: Dict[str, int] = {}
+
+	for idx, cls in enumerate(obj.__mro__):
+		if cls.__name__ == inherited_members and cls != obj:
+			return idx, defined_in
+
+		for name in cls.__dict__:
+			defined_in.setdefault(name, idx)
+
+		annotations = get_attr(cls, "__annotations__", {})
+		if isinstance(annotations, Mapping):
+			for name in annotations:
+				defined_in.setdefault(name, idx)
+
+	return None, defined_in
+
+
 def add_autosummary(self):
 	"""
 	Add the :rst:dir:`autosummary` table of this documenter.
@@ -387,18 +430,24 @@ class PatchedAutoSummModuleDocumenter(autodocsumm.AutoSummModuleDocumenter):
 		The user can override the skipping decision by connecting to the :event:`autodoc-skip-member` event.
 		"""
 
+		inherited_index: Optional[Tuple[Optional[int], Dict[str, int]]] = None
+
 		def is_filtered_inherited_member(name: str) -> bool:
-			if inspect.isclass(self.object):
-				for cls in self.object.__mro__:
-					if cls.__name__ == self.options.inherited_members and cls != self.object:
-						# given member is a member of specified *super class*
-						return True
-					elif name in cls.__dict__:
-						return False
-					elif name in self.get_attr(cls, "__annotations__", {}):
-						return False
-
-			return False
+			nonlocal inherited_index
+
+			if not inspect.isclass(self.object):
+				return False
+
+			if inherited_index is None:
+				inherited_index = _index_mro(self.object, self.options.inherited_members, self.get_attr)
+
+			stop_index, defined_in = inherited_index
+
+			if stop_index is None:
+				return False
+
+			# given member is a member of specified *super class*
+			return stop_index <= defined_in.get(name, stop_index)
 
 		ret = []
 
@@ -410,8 +459,6 @@ class PatchedAutoSummModuleDocumenter(autodocsumm.AutoSummModuleDocumenter):
 		else:
 			attr_docs = {}
 
-		doc: Optional[str]
-
 		# process members and determine which to skip
 		for (membername, member) in members:
 			# if isattr is True, the member is documented as an attribute
@@ -420,30 +467,7 @@ class PatchedAutoSummModuleDocumenter(autodocsumm.AutoSummModuleDocumenter):
 			else:
 				isattr = False
 
-			doc = getdoc(
-					member,
-					self.get_attr,
-					self.env.config.autodoc_inherit_docstrings,
-					self.parent,
-					self.object_name
-					)
-			if not isinstance(doc, str):
-				# Ignore non-string __doc__
-				doc = None
-
-			# if the member __doc__ is the same as self's __doc__, it's just
-			# inherited and therefore not the member's doc
-			cls = self.get_attr(member, "__class__", None)
-			if cls:
-				cls_doc = self.get_attr(cls, "__doc__", None)
-				if cls_doc == doc:
-					doc = None
-
-			if sphinx.version_info > (4, 1):
-				doc, metadata = separate_metadata(doc)  # type: ignore
-			else:
-				metadata = extract_metadata(doc)  # type: ignore
-
+			doc, metadata = self._get_member_doc(member)
 			has_doc = bool(doc)
 
 			if "private" in metadata:
@@ -525,6 +549,44 @@ class PatchedAutoSummModuleDocumenter(autodocsumm.AutoSummModuleDocumenter):
 
 		return ret
 
+	def _get_member_doc(self, member: Any) -> Tuple[Optional[str], Dict[str, str]]:
+		"""
+		Returns the docstring of the member and the metadata extracted from it.
+
+		The result is cached until the end of the build,
+		as the same members are often inherited by many of the documented classes.
+
+		:param member:
+		"""
+
+		inherit_docstrings = self.env.config.autodoc_inherit_docstrings
+		key = (id(member), id(self.parent), self.object_name, inherit_docstrings)
+		cached = _member_doc_cache.get(key)
+
+		if cached is not None and cached[0] is member and cached[1] is self.parent:
+			return cached[2], cached[3]
+
+		doc: Optional[str] = getdoc(member, self.get_attr, inherit_docstrings, self.parent, self.object_name)
+		if not isinstance(doc, str):
+			# Ignore non-string __doc__
+			doc = None
+
+		# if the member __doc__ is the same as self's __doc__, it's just
+		# inherited and therefore not the member's doc
+		cls = self.get_attr(member, "__class__", None)
+		if cls:
+			cls_doc = self.get_attr(cls, "__doc__", None)
+			if cls_doc == doc:
+				doc = None
+
+		if sphinx.version_info > (4, 1):
+			doc, metadata = separate_metadata(doc)  # type: ignore
+		else:
+			metadata = extract_metadata(doc)  # type: ignore
+
+		_member_doc_cache[key] = (member, self.parent, doc, metadata)
+		return doc, metadata
+
 	def get_object_members(self, want_all: bool) -> Tuple[bool, ObjectMembers]:
 		"""
 		Return a tuple of  ``(members_check_module, members)``,
@@ -659,4 +721,6 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 			types=[str],
 			)
 
-	return {"parallel_read_safe": True}
+	app.connect("build-finished", _clear_member_doc_cache)
+
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
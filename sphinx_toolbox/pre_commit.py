@@ -173,6 +173,8 @@ class PreCommitDirective(SphinxDirective):
 		Process the content of the directive.
 		"""
 
+		dependencies = []
+
 		if "hooks" in self.options:
 			hooks = self.options["hooks"]
 		else:
@@ -183,6 +185,7 @@ class PreCommitDirective(SphinxDirective):
 				if hook_file.is_file():
 					hooks_dict = YAML(typ="safe", pure=True).load(hook_file.read_text())
 					hooks = [h["id"] for h in hooks_dict]
+					dependencies.append(hook_file)
 					break
 			else:
 				warnings.warn("No hooks specified and no .pre-commit-hooks.yaml file found.")
@@ -218,7 +221,7 @@ class PreCommitDirective(SphinxDirective):
 		pre_commit_node = nodes.paragraph(rawsource=content)
 		self.state.nested_parse(view, self.content_offset, pre_commit_node)
 
-		pre_commit_node_purger.add_node(self.env, pre_commit_node, targetnode, self.lineno)
+		pre_commit_node_purger.add_node(self.env, pre_commit_node, targetnode, self.lineno, files=dependencies)
 
 		return [pre_commit_node]
 
@@ -347,10 +350,13 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	app.add_directive("pre-commit", PreCommitDirective)
 	app.add_directive("pre-commit:flake8", Flake8PreCommitDirective)
+	app.connect("env-get-outdated", pre_commit_node_purger.get_outdated_docnames)
 	app.connect("env-purge-doc", pre_commit_node_purger.purge_nodes)
+	app.connect("env-merge-info", pre_commit_node_purger.merge_nodes)
 	app.connect("env-purge-doc", pre_commit_f8_node_purger.purge_nodes)
+	app.connect("env-merge-info", pre_commit_f8_node_purger.merge_nodes)
 
 	if sphinx.version_info >= (4, 0):
 		revert_8345()
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -0,0 +1,601 @@
+#!/usr/bin/env python3
+#
+#  profiling.py
+"""
+Measure the time taken by each part of ``sphinx-toolbox`` during a build.
+
+.. versionadded:: 2.19.0
+
+When profiling is enabled every event handler, directive, role and node visitor registered
+by a ``sphinx-toolbox`` extension is timed.
+At the end of the build a summary of the slowest components is shown on the console,
+and a full report is written to the output directory.
+
+Profiling is enabled with the :confval:`toolbox_profile` configuration value,
+or by setting the ``SPHINX_TOOLBOX_PROFILE`` environment variable.
+It is set up automatically by the ``setup`` function of each ``sphinx-toolbox`` extension,
+so this module need not be added to ``extensions`` in ``conf.py``.
+
+The report contains one entry per component, with these fields:
+
+* ``kind`` -- one of ``'event'``, ``'directive'``, ``'role'``, ``'visit'`` or ``'depart'``.
+* ``name`` -- the name of the event, directive or role, or of the node class being visited.
+* ``handler`` -- the fully qualified name of the function or class which handles it.
+* ``calls`` -- the number of times the handler was called.
+* ``total`` -- the total wall time spent in the handler, in seconds.
+* ``p95`` -- the 95th percentile wall time of a single call, in seconds.
+* ``bytes_written`` -- for event handlers, the number of bytes written to files while the handler was running.
+  This is only measured on Linux, and may include data written by other threads.
+  For node visitors, the number of characters of output produced.
+
+.. note::
+
+	In parallel builds only the work done in the main process is recorded.
+
+Configuration
+--------------
+
+.. confval:: toolbox_profile
+	:type: :class:`bool` or :class:`str`
+	:required: False
+	:default: :py:obj:`False`
+
+	Whether to profile ``sphinx-toolbox``.
+	If a string, the filename of the report, relative to the output directory.
+	Reports with a ``.csv`` suffix are written in CSV format; otherwise JSON is used.
+	The default filename is ``toolbox_profile.json``.
+
+	The ``SPHINX_TOOLBOX_PROFILE`` environment variable takes the same values,
+	where ``1``, ``true``, ``yes`` and ``on`` enable profiling with the default filename.
+
+
+API Reference
+--------------
+
+"""
+#
+#  Copyright © 2022 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+#  MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+#  IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+#  DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+#  OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+# stdlib
+import csv
+import functools
+import math
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+from weakref import WeakKeyDictionary
+
+# 3rd party
+from docutils import nodes
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+from sphinx.application import Sphinx
+from sphinx.util import logging
+from sphinx.util.console import bold  # type: ignore[attr-defined]
+
+# this package
+import sphinx_toolbox
+
+__all__ = [
+		"PROFILE_ENV_VAR",
+		"ComponentStats",
+		"Profiler",
+		"get_profiler",
+		"get_profile_setting",
+		"instrument_app",
+		"write_report",
+		"setup",
+		]
+
+logger = logging.getLogger(__name__)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+#: The name of an environment variable which enables profiling.
+#: It takes the same values as :confval:`toolbox_profile`.
+PROFILE_ENV_VAR = "SPHINX_TOOLBOX_PROFILE"
+
+_default_report_filename = "toolbox_profile.json"
+
+#: The number of components shown in the summary on the console.
+_summary_length = 15
+
+
+class ComponentStats:
+	"""
+	Timings for a single event handler, directive, role or node visitor.
+
+	:param kind: One of ``'event'``, ``'directive'``, ``'role'``, ``'visit'`` or ``'depart'``.
+	:param name: The name of the event, directive or role, or of the node class being visited.
+	:param handler: The fully qualified name of the function or class which handles it.
+	"""
+
+	def __init__(self, kind: str, name: str, handler: str):
+		self.kind: str = kind
+		self.name: str = name
+		self.handler: str = handler
+
+		#: The wall time of each call, in seconds.
+		self.durations: List[float] = []
+
+		#: The number of bytes written.
+		self.bytes_written: int = 0
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__}({self.kind!r}, {self.name!r}, {self.handler!r}, calls={self.calls})>"
+
+	@property
+	def calls(self) -> int:
+		"""
+		The number of times the handler was called.
+		"""
+
+		return len(self.durations)
+
+	@property
+	def total(self) -> float:
+		"""
+		The total wall time spent in the handler, in seconds.
+		"""
+
+		return math.fsum(self.durations)
+
+	@property
+	def p95(self) -> float:
+		"""
+		The 95th percentile wall time of a single call, in seconds.
+		"""
+
+		if not self.durations:
+			return 0.0
+
+		durations = sorted(self.durations)
+		return durations[math.ceil(0.95 * len(durations)) - 1]
+
+	def as_dict(self) -> Dict[str, Any]:
+		"""
+		Returns the statistics as a dictionary, in the format used for the report.
+		"""
+
+		return {
+				"kind": self.kind,
+				"name": self.name,
+				"handler": self.handler,
+				"calls": self.calls,
+				"total": self.total,
+				"p95": self.p95,
+				"bytes_written": self.bytes_written,
+				}
+
+
+def _qualified_name(obj: Any) -> str:
+	if not hasattr(obj, "__qualname__"):
+		# e.g. instances of SphinxRole
+		obj = type(obj)
+
+	return f"{obj.__module__}.{obj.__qualname__}"
+
+
+def _is_toolbox_object(obj: Any) -> bool:
+	module = getattr(obj, "__module__", None) or ''
+	return module.startswith("sphinx_toolbox.") and module != __name__
+
+
+def _get_bytes_written() -> int:
+	# The number of bytes this process has passed to write(2) and similar, on Linux.
+	try:
+		with open("/proc/self/io", "rb") as fp:
+			for line in fp:
+				if line.startswith(b"wchar:"):
+					return int(line.split()[1])
+	except (OSError, ValueError):  # pragma: no cover (!Linux)
+		pass
+
+	return 0  # pragma: no cover (!Linux)
+
+
+def _output_length(translator: nodes.NodeVisitor) -> Optional[int]:
+	body = getattr(translator, "body", None)
+
+	if isinstance(body, list):
+		return len(body)
+
+	return None
+
+
+class Profiler:
+	"""
+	Records the time spent in the handlers registered by ``sphinx-toolbox`` extensions.
+	"""
+
+	def __init__(self):
+		#: Mapping of ``(kind, name, handler)`` to the statistics for that component.
+		self.stats: Dict[Tuple[str, str, str], ComponentStats] = {}
+
+	def get_stats(self, kind: str, name: str, handler: str) -> ComponentStats:
+		"""
+		Returns the statistics for the given component, creating them if necessary.
+
+		:param kind: One of ``'event'``, ``'directive'``, ``'role'``, ``'visit'`` or ``'depart'``.
+		:param name: The name of the event, directive or role, or of the node class being visited.
+		:param handler: The fully qualified name of the function or class which handles it.
+		"""
+
+		key = (kind, name, handler)
+
+		if key not in self.stats:
+			self.stats[key] = ComponentStats(kind, name, handler)
+
+		return self.stats[key]
+
+	def wrap_event_handler(self, event: str, callback: _F) -> _F:
+		"""
+		Returns a wrapper around the given event handler which records its timings.
+
+		Handlers which are not part of ``sphinx-toolbox`` are returned unchanged.
+
+		:param event: The name of the event.
+		:param callback:
+		"""
+
+		if not _is_toolbox_object(callback):
+			return callback
+
+		stats = self.get_stats("event", event, _qualified_name(callback))
+
+		@functools.wraps(callback)
+		def wrapper(*args, **kwargs):
+			written = _get_bytes_written()
+			start = time.perf_counter()
+
+			try:
+				return callback(*args, **kwargs)
+			finally:
+				stats.durations.append(time.perf_counter() - start)
+				stats.bytes_written += _get_bytes_written() - written
+
+		return wrapper  # type: ignore[return-value]
+
+	def wrap_directive(self, name: str, directive: Any) -> Any:
+		"""
+		Returns a subclass of the given directive which records the timings of its ``run`` method.
+
+		Directives which are not part of ``sphinx-toolbox`` are returned unchanged.
+
+		:param name: The name of the directive.
+		:param directive: The directive class.
+		"""
+
+		if not (isinstance(directive, type) and _is_toolbox_object(directive)):
+			return directive
+
+		stats = self.get_stats("directive", name, _qualified_name(directive))
+		run = directive.run
+
+		@functools.wraps(run)
+		def timed_run(self) -> List[nodes.Node]:  # noqa: MAN001
+			start = time.perf_counter()
+
+			try:
+				return run(self)
+			finally:
+				stats.durations.append(time.perf_counter() - start)
+
+		return type(
+				directive.__name__,
+				(directive, ),
+				{"run": timed_run, "__module__": directive.__module__, "__qualname__": directive.__qualname__},
+				)
+
+	def wrap_role(self, name: str, role: _F) -> _F:
+		"""
+		Returns a wrapper around the given role which records its timings.
+
+		Roles which are not part of ``sphinx-toolbox`` are returned unchanged.
+
+		:param name: The name of the role.
+		:param role: The role function, or an instance of :class:`sphinx.util.docutils.SphinxRole`.
+		"""
+
+		if not _is_toolbox_object(role):
+			return role
+
+		stats = self.get_stats("role", name, _qualified_name(role))
+
+		@functools.wraps(role)
+		def wrapper(*args, **kwargs):
+			start = time.perf_counter()
+
+			try:
+				return role(*args, **kwargs)
+			finally:
+				stats.durations.append(time.perf_counter() - start)
+
+		return wrapper  # type: ignore[return-value]
+
+	def wrap_visitor(self, kind: str, node: str, visitor: _F) -> _F:
+		"""
+		Returns a wrapper around the given node visitor which records its timings
+		and the number of characters of output it produces.
+
+		Visitors which are not part of ``sphinx-toolbox`` are returned unchanged.
+
+		:param kind: Either ``'visit'`` or ``'depart'``.
+		:param node: The name of the node class.
+		:param visitor: The visitor function.
+		"""  # noqa: D400
+
+		if not _is_toolbox_object(visitor):
+			return visitor
+
+		stats = self.get_stats(kind, node, _qualified_name(visitor))
+
+		@functools.wraps(visitor)
+		def wrapper(translator: nodes.NodeVisitor, node: nodes.Node):
+			output_length = _output_length(translator)
+			start = time.perf_counter()
+
+			try:
+				return visitor(translator, node)
+			finally:
+				stats.durations.append(time.perf_counter() - start)
+
+				if output_length is not None:
+					body = translator.body  # type: ignore[attr-defined]
+					stats.bytes_written += sum(map(len, body[output_length:]))
+
+		return wrapper  # type: ignore[return-value]
+
+	def summary(self) -> List[Dict[str, Any]]:
+		"""
+		Returns the statistics for each component which was called, slowest first.
+		"""
+
+		stats = [s for s in self.stats.values() if s.calls]
+		stats.sort(key=lambda s: (-s.total, s.kind, s.name, s.handler))
+		return [s.as_dict() for s in stats]
+
+
+_profilers: "WeakKeyDictionary[Sphinx, Profiler]" = WeakKeyDictionary()
+
+
+def get_profiler(app: Sphinx) -> Optional[Profiler]:
+	"""
+	Returns the :class:`~.Profiler` for the given Sphinx application,
+	or :py:obj:`None` if profiling is not enabled.
+
+	:param app: The Sphinx application.
+	"""  # noqa: D400
+
+	return _profilers.get(app)
+
+
+def _parse_setting(value: Any) -> Union[bool, str]:
+	if isinstance(value, str):
+		if value.strip().lower() in {'', '0', "false", "no", "off"}:
+			return False
+		elif value.strip().lower() in {'1', "true", "yes", "on"}:
+			return True
+		return value
+
+	return bool(value)
+
+
+def get_profile_setting(app: Sphinx) -> Union[bool, str]:
+	"""
+	Returns the value of :confval:`toolbox_profile`,
+	taking into account the :data:`~.PROFILE_ENV_VAR` environment variable.
+
+	This can be called before the configuration has been initialised,
+	such as from an extension's ``setup`` function.
+
+	:param app: The Sphinx application.
+	"""  # noqa: D400
+
+	config = getattr(app, "config", None)
+	overrides = getattr(config, "overrides", {})
+	raw_config = getattr(config, "_raw_config", {})
+
+	if "toolbox_profile" in overrides:
+		return _parse_setting(overrides["toolbox_profile"])
+	elif "toolbox_profile" in raw_config:
+		return _parse_setting(raw_config["toolbox_profile"])
+	else:
+		return _parse_setting(os.environ.get(PROFILE_ENV_VAR, ''))
+
+
+def _patch(app: Sphinx, method_name: str, patch: Callable[[Callable], Callable]) -> None:
+	setattr(app, method_name, patch(getattr(app, method_name)))
+
+
+def instrument_app(app: Sphinx) -> Profiler:
+	"""
+	Start profiling the ``sphinx-toolbox`` components registered with the given Sphinx application.
+
+	Event handlers which have already been connected are wrapped,
+	as are any event handlers, directives, roles and node visitors registered afterwards.
+
+	:param app: The Sphinx application.
+
+	:returns: The profiler, which is also available from :func:`~.get_profiler`.
+	"""
+
+	if app in _profilers:
+		return _profilers[app]
+
+	profiler = _profilers[app] = Profiler()
+
+	for event, listeners in app.events.listeners.items():
+		listeners[:] = [
+				listener._replace(handler=profiler.wrap_event_handler(event, listener.handler))
+				for listener in listeners
+				]
+
+	def patch_connect(connect: Callable) -> Callable:
+
+		def patched_connect(event: str, callback: Callable, *args, **kwargs):
+			return connect(event, profiler.wrap_event_handler(event, callback), *args, **kwargs)
+
+		return patched_connect
+
+	def patch_add_directive(add_directive: Callable) -> Callable:
+
+		def patched_add_directive(name: str, cls: Any, *args, **kwargs):
+			return add_directive(name, profiler.wrap_directive(name, cls), *args, **kwargs)
+
+		return patched_add_directive
+
+	def patch_add_directive_to_domain(add_directive_to_domain: Callable) -> Callable:
+
+		def patched_add_directive_to_domain(domain: str, name: str, cls: Any, *args, **kwargs):
+			wrapped = profiler.wrap_directive(f"{domain}:{name}", cls)
+			return add_directive_to_domain(domain, name, wrapped, *args, **kwargs)
+
+		return patched_add_directive_to_domain
+
+	def patch_add_role(add_role: Callable) -> Callable:
+
+		def patched_add_role(name: str, role: Any, *args, **kwargs):
+			return add_role(name, profiler.wrap_role(name, role), *args, **kwargs)
+
+		return patched_add_role
+
+	def patch_add_role_to_domain(add_role_to_domain: Callable) -> Callable:
+
+		def patched_add_role_to_domain(domain: str, name: str, role: Any, *args, **kwargs):
+			return add_role_to_domain(domain, name, profiler.wrap_role(f"{domain}:{name}", role), *args, **kwargs)
+
+		return patched_add_role_to_domain
+
+	def patch_add_node(add_node: Callable) -> Callable:
+
+		def patched_add_node(node: type, *args, **kwargs):
+			for key, value in kwargs.items():
+				if isinstance(value, tuple) and len(value) == 2:
+					visit, depart = value
+					kwargs[key] = (
+							profiler.wrap_visitor("visit", node.__name__, visit),
+							depart and profiler.wrap_visitor("depart", node.__name__, depart),
+							)
+
+			return add_node(node, *args, **kwargs)
+
+		return patched_add_node
+
+	_patch(app, "connect", patch_connect)
+	_patch(app, "add_directive", patch_add_directive)
+	_patch(app, "add_directive_to_domain", patch_add_directive_to_domain)
+	_patch(app, "add_role", patch_add_role)
+	_patch(app, "add_role_to_domain", patch_add_role_to_domain)
+	_patch(app, "add_node", patch_add_node)
+	_patch(app, "add_enumerable_node", patch_add_node)
+
+	return profiler
+
+
+def write_report(filename: PathLike, profiler: Profiler) -> None:
+	"""
+	Write the statistics recorded by the given profiler to a file.
+
+	:param filename: The filename of the report.
+		Reports with a ``.csv`` suffix are written in CSV format; otherwise JSON is used.
+	:param profiler:
+	"""
+
+	filename = PathPlus(filename)
+	filename.parent.maybe_make(parents=True)
+	summary = profiler.summary()
+
+	if filename.suffix.lower() == ".csv":
+		with filename.open('w', newline='') as fp:
+			writer = csv.DictWriter(
+					fp,
+					fieldnames=["kind", "name", "handler", "calls", "total", "p95", "bytes_written"],
+					)
+			writer.writeheader()
+			writer.writerows(summary)
+	else:
+		filename.dump_json(summary, indent=2)
+
+
+def _report(app: Sphinx, exception: Optional[Exception] = None) -> None:
+	"""
+	Write the profiling report, and show a summary on the console.
+
+	:param app: The Sphinx application.
+	:param exception: Any exception which occurred and caused Sphinx to abort.
+	"""
+
+	# 3rd party
+	import tabulate
+
+	profiler = get_profiler(app)
+	if profiler is None:  # pragma: no cover
+		return
+
+	setting = get_profile_setting(app)
+	if not isinstance(setting, str):
+		setting = _default_report_filename
+
+	filename = PathPlus(app.outdir) / setting
+	write_report(filename, profiler)
+
+	summary = profiler.summary()
+	rows = [[
+			s["kind"],
+			s["name"],
+			s["handler"],
+			s["calls"],
+			f"{s['total']:.3f}",
+			f"{s['p95'] * 1000:.2f}",
+			s["bytes_written"],
+			] for s in summary[:_summary_length]]
+
+	table = tabulate.tabulate(
+			rows,
+			headers=["Kind", "Name", "Handler", "Calls", "Total (s)", "p95 (ms)", "Bytes"],
+			tablefmt="simple",
+			)
+
+	logger.info('')
+	logger.info(bold(f"sphinx-toolbox profile (slowest {len(rows)} of {len(summary)} components):"))
+	logger.info(table)
+	logger.info(f"Full profile written to {filename}")
+
+
+def setup(app: Sphinx) -> Dict[str, Any]:
+	"""
+	Setup :mod:`sphinx_toolbox.profiling`.
+
+	This is called by the ``setup`` function of each ``sphinx-toolbox`` extension
+	when :confval:`toolbox_profile` is enabled.
+
+	:param app: The Sphinx application.
+	"""
+
+	app.add_config_value("toolbox_profile", False, '', types=[bool, str])
+
+	if get_profile_setting(app):
+		instrument_app(app)
+		app.connect("build-finished", _report, priority=900)
+
+	return {"version": sphinx_toolbox.__version__, "parallel_read_safe": True, "parallel_write_safe": True}
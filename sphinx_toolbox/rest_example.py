@@ -191,5 +191,6 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	app.add_directive("rest-example", reSTExampleDirective)
 	app.connect("env-purge-doc", rest_example_purger.purge_nodes)
+	app.connect("env-merge-info", rest_example_purger.merge_nodes)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
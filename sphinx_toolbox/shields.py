@@ -388,7 +388,6 @@ from typing import List, Optional
 from urllib.parse import quote
 
 # 3rd party
-import dict2css
 from apeye.url import URL
 from docutils import nodes
 from docutils.nodes import fully_normalize_name, whitespace_normalize_name
@@ -876,8 +875,7 @@ def copy_asset_files(app: Sphinx, exception: Optional[Exception] = None):
 		return
 
 	static_dir = PathPlus(app.outdir) / "_static"
-	static_dir.maybe_make(parents=True)
-	dict2css.dump(_css.shields_styles, static_dir / "toolbox-shields.css", minify=True)
+	_css.write_stylesheet(static_dir / "toolbox-shields.css", _css.shields_styles, minify=True)
 
 
 @metadata_add_version
@@ -903,4 +901,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	app.add_directive("pre-commit-shield", PreCommitShield)
 	app.add_directive("pre-commit-ci-shield", PreCommitCIShield)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
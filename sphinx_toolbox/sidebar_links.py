@@ -195,4 +195,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	app.add_directive("sidebar-links", SidebarLinksDirective)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -64,17 +64,21 @@ Functions for testing Sphinx extensions.
 
 # stdlib
 import copy
+import hashlib
+import pickle  # nosec: B403
 import re
+import shutil
 import sys
 import tempfile
 from functools import partial
+from io import StringIO
 from types import SimpleNamespace
-from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Type, Union, cast
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Type, Union, cast
 
 # 3rd party
 import pytest  # nodep
 import sphinx.application
-from bs4 import BeautifulSoup  # type: ignore
+from bs4 import BeautifulSoup, Tag  # type: ignore
 from coincidence.regressions import (  # nodep
 		AdvancedFileRegressionFixture,
 		check_file_output,
@@ -116,11 +120,16 @@ __all__ = [
 		"remove_html_footer",
 		"check_html_regression",
 		"remove_html_link_tags",
+		"NormalizedHTML",
+		"normalize_html",
 		"check_asset_copy",
 		"HTMLRegressionFixture",
 		"html_regression",
 		"LaTeXRegressionFixture",
 		"latex_regression",
+		"SharedSphinxApp",
+		"SphinxAppCache",
+		"sphinx_app_cache",
 		]
 
 
@@ -639,10 +648,114 @@ def remove_html_link_tags(page: BeautifulSoup) -> BeautifulSoup:
 	return page
 
 
-def check_html_regression(page: BeautifulSoup, file_regression: FileRegressionFixture):
+class NormalizedHTML(NamedTuple):
+	"""
+	The canonical serialization of an HTML page generated by Sphinx, as returned by :func:`~.normalize_html`.
+
+	.. versionadded:: 2.19.0
+	"""
+
+	#: The canonical serialization of the page.
+	html: str
+
+	#: The SHA-256 hash of :attr:`~.NormalizedHTML.html`, encoded as UTF-8.
+	sha256: str
+
+	@classmethod
+	def from_html(cls, html: str) -> "NormalizedHTML":
+		"""
+		Construct a :class:`~.NormalizedHTML` from an already normalized page, computing its hash.
+
+		:param html:
+		"""
+
+		return cls(html, hashlib.sha256(html.encode("UTF-8")).hexdigest())
+
+
+def _is_removed(tag: Tag, in_head: bool, pygments_whitespace: bool) -> bool:
+	name = tag.name
+
+	if name == "div":
+		classes = tag.get("class") or ()
+		return "footer" in classes or "sphinxsidebar" in classes
+	elif name == "link":
+		return in_head
+	elif name == "script":
+		return "_static/language_data.js" in str(tag)
+	elif name == "span" and pygments_whitespace:
+		return 'w' in (tag.get("class") or ())
+
+	return False
+
+
+def _canonicalize_tree(page: BeautifulSoup, pygments_whitespace: bool = False) -> BeautifulSoup:
+	"""
+	Remove the parts of the page which vary between Sphinx versions, in a single pass over the tree.
+
+	:param page:
+	:param pygments_whitespace: Whether to remove Pygments' whitespace tokens,
+		and normalise the spacing around ``=`` tokens.
+	"""
+
+	removed: List[Tag] = []
+	equals_signs: List[Tag] = []
+
+	# Depth-first, in document order, without descending into elements which are being removed.
+	stack: List[Tuple[Tag, bool]] = [(child, False) for child in reversed(page.contents) if isinstance(child, Tag)]
+
+	while stack:
+		tag, in_head = stack.pop()
+
+		if _is_removed(tag, in_head, pygments_whitespace):
+			removed.append(tag)
+			continue
+
+		if pygments_whitespace and tag.name == "span" and 'p' in (tag.get("class") or ()) and tag.string == '=':
+			equals_signs.append(tag)
+
+		in_head = in_head or tag.name == "head"
+		stack.extend((child, in_head) for child in reversed(tag.contents) if isinstance(child, Tag))
+
+	for tag in removed:
+		tag.extract()
+
+	for tag in equals_signs:
+		sibling = tag.next_sibling
+		tag.replace_with('')
+		sibling.replace_with(f"= {sibling.text}")
+
+	return page
+
+
+def normalize_html(page: Union[str, BeautifulSoup], *, pygments_whitespace: bool = False) -> NormalizedHTML:
+	"""
+	Returns the canonical serialization of an HTML page generated by Sphinx, and its hash.
+
+	The Sphinx footer, the link tags in the page head, the ``language_data.js`` script
+	and the sidebar are removed, as these vary between versions of Sphinx and its extensions.
+	The page is then prettified, one tag per line.
+
+	.. versionadded:: 2.19.0
+
+	:param page: The page, either as a string or already parsed with :mod:`html5lib`.
+		If a :class:`~bs4.BeautifulSoup` object is given it is modified in place.
+	:param pygments_whitespace: Whether to remove Pygments' whitespace tokens from code,
+		and normalise the spacing around ``=`` tokens. Sphinx 4.3 and newer emit these tokens.
+	"""
+
+	if isinstance(page, str):
+		page = BeautifulSoup(page, "html5lib")
+
+	page = _canonicalize_tree(page, pygments_whitespace)
+	return NormalizedHTML.from_html(str(StringList(page.prettify())))
+
+
+def check_html_regression(page: Union[str, BeautifulSoup], file_regression: FileRegressionFixture):
 	"""
 	Check an HTML page generated by Sphinx for regressions, using `pytest-regressions`_.
 
+	.. versionchanged:: 2.19.0  The page is normalized with :func:`~.normalize_html`, and may be given as a string.
+
 	:param page: The page to test.
 	:param file_regression: The file regression fixture.
 
@@ -657,21 +770,7 @@ def check_html_regression(page: BeautifulSoup, file_regression: FileRegressionFi
 
 	__tracebackhide__ = True
 
-	page = remove_html_footer(page)
-	page = remove_html_link_tags(page)
-
-	for div in page.select("script"):
-		if "_static/language_data.js" in str(div):
-			div.extract()
-
-	for div in page.select("div.sphinxsidebar"):
-		div.extract()
-
-	check_file_regression(
-			StringList(page.prettify()),
-			file_regression,
-			extension=".html",
-			)
+	check_file_regression(normalize_html(page).html, file_regression, extension=".html")
 
 
 class HTMLRegressionFixture(FileRegressionFixture):
@@ -683,7 +782,7 @@ class HTMLRegressionFixture(FileRegressionFixture):
 
 	def check(  # type: ignore
 		self,
-		page: BeautifulSoup,
+		page: Union[str, BeautifulSoup],
 		*,
 		extension: str = ".html",
 		jinja2: bool = False,
@@ -702,6 +801,11 @@ class HTMLRegressionFixture(FileRegressionFixture):
 
 		.. versionchanged:: 2.14.0  Added the ``jinja2`` keyword argument.
 		.. versionchanged:: 2.17.0  Added the ``jinja2_namespace`` keyword argument.
+		.. versionchanged:: 2.19.0
+
+			``page`` may be the page's source, which is parsed with :mod:`html5lib`.
+			The page is normalized with :func:`~.normalize_html`, and the diff is skipped
+			if its hash matches that of the reference file.
 
 		When ``jinja2`` is :py:obj:`True`, the reference file will be rendered as a jinja2 template.
 		The template is passed the following variables:
@@ -721,44 +825,29 @@ class HTMLRegressionFixture(FileRegressionFixture):
 
 		__tracebackhide__ = True
 
-		page = remove_html_footer(page)
-		page = remove_html_link_tags(page)
-
-		for div in page.select("script"):
-			if "_static/language_data.js" in str(div):
-				div.extract()
-
-		for div in page.select("div.sphinxsidebar"):
-			div.extract()
-
-		if sphinx.version_info >= (4, 3):  # pragma: no cover
-			for div in page.select("span.w"):
-				div.extract()
-			for div in page.select("span.p"):
-				if div.string == '=':
-					sibling = div.next_sibling
-					div.replace_with('')
-					sibling.replace_with(f"= {sibling.text}")
+		normalized = normalize_html(page, pygments_whitespace=sphinx.version_info >= (4, 3))
 
 		kwargs.pop("encoding", None)
 		kwargs.pop("extension", None)
 
+		def render(expected_filename: PathPlus) -> str:
+			return Template(expected_filename.read_text()).render(
+					sphinx_version=sphinx.version_info,
+					python_version=sys.version_info,
+					docutils_version=docutils_version,
+					**jinja2_namespace or {},
+					)
+
+		if self._matches_reference(normalized, extension, render if jinja2 else None):
+			return
+
 		if jinja2:
 
 			def check_fn(obtained_filename, expected_filename):
 				__tracebackhide__ = True
 
 				expected_filename = PathPlus(expected_filename)
-				template = Template(expected_filename.read_text())
-
-				expected_filename.write_text(
-						template.render(
-								sphinx_version=sphinx.version_info,
-								python_version=sys.version_info,
-								docutils_version=docutils_version,
-								**jinja2_namespace or {},
-								)
-						)
+				expected_filename.write_text(render(expected_filename))
 
 				return check_text_files(obtained_filename, expected_filename, encoding="UTF-8")
 
@@ -766,12 +855,46 @@ class HTMLRegressionFixture(FileRegressionFixture):
 			check_fn = partial(check_text_files, encoding="UTF-8")
 
 		super().check(
-				str(StringList(page.prettify())),
+				normalized.html,
 				encoding="UTF-8",
 				extension=extension,
 				check_fn=check_fn,
 				)
 
+	def _matches_reference(
+			self,
+			normalized: NormalizedHTML,
+			extension: str,
+			render: Optional[Callable[[PathPlus], str]] = None,
+			) -> bool:
+		"""
+		Returns whether the page's hash matches that of the reference file,
+		in which case there is no need to write the page to disk and diff it.
+
+		:param normalized:
+		:param extension:
+		:param render: A function to render the reference file as a jinja2 template.
+		"""  # noqa: D400
+
+		if self.force_regen or self.request.config.getoption("force_regen"):
+			return False
+
+		if self.request.config.getoption("regen_all", default=False):
+			return False
+
+		basename = re.sub(r"[\W]", '_', self.request.node.name)
+		expected_filename = PathPlus(self.original_datadir) / f"{basename}{extension}"
+
+		if not expected_filename.is_file():
+			return False
+
+		if render is None:
+			expected = expected_filename.read_text(encoding="UTF-8")
+		else:
+			expected = render(expected_filename)
+
+		return NormalizedHTML.from_html(expected).sha256 == normalized.sha256
+
 
 @pytest.fixture()
 def html_regression(datadir, original_datadir, request) -> HTMLRegressionFixture:
@@ -931,3 +1054,203 @@ def latex_regression(datadir, original_datadir, request) -> LaTeXRegressionFixtu
 	"""
 
 	return LaTeXRegressionFixture(datadir, original_datadir, request)
+
+
+class SharedSphinxApp:
+	"""
+	A Sphinx application whose environment is read once, and then reused for several builds.
+
+	After the read phase the environment is pickled.
+	Each call to :meth:`~.SharedSphinxApp.build` restores the environment from that snapshot
+	and creates a fresh builder, so only the write phase is repeated.
+
+	The docutils directives, roles and nodes registered by the application's extensions
+	are only installed while the application is reading or building,
+	so they do not affect other tests.
+
+	Instances are usually obtained from :func:`~.sphinx_app_cache`.
+
+	.. versionadded:: 2.19.0
+
+	:param srcdir: The source (and configuration) directory. This is used as is, without being copied.
+	:param builddir: The directory to place the output and doctrees in.
+	:param buildername: The name of the builder to use.
+	:param confoverrides: Configuration values to override those set in ``conf.py``.
+	"""
+
+	def __init__(
+			self,
+			srcdir: PathLike,
+			builddir: PathLike,
+			buildername: str = "html",
+			confoverrides: Optional[Dict[str, Any]] = None,
+			):
+
+		# 3rd party
+		from sphinx.util.build_phase import BuildPhase
+
+		builddir = PathPlus(builddir)
+
+		#: Messages logged by Sphinx during the most recent build.
+		self.status = StringIO()
+
+		#: Warnings logged by Sphinx during the most recent build.
+		self.warning = StringIO()
+
+		self.buildername = buildername
+
+		with docutils.docutils_namespace():
+			self.app = sphinx.application.Sphinx(
+					str(srcdir),
+					str(srcdir),
+					str(builddir / buildername),
+					str(builddir / "doctrees"),
+					buildername,
+					confoverrides=confoverrides,
+					status=self.status,
+					warning=self.warning,
+					freshenv=True,
+					)
+
+			self.app.builder.read()
+			self.app.phase = BuildPhase.CONSISTENCY_CHECK
+			self.app.env.check_consistency()
+
+			self._env_snapshot = pickle.dumps(self.app.env, pickle.HIGHEST_PROTOCOL)
+			self._directives = copy.copy(docutils.directives._directives)  # type: ignore[attr-defined]
+			self._roles = copy.copy(docutils.roles._roles)  # type: ignore[attr-defined]
+			self._nodes = copy.copy(docutils.additional_nodes)
+
+	@property
+	def outdir(self) -> PathPlus:
+		"""
+		The output directory of the application.
+		"""
+
+		return PathPlus(self.app.outdir)
+
+	def build(self, docnames: Optional[Iterable[str]] = None) -> sphinx.application.Sphinx:
+		"""
+		Restore the environment as it was after the read phase, and write the output.
+
+		The output directory is emptied first.
+		The :event:`env-updated` event is emitted again for the new builder,
+		as extensions use it to prepare the builder for the write phase.
+
+		:param docnames: The documents to write. Defaults to all documents.
+
+		:returns: The Sphinx application.
+		"""
+
+		# 3rd party
+		from sphinx.util.build_phase import BuildPhase
+		from sphinx.util.parallel import SerialTasks
+
+		app = self.app
+
+		for stream in (self.status, self.warning):
+			stream.seek(0)
+			stream.truncate()
+
+		if self.outdir.is_dir():
+			shutil.rmtree(self.outdir)
+		self.outdir.maybe_make(parents=True)
+
+		with docutils.docutils_namespace():
+			docutils.directives._directives.update(self._directives)  # type: ignore[attr-defined]
+			docutils.roles._roles.update(self._roles)  # type: ignore[attr-defined]
+			for node in self._nodes:
+				docutils.register_node(node)
+
+			app.env = pickle.loads(self._env_snapshot)  # nosec: B301
+			app.env.setup(app)
+			app.builder = app.create_builder(self.buildername)
+			app._init_builder()
+
+			app.builder.parallel_ok = False
+			app.builder.finish_tasks = SerialTasks()
+
+			try:
+				app.events.emit("env-updated", app.env)
+				app.phase = BuildPhase.RESOLVING
+
+				if docnames is None:
+					app.builder.write(None, [], "all")
+				else:
+					app.builder.write(sorted(set(docnames) & app.env.found_docs), [], "specific")
+
+				app.builder.finish()
+				app.builder.finish_tasks.join()
+			except Exception as err:
+				app.events.emit("build-finished", err)
+				raise
+			else:
+				app.events.emit("build-finished", None)
+			finally:
+				app.builder.cleanup()
+
+		return app
+
+
+class SphinxAppCache:
+	"""
+	Cache of :class:`~.SharedSphinxApp` instances, keyed by source directory, builder and configuration overrides.
+
+	Each source directory is copied into ``tempdir`` before it is read,
+	so builds never write to the original directory.
+
+	.. versionadded:: 2.19.0
+
+	:param tempdir: The directory to place copies of the source directories and the build output in.
+	"""
+
+	def __init__(self, tempdir: PathLike):
+		self.tempdir = PathPlus(tempdir)
+		self._apps: Dict[Tuple[str, str, str], SharedSphinxApp] = {}
+
+	def get(
+			self,
+			srcdir: PathLike,
+			buildername: str = "html",
+			confoverrides: Optional[Dict[str, Any]] = None,
+			) -> SharedSphinxApp:
+		"""
+		Returns the shared application for the given source directory, builder and configuration overrides,
+		reading the source files if this is the first time it has been requested.
+
+		:param srcdir: The source (and configuration) directory.
+		:param buildername: The name of the builder to use.
+		:param confoverrides: Configuration values to override those set in ``conf.py``.
+		"""  # noqa: D400
+
+		confoverrides = confoverrides or {}
+		key = (PathPlus(srcdir).abspath().as_posix(), buildername, repr(sorted(confoverrides.items())))
+
+		if key not in self._apps:
+			builddir = self.tempdir / str(len(self._apps))
+			shutil.copytree(srcdir, builddir / "src")
+			self._apps[key] = SharedSphinxApp(builddir / "src", builddir / "_build", buildername, confoverrides)
+
+		return self._apps[key]
+
+
+@pytest.fixture(scope="session")
+def sphinx_app_cache(tmp_path_factory) -> SphinxAppCache:
+	"""
+	Returns a session-scoped :class:`~.SphinxAppCache`,
+	so each test root is only read once per test session.
+
+	Tests then call :meth:`SharedSphinxApp.build() <.SharedSphinxApp.build>` to write the output they check:
+
+	.. code-block:: python
+
+		@pytest.fixture()
+		def app(sphinx_app_cache):
+			return sphinx_app_cache.get(PathPlus(__file__).parent / "test-root").build()
+
+	With pytest-xdist each worker process has its own cache and temporary directory.
+
+	.. versionadded:: 2.19.0
+	"""  # noqa: D400
+
+	return SphinxAppCache(tmp_path_factory.mktemp("sphinx_app_cache"))
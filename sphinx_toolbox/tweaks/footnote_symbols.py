@@ -86,4 +86,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	Footnotes.symbols = symbols
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
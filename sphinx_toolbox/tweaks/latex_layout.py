@@ -158,4 +158,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	app.add_node(nodes.field_list, latex=(visit_field_list, depart_field_list), override=True)
 	app.add_node(nodes.paragraph, latex=(visit_paragraph, LaTeXTranslator.depart_paragraph), override=True)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
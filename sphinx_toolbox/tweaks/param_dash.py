@@ -165,4 +165,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	sphinx.util.docfields.TypedField.make_field = make_field  # type: ignore
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
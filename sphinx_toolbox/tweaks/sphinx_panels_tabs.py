@@ -43,7 +43,6 @@ Fix for :github:issue:`51 <executablebooks/sphinx-panels>`.
 from typing import Optional
 
 # 3rd party
-import dict2css
 from deprecation_alias import deprecated
 from docutils import nodes
 from domdf_python_tools.paths import PathPlus
@@ -112,8 +111,7 @@ def copy_asset_files(app: Sphinx, exception: Optional[Exception] = None) -> None
 	# 		])
 
 	css_static_dir = PathPlus(app.builder.outdir) / "_static" / "css"
-	css_static_dir.maybe_make(parents=True)
-	dict2css.dump(_css.tweaks_sphinx_panels_tabs_styles, css_static_dir / "tabs_customise.css")
+	_css.write_stylesheet(css_static_dir / "tabs_customise.css", _css.tweaks_sphinx_panels_tabs_styles)
 
 
 copy_assets = deprecated(
@@ -139,4 +137,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	app.add_node(nodes.container, override=True, html=(visit_container, depart_container))
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
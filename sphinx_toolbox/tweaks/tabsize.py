@@ -75,4 +75,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 
 	app.add_source_parser(CustomRSTParser, override=True)
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -34,24 +34,50 @@ General utility functions.
 # stdlib
 import atexit
 import functools
+import importlib.util
+import os
 import re
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Pattern, Set, Tuple, Type, TypeVar, cast
+import sys
+import types
+from typing import (
+		TYPE_CHECKING,
+		Any,
+		Callable,
+		Dict,
+		FrozenSet,
+		Iterable,
+		Iterator,
+		List,
+		Mapping,
+		NamedTuple,
+		Optional,
+		Pattern,
+		Set,
+		Tuple,
+		Type,
+		TypeVar
+		)
 
 # 3rd party
 import sphinx.config
-from apeye.requests_url import RequestsURL
 from deprecation_alias import deprecated
 from docutils.nodes import Node
 from domdf_python_tools.doctools import prettify_docstrings
+from domdf_python_tools.typing import PathLike
 from sphinx.addnodes import desc_content
 from sphinx.application import Sphinx
 from sphinx.environment import BuildEnvironment
 from sphinx.errors import PycodeError
-from sphinx.ext.autodoc import Documenter, logger
+from sphinx.ext.autodoc import INSTANCEATTR, Documenter, logger
 from sphinx.locale import __
 from sphinx.pycode import ModuleAnalyzer
+from sphinx.util.inspect import safe_getattr
 from typing_extensions import TypedDict
 
+if TYPE_CHECKING:
+	# 3rd party
+	from apeye.requests_url import RequestsURL
+
 __all__ = [
 		"add_nbsp_substitution",
 		"allow_subclass_add",
@@ -60,15 +86,21 @@ __all__ = [
 		"code_repr",
 		"escape_trailing__",
 		"filter_members_warning",
+		"filter_object_members",
 		"flag",
+		"get_class_namespace",
 		"get_first_matching",
+		"get_module_attribute_docs",
 		"GITHUB_COM",
 		"is_namedtuple",
+		"iter_parameters",
 		"make_github_url",
 		"metadata_add_version",
+		"ModuleAttributeDocs",
 		"NoMatchError",
 		"OptionSpec",
 		"Param",
+		"ParameterEvent",
 		"parse_parameters",
 		"Purger",
 		"SetupFunc",
@@ -80,19 +112,45 @@ __all__ = [
 		"add_fallback_css_class",
 		]
 
-#: Instance of :class:`apeye.requests_url.RequestsURL` that points to the GitHub website.
-GITHUB_COM: RequestsURL = RequestsURL("https://github.com")
+GITHUB_COM: "RequestsURL"
+"""
+Instance of :class:`apeye.requests_url.RequestsURL` that points to the GitHub website.
+
+.. versionchanged:: 2.19.0
+
+	Created the first time it is accessed, as :mod:`apeye.requests_url` imports :mod:`requests`.
+"""
 
 #: Type hint for the ``option_spec`` variable of Docutils directives.
 OptionSpec = Mapping[str, Callable[[str], Any]]
 
 _T = TypeVar("_T")
 
-atexit.register(GITHUB_COM.session.close)
+
+@functools.lru_cache(1)
+def _get_github_com() -> "RequestsURL":
+	# 3rd party
+	from apeye.requests_url import RequestsURL
+
+	github_com = RequestsURL("https://github.com")
+	atexit.register(github_com.session.close)
+	return github_com
+
+
+class _UtilsModule(types.ModuleType):
+	# Creates :data:`~.GITHUB_COM` on first access without relying on
+	# module-level ``__getattr__`` (PEP 562), which requires Python 3.7.
+
+	@property
+	def GITHUB_COM(self) -> "RequestsURL":  # noqa: D102
+		return _get_github_com()
+
+
+sys.modules[__name__].__class__ = _UtilsModule
 
 
 @functools.lru_cache()
-def make_github_url(username: str, repository: str) -> RequestsURL:
+def make_github_url(username: str, repository: str) -> "RequestsURL":
 	"""
 	Construct a URL to a GitHub repository from a username and repository name.
 
@@ -100,7 +158,7 @@ def make_github_url(username: str, repository: str) -> RequestsURL:
 	:param repository: The name of the repository.
 	"""
 
-	return GITHUB_COM / username / repository
+	return _get_github_com() / username / repository
 
 
 def flag(argument: Any) -> bool:
@@ -127,16 +185,61 @@ class Purger:
 	"""
 	Class to purge redundant nodes.
 
-	:param attr_name: The name of the build environment's attribute that stores the list of nodes,
+	.. versionchanged:: 2.19.0
+
+		Nodes can record the inputs they depend on (configuration values, files, modules and the builder format),
+		and :meth:`~.Purger.get_outdated_docnames` only reports documents where one of those inputs has changed.
+
+	.. versionchanged:: 2.19.0
+
+		Nodes are stored in a mapping of docnames to lists of entries, rather than a flat list.
+		Environments pickled by older versions are migrated the first time the nodes are accessed.
+
+	:param attr_name: The name of the build environment's attribute that stores the nodes,
 		e.g. ``all_installation_nodes``.
+	:param lightweight: If :py:obj:`True`, only store the docname, line number and target IDs for each node,
+		rather than a copy of the node and its target.
 	"""
 
-	def __init__(self, attr_name: str):
+	def __init__(self, attr_name: str, lightweight: bool = False):
 		self.attr_name = str(attr_name)
+		self.lightweight = bool(lightweight)
 
 	def __repr__(self) -> str:
+		if self.lightweight:
+			return f"{self.__class__.__name__}({self.attr_name!r}, lightweight=True)"
+
 		return f"{self.__class__.__name__}({self.attr_name!r})"
 
+	def get_nodes(self, env: BuildEnvironment) -> Dict[str, List[Dict[str, Any]]]:
+		"""
+		Returns the mapping of docnames to the nodes in that document this :class:`~.Purger` is aware of.
+
+		If the build environment stores the nodes in a flat list, as was the case before version 2.19.0,
+		they are converted to the current format.
+
+		.. versionadded:: 2.19.0
+
+		:param env: The Sphinx build environment.
+		"""
+
+		all_nodes = getattr(env, self.attr_name, None)
+
+		if all_nodes is None:
+			all_nodes = {}
+			setattr(env, self.attr_name, all_nodes)
+
+		elif isinstance(all_nodes, list):
+			migrated: Dict[str, List[Dict[str, Any]]] = {}
+
+			for todo in all_nodes:
+				migrated.setdefault(todo["docname"], []).append(todo)
+
+			all_nodes = migrated
+			setattr(env, self.attr_name, all_nodes)
+
+		return all_nodes
+
 	def purge_nodes(  # pragma: no cover
 			self,
 			app: Sphinx,
@@ -163,8 +266,44 @@ class Purger:
 		if not hasattr(env, self.attr_name):
 			return
 
-		all_nodes = [todo for todo in getattr(env, self.attr_name) if todo["docname"] != docname]
-		setattr(env, self.attr_name, all_nodes)
+		self.get_nodes(env).pop(docname, None)
+
+	def merge_nodes(
+			self,
+			app: Sphinx,
+			env: BuildEnvironment,
+			docnames: Set[str],
+			other: BuildEnvironment,
+			) -> None:
+		"""
+		Merge the nodes from a parallel reading process into the main build environment.
+
+		This function can be configured for the :event:`env-merge-info` event:
+
+		.. code-block::
+
+			my_node_purger = Purger("all_my_node_nodes")
+
+			def setup(app: Sphinx):
+				app.connect("env-merge-info", my_node_purger.merge_nodes)
+
+		.. versionadded:: 2.19.0
+
+		:param app: The Sphinx application.
+		:param env: The Sphinx build environment.
+		:param docnames: The names of the documents read by the other process.
+		:param other: The build environment from the other process.
+		"""
+
+		if not hasattr(other, self.attr_name):
+			return
+
+		all_nodes = self.get_nodes(env)
+		other_nodes = self.get_nodes(other)
+
+		for docname in docnames:
+			if docname in other_nodes:
+				all_nodes[docname] = other_nodes[docname]
 
 	def get_outdated_docnames(
 			self,
@@ -175,7 +314,8 @@ class Purger:
 			removed: Set[str],
 			) -> List[str]:
 		"""
-		Returns a list of all docnames containing one or more nodes this :class:`~.Purger` is aware of.
+		Returns a list of all docnames containing one or more nodes this :class:`~.Purger` is aware of
+		where one of the inputs the node depends on has changed since the document was read.
 
 		This function can be configured for the :event:`env-get-outdated` event:
 
@@ -188,39 +328,132 @@ class Purger:
 
 		.. versionadded:: 2.7.0
 
+		.. versionchanged:: 2.19.0
+
+			Previously all documents containing nodes were returned, regardless of whether anything had changed.
+
 		:param app: The Sphinx application.
 		:param env: The Sphinx build environment.
 		:param added: A set of newly added documents.
 		:param changed: A set of document names whose content has changed.
 		:param removed: A set of document names which have been removed.
-		"""
+		"""  # noqa: D400
 
 		if not hasattr(env, self.attr_name):
 			return []
 
-		return list({todo["docname"] for todo in getattr(env, self.attr_name)})
+		outdated: Set[str] = set()
+		current: Dict[Tuple[str, str], Any] = {}
+
+		for docname, todos in self.get_nodes(env).items():
+			if docname in removed:
+				continue
 
-	def add_node(self, env: BuildEnvironment, node: Node, targetnode: Node, lineno: int):
+			if any(self._is_outdated(env, todo, current) for todo in todos):
+				outdated.add(docname)
+
+		return sorted(outdated)
+
+	def add_node(
+			self,
+			env: BuildEnvironment,
+			node: Node,
+			targetnode: Node,
+			lineno: int,
+			*,
+			config_values: Iterable[str] = (),
+			files: Iterable[PathLike] = (),
+			modules: Iterable[str] = (),
+			builder: bool = False,
+			):
 		"""
 		Add a node.
 
+		.. versionchanged:: 2.19.0  Added the ``config_values``, ``files``, ``modules`` and ``builder`` arguments.
+
 		:param env: The Sphinx build environment.
 		:param node:
 		:param targetnode:
 		:param lineno:
+		:param config_values: The names of configuration values the node depends on.
+		:param files: Files the node depends on.
+		:param modules: The names of Python modules the node depends on.
+		:param builder: Whether the node depends on the format of the builder, e.g. ``'html'`` or ``'latex'``.
 		"""
 
-		if not hasattr(env, self.attr_name):
-			setattr(env, self.attr_name, [])
+		keys = [
+				*(("config", name) for name in config_values),
+				*(("file", os.path.abspath(filename)) for filename in files),
+				*(("module", name) for name in modules),
+				]
+
+		if builder:
+			keys.append(("builder", "format"))
+
+		todo: Dict[str, Any] = {"docname": env.docname, "lineno": lineno}
+
+		if self.lightweight:
+			todo["target_ids"] = list(targetnode.get("ids", ()))  # type: ignore
+		else:
+			todo["installation_node"] = node.deepcopy()
+			todo["target"] = targetnode
+
+		todo["dependencies"] = {key: _get_dependency(env, *key) for key in keys}
 
-		all_nodes = getattr(env, self.attr_name)
+		self.get_nodes(env).setdefault(env.docname, []).append(todo)
 
-		all_nodes.append({
-				"docname": env.docname,
-				"lineno": lineno,
-				"installation_node": node.deepcopy(),
-				"target": targetnode,
-				})
+	@staticmethod
+	def _is_outdated(env: BuildEnvironment, todo: Dict[str, Any], current: Dict[Tuple[str, str], Any]) -> bool:
+		# Returns whether any of the dependencies of the node have changed,
+		# caching the current state of each dependency in ``current``.
+
+		for key, value in todo.get("dependencies", {}).items():
+			if key not in current:
+				current[key] = _get_dependency(env, *key)
+
+			if current[key] != value:
+				return True
+
+		return False
+
+
+def _get_dependency(env: BuildEnvironment, kind: str, name: str) -> Any:
+	"""
+	Returns the current state of an input a node tracked by a :class:`~.Purger` depends on.
+
+	* For configuration values (``kind='config'``) this is the value.
+	* For files (``kind='file'``) this is the modification time, or :py:obj:`None` if the file doesn't exist.
+	* For modules (``kind='module'``) this is the modification time of the module's source,
+	  or :py:obj:`None` if it can't be determined.
+	* For the builder (``kind='builder'``) this is its format.
+
+	:param env: The Sphinx build environment.
+	:param kind:
+	:param name:
+	"""
+
+	if kind == "config":
+		return getattr(env.config, name, None)
+
+	elif kind == "builder":
+		builder = getattr(env.app, "builder", None)
+		return getattr(builder, name, None)
+
+	elif kind == "module":
+		try:
+			spec = importlib.util.find_spec(name)
+		except (ImportError, ValueError):
+			return None
+
+		if spec is None or not spec.has_location or not spec.origin:
+			return None
+
+		name = spec.origin
+
+	try:
+		return os.stat(name).st_mtime
+	except OSError:
+		return None
 
 
 def singleton(name: str) -> object:
@@ -490,6 +723,156 @@ def filter_members_warning(member, exception: Exception) -> None:
 			)
 
 
+class ModuleAttributeDocs(NamedTuple):
+	"""
+	The attribute docstrings and annotations found in a module's source code by
+	:class:`sphinx.pycode.ModuleAnalyzer`, as returned by :func:`~.get_module_attribute_docs`.
+
+	.. versionadded:: 2.19.0
+	"""  # noqa: D400
+
+	#: Mapping of ``(namespace, name)`` pairs to the docstring for that attribute (as a list of strings).
+	attr_docs: Dict[Tuple[str, str], List[str]]
+
+	#: Mapping of ``(namespace, name)`` pairs to the annotation for that attribute.
+	annotations: Dict[Tuple[str, str], str]
+
+	#: Mapping of namespaces (e.g. class names) to mappings of attribute names to docstrings.
+	by_namespace: Dict[str, Dict[str, List[str]]]
+
+	#: Mapping of attribute names to docstrings, regardless of namespace.
+	#: Where the same name appears in several namespaces the last one in the source wins.
+	by_name: Dict[str, List[str]]
+
+
+# Mapping of module names to the modification time of the source and the parsed attribute docs.
+_module_attribute_docs: Dict[str, Tuple[Optional[float], ModuleAttributeDocs]] = {}
+
+
+def get_module_attribute_docs(modname: str) -> ModuleAttributeDocs:
+	"""
+	Returns the attribute docstrings and annotations for the given module.
+
+	The source of each module is analysed once, and the result reused by all the documenters in
+	:mod:`sphinx_toolbox.more_autodoc` until the module's source file is modified.
+
+	.. versionadded:: 2.19.0
+
+	:param modname:
+
+	:raises: :exc:`sphinx.errors.PycodeError` if the source of the module can't be found or parsed.
+	"""
+
+	mtime = _get_source_mtime(modname)
+
+	if modname in _module_attribute_docs:
+		cached_mtime, attribute_docs = _module_attribute_docs[modname]
+		if cached_mtime == mtime:
+			return attribute_docs
+
+		# Sphinx caches analyzers by module name, regardless of whether the source has changed.
+		getattr(ModuleAnalyzer, "cache", {}).pop(("module", modname), None)
+
+	analyzer = ModuleAnalyzer.for_module(modname)
+	attr_docs = analyzer.find_attr_docs()
+
+	by_namespace: Dict[str, Dict[str, List[str]]] = {}
+	by_name: Dict[str, List[str]] = {}
+
+	for (namespace, name), docstring in attr_docs.items():
+		by_namespace.setdefault(namespace, {})[name] = docstring
+		by_name[name] = docstring
+
+	attribute_docs = ModuleAttributeDocs(attr_docs, analyzer.annotations, by_namespace, by_name)
+	_module_attribute_docs[modname] = (mtime, attribute_docs)
+
+	return attribute_docs
+
+
+def _get_source_mtime(modname: str) -> Optional[float]:
+	module = sys.modules.get(modname)
+	filename = getattr(module, "__file__", None)
+
+	if not filename:
+		return None
+
+	try:
+		return os.stat(filename).st_mtime
+	except OSError:
+		return None
+
+
+def filter_object_members(
+		documenter: Documenter,
+		members: Iterable[Tuple[str, Any]],
+		keep: Callable[[str, Any], bool],
+		) -> List[Tuple[str, Any, bool]]:
+	"""
+	Filter the members of the object being documented, for use in :meth:`Documenter.filter_members`.
+
+	Mocked objects are always skipped. Otherwise, whether a member is kept is determined by ``keep``,
+	and the user can override the decision by connecting to the :event:`autodoc-skip-member` event.
+
+	.. versionadded:: 2.19.0
+
+	:param documenter:
+	:param members: The ``(membername, member)`` pairs to filter.
+	:param keep: Function which takes the name of a member and the member, and returns whether it should be kept.
+
+	:returns: A list of ``(membername, member, isattr)`` tuples for the members to document.
+	"""
+
+	ret = []
+
+	for (membername, member) in members:
+		if safe_getattr(member, "__sphinx_mock__", False):
+			# mocked module or object
+			kept = False
+		else:
+			kept = keep(membername, member)
+
+		# give the user a chance to decide whether this member
+		# should be skipped
+		if documenter.env.app:
+			# let extensions preprocess docstrings
+			try:
+				skip_user = documenter.env.app.emit_firstresult(
+						"autodoc-skip-member",
+						documenter.objtype,
+						membername,
+						member,
+						not kept,
+						documenter.options,
+						)
+
+				if skip_user is not None:
+					kept = not skip_user
+
+			except Exception as exc:
+				filter_members_warning(member, exc)
+				kept = False
+
+		if kept:
+			ret.append((membername, member, member is INSTANCEATTR))
+
+	return ret
+
+
+@functools.lru_cache()
+def get_class_namespace(obj: Type) -> FrozenSet[str]:
+	"""
+	Returns the names of the attributes of the given class, as listed by :func:`dir`.
+
+	The result is cached, as the same base classes are often checked many times.
+
+	.. versionadded:: 2.19.0
+
+	:param obj:
+	"""
+
+	return frozenset(dir(obj))
+
+
 class Param(TypedDict):
 	"""
 	:class:`~typing.TypedDict` to represent a parameter parsed from a class or function's docstring.
@@ -537,12 +920,106 @@ Regex to match ``:type <name>: <type>`` flags.
 """
 
 
+# The three regexes above, combined so each line is only matched once.
+# The alternatives are tried in the same order as in parse_parameters prior to 2.19.0.
+_parameter_field_regex: Pattern[str] = re.compile(
+		"|".join([
+				typed_param_regex.pattern.replace("(param", "(?P<typed>param", 1),
+				untyped_param_regex.pattern.replace("(param", "(?P<untyped>param", 1),
+				typed_flag_regex.pattern.replace("(paramtype", "(?P<type_only>paramtype", 1),
+				]),
+		flags=re.ASCII,
+		)
+
+
+class ParameterEvent(NamedTuple):
+	"""
+	An event yielded by :func:`~.iter_parameters`.
+
+	.. versionadded:: 2.19.0
+	"""
+
+	#: The kind of event. One of ``'pre'``, ``'param'``, ``'type'``, ``'doc'`` or ``'post'``.
+	kind: str
+
+	#: The line of the docstring the event is for.
+	line: str
+
+	#: The name of the parameter, for ``'param'``, ``'type'`` and ``'doc'`` events.
+	name: Optional[str] = None
+
+	#: The docstring of the parameter for ``'param'`` events, or the continuation line for ``'doc'`` events.
+	doc: str = ''
+
+	#: The type of the parameter for ``'type'`` events, and for ``'param'`` events where the type is given inline.
+	type: str = ''  # noqa: A003  # pylint: disable=redefined-builtin
+
+
+def iter_parameters(lines: Iterable[str], tab_size: int = 8) -> Iterator[ParameterEvent]:
+	"""
+	Parse parameters from the docstring of a class/function, yielding an event for each line.
+
+	The events are:
+
+	* ``'pre'`` -- a line before the first parameter.
+	* ``'param'`` -- a ``:param [<type>] <name>: <docstring>`` line.
+	* ``'type'`` -- a ``:type <name>: <type>`` line.
+	* ``'doc'`` -- an indented line continuing the docstring of the previous parameter.
+	* ``'post'`` -- a line after the parameters. All subsequent lines are also ``'post'`` lines.
+
+	Unlike :func:`~.parse_parameters` the docstring is parsed lazily,
+	so the caller can stop once it has found what it needs.
+
+	.. versionadded:: 2.19.0
+
+	:param lines: The lines of the docstring
+	:param tab_size:
+	"""
+
+	a_tab = ' ' * tab_size
+	last_arg: Optional[str] = None
+	match = _parameter_field_regex.match
+
+	iterator = iter(lines)
+
+	for line in iterator:
+		m = match(line) if line.startswith(':') else None
+
+		if m is None:
+			if line.startswith(a_tab) and last_arg is not None:
+				yield ParameterEvent("doc", line, last_arg, doc=line)
+			elif last_arg is None:
+				yield ParameterEvent("pre", line)
+			else:
+				yield ParameterEvent("post", line)
+				break
+
+		elif m.group("typed"):
+			last_arg = m.group(3).strip()
+			yield ParameterEvent("param", line, last_arg, doc=m.group(4), type=m.group(2).strip())
+
+		elif m.group("untyped"):
+			last_arg = m.group(6).strip()
+			yield ParameterEvent("param", line, last_arg, doc=m.group(7))
+
+		else:
+			yield ParameterEvent("type", line, m.group(9), type=m.group(10))
+
+	for line in iterator:
+		yield ParameterEvent("post", line)
+
+
 def parse_parameters(lines: List[str], tab_size: int = 8) -> Tuple[Dict[str, Param], List[str], List[str]]:
 	"""
 	Parse parameters from the docstring of a class/function.
 
 	.. versionadded:: 0.8.0
 
+	.. versionchanged:: 2.19.0
+
+		Each line is now matched against a single combined regular expression.
+		See :func:`~.iter_parameters` for a version which parses the docstring lazily.
+
 	:param lines: The lines of the docstring
 	:param tab_size:
 
@@ -553,6 +1030,7 @@ def parse_parameters(lines: List[str], tab_size: int = 8) -> Tuple[Dict[str, Par
 	"""
 
 	a_tab = ' ' * tab_size
+	match = _parameter_field_regex.match
 
 	params: Dict[str, Param] = {}
 	last_arg: Optional[str] = None
@@ -560,43 +1038,29 @@ def parse_parameters(lines: List[str], tab_size: int = 8) -> Tuple[Dict[str, Par
 	pre_output: List[str] = []
 	post_output: List[str] = []
 
-	def add_empty(param_name: str):
-		if param_name not in params:
-			params[param_name] = {"doc": [], "type": ''}
-
-	for line in lines:
-
-		if post_output:
-			post_output.append(line)
-			continue
+	# This duplicates the logic of iter_parameters, as creating the events is comparatively slow.
+	for idx, line in enumerate(lines):
+		m = match(line) if line.startswith(':') else None
 
-		typed_m = typed_param_regex.match(line)
-		untyped_m = untyped_param_regex.match(line)
-		type_only_m = typed_flag_regex.match(line)
+		if m is None:
+			if line.startswith(a_tab) and last_arg is not None:
+				params[last_arg]["doc"].append(line)
+			elif last_arg is None:
+				pre_output.append(line)
+			else:
+				post_output.extend(lines[idx:])
+				break
 
-		if typed_m:
-			last_arg = typed_m.group(3).strip()
-			add_empty(cast(str, last_arg))
-			params[last_arg]["doc"] = [typed_m.group(4)]
-			params[last_arg]["type"] = typed_m.group(2).strip()
+		elif m.group("typed"):
+			last_arg = m.group(3).strip()
+			params[last_arg] = {"doc": [m.group(4)], "type": m.group(2).strip()}
 
-		elif untyped_m:
-			last_arg = untyped_m.group(2).strip()
-			add_empty(cast(str, last_arg))
-			params[last_arg]["doc"] = [untyped_m.group(3)]
-
-		elif type_only_m:
-			add_empty(type_only_m.group(2))
-			params[type_only_m.group(2)]["type"] = type_only_m.group(3)
-
-		elif line.startswith(a_tab) and last_arg is not None:
-			params[last_arg]["doc"].append(line)
-
-		elif last_arg is None:
-			pre_output.append(line)
+		elif m.group("untyped"):
+			last_arg = m.group(6).strip()
+			params.setdefault(last_arg, {"doc": [], "type": ''})["doc"] = [m.group(7)]  # type: ignore[index]
 
 		else:
-			post_output.append(line)
+			params.setdefault(m.group(9), {"doc": [], "type": ''})["type"] = m.group(10)
 
 	return params, pre_output, post_output
 
@@ -650,6 +1114,11 @@ def metadata_add_version(func: SetupFunc) -> SetupFunc:
 
 	.. versionadded:: 1.9.0
 
+	.. versionchanged:: 2.19.0
+
+		Sets up :mod:`sphinx_toolbox.profiling` before calling the function
+		if :confval:`toolbox_profile` is enabled.
+
 	:param func:
 	"""  # noqa: D400
 
@@ -658,6 +1127,10 @@ def metadata_add_version(func: SetupFunc) -> SetupFunc:
 
 		# this package
 		from sphinx_toolbox import __version__
+		from sphinx_toolbox.profiling import get_profile_setting
+
+		if get_profile_setting(app):
+			app.setup_extension("sphinx_toolbox.profiling")
 
 		ret = func(app) or {}
 		ret["version"] = __version__
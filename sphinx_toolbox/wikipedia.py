@@ -166,4 +166,4 @@ def setup(app: Sphinx) -> SphinxExtMetadata:
 	app.add_role("wikipedia", make_wikipedia_link)
 	app.add_config_value("wikipedia_lang", "en", "env", [str])
 
-	return {"parallel_read_safe": True}
+	return {"parallel_read_safe": True, "parallel_write_safe": True}
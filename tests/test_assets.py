@@ -1,12 +1,25 @@
+# stdlib
+import os
+from io import StringIO
+
+# 3rd party
+import docutils.utils
+import pytest
+from domdf_python_tools.paths import PathPlus
+from sphinx.application import Sphinx
+from sphinx.events import EventListener
+from sphinx.util.docutils import docutils_namespace
+
 # this package
 from sphinx_toolbox import __version__, assets
 from sphinx_toolbox.testing import run_setup
+from tests.common import AttrDict
 
 
 def test_setup():
 	setup_ret, directives, roles, additional_nodes, app = run_setup(assets.setup)
 
-	assert setup_ret == {"parallel_read_safe": True, "version": __version__}
+	assert setup_ret == {"parallel_read_safe": True, "parallel_write_safe": True, "version": __version__}
 
 	assert directives == {}
 	assert roles == {"asset": assets.asset_role}
@@ -17,4 +30,174 @@ def test_setup():
 			}
 
 	assert app.config.values["assets_dir"] == ("./assets", "env", [str])
+	assert app.config.values["assets_copy_mode"] == ("copy", '', [str])
+	assert app.config.values["assets_compare"] == ("mtime", '', [str])
 	assert app.registry.source_parsers == {}
+
+	assert app.events.listeners == {
+			"builder-inited": [EventListener(id=0, handler=assets.setup_asset_copier, priority=500)],
+			"doctree-read": [EventListener(id=1, handler=assets.collect_asset_files, priority=500)],
+			"env-purge-doc": [EventListener(id=2, handler=assets.purge_asset_files, priority=500)],
+			"env-merge-info": [EventListener(id=3, handler=assets.merge_asset_files, priority=500)],
+			"env-updated": [EventListener(id=4, handler=assets.schedule_asset_copies, priority=500)],
+			"build-finished": [EventListener(id=5, handler=assets.join_asset_copier, priority=500)],
+			}
+
+
+@pytest.mark.parametrize("compare", ["mtime", "hash"])
+def test_copy_asset(tmp_pathplus: PathPlus, compare: str):
+	source = tmp_pathplus / "data.csv"
+	source.write_text("a,b,c\n1,2,3\n")
+	destination = tmp_pathplus / "data_copy.csv"
+
+	assert assets.copy_asset(source, destination, compare=compare)
+	assert destination.read_text() == "a,b,c\n1,2,3\n"
+	assert not os.path.samefile(source, destination)
+
+	# Unchanged, so not copied again.
+	assert not assets.copy_asset(source, destination, compare=compare)
+
+	source.write_text("a,b,c\n4,5,6\n")
+	assert assets.copy_asset(source, destination, compare=compare)
+	assert destination.read_text() == "a,b,c\n4,5,6\n"
+
+
+def test_copy_asset_compare(tmp_pathplus: PathPlus):
+	source = tmp_pathplus / "data.csv"
+	source.write_text("a,b,c\n1,2,3\n")
+	destination = tmp_pathplus / "data_copy.csv"
+	destination.write_text("a,b,c\n4,5,6\n")
+	os.utime(destination, ns=(source.stat().st_atime_ns, source.stat().st_mtime_ns))
+
+	# Same size and modification time, so only detected by comparing the contents.
+	assert not assets.copy_asset(source, destination, compare="mtime")
+	assert assets.copy_asset(source, destination, compare="hash")
+	assert destination.read_text() == "a,b,c\n1,2,3\n"
+
+
+@pytest.mark.parametrize("mode", ["hardlink", "reflink"])
+def test_copy_asset_link(tmp_pathplus: PathPlus, mode: str):
+	source = tmp_pathplus / "data.csv"
+	source.write_text("a,b,c\n1,2,3\n")
+	destination = tmp_pathplus / "data_copy.csv"
+
+	assert assets.copy_asset(source, destination, mode=mode)
+	assert destination.read_text() == "a,b,c\n1,2,3\n"
+	assert not assets.copy_asset(source, destination, mode=mode)
+
+	if mode == "hardlink":
+		assert os.path.samefile(source, destination)
+
+	# The source is replaced by a new file, as many editors do.
+	new_source = tmp_pathplus / "new_data.csv"
+	new_source.write_text("a,b,c\n4,5,6\n")
+	os.replace(new_source, source)
+
+	assert assets.copy_asset(source, destination, mode=mode)
+	assert destination.read_text() == "a,b,c\n4,5,6\n"
+
+
+def test_asset_copier(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "assets").mkdir()
+	(tmp_pathplus / "out").mkdir()
+
+	for name in ("a.txt", "b.txt", "c.txt"):
+		(tmp_pathplus / "assets" / name).write_text(name)
+
+	copier = assets.AssetCopier()
+	assert repr(copier) == "AssetCopier(mode='copy', compare='mtime')"
+
+	for name in ("a.txt", "b.txt", "a.txt", "missing.txt"):
+		copier.submit(str(tmp_pathplus / "assets" / name), str(tmp_pathplus / "out" / name))
+
+	errors = copier.join()
+	assert list(errors) == [str(tmp_pathplus / "assets" / "missing.txt")]
+	assert isinstance(errors[str(tmp_pathplus / "assets" / "missing.txt")], FileNotFoundError)
+	assert sorted(copier.copied) == [str(tmp_pathplus / "assets" / name) for name in ("a.txt", "b.txt")]
+	assert copier.skipped == []
+	assert sorted(p.name for p in (tmp_pathplus / "out").iterdir()) == ["a.txt", "b.txt"]
+
+	# A second build skips the unchanged files.
+	copier = assets.AssetCopier()
+	for name in ("a.txt", "b.txt", "c.txt"):
+		copier.submit(str(tmp_pathplus / "assets" / name), str(tmp_pathplus / "out" / name))
+
+	assert copier.join() == {}
+	assert copier.copied == [str(tmp_pathplus / "assets" / "c.txt")]
+	assert sorted(copier.skipped) == [str(tmp_pathplus / "assets" / name) for name in ("a.txt", "b.txt")]
+
+	with pytest.raises(ValueError, match="Unknown asset copy mode 'symlink'"):
+		assets.AssetCopier(mode="symlink")
+
+	with pytest.raises(ValueError, match="Unknown asset comparison 'size'"):
+		assets.AssetCopier(compare="size")
+
+
+def test_collect_purge_merge_asset_files():
+	doctree = docutils.utils.new_document("index")
+	doctree += assets.AssetNode("a.pdf", "a.pdf", refuri="a.pdf", source_file=PathPlus("assets/a.pdf"))
+	doctree += assets.AssetNode("b.pdf", "b.pdf", refuri="b.pdf", source_file=PathPlus("assets/b.pdf"))
+	doctree += assets.AssetNode("a.pdf", "a.pdf", refuri="a.pdf", source_file=PathPlus("assets/a.pdf"))
+
+	env = AttrDict(docname="index")
+	app = AttrDict(env=env)
+
+	assets.collect_asset_files(app, doctree)  # type: ignore
+	assert env.toolbox_asset_files == {"index": {"assets/a.pdf", "assets/b.pdf"}}
+
+	other = AttrDict(toolbox_asset_files={"api": {"assets/c.pdf"}})
+	assets.merge_asset_files(app, env, {"api"}, other)  # type: ignore
+	assert set(env.toolbox_asset_files) == {"index", "api"}
+
+	assets.purge_asset_files(app, env, "index")  # type: ignore
+	assert env.toolbox_asset_files == {"api": {"assets/c.pdf"}}
+
+
+@pytest.mark.parametrize("parallel", [1, 2])
+def test_schedule_asset_copies(tmp_pathplus: PathPlus, parallel: int):
+	(tmp_pathplus / "assets").mkdir()
+	(tmp_pathplus / "assets" / "a.txt").write_text("a")
+	(tmp_pathplus / "assets" / "b.txt").write_text("b")
+
+	env = AttrDict(toolbox_asset_files={"index": {"assets/a.txt"}, "api": {"assets/a.txt", "assets/b.txt"}})
+	builder = AttrDict(format="html", outdir=str(tmp_pathplus / "out"), config=AttrDict())
+	app = AttrDict(builder=builder, confdir=str(tmp_pathplus), parallel=parallel)
+
+	assets.schedule_asset_copies(app, env)  # type: ignore
+	copier = builder.asset_copier
+	assert sorted(copier.seen) == [str(tmp_pathplus / "assets" / "a.txt"), str(tmp_pathplus / "assets" / "b.txt")]
+
+	# When running in parallel the copies are finished before the writer processes are forked.
+	assert (copier._executor is None) is (parallel > 1)
+	assert copier.join() == {}
+	assert (tmp_pathplus / "out" / "_assets" / "b.txt").read_text() == 'b'
+
+
+def test_parallel_build(tmp_pathplus: PathPlus):
+	srcdir = tmp_pathplus / "src"
+	(srcdir / "assets").mkdir(parents=True)
+	(srcdir / "assets" / "data.csv").write_text("a,b,c\n")
+	(srcdir / "conf.py").write_lines(['extensions = ["sphinx_toolbox.assets"]', 'project = "Demo"'])
+
+	docnames = [f"page_{number}" for number in range(8)]
+	(srcdir / "index.rst").write_lines(["Demo", "====", '', ".. toctree::", '', *(f"\t{d}" for d in docnames)])
+	for docname in docnames:
+		(srcdir / f"{docname}.rst").write_lines([docname, '=' * len(docname), '', ":asset:`data.csv`"])
+
+	with docutils_namespace():
+		app = Sphinx(
+				srcdir,
+				srcdir,
+				tmp_pathplus / "out",
+				tmp_pathplus / "doctrees",
+				"html",
+				status=StringIO(),
+				warning=StringIO(),
+				parallel=2,
+				)
+		assert app.is_parallel_allowed("write")
+		app.build()
+
+	assert app.builder.asset_copier.copied == [str(srcdir / "assets" / "data.csv")]  # type: ignore[attr-defined]
+	assert (tmp_pathplus / "out" / "_assets" / "data.csv").read_text() == "a,b,c\n"
+	assert 'href="_assets/data.csv' in (tmp_pathplus / "out" / "page_7.html").read_text()
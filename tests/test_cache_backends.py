@@ -0,0 +1,297 @@
+# stdlib
+import gzip
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+# 3rd party
+import pytest
+import requests
+from cachecontrol import CacheControl
+from domdf_python_tools.paths import PathPlus
+from pytest_httpserver import HTTPServer
+from werkzeug import Response
+
+# this package
+from sphinx_toolbox.cache import (
+		CACHE_BACKENDS,
+		CACHE_DIR_ENV_VAR,
+		cache,
+		configure_cache,
+		get_cache_backend,
+		set_offline
+		)
+from sphinx_toolbox.cache_backends import (
+		CacheBackend,
+		CacheStats,
+		FileSystemCache,
+		MemoryCache,
+		SQLiteCache,
+		StrippingSerializer,
+		cache_backends,
+		strip_issue_json,
+		strip_issue_page
+		)
+
+issue_page = (
+		b'<html><head><title>An issue</title>' + b"<script></script>" * 100 + b'</head><body>'
+		b'<h1><span class="js-issue-title markdown-title">An &amp; issue</span></h1>'
+		b'<span title="Status: Closed" class="State State--merged">\n Merged </span>'
+		b'<div class="comment">' + b"Lorem ipsum " * 100 + b'</div></body></html>'
+		)
+
+issue_json = {
+		"number": 2,
+		"title": "A pull request",
+		"state": "closed",
+		"body": "Lorem ipsum " * 100,
+		"pull_request": {"url": "https://api.github.com/", "merged_at": "2022-01-01T00:00:00Z"},
+		}
+
+
+@pytest.fixture(params=["memory", "sqlite", "filesystem"])
+def backend(request, tmp_pathplus: PathPlus) -> Iterator[CacheBackend]:
+	cache_backend = cache_backends[request.param].from_cache_dir(tmp_pathplus, max_size=350)
+	yield cache_backend
+	cache_backend.close()
+
+
+@pytest.fixture()
+def default_cache_settings() -> Iterator[None]:
+	try:
+		yield
+	finally:
+		configure_cache()
+
+
+def test_cache_backends():
+	assert sorted(cache_backends) == sorted(CACHE_BACKENDS)
+	assert all(cls.name == name for name, cls in cache_backends.items())
+
+
+def test_cache_backend_abstract():
+	with pytest.raises(TypeError, match="abstract"):
+		CacheBackend()  # type: ignore[abstract]
+
+	assert all(not cls.__abstractmethods__ for cls in cache_backends.values())
+
+
+def test_get_set_delete(backend: CacheBackend):
+	assert backend.get("https://example.com/a") is None
+	assert len(backend) == 0
+	assert backend.size() == 0
+
+	backend.set("https://example.com/a", b"Response A")
+	backend.set("https://example.com/b", b"Response B", expires=3600)
+	assert backend.get("https://example.com/a") == b"Response A"
+	assert backend.get("https://example.com/b") == b"Response B"
+	assert len(backend) == 2
+	assert backend.size() > 0
+
+	backend.delete("https://example.com/a")
+	backend.delete("https://example.com/missing")
+	assert backend.get("https://example.com/a") is None
+	assert len(backend) == 1
+
+	backend.clear()
+	assert len(backend) == 0
+	assert backend.get("https://example.com/b") is None
+
+	assert backend.stats == CacheStats(hits=2, misses=3, bytes_read=20, bytes_written=20)
+	assert backend.stats.hit_rate == pytest.approx(0.4)
+
+
+def test_expiry(backend: CacheBackend):
+	backend.set("https://example.com/past", b"Expired", expires=datetime.now(timezone.utc) - timedelta(hours=1))
+	backend.set("https://example.com/naive", b"Expired", expires=datetime.utcnow() - timedelta(hours=1))
+	backend.set("https://example.com/future", b"Fresh", expires=datetime.now(timezone.utc) + timedelta(hours=1))
+	backend.set("https://example.com/forever", b"Fresh")
+
+	assert backend.get("https://example.com/past") is None
+	assert backend.get("https://example.com/future") == b"Fresh"
+	assert len(backend) == 3
+
+	assert backend.remove_expired() == 1
+	assert len(backend) == 2
+
+
+def test_lru_eviction(backend: CacheBackend):
+	# Random bytes, so the SQLite backend can't compress them.
+	values = {name: os.urandom(100) for name in "abcd"}
+
+	for name in "abc":
+		backend.set(name, values[name])
+		time.sleep(0.01)
+
+	assert backend.get('a') == values['a']
+	time.sleep(0.01)
+
+	backend.set('d', values['d'])
+	assert backend.get('b') is None
+	assert [backend.get(name) for name in "acd"] == [values['a'], values['c'], values['d']]
+	assert backend.stats.evictions == 1
+	assert backend.size() <= backend.max_size
+
+
+def test_vacuum(backend: CacheBackend):
+	backend.set("expired", b"Expired", expires=datetime.now(timezone.utc) - timedelta(hours=1))
+	backend.set("fresh", b"Fresh")
+	backend.max_size = 0
+
+	assert backend.vacuum() == 2
+	assert len(backend) == 0
+
+
+@pytest.mark.parametrize("name", ["sqlite", "filesystem"])
+def test_stats_persisted(tmp_pathplus: PathPlus, name: str):
+	first = cache_backends[name].from_cache_dir(tmp_pathplus)
+	first.set("https://example.com", b"Response")
+	assert first.get("https://example.com") == b"Response"
+	first.close()
+
+	second = cache_backends[name].from_cache_dir(tmp_pathplus)
+	assert second.get("https://example.com") == b"Response"
+	assert second.get("https://example.com/missing") is None
+	assert second.total_stats() == CacheStats(hits=2, misses=1, bytes_read=16, bytes_written=8)
+	assert second.total_stats() == CacheStats(hits=2, misses=1, bytes_read=16, bytes_written=8)
+	second.close()
+
+
+def test_memory_stats_not_persisted(tmp_pathplus: PathPlus):
+	backend = MemoryCache.from_cache_dir(tmp_pathplus)
+	backend.set("https://example.com", b"Response")
+	assert backend.total_stats() == CacheStats(bytes_written=8)
+	assert list(tmp_pathplus.iterdir()) == []
+
+
+def test_shared_directory(tmp_pathplus: PathPlus):
+	first = FileSystemCache(tmp_pathplus / "shared", max_size=330)
+	second = FileSystemCache(tmp_pathplus / "shared", max_size=330)
+
+	first.set("https://example.com", b"Response")
+	assert second.get("https://example.com") == b"Response"
+
+	# Each process only knows the size of the responses it stored itself,
+	# but the directory is rescanned before evicting.
+	for idx in range(3):
+		second.set(str(idx), os.urandom(100))
+		time.sleep(0.01)
+
+	assert first.get("https://example.com") is None
+	assert len(first) == 3
+	assert not list((tmp_pathplus / "shared").glob("??/.tmp*"))
+
+
+def test_sqlite_compressed(tmp_pathplus: PathPlus):
+	backend = SQLiteCache(tmp_pathplus / "cache.sqlite")
+	backend.set("https://example.com", b"Response " * 1000)
+	assert backend.size() < 100
+	assert backend.get("https://example.com") == b"Response " * 1000
+
+
+def test_strip_issue_page():
+	stripped = strip_issue_page(issue_page)
+	assert stripped == (
+			b'<html><body><span class="js-issue-title markdown-title">An &amp; issue</span>'
+			b'<span title="Status: Closed" class="State State--merged">\n Merged </span></body></html>'
+			)
+	assert strip_issue_page(stripped) == stripped  # type: ignore[arg-type]
+	assert strip_issue_page(b"<html><body>Not found</body></html>") is None
+
+
+def test_strip_issue_json():
+	stripped = strip_issue_json(json.dumps(issue_json).encode("UTF-8"))
+	assert stripped is not None
+	assert json.loads(stripped) == {
+			"title": "A pull request",
+			"state": "closed",
+			"pull_request": {"merged_at": "2022-01-01T00:00:00Z"},
+			}
+	assert strip_issue_json(stripped) == stripped
+
+	assert json.loads(strip_issue_json(b'{"title": "An issue", "state": "open"}')) == {  # type: ignore[arg-type]
+			"title": "An issue",
+			"state": "open",
+			}
+	assert strip_issue_json(b"[]") is None
+	assert strip_issue_json(b"<html></html>") is None
+
+
+def test_stripping_serializer(httpserver: HTTPServer):
+	backend = MemoryCache()
+	session = CacheControl(requests.Session(), cache=backend, serializer=StrippingSerializer())
+
+	httpserver.expect_request("/octocat/hello-world/issues/1").respond_with_response(
+			Response(
+					gzip.compress(issue_page),
+					headers={"Content-Encoding": "gzip", "Cache-Control": "max-age=600"},
+					content_type="text/html; charset=utf-8",
+					)
+			)
+	httpserver.expect_request("/repos/octocat/hello-world/issues/2").respond_with_json(
+			issue_json,
+			headers={"Cache-Control": "max-age=600"},
+			)
+	httpserver.expect_request("/octocat/hello-world/blob/master/README.md").respond_with_data(
+			"Lorem ipsum " * 100,
+			headers={"Cache-Control": "max-age=600"},
+			)
+
+	for path in ["/octocat/hello-world/issues/1", "/repos/octocat/hello-world/issues/2"]:
+		assert session.get(httpserver.url_for(path)).status_code == 200
+
+	assert backend.stats.bytes_written < 1000
+
+	cached = session.get(httpserver.url_for("/octocat/hello-world/issues/1"))
+	assert "Content-Encoding" not in cached.headers
+	assert cached.headers["Content-Length"] == str(len(cached.content))
+	assert cached.content == strip_issue_page(issue_page)
+
+	cached = session.get(httpserver.url_for("/repos/octocat/hello-world/issues/2"))
+	assert cached.json()["title"] == "A pull request"
+	assert "body" not in cached.json()
+
+	# Other responses are stored as they are.
+	readme_url = httpserver.url_for("/octocat/hello-world/blob/master/README.md")
+	assert session.get(readme_url).text == "Lorem ipsum " * 100
+	assert session.get(readme_url).text == "Lorem ipsum " * 100
+	assert backend.stats.hits == 3
+
+
+@pytest.mark.usefixtures("default_cache_settings")
+def test_configure_cache(tmp_pathplus: PathPlus, monkeypatch):
+	configure_cache("sqlite", tmp_pathplus / "cache", max_size=1024)
+	backend = get_cache_backend()
+
+	assert isinstance(backend, SQLiteCache)
+	assert backend.max_size == 1024
+	assert cache.cache_dir == tmp_pathplus / "cache"
+	adapter = cache.session.get_adapter("https://")
+	assert adapter.cache is backend  # type: ignore[attr-defined]
+	assert isinstance(adapter.controller.serializer, StrippingSerializer)  # type: ignore[attr-defined]
+
+	# The backend is only replaced when the settings change.
+	configure_cache("sqlite", tmp_pathplus / "cache", max_size=1024)
+	assert get_cache_backend() is backend
+
+	monkeypatch.setenv(CACHE_DIR_ENV_VAR, os.fspath(tmp_pathplus / "ci-cache"))
+	configure_cache("filesystem")
+	assert isinstance(get_cache_backend(), FileSystemCache)
+	assert cache.cache_dir == tmp_pathplus / "ci-cache"
+
+	with pytest.raises(ValueError, match="Unknown cache backend 'redis'"):
+		configure_cache("redis")
+
+
+@pytest.mark.usefixtures("default_cache_settings")
+def test_configure_cache_offline(tmp_pathplus: PathPlus):
+	set_offline(True)
+	try:
+		configure_cache("memory", tmp_pathplus)
+	finally:
+		set_offline(False)
+
+	assert cache.session.get_adapter("https://").cache is get_cache_backend()  # type: ignore[attr-defined]
+	assert isinstance(get_cache_backend(), MemoryCache)
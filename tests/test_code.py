@@ -3,14 +3,14 @@ from coincidence.regressions import AdvancedFileRegressionFixture
 from sphinx.events import EventListener
 
 # this package
-from sphinx_toolbox import __version__, code
+from sphinx_toolbox import __version__, _css, code
 from sphinx_toolbox.testing import check_asset_copy, run_setup
 
 
 def test_setup():
 	setup_ret, directives, roles, additional_nodes, app = run_setup(code.setup)
 
-	assert setup_ret == {"parallel_read_safe": True, "version": __version__}
+	assert setup_ret == {"parallel_read_safe": True, "parallel_write_safe": True, "version": __version__}
 
 	assert directives == {
 			"code-block": code.CodeBlock,
@@ -24,10 +24,11 @@ def test_setup():
 	assert additional_nodes == {code.Prompt}
 
 	assert app.events.listeners == {
-			"build-finished": [EventListener(id=1, handler=code.copy_asset_files, priority=500)],
 			"config-inited": [EventListener(id=0, handler=code.configure, priority=500)],
 			}
 
+	assert _css.get_stylesheets(app) == [_css.Stylesheet("sphinx-toolbox-code.css", _css.code_styles)]
+
 
 def test_copy_asset_files(tmp_pathplus, advanced_file_regression: AdvancedFileRegressionFixture):
 	check_asset_copy(
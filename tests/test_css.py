@@ -1,5 +1,11 @@
+# stdlib
+import os
+import re
+from types import SimpleNamespace
+
 # 3rd party
 from coincidence.regressions import AdvancedFileRegressionFixture
+from domdf_python_tools.paths import PathPlus
 from sphinx.events import EventListener
 
 # this package
@@ -11,14 +17,86 @@ from sphinx_toolbox.testing import check_asset_copy, run_setup
 def test_setup():
 	setup_ret, directives, roles, additional_nodes, app = run_setup(_css.setup)
 
-	assert setup_ret == {"version": sphinx_toolbox.__version__, "parallel_read_safe": True}
+	assert setup_ret == {
+			"version": sphinx_toolbox.__version__,
+			"parallel_read_safe": True,
+			"parallel_write_safe": True,
+			}
 
 	assert additional_nodes == set()
 	assert app.registry.translation_handlers == {}
-	assert app.events.listeners == {"build-finished": [EventListener(0, _css.copy_asset_files, 500)]}
+	assert app.events.listeners == {
+			"config-inited": [EventListener(0, _css.register_stylesheets, 510)],
+			"build-finished": [EventListener(1, _css.write_stylesheets, 500)],
+			}
+	assert app.config.values["toolbox_css_fingerprint"] == (False, "html", [bool])
+	assert app.config.values["toolbox_css_bundle"] == (False, "html", [bool])
+	assert _css.get_stylesheets(app) == [_css.Stylesheet("css/sphinx-toolbox.css", _css.toolbox_styles)]
+
+	assert app.registry.css_files == []
+	_css.register_stylesheets(app, app.config)  # type: ignore[arg-type]
 	assert app.registry.css_files == [("css/sphinx-toolbox.css", {})]
 
 
+def _make_app(tmp_pathplus: PathPlus, fingerprint: bool = False, bundle: bool = False):
+	app = run_setup(_css.setup).app
+	app.config.toolbox_css_fingerprint = fingerprint
+	app.config.toolbox_css_bundle = bundle
+	app.builder = SimpleNamespace(format="html")  # type: ignore[assignment]
+	app.outdir = tmp_pathplus  # type: ignore[misc]
+	_css.add_stylesheet(app, "extra.css", {"p.extra": {"color": "red"}}, minify=True)  # type: ignore[arg-type]
+	_css.register_stylesheets(app, app.config)  # type: ignore[arg-type]
+	return app
+
+
+def test_write_stylesheets(tmp_pathplus: PathPlus):
+	app = _make_app(tmp_pathplus)
+	assert app.registry.css_files == [("css/sphinx-toolbox.css", {}), ("extra.css", {})]
+
+	_css.write_stylesheets(app)  # type: ignore[arg-type]
+	main_css = tmp_pathplus / "_static" / "css" / "sphinx-toolbox.css"
+	extra_css = tmp_pathplus / "_static" / "extra.css"
+	assert "p.source-link {" in main_css.read_text()
+	assert extra_css.read_text() == "p.extra{color:red}\n"
+
+	# Unchanged files are not rewritten.
+	os.utime(main_css, ns=(0, 0))
+	_css.write_stylesheets(app)  # type: ignore[arg-type]
+	assert main_css.stat().st_mtime_ns == 0
+
+	assert not _css.write_if_changed(extra_css, "p.extra{color:red}\n")
+	assert _css.write_if_changed(extra_css, "p.extra{color:blue}\n")
+	assert extra_css.read_text() == "p.extra{color:blue}\n"
+
+
+def test_write_stylesheets_fingerprint(tmp_pathplus: PathPlus):
+	app = _make_app(tmp_pathplus, fingerprint=True)
+	(main_css, _), (extra_css, _) = app.registry.css_files
+	assert re.fullmatch(r"css/sphinx-toolbox\.[0-9a-f]{10}\.css", main_css)
+	assert re.fullmatch(r"extra\.[0-9a-f]{10}\.css", extra_css)
+
+	stale_css = tmp_pathplus / "_static" / "extra.0123456789.css"
+	stale_css.parent.maybe_make()
+	stale_css.write_text("p.extra{color:blue}\n")
+	(tmp_pathplus / "_static" / "extra.custom.css").write_text('')
+
+	_css.write_stylesheets(app)  # type: ignore[arg-type]
+	assert sorted(p.name for p in (tmp_pathplus / "_static").iterdir()) == sorted(["css", extra_css, "extra.custom.css"])
+	assert (tmp_pathplus / "_static" / extra_css).read_text() == "p.extra{color:red}\n"
+
+
+def test_write_stylesheets_bundle(tmp_pathplus: PathPlus):
+	app = _make_app(tmp_pathplus, bundle=True)
+	assert app.registry.css_files == [("css/sphinx-toolbox-bundle.css", {})]
+
+	_css.write_stylesheets(app)  # type: ignore[arg-type]
+	assert sorted(p.name for p in (tmp_pathplus / "_static" / "css").iterdir()) == ["sphinx-toolbox-bundle.css"]
+
+	bundle = (tmp_pathplus / "_static" / "css" / "sphinx-toolbox-bundle.css").read_text()
+	assert bundle.startswith("p.source-link{margin-bottom:0}")
+	assert bundle.endswith("p.extra{color:red}\n")
+
+
 def test_copy_asset_files(tmp_pathplus, advanced_file_regression: AdvancedFileRegressionFixture):
 	check_asset_copy(
 			_css.copy_asset_files,
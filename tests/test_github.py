@@ -1,26 +1,39 @@
 # stdlib
-from typing import Set, Type
+import json
+import re
+from datetime import timedelta
+from typing import Set, Tuple, Type
 
 # 3rd party
 import docutils.nodes
 import pytest
+import requests
 from apeye.requests_url import RequestsURL
 from coincidence.params import count
 from docutils import nodes
 from docutils.utils import Reporter
+from domdf_python_tools.paths import PathPlus
+from pytest_httpserver import HTTPServer
 from sphinx.events import EventListener
+from werkzeug import Response
 
 # this package
 import sphinx_toolbox
 from sphinx_toolbox import github
-from sphinx_toolbox.config import MissingOptionError
+from sphinx_toolbox.cache import cache, configure_cache, is_offline, set_offline
+from sphinx_toolbox.config import InvalidOptionError, MissingOptionError
 from sphinx_toolbox.github.issues import (
 		IssueNode,
 		_depart_issue_node_latex,
 		_visit_issue_node_latex,
+		collect_issue_urls,
 		depart_issue_node,
+		get_issue_title,
 		issue_role,
+		merge_issue_urls,
+		prefetch_issue_titles,
 		pull_role,
+		purge_issue_urls,
 		visit_issue_node
 		)
 from sphinx_toolbox.github.repos_and_users import (
@@ -32,6 +45,15 @@ from sphinx_toolbox.github.repos_and_users import (
 		user_role,
 		visit_github_object_link_node
 		)
+from sphinx_toolbox.github.title_backends import (
+		GraphQLBackend,
+		HTMLBackend,
+		IssueInfo,
+		IssueTitleBackend,
+		RESTBackend,
+		get_issue_title_backend
+		)
+from sphinx_toolbox.github.title_store import IssueTitleEntry, IssueTitleStore, issue_key, write_snapshot
 from sphinx_toolbox.testing import run_setup
 from sphinx_toolbox.utils import make_github_url
 from tests.common import AttrDict, error_codes
@@ -312,6 +334,14 @@ def test_visit_issue_node():
 	assert translator.body == ['<abbr title="Add --log-cli option">']
 	assert node.has_tooltip
 
+	# Once the titles have been prefetched, missing titles aren't fetched while writing.
+	other_node = IssueNode(7681, make_github_url("pytest-dev", "pytest") / "issues/7681")
+
+	with pytest.warns(UserWarning, match="Issue/Pull Request #7681 not found."):
+		visit_issue_node(translator, other_node)  # type: ignore
+
+	assert not other_node.has_tooltip
+
 
 @error_codes
 def test_visit_issue_node_errors(error_code, error_server):
@@ -328,6 +358,371 @@ def test_visit_issue_node_errors(error_code, error_server):
 	assert not node.has_tooltip
 
 
+def test_visit_issue_node_prefetched():
+	node = IssueNode(7680, make_github_url("pytest-dev", "pytest") / "issues/7680")
+	translator = FakeTranslator()
+	translator.builder = AttrDict(github_issue_titles={node.issue_url: "Add --log-cli option"})  # type: ignore
+
+	visit_issue_node(translator, node)  # type: ignore
+
+	assert translator.body == ['<abbr title="Add --log-cli option">']
+	assert node.has_tooltip
+
+
+def test_collect_purge_merge_issue_urls():
+	doctree = docutils.utils.new_document("index")
+	doctree += IssueNode(1, "https://github.com/octocat/hello-world/issues/1")
+	doctree += IssueNode(2, "https://github.com/octocat/hello-world/pull/2")
+	doctree += IssueNode(1, "https://github.com/octocat/hello-world/issues/1")
+
+	env = AttrDict(docname="index")
+	app = AttrDict(env=env)
+
+	collect_issue_urls(app, doctree)  # type: ignore
+	assert env.github_issue_urls == {
+			"index": {
+					"https://github.com/octocat/hello-world/issues/1",
+					"https://github.com/octocat/hello-world/pull/2",
+					},
+			}
+
+	other = AttrDict(github_issue_urls={"api": {"https://github.com/octocat/hello-world/issues/3"}})
+	merge_issue_urls(app, env, {"api"}, other)  # type: ignore
+	assert set(env.github_issue_urls) == {"index", "api"}
+
+	purge_issue_urls(app, env, "index")  # type: ignore
+	assert env.github_issue_urls == {"api": {"https://github.com/octocat/hello-world/issues/3"}}
+
+
+def test_html_backend(httpserver: HTTPServer):
+	for number in range(1, 6):
+		httpserver.expect_request(f"/prefetch/issues/{number}").respond_with_data(
+				f'<html><body><span class="State">Closed</span>'
+				f'<span class="js-issue-title"> Issue {number} </span></body></html>',
+				content_type="text/html",
+				)
+
+	urls = [httpserver.url_for(f"/prefetch/issues/{number}") for number in range(1, 6)]
+	urls.append(httpserver.url_for("/404"))
+
+	issues = HTMLBackend(max_workers=4, rate_limit=0).fetch(urls)
+
+	assert issues == {
+			**{url: (f"Issue {number}", "closed") for number, url in enumerate(urls[:-1], start=1)},
+			urls[-1]: None,
+			}
+
+
+def test_backends_unexpected_responses(httpserver: HTTPServer, monkeypatch):
+	monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+	httpserver.expect_request("/unexpected/issues/1").respond_with_data(
+			"<html><body><form>Sign in to GitHub</form></body></html>",
+			content_type="text/html",
+			)
+	httpserver.expect_request("/unexpected/issues/2").respond_with_data(
+			'<html><body><span class="js-issue-title"> Issue 2 </span></body></html>',
+			content_type="text/html",
+			)
+
+	urls = [httpserver.url_for(f"/unexpected/issues/{number}") for number in (1, 2)]
+	assert HTMLBackend(rate_limit=0).fetch(urls) == {urls[0]: None, urls[1]: IssueInfo("Issue 2")}
+	assert get_issue_title(urls[0]) is None
+
+	httpserver.expect_request("/unexpected-rest/repos/octocat/hello-world/issues/1").respond_with_data(
+			"<html><body>Sign in</body></html>",
+			content_type="text/html",
+			)
+	httpserver.expect_request("/unexpected-rest/repos/octocat/hello-world/issues/2").respond_with_json({
+			"message": "Moved Permanently",
+			})
+	httpserver.expect_request("/unexpected-rest/repos/octocat/hello-world/issues/3").respond_with_json({
+			"title": "An issue",
+			"state": "open",
+			})
+
+	backend = RESTBackend(rate_limit=0, api_url=httpserver.url_for("/unexpected-rest"))
+	urls = [f"https://github.com/octocat/hello-world/issues/{number}" for number in (1, 2, 3)]
+	assert backend.fetch(urls) == {urls[0]: None, urls[1]: None, urls[2]: IssueInfo("An issue", "open")}
+
+	repository = {"i1": {"title": "Issue 1"}, "i2": {"title": "Issue 2", "state": "OPEN"}}
+	httpserver.expect_request("/unexpected-graphql/graphql", method="POST").respond_with_json({
+			"data": {"repository": repository},
+			})
+
+	backend = GraphQLBackend(rate_limit=0, api_url=httpserver.url_for("/unexpected-graphql"))
+	urls = [f"https://github.com/octocat/hello-world/issues/{number}" for number in (1, 2)]
+	assert backend.fetch(urls) == {urls[0]: None, urls[1]: IssueInfo("Issue 2", "open")}
+
+
+def test_issue_title_backend_abstract():
+	with pytest.raises(TypeError, match="abstract"):
+		IssueTitleBackend()  # type: ignore[abstract]
+
+
+class FakeBuilder:
+	format = "html"
+
+	def __init__(self, outdated):
+		self.outdated = outdated
+
+	def get_outdated_docs(self):
+		return iter(self.outdated)
+
+
+def test_rest_backend(httpserver: HTTPServer, monkeypatch):
+	monkeypatch.setenv("GITHUB_TOKEN", "t0ken")
+
+	httpserver.expect_request(
+			"/rest-api/repos/octocat/hello-world/issues/1",
+			headers={"Authorization": "bearer t0ken"},
+			).respond_with_json({"title": "An issue", "state": "open"})
+	httpserver.expect_request("/rest-api/repos/octocat/hello-world/issues/2").respond_with_json({
+			"title": "A pull request",
+			"state": "closed",
+			"pull_request": {"merged_at": "2022-01-01T00:00:00Z"},
+			})
+
+	backend = RESTBackend(rate_limit=0, api_url=httpserver.url_for("/rest-api"))
+	assert backend.token == "t0ken"
+
+	assert backend.fetch([
+			"https://github.com/octocat/hello-world/issues/1",
+			"https://github.com/octocat/hello-world/pull/2",
+			"https://github.com/octocat/hello-world/issues/3",
+			]) == {
+					"https://github.com/octocat/hello-world/issues/1": IssueInfo("An issue", "open"),
+					"https://github.com/octocat/hello-world/pull/2": IssueInfo("A pull request", "merged"),
+					"https://github.com/octocat/hello-world/issues/3": None,
+					}
+
+
+def test_graphql_backend(httpserver: HTTPServer, monkeypatch):
+	monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+	def handler(request):
+		query = request.get_json()["query"]
+		numbers = [int(number) for number in re.findall(r"issueOrPullRequest\(number: (\d+)\)", query)]
+		assert len(numbers) <= 2
+
+		repository = {f"i{number}": {"title": f"Issue {number}", "state": "OPEN"} for number in numbers}
+		repository.pop("i4", None)
+
+		return Response(json.dumps({"data": {"repository": repository}}), content_type="application/json")
+
+	httpserver.expect_request("/graphql-api/graphql", method="POST").respond_with_handler(handler)
+
+	backend = GraphQLBackend(rate_limit=0, api_url=httpserver.url_for("/graphql-api"))
+	backend.batch_size = 2
+	assert backend.token is None
+
+	urls = [f"https://github.com/octocat/hello-world/issues/{number}" for number in range(1, 6)]
+	urls.append("https://github.com/octocat/hello-world/pull/1")
+	n_requests = len(httpserver.log)
+
+	assert backend.fetch(urls) == {
+			urls[0]: IssueInfo("Issue 1", "open"),
+			urls[1]: IssueInfo("Issue 2", "open"),
+			urls[2]: IssueInfo("Issue 3", "open"),
+			urls[3]: None,
+			urls[4]: IssueInfo("Issue 5", "open"),
+			urls[5]: IssueInfo("Issue 1", "open"),
+			}
+	assert len(httpserver.log) == n_requests + 3
+
+
+def test_get_issue_title_backend():
+	config = AttrDict(
+			github_issue_title_workers=2,
+			github_issue_title_rate_limit=1,
+			github_issue_title_backend="GraphQL",
+			github_api_url="https://github.example.com/api",
+			)
+	app = AttrDict(config=config)
+
+	backend = get_issue_title_backend(app)  # type: ignore
+	assert isinstance(backend, GraphQLBackend)
+	assert backend.max_workers == 2
+	assert str(backend.api_url) == "https://github.example.com/api"
+
+	config.github_issue_title_backend = RESTBackend
+	assert isinstance(get_issue_title_backend(app), RESTBackend)  # type: ignore
+
+	instance = HTMLBackend()
+	config.github_issue_title_backend = instance
+	assert get_issue_title_backend(app) is instance  # type: ignore
+
+	config.github_issue_title_backend = "carrier-pigeon"
+	with pytest.raises(InvalidOptionError, match="Unknown issue title backend 'carrier-pigeon'."):
+		get_issue_title_backend(app)  # type: ignore
+
+
+def test_prefetch_issue_titles(httpserver: HTTPServer, tmp_pathplus: PathPlus):
+	httpserver.expect_request("/store/issues/1").respond_with_data(
+			'<html><body><span class="State">Open</span><span class="js-issue-title">Open issue</span></body></html>',
+			content_type="text/html",
+			)
+	httpserver.expect_request("/store/issues/2").respond_with_data(
+			'<html><body><span class="State">Closed</span><span class="js-issue-title">Closed issue</span></body></html>',
+			content_type="text/html",
+			)
+
+	httpserver.expect_request("/store/issues/3").respond_with_data(
+			'<html><body><span class="State">Closed</span><span class="js-issue-title">Other issue</span></body></html>',
+			content_type="text/html",
+			)
+
+	urls = [httpserver.url_for(f"/store/issues/{number}") for number in (1, 2, 3)]
+	env = AttrDict(github_issue_urls={"index": {urls[0]}, "api": {urls[1]}, "other": {urls[2]}})
+	config = AttrDict(
+			github_issue_title_workers=2,
+			github_issue_title_rate_limit=0,
+			github_issue_title_ttl=4,
+			github_issue_title_store="titles.sqlite",
+			github_issue_title_backend="html",
+			github_api_url="https://api.github.com",
+			)
+
+	# Documents which aren't outdated are included too, as Sphinx may write them as well.
+	app = AttrDict(builder=FakeBuilder(["index", "api"]), config=config, confdir=tmp_pathplus)
+	prefetch_issue_titles(app, env)  # type: ignore
+	expected = {urls[0]: "Open issue", urls[1]: "Closed issue", urls[2]: "Other issue"}
+	assert app.builder.github_issue_titles == expected
+
+	with IssueTitleStore(tmp_pathplus / "titles.sqlite") as store:
+		assert [(entry.title, entry.state) for entry in store.entries()] == [
+				("Open issue", "open"),
+				("Closed issue", "closed"),
+				("Other issue", "closed"),
+				]
+
+	# A subsequent build should read all the titles from the store
+	n_requests = len(httpserver.log)
+	app.builder = FakeBuilder(["index", "api"])
+	prefetch_issue_titles(app, env)  # type: ignore
+	assert app.builder.github_issue_titles == expected
+	assert len(httpserver.log) == n_requests
+
+	# Once the TTL has passed, only the open issue is fetched again
+	with IssueTitleStore(tmp_pathplus / "titles.sqlite") as store:
+		fetched = [entry.fetched for entry in store.entries()]
+
+	config.github_issue_title_ttl = 0
+	app.builder = FakeBuilder(["index", "api"])
+	prefetch_issue_titles(app, env)  # type: ignore
+
+	with IssueTitleStore(tmp_pathplus / "titles.sqlite") as store:
+		refetched = [entry.fetched for entry in store.entries()]
+
+	assert refetched[0] > fetched[0]
+	assert refetched[1] == fetched[1]
+
+
+@pytest.fixture()
+def offline():
+	set_offline(True)
+	try:
+		yield
+	finally:
+		set_offline(False)
+
+
+@pytest.mark.usefixtures("offline")
+def test_prefetch_issue_titles_offline(tmp_pathplus: PathPlus):
+	write_snapshot(
+			tmp_pathplus / "issue_titles.json",
+			[IssueTitleEntry("octocat/hello-world", 1, "An issue", "open", 0)],
+			)
+
+	urls = ["https://github.com/octocat/hello-world/issues/1", "https://github.com/octocat/hello-world/pull/2"]
+	env = AttrDict(github_issue_urls={"index": {urls[0]}, "api": {urls[1]}})
+	config = AttrDict(toolbox_offline_snapshot="issue_titles.json")
+
+	# Documents which aren't outdated are included too, so the visitor never needs to fall back to the network.
+	app = AttrDict(builder=FakeBuilder([]), config=config, confdir=tmp_pathplus)
+	prefetch_issue_titles(app, env)  # type: ignore
+	assert app.builder.github_issue_titles == {urls[0]: "An issue", urls[1]: None}
+
+
+@pytest.mark.usefixtures("offline")
+def test_offline_mode(httpserver: HTTPServer):
+	httpserver.expect_request("/offline/issues/1").respond_with_data(
+			'<html><body><span class="js-issue-title">An issue</span></body></html>',
+			content_type="text/html",
+			)
+
+	n_requests = len(httpserver.log)
+
+	with pytest.raises(requests.exceptions.ConnectionError, match="as sphinx-toolbox is in offline mode"):
+		cache.session.get(httpserver.url_for("/offline/issues/1"))
+
+	assert get_issue_title(httpserver.url_for("/offline/issues/1")) is None
+	assert HTMLBackend().fetch([httpserver.url_for("/offline/issues/1")]) == {
+			httpserver.url_for("/offline/issues/1"): None,
+			}
+	assert len(httpserver.log) == n_requests
+
+	set_offline(False)
+	assert get_issue_title(httpserver.url_for("/offline/issues/1")) == "An issue"
+
+
+def test_offline_env_var(monkeypatch):
+	assert not is_offline()
+	monkeypatch.setenv("SPHINX_TOOLBOX_OFFLINE", '1')
+	assert is_offline()
+
+
+def test_configure_cache(tmp_pathplus: PathPlus):
+	config = AttrDict(toolbox_cache_backend="memory", toolbox_cache_dir="_cache", toolbox_cache_max_size=1024)
+	app = AttrDict(config=config, confdir=tmp_pathplus)
+
+	try:
+		github._configure_cache(app, config)  # type: ignore[arg-type]
+		assert cache.cache_dir == tmp_pathplus / "_cache"
+		assert cache.session.get_adapter("https://").cache.max_size == 1024  # type: ignore[attr-defined]
+	finally:
+		configure_cache()
+
+	config.toolbox_cache_backend = "redis"
+	with pytest.raises(InvalidOptionError, match="Unknown cache backend 'redis'."):
+		github._configure_cache(app, config)  # type: ignore[arg-type]
+
+
+def test_title_store(tmp_pathplus: PathPlus):
+	with IssueTitleStore(tmp_pathplus / "titles.sqlite") as store:
+		assert len(store) == 0
+		assert store.get("https://github.com/octocat/hello-world/issues/1") is None
+
+		store.set("https://github.com/octocat/hello-world/issues/1", "Open issue", "open")
+		store.set("https://github.com/octocat/hello-world/pull/2", "Merged PR", "merged")
+		store.set("https://github.com/octocat/spoon-knife/issues/3", "Unknown issue")
+		assert len(store) == 3
+
+		entry = store.get("https://github.com/octocat/hello-world/pull/1")
+		assert entry is not None
+		assert (entry.repo, entry.number, entry.title, entry.state) == ("octocat/hello-world", 1, "Open issue", "open")
+		assert not entry.is_expired(timedelta(hours=1))
+		assert entry.is_expired(timedelta(hours=1), now=entry.fetched + 3601)
+
+		assert [entry.number for entry in store.entries("octocat/hello-world")] == [1, 2]
+
+		assert store.prune(timedelta(0), "octocat/spoon-knife") == 1
+		assert store.prune(timedelta(0)) == 1
+		assert [entry.title for entry in store.entries()] == ["Merged PR"]
+
+
+@pytest.mark.parametrize(
+		"url, key",
+		[
+				("https://github.com/octocat/hello-world/issues/1", ("octocat/hello-world", 1)),
+				("https://github.com/octocat/hello-world/pull/12", ("octocat/hello-world", 12)),
+				("http://localhost:8000/octocat/hello-world/issues/3", ("localhost:8000/octocat/hello-world", 3)),
+				]
+		)
+def test_issue_key(url: str, key: Tuple[str, int]):
+	assert issue_key(url) == key
+
+
 def test_depart_issue_node():
 	node = IssueNode(7680, make_github_url("pytest-dev", "pytest") / "issues/7680")
 	translator = FakeTranslator()
@@ -349,7 +744,11 @@ def test_depart_issue_node():
 def test_setup():
 	setup_ret, directives, roles, additional_nodes, app = run_setup(github.setup)
 
-	assert setup_ret == {"version": sphinx_toolbox.__version__, "parallel_read_safe": True}
+	assert setup_ret == {
+			"version": sphinx_toolbox.__version__,
+			"parallel_read_safe": True,
+			"parallel_write_safe": True,
+			}
 
 	expected_additional_nodes: Set[Type[nodes.reference]] = {IssueNode, GitHubObjectLinkNode}
 	assert additional_nodes == expected_additional_nodes
@@ -370,9 +769,29 @@ def test_setup():
 	# Moved to own setup function
 	assert app.config.values["github_username"] == (None, "env", [str])
 	assert app.config.values["github_repository"] == (None, "env", [str])
+	assert app.config.values["github_issue_title_workers"] == (8, '', [int])
+	assert app.config.values["github_issue_title_rate_limit"] == (5, '', [int, float])
+	assert app.config.values["github_issue_title_ttl"] == (4, '', [int, float])
+	assert app.config.values["github_issue_title_store"] == (None, '', [str, None])
+	assert app.config.values["github_issue_title_backend"] == ("html", '', [str, type, IssueTitleBackend])
+	assert app.config.values["github_api_url"] == ("https://api.github.com", '', [str])
+
+	assert app.config.values["toolbox_offline"] == (False, '', [bool])
+	assert app.config.values["toolbox_offline_snapshot"] == (None, '', [str, None])
+	assert app.config.values["toolbox_cache_backend"] == ("filesystem", '', [str])
+	assert app.config.values["toolbox_cache_dir"] == (None, '', [str, None])
+	assert app.config.values["toolbox_cache_max_size"] == (50 * 1024 * 1024, '', [int])
 
 	assert app.events.listeners == {
-			"config-inited": [EventListener(id=0, handler=github.validate_config, priority=850)],
+			"config-inited": [
+					EventListener(id=0, handler=github.validate_config, priority=850),
+					EventListener(id=1, handler=github._configure_cache, priority=500),
+					EventListener(id=2, handler=github._configure_offline_mode, priority=500),
+					],
+			"doctree-read": [EventListener(id=3, handler=collect_issue_urls, priority=500)],
+			"env-purge-doc": [EventListener(id=4, handler=purge_issue_urls, priority=500)],
+			"env-merge-info": [EventListener(id=5, handler=merge_issue_urls, priority=500)],
+			"env-updated": [EventListener(id=6, handler=prefetch_issue_titles, priority=500)],
 			}
 
 	assert directives == {}
@@ -0,0 +1,137 @@
+# stdlib
+import importlib
+import subprocess
+import sys
+from typing import Set
+
+# 3rd party
+import pytest
+from apeye.requests_url import RequestsURL
+
+# this package
+import sphinx_toolbox
+from sphinx_toolbox import utils
+from sphinx_toolbox.cache import cache
+
+# Modules which should only be imported by builds which make network requests.
+heavy_modules = {
+		"requests",
+		"bs4",
+		"html5lib",
+		"cachecontrol",
+		"apeye.rate_limiter",
+		"apeye.requests_url",
+		}
+
+
+def get_imported_modules(statement: str) -> Set[str]:
+	"""
+	Returns the names of the modules imported by ``statement`` in a fresh interpreter,
+	as reported by ``python -X importtime``.
+	"""  # noqa: D400
+
+	process = subprocess.run(
+			[sys.executable, "-X", "importtime", "-c", statement],
+			stdout=subprocess.PIPE,
+			stderr=subprocess.PIPE,
+			universal_newlines=True,
+			check=True,
+			)
+
+	modules = set()
+
+	for line in process.stderr.splitlines():
+		if line.startswith("import time:") and not line.rstrip().endswith("| cumulative | imported package"):
+			modules.add(line.split('|')[-1].strip())
+
+	return modules
+
+
+def test_import_package():
+	modules = get_imported_modules("import sphinx_toolbox")
+
+	assert "sphinx_toolbox" in modules
+	assert not {m for m in modules if m.startswith("sphinx_toolbox.")}
+	assert not modules & heavy_modules
+	assert "sphinx.application" not in modules
+
+
+@pytest.mark.parametrize(
+		"module",
+		[
+				"sphinx_toolbox.cache",
+				"sphinx_toolbox.config",
+				"sphinx_toolbox.github",
+				"sphinx_toolbox.github.issues",
+				"sphinx_toolbox.github.title_backends",
+				"sphinx_toolbox.github.title_store",
+				"sphinx_toolbox.issues",
+				"sphinx_toolbox.source",
+				"sphinx_toolbox.utils",
+				"sphinx_toolbox.wikipedia",
+				]
+		)
+def test_import_submodule(module: str):
+	modules = get_imported_modules(f"import {module}")
+
+	assert module in modules
+	assert not modules & heavy_modules
+
+
+def test_main_import():
+	# The HTTP cache is only created by the commands which use it.
+	modules = get_imported_modules("import sphinx_toolbox.__main__")
+	assert not modules & heavy_modules
+
+
+def test_cache_imported_on_access():
+	modules = get_imported_modules("from sphinx_toolbox.cache import cache; cache.session")
+	assert {"requests", "apeye.rate_limiter"} <= modules
+
+	# For backwards compatibility ``sphinx_toolbox.cache`` is the cache itself.
+	statement = "import sphinx_toolbox; assert type(sphinx_toolbox.cache).__name__ == 'HTTPCache'"
+	subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+@pytest.mark.parametrize(
+		"statement",
+		[
+				"import sphinx_toolbox.cache",
+				"from sphinx_toolbox.cache import configure_cache",
+				"import sphinx_toolbox; sphinx_toolbox.cache; import sphinx_toolbox.cache",
+				"import sphinx_toolbox.github",
+				]
+		)
+def test_cache_attribute_after_submodule_import(statement: str):
+	# Importing the submodule must not replace the HTTP cache with the module.
+	statement += "; import sphinx_toolbox; assert type(sphinx_toolbox.cache).__name__ == 'HTTPCache'"
+	subprocess.run([sys.executable, "-c", statement], check=True)
+
+	importlib.import_module("sphinx_toolbox.cache")
+	assert sphinx_toolbox.cache is cache
+
+
+def test_lazy_submodules():
+	assert sphinx_toolbox.utils is utils
+	assert sphinx_toolbox.config.validate_config is not None
+	assert {"assets", "code", "config", "utils", "wikipedia", "setup"} <= set(dir(sphinx_toolbox))
+
+	with pytest.raises(AttributeError, match="module 'sphinx_toolbox' has no attribute 'foo'"):
+		sphinx_toolbox.foo  # type: ignore[attr-defined]  # pylint: disable=pointless-statement
+
+
+def test_lazy_attributes():
+	cache_module = importlib.import_module("sphinx_toolbox.cache")
+	assert cache_module.cache is cache
+	assert cache.cache_dir.name == "sphinx-toolbox"
+
+	assert isinstance(utils.GITHUB_COM, RequestsURL)
+	assert utils.GITHUB_COM is utils.GITHUB_COM
+	github_url = utils.GITHUB_COM / "sphinx-toolbox" / "sphinx-toolbox"
+	assert utils.make_github_url("sphinx-toolbox", "sphinx-toolbox") == github_url
+
+	with pytest.raises(AttributeError, match="module 'sphinx_toolbox.utils' has no attribute 'foo'"):
+		utils.foo  # type: ignore[attr-defined]  # pylint: disable=pointless-statement
+
+	with pytest.raises(AttributeError, match="module 'sphinx_toolbox.cache' has no attribute 'foo'"):
+		cache_module.foo  # type: ignore[attr-defined]  # pylint: disable=pointless-statement
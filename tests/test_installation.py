@@ -1,12 +1,17 @@
 # stdlib
-from typing import List
+from io import StringIO
+from typing import List, Set
 
 # 3rd party
 import pytest
+from docutils import nodes
+from domdf_python_tools.paths import PathPlus
+from sphinx.application import Sphinx
 from sphinx.events import EventListener
+from sphinx.util.docutils import docutils_namespace
 
 # this package
-from sphinx_toolbox import installation
+from sphinx_toolbox import _css, installation
 from sphinx_toolbox.installation import make_installation_instructions
 from sphinx_toolbox.testing import run_setup
 from tests.common import AttrDict
@@ -188,7 +193,12 @@ def test_setup():
 
 	assert app.events.listeners == {
 			"env-purge-doc": [
-					EventListener(id=1, handler=installation.extensions_node_purger.purge_nodes, priority=500),
+					EventListener(id=1, handler=installation.installation_node_purger.purge_nodes, priority=500),
+					EventListener(id=3, handler=installation.extensions_node_purger.purge_nodes, priority=500),
+					],
+			"env-merge-info": [
+					EventListener(id=2, handler=installation.installation_node_purger.merge_nodes, priority=500),
+					EventListener(id=4, handler=installation.extensions_node_purger.merge_nodes, priority=500),
 					],
 			"env-get-outdated": [
 					EventListener(
@@ -197,8 +207,8 @@ def test_setup():
 							priority=500
 							),
 					],
-			"build-finished": [EventListener(id=3, handler=installation.copy_asset_files, priority=500)],
-			"config-inited": [EventListener(id=2, handler=installation._on_config_inited, priority=510)],
+			"build-finished": [EventListener(id=6, handler=installation._copy_js_file, priority=500)],
+			"config-inited": [EventListener(id=5, handler=installation._on_config_inited, priority=510)],
 			}
 
 	assert app.config.values["conda_channels"] == ([], "env", [list])
@@ -213,5 +223,55 @@ def test_setup():
 	assert app.registry.js_files == []
 
 	installation._on_config_inited(app, app.config)  # type: ignore
-	assert app.registry.css_files == [("sphinx_toolbox_installation.css", {})]
+	assert app.registry.css_files == []
 	assert app.registry.js_files == [("sphinx_toolbox_installation.js", {})]
+
+	assert _css.get_stylesheets(app) == [
+			_css.Stylesheet("sphinx_toolbox_installation.css", _css.installation_styles, minify=True),
+			]
+
+
+def test_parallel_read_outdated(tmp_pathplus: PathPlus):
+	srcdir = tmp_pathplus / "src"
+	srcdir.mkdir()
+	(srcdir / "conf.py").write_lines(['extensions = ["sphinx_toolbox.installation"]', 'project = "Demo"'])
+
+	docnames = [f"page_{number}" for number in range(8)]
+	(srcdir / "index.rst").write_lines(["Demo", "====", '', ".. toctree::", '', *(f"\t{d}" for d in docnames)])
+	for docname in docnames:
+		(srcdir / f"{docname}.rst").write_lines([docname, '=' * len(docname)])
+
+	(srcdir / "page_3.rst").write_lines(["page_3", "======", '', ".. installation:: demo", "\t:pypi:"])
+	(srcdir / "page_5.rst").write_lines(["page_5", "======", '', ".. extensions:: demo"])
+
+	def build(buildername: str) -> Set[str]:
+		read: Set[str] = set()
+
+		with docutils_namespace():
+			app = Sphinx(
+					srcdir,
+					srcdir,
+					tmp_pathplus / buildername,
+					tmp_pathplus / "doctrees",
+					buildername,
+					status=StringIO(),
+					warning=StringIO(),
+					parallel=2,
+					)
+			assert app.is_parallel_allowed("read")
+			app.connect("env-before-read-docs", lambda app, env, docnames: read.update(docnames))
+			app.build()
+
+		# The nodes recorded while reading in other processes are merged into the main environment.
+		assert list(installation.installation_node_purger.get_nodes(app.env)) == ["page_3"]
+		assert list(installation.extensions_node_purger.get_nodes(app.env)) == ["page_5"]
+
+		# The built-in purgers keep a copy of each node, as they did before lightweight mode was added.
+		node_entry = installation.installation_node_purger.get_nodes(app.env)["page_3"][0]
+		assert isinstance(node_entry["installation_node"], nodes.Node)
+		return read
+
+	assert build("html") == {"index", *docnames}
+
+	# The installation instructions depend on the builder, so only that document is read again.
+	assert build("latex") == {"page_3"}
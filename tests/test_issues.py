@@ -269,7 +269,11 @@ def test_depart_issue_node():
 def test_setup():
 	setup_ret, directives, roles, additional_nodes, app = run_setup(issues.setup)
 
-	assert setup_ret == {"version": sphinx_toolbox.__version__, "parallel_read_safe": True}
+	assert setup_ret == {
+			"version": sphinx_toolbox.__version__,
+			"parallel_read_safe": True,
+			"parallel_write_safe": True,
+			}
 	assert roles == {
 			"issue": issue_role,
 			"pr": pull_role,
@@ -1,14 +1,32 @@
+# stdlib
+import base64
+import random
+from io import StringIO
+
 # 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus
+from sphinx.application import Sphinx
+from sphinx.builders import Builder
 from sphinx.events import EventListener
+from sphinx.util.docutils import docutils_namespace
 
 # this package
+import sphinx_toolbox
 from sphinx_toolbox import latex
 from sphinx_toolbox.testing import run_setup
+from tests.common import AttrDict
 
 
 def test_setup():
 	setup_ret, directives, roles, additional_nodes, app = run_setup(latex.setup)
 
+	assert setup_ret == {
+			"version": sphinx_toolbox.__version__,
+			"parallel_read_safe": True,
+			"parallel_write_safe": True,
+			}
+
 	assert app.events.listeners == {
 			"config-inited": [EventListener(id=0, handler=latex.configure, priority=500)],
 			}
@@ -24,3 +42,114 @@ def test_setup():
 
 	assert app.registry.css_files == []
 	assert app.registry.js_files == []
+
+
+@pytest.mark.parametrize("parallel", [1, 2])
+def test_replace_unknown_unicode(tmp_pathplus: PathPlus, parallel: int):
+	(tmp_pathplus / "manual.tex").write_text(
+			"\\begin{document}   \n♠♥♦♣ μ\u200b\n\n\n1 ≤ 2 ≥ 0 ≈ 1 ≡ 1\n→ \n\n\n",
+			)
+	(tmp_pathplus / "guide.tex").write_text("≈ ⟶ →\n")
+	(tmp_pathplus / "untouched.tex").write_text("♠\n")
+
+	app = AttrDict({
+			"builder": AttrDict({
+					"name": "latex",
+					"outdir": str(tmp_pathplus),
+					"document_data": [
+							("index", "manual.tex", "Manual", "Author", "manual", False),
+							("guide", "guide.tex", "Guide", "Author", "howto", False),
+							("missing", "missing.tex", "Missing", "Author", "howto", False),
+							],
+					}),
+			"config": AttrDict({"latex_unicode_replacements": {'→': r"$\rightarrow$"}}),
+			"parallel": parallel,
+			})
+
+	latex.replace_unknown_unicode(app)  # type: ignore[arg-type]
+
+	assert (tmp_pathplus / "manual.tex").read_text() == (
+			"\\begin{document}\n"
+			" $\\spadesuit$  $\\heartsuit$  $\\diamondsuit$  $\\clubsuit$  \\textmu{}\\hspace{0pt}\n"
+			"\n\n"
+			"1  $\\leq$  2  $\\geq$  0  $\\approx$  1  $\\equiv$  1\n"
+			"$\\rightarrow$\n"
+			)
+	assert (tmp_pathplus / "guide.tex").read_text() == " $\\approx$  ⟶ $\\rightarrow$\n"
+	assert (tmp_pathplus / "untouched.tex").read_text() == "♠\n"
+	assert not (tmp_pathplus / "missing.tex").exists()
+	assert sorted(p.name for p in tmp_pathplus.iterdir()) == ["guide.tex", "manual.tex", "untouched.tex"]
+
+	# Strings longer than a single character are also supported.
+	app.config.latex_unicode_replacements = {"⟶": r"$\longrightarrow$", "≈ ⟶": "!"}
+	(tmp_pathplus / "guide.tex").write_text("≈ ⟶ ⟶\n")
+	latex.replace_unknown_unicode(app)  # type: ignore[arg-type]
+	assert (tmp_pathplus / "guide.tex").read_text() == "! $\\longrightarrow$\n"
+
+
+def test_replace_unknown_unicode_matches_write_clean(tmp_pathplus: PathPlus):
+	content = ''.join(random.Random(1234).choices("ab ≤\t\n♠", k=50_000))
+
+	expected = tmp_pathplus / "expected.tex"
+	expected.write_clean(content.replace('≤', r" $\leq$ ").replace('♠', r' $\spadesuit$ '))
+
+	actual = tmp_pathplus / "actual.tex"
+	actual.write_text(content)
+	latex._replace_unicode_in_file(
+			actual,
+			latex._make_unicode_replacer(latex._default_unicode_replacements),
+			chunk_size=1000,
+			)
+
+	assert actual.read_text() == expected.read_text()
+
+
+def test_parallel_write(tmp_pathplus: PathPlus):
+	srcdir = tmp_pathplus / "src"
+	srcdir.mkdir()
+	(srcdir / "conf.py").write_lines([
+			'extensions = ["sphinx_toolbox.latex"]',
+			'project = "Demo"',
+			"latex_documents = [",
+			'	("index", "manual.tex", "Manual", "Author", "manual"),',
+			'	("guide", "guide.tex", "Guide", "Author", "howto"),',
+			'	("api", "api.tex", "API", "Author", "manual"),',
+			"	]",
+			])
+	(srcdir / "index.rst").write_lines(["Manual", "======", '', ".. toctree::", '', "	guide", "	api"])
+	(srcdir / "guide.rst").write_lines(["Guide", "=====", '', ".. image:: image.png"])
+	(srcdir / "api.rst").write_lines(["API", "===", '', "Some text."])
+	(srcdir / "image.png").write_bytes(
+			base64.b64decode(
+					"iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+					)
+			)
+
+	outputs = {}
+
+	for parallel in (1, 2):
+		outdir = tmp_pathplus / f"out_{parallel}"
+		with docutils_namespace():
+			app = Sphinx(
+					srcdir,
+					srcdir,
+					outdir,
+					tmp_pathplus / f"doctrees_{parallel}",
+					"latex",
+					parallel=parallel,
+					freshenv=True,
+					status=None,
+					warning=StringIO(),
+					)
+			app.build()
+
+			assert isinstance(app.builder, latex.PatchedLaTeXBuilder)
+			assert app.builder.parallel_ok is (parallel > 1)
+			# The base class's method of the same name writes docnames, and must not be shadowed.
+			assert type(app.builder)._write_parallel is Builder._write_parallel
+			assert app.builder.images == {"image.png": "image.png"}
+			assert (outdir / "image.png").is_file()
+
+		outputs[parallel] = {name: (outdir / name).read_text() for name in ("manual.tex", "guide.tex", "api.tex")}
+
+	assert outputs[1] == outputs[2]
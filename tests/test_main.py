@@ -1,3 +1,158 @@
 def test_import():
 	# this package
 	import sphinx_toolbox.__main__
+
+
+def test_title_store_commands(tmp_pathplus, capsys):
+	# stdlib
+	import json
+
+	# this package
+	from sphinx_toolbox.__main__ import main
+	from sphinx_toolbox.github.title_store import IssueTitleStore
+
+	store_file = (tmp_pathplus / "titles.sqlite").as_posix()
+
+	with IssueTitleStore(store_file) as store:
+		store.set("https://github.com/octocat/hello-world/issues/1", "Open issue", "open")
+		store.set("https://github.com/octocat/hello-world/pull/2", "Merged PR", "merged")
+		store.set("https://github.com/octocat/spoon-knife/issues/3", "Closed issue", "closed")
+
+	assert main(["inspect", "octocat/hello-world", "--store", store_file]) == 0
+	lines = capsys.readouterr().out.splitlines()
+	assert [line.split('\t')[0] for line in lines[:-1]] == ["octocat/hello-world#1", "octocat/hello-world#2"]
+	assert lines[-1] == f"2 titles in {store_file}"
+
+	assert main(["prune", "--store", store_file, "--ttl", '0']) == 0
+	assert capsys.readouterr().out == "Removed 1 expired titles.\n"
+
+	assert main(["export", "--store", store_file, "--output", (tmp_pathplus / "titles.json").as_posix()]) == 0
+	exported = json.loads((tmp_pathplus / "titles.json").read_text())
+	assert [(entry["repo"], entry["number"], entry["title"]) for entry in exported] == [
+			("octocat/hello-world", 2, "Merged PR"),
+			("octocat/spoon-knife", 3, "Closed issue"),
+			]
+
+
+def test_snapshot_command(tmp_pathplus, capsys):
+	# stdlib
+	import pickle
+	from types import SimpleNamespace
+
+	# this package
+	from sphinx_toolbox.__main__ import main
+	from sphinx_toolbox.github.title_store import IssueTitleStore, read_snapshot
+
+	store_file = (tmp_pathplus / "titles.sqlite").as_posix()
+
+	with IssueTitleStore(store_file) as store:
+		store.set("https://github.com/octocat/hello-world/issues/1", "Closed issue", "closed")
+		store.set("https://github.com/octocat/hello-world/issues/2", "Unrelated issue", "closed")
+
+	env = SimpleNamespace(github_issue_urls={"index": {"https://github.com/octocat/hello-world/pull/1"}})
+	(tmp_pathplus / "doctrees").mkdir()
+	(tmp_pathplus / "doctrees" / "environment.pickle").write_bytes(pickle.dumps(env))
+
+	output = (tmp_pathplus / "issue_titles.json").as_posix()
+	assert main(["snapshot", (tmp_pathplus / "doctrees").as_posix(), "-o", output, "--store", store_file]) == 0
+	assert capsys.readouterr().out == f"Wrote 1 of 1 titles to {output}.\n"
+
+	assert list(read_snapshot(output)) == [("octocat/hello-world", 1)]
+
+
+def test_snapshot_command_backend(tmp_pathplus, capsys, httpserver, monkeypatch):
+	# stdlib
+	import pickle
+	from types import SimpleNamespace
+
+	# 3rd party
+	import pytest
+
+	# this package
+	from sphinx_toolbox.__main__ import main
+	from sphinx_toolbox.github.title_store import read_snapshot
+
+	monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+	httpserver.expect_request("/snapshot-api/repos/octocat/hello-world/issues/3").respond_with_json({
+			"title": "Fetched issue",
+			"state": "closed",
+			})
+
+	env = SimpleNamespace(github_issue_urls={"index": {"https://github.com/octocat/hello-world/issues/3"}})
+	(tmp_pathplus / "doctrees").mkdir()
+	(tmp_pathplus / "doctrees" / "environment.pickle").write_bytes(pickle.dumps(env))
+
+	doctreedir = (tmp_pathplus / "doctrees").as_posix()
+	output = (tmp_pathplus / "issue_titles.json").as_posix()
+	store_file = (tmp_pathplus / "titles.sqlite").as_posix()
+
+	with pytest.raises(SystemExit):
+		main(["snapshot", doctreedir, "-o", output, "--store", store_file, "--backend", "carrier-pigeon"])
+	assert "invalid choice: 'carrier-pigeon'" in capsys.readouterr().err
+
+	api_url = httpserver.url_for("/snapshot-api")
+	assert main([
+			"snapshot",
+			doctreedir,
+			"-o",
+			output,
+			"--store",
+			store_file,
+			"--backend",
+			"rest",
+			"--api-url",
+			api_url,
+			]) == 0
+	assert capsys.readouterr().out == f"Wrote 1 of 1 titles to {output}.\n"
+	assert list(read_snapshot(output)) == [("octocat/hello-world", 3)]
+
+
+def test_cache_commands(tmp_pathplus, capsys):
+	# this package
+	from sphinx_toolbox.__main__ import main
+	from sphinx_toolbox.cache import configure_cache, get_cache_backend
+
+	cache_dir = (tmp_pathplus / "cache").as_posix()
+
+	try:
+		configure_cache("sqlite", cache_dir)
+		backend = get_cache_backend()
+		backend.set("https://example.com/a", b"Response A", expires=-1)
+		backend.set("https://example.com/b", b"Response B")
+		assert backend.get("https://example.com/b") == b"Response B"
+		assert backend.get("https://example.com/c") is None
+
+		assert main(["stats", "--backend", "sqlite", "--cache-dir", cache_dir]) == 0
+		lines = capsys.readouterr().out.splitlines()
+		assert lines[0] == f"Backend:       sqlite ({cache_dir}/http_cache.sqlite)"
+		assert lines[1:3] == ["Responses:     2", f"Size:          {backend.size()} bytes"]
+		assert lines[3:6] == ["Hits:          1", "Misses:        1", "Hit rate:      50.0%"]
+
+		assert main(["vacuum", "--backend", "sqlite", "--cache-dir", cache_dir]) == 0
+		assert capsys.readouterr().out.startswith("Removed 1 responses.")
+
+		assert main(["vacuum", "--backend", "sqlite", "--cache-dir", cache_dir, "--max-size", '0']) == 0
+		assert capsys.readouterr().out == "Removed 1 responses. The cache now uses 0 bytes.\n"
+
+		assert main(["stats", "--cache-dir", cache_dir]) == 0
+		assert capsys.readouterr().out.splitlines()[:2] == [
+				f"Backend:       filesystem ({cache_dir}/http)",
+				"Responses:     0",
+				]
+
+		for name in ["sqlite", "filesystem"]:
+			configure_cache(name, cache_dir)
+			get_cache_backend().set("https://example.com/a", b"Response A")
+
+		assert main(["clear", "--backend", "sqlite", "--cache-dir", cache_dir]) == 0
+		assert capsys.readouterr().out == "Cache cleared successfully.\n"
+		assert len(get_cache_backend()) == 0
+
+		configure_cache("filesystem", cache_dir)
+		assert len(get_cache_backend()) == 1
+
+		assert main(["clear", "--cache-dir", cache_dir]) == 0
+		assert capsys.readouterr().out == "Cache cleared successfully.\n"
+		assert len(get_cache_backend()) == 0
+	finally:
+		configure_cache()
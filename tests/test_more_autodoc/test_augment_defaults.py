@@ -14,7 +14,7 @@ def test_setup():
 
 		setup_ret, directives, roles, additional_nodes, app = run_setup(augment_defaults.setup)
 
-		assert setup_ret == {"parallel_read_safe": True, "version": __version__}
+		assert setup_ret == {"parallel_read_safe": True, "parallel_write_safe": True, "version": __version__}
 
 		assert directives == {}
 		assert roles == {}
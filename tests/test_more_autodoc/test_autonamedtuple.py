@@ -10,7 +10,7 @@ from sphinx_toolbox.testing import run_setup
 def test_setup():
 	setup_ret, directives, roles, additional_nodes, app = run_setup(autonamedtuple.setup)
 
-	assert setup_ret == {"parallel_read_safe": True, "version": __version__}
+	assert setup_ret == {"parallel_read_safe": True, "parallel_write_safe": True, "version": __version__}
 
 	assert directives == {"autonamedtuple": AutodocDirective}
 	assert roles == {}
@@ -1,16 +1,19 @@
 # 3rd party
+from sphinx.ext.autodoc import Options
 from sphinx.ext.autodoc.directive import AutodocDirective
+from typing_extensions import Protocol
 
 # this package
 from sphinx_toolbox import __version__
 from sphinx_toolbox.more_autodoc import autoprotocol
 from sphinx_toolbox.testing import run_setup
+from tests.common import AttrDict
 
 
 def test_setup():
 	setup_ret, directives, roles, additional_nodes, app = run_setup(autoprotocol.setup)
 
-	assert setup_ret == {"parallel_read_safe": True, "version": __version__}
+	assert setup_ret == {"parallel_read_safe": True, "parallel_write_safe": True, "version": __version__}
 
 	assert directives == {"autoprotocol": AutodocDirective}
 	assert roles == {}
@@ -21,3 +24,39 @@ def test_setup():
 	assert "protocol" in app.registry.domain_roles["py"]
 
 	assert app.registry.documenters["protocol"] == autoprotocol.ProtocolDocumenter
+
+
+class HasLength(Protocol):
+
+	def __len__(self) -> int: ...
+
+	def describe(self) -> str: ...
+
+
+class HasSizedName(HasLength, Protocol):
+
+	def __len__(self) -> int: ...
+
+	def name(self) -> str: ...
+
+	def _private(self) -> None: ...
+
+
+def test_filter_members():
+	documenter = autoprotocol.ProtocolDocumenter.__new__(autoprotocol.ProtocolDocumenter)
+	documenter.object = HasSizedName
+	documenter.options = Options()
+	documenter.env = AttrDict(app=None)  # type: ignore
+
+	members = [(name, getattr(HasSizedName, name)) for name in dir(HasSizedName)]
+
+	filtered = [name for name, *_ in documenter.filter_members(members, True)]
+
+	# Overridden or new
+	assert "__len__" in filtered
+	assert "name" in filtered
+
+	# Private, excluded, or unchanged from the base class
+	assert "_private" not in filtered
+	assert "__init__" not in filtered
+	assert "describe" not in filtered
@@ -4,6 +4,7 @@ import re
 # 3rd party
 import pytest
 from coincidence.regressions import AdvancedFileRegressionFixture
+from docutils import nodes
 from sphinx.events import EventListener
 from sphinx.ext.autodoc.directive import AutodocDirective
 
@@ -11,6 +12,7 @@ from sphinx.ext.autodoc.directive import AutodocDirective
 from sphinx_toolbox import __version__
 from sphinx_toolbox.more_autodoc import regex
 from sphinx_toolbox.testing import check_asset_copy, run_setup
+from tests.common import AttrDict
 from tests.regex_demo import no_flags, one_flag, two_flags
 
 parser = regex.RegexParser()
@@ -111,6 +113,115 @@ def test_regex_parser(regex, expected):
 terminal_parser = regex.TerminalRegexParser()
 
 
+def test_regex_render_cache(monkeypatch):
+	monkeypatch.setattr(regex, "regex_render_cache", {})
+	pattern = re.compile(r"^:(Lovely|Horrible)\s*")
+
+	assert parser.parse_pattern(pattern) == r"^:(Lovely|Horrible)\s*"
+	assert terminal_parser.parse_pattern(pattern) == terminal_parser._render(pattern)
+	assert regex.regex_render_cache == {
+			(pattern.pattern, pattern.flags, "sphinx_toolbox.more_autodoc.regex.RegexParser"):
+					r"^:(Lovely|Horrible)\s*",
+			(pattern.pattern, pattern.flags, "sphinx_toolbox.more_autodoc.regex.TerminalRegexParser"):
+					terminal_parser._render(pattern),
+			}
+
+	# Cached output is returned without re-rendering.
+	key = (pattern.pattern, pattern.flags, "sphinx_toolbox.more_autodoc.regex.RegexParser")
+	regex.regex_render_cache[key] = "cached"
+	assert parser.parse_pattern(pattern) == "cached"
+	assert parser.parse_pattern(re.compile(pattern.pattern, re.IGNORECASE)) == r"^:(Lovely|Horrible)\s*"
+
+	# The HTML wrapper is applied to the cached output.
+	assert regex.regex_parser.parse_pattern(re.compile("a")) == (
+			'\n<code class="docutils literal notranslate regex">\n'
+			'<span class="regex regex_literal">a</span>\n</code>\n'
+			)
+
+
+def test_regex_render_cache_bounded(monkeypatch):
+	monkeypatch.setattr(regex, "regex_render_cache", {})
+	monkeypatch.setattr(regex, "_render_cache_max_size", 3)
+
+	for pattern in ('a', 'b', 'c'):
+		parser.parse_pattern(re.compile(pattern))
+
+	# 'a' is now the most recently used, so 'b' is discarded.
+	parser.parse_pattern(re.compile('a'))
+	parser.parse_pattern(re.compile('d'))
+
+	assert [key[0] for key in regex.regex_render_cache] == ['c', 'a', 'd']
+
+
+def test_load_render_cache(monkeypatch):
+	monkeypatch.setattr(regex, "regex_render_cache", {})
+	monkeypatch.setattr(regex, "_render_cache_max_size", regex._render_cache_max_size)
+	key = ('a', 32, "sphinx_toolbox.more_autodoc.regex.RegexParser")
+	config = AttrDict(regex_render_cache_size=1000)
+
+	# Patterns rendered by another version of sphinx-toolbox are discarded.
+	app = AttrDict(
+			env=AttrDict(regex_render_cache={key: "old"}, regex_render_cache_version="0.0.0"),
+			config=config,
+			)
+	regex.load_render_cache(app)  # type: ignore[arg-type]
+	assert regex.regex_render_cache == {}
+	assert app.env.regex_render_cache is regex.regex_render_cache
+	assert app.env.regex_render_cache_version == __version__
+	assert regex._render_cache_max_size == 1000
+
+	app = AttrDict(
+			env=AttrDict(regex_render_cache={key: "cached"}, regex_render_cache_version=__version__),
+			config=config,
+			)
+	regex.load_render_cache(app)  # type: ignore[arg-type]
+	assert regex.regex_render_cache == {key: "cached"}
+
+	other = AttrDict(regex_render_cache={key: "old"})
+	regex.merge_render_cache(app, app.env, set(), other)  # type: ignore[arg-type]
+	assert regex.regex_render_cache == {key: "cached"}
+
+
+@pytest.mark.parametrize(
+		"builder_format, active_parser",
+		[
+				pytest.param("html", regex.regex_parser, id="html"),
+				pytest.param("latex", regex.latex_regex_parser, id="latex"),
+				]
+		)
+def test_regex_render_cache_write_phase(monkeypatch, builder_format: str, active_parser: regex.RegexParser):
+	monkeypatch.setattr(regex, "regex_render_cache", {})
+	monkeypatch.setattr(regex, "_render_cache_max_size", regex._render_cache_max_size)
+
+	app = AttrDict(
+			env=AttrDict(),
+			config=AttrDict(regex_render_cache_size=16384),
+			builder=AttrDict(format=builder_format),
+			)
+	regex.load_render_cache(app)  # type: ignore[arg-type]
+
+	# More patterns than the old bound of 4096, each of which used to take two entries.
+	doctree = nodes.paragraph()
+	for idx in range(5000):
+		doctree += regex.RegexNode(f":regex:`^pattern_{idx}$`")
+
+	regex.render_regex_nodes(app, doctree)  # type: ignore[arg-type]
+
+	# Only the parser for the current builder is used in the read phase.
+	parser_name = f"{type(active_parser).__module__}.{type(active_parser).__qualname__}"
+	assert len(regex.regex_render_cache) == 5000
+	assert {key[2] for key in regex.regex_render_cache} == {parser_name}
+
+	def render(pattern):  # pragma: no cover
+		raise AssertionError(f"{pattern.pattern!r} was not cached")
+
+	# Every pattern is served from the cache in the write phase.
+	monkeypatch.setattr(active_parser, "_render", render)
+
+	for node in doctree.traverse(regex.RegexNode):
+		active_parser.parse_pattern(node.pattern)
+
+
 @pytest.mark.parametrize(
 		"regex",
 		[
@@ -175,7 +286,7 @@ def test_parse_regex_flags(flags: int, expected: str):
 def test_setup():
 	setup_ret, directives, roles, additional_nodes, app = run_setup(regex.setup)
 
-	assert setup_ret == {"parallel_read_safe": True, "version": __version__}
+	assert setup_ret == {"parallel_read_safe": True, "parallel_write_safe": True, "version": __version__}
 
 	assert directives == {"autoregex": AutodocDirective}
 	assert "regex" in roles
@@ -183,6 +294,12 @@ def test_setup():
 	assert additional_nodes == {regex.RegexNode}
 
 	assert app.registry.documenters["regex"] == regex.RegexDocumenter
+	assert app.config.values["regex_render_cache_size"] == (16384, '', [int])
 
-	assert app.events.listeners == {"config-inited": [EventListener(0, regex.configure, 500)]}
+	assert app.events.listeners == {
+			"config-inited": [EventListener(0, regex.configure, 500)],
+			"builder-inited": [EventListener(1, regex.load_render_cache, 500)],
+			"doctree-read": [EventListener(2, regex.render_regex_nodes, 500)],
+			"env-merge-info": [EventListener(3, regex.merge_render_cache, 500)],
+			}
 	assert app.registry.css_files == []
@@ -14,7 +14,7 @@ from sphinx_toolbox.utils import flag
 def test_setup():
 	setup_ret, directives, roles, additional_nodes, app = run_setup(sourcelink.setup)
 
-	assert setup_ret == {"parallel_read_safe": True, "version": __version__}
+	assert setup_ret == {"parallel_read_safe": True, "parallel_write_safe": True, "version": __version__}
 
 	assert "sourcelink" in ModuleDocumenter.option_spec
 	assert ModuleDocumenter.option_spec["sourcelink"] is flag
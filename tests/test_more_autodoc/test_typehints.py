@@ -4,10 +4,11 @@ import io
 import itertools
 import re
 import sys
+import traceback
 import types
 from email.headerregistry import Address
 from tempfile import TemporaryDirectory
-from typing import Any, List
+from typing import Any, List, Union
 
 # 3rd party
 import pytest
@@ -25,6 +26,7 @@ from typing_extensions import Literal, Protocol
 from sphinx_toolbox import __version__
 from sphinx_toolbox.more_autodoc import typehints
 from sphinx_toolbox.testing import Sphinx, run_setup
+from tests.common import AttrDict
 
 if sys.version_info >= (3, 10):
 	UnionType = types.UnionType
@@ -145,13 +147,136 @@ def test_format_annotation(annotation: Any, expected: str):
 	assert typehints.format_annotation(annotation, True) == expected
 
 
+def test_format_annotation_cache():
+	typehints.format_annotation.cache_clear()  # type: ignore[attr-defined]
+
+	assert typehints.format_annotation(List[int]) == r":py:class:`~typing.List`\[:py:class:`int`]"
+	assert typehints.format_annotation.cache_info()[:2] == (0, 2)  # type: ignore[attr-defined]
+
+	assert typehints.format_annotation(List[int]) == r":py:class:`~typing.List`\[:py:class:`int`]"
+	assert typehints.format_annotation.cache_info()[:2] == (1, 2)  # type: ignore[attr-defined]
+
+	# These compare equal, but are formatted differently
+	expected = r":py:data:`~typing.Union`\[:py:class:`int`, :py:class:`str`]"
+	assert typehints.format_annotation(Union[int, str]) == expected
+	expected = r":py:data:`~typing.Union`\[:py:class:`str`, :py:class:`int`]"
+	assert typehints.format_annotation(Union[str, int]) == expected
+
+	# 1 == True
+	assert typehints.format_annotation(Literal[1]) == r":py:data:`~typing.Literal`\[``1``]"
+	assert typehints.format_annotation(Literal[True]) == r":py:data:`~typing.Literal`\[:py:obj:`True`]"
+
+	# Unhashable annotations aren't cached
+	info = typehints.format_annotation.cache_info()  # type: ignore[attr-defined]
+	assert typehints.format_annotation(["a list"]) == r":py:obj:`~.['a list']`"
+	assert typehints.format_annotation.cache_info().currsize == info.currsize  # type: ignore[attr-defined]
+
+	typehints.format_annotation.cache_clear()  # type: ignore[attr-defined]
+	assert typehints.format_annotation.cache_info()[:] == (0, 0, 4096, 0)  # type: ignore[attr-defined]
+
+
+def demo_function(a: int, b_: str, c: List[int]) -> str: ...
+
+
+@pytest.mark.parametrize(
+		"lines, expected",
+		[
+				pytest.param(
+						[":param a: The first.", ":param b\\_: The second.", ":returns: Something."],
+						[
+								":type a: :py:class:`int`",
+								":param a: The first.",
+								":type b\\_: :py:class:`str`",
+								":param b\\_: The second.",
+								":rtype: :py:class:`str`",
+								":returns: Something.",
+								],
+						id="params_returns",
+						),
+				pytest.param(
+						["Summary.", '', ":param c:", ":rtype:", ":raises ValueError: Oops."],
+						[
+								"Summary.",
+								'',
+								":type c: :py:class:`~typing.List`\\[:py:class:`int`]",
+								":param c:",
+								":rtype: :py:class:`str`",
+								":raises ValueError: Oops.",
+								],
+						id="empty_rtype",
+						),
+				pytest.param(
+						[":param int c:", ":rtype: bytes"],
+						[":param int c:", ":rtype: bytes"],
+						id="rtype_given",
+						),
+				pytest.param(
+						["Summary."],
+						["Summary.", '', ":rtype: :py:class:`str`"],
+						id="no_fields",
+						),
+				]
+		)
+def test_process_docstring(lines: List[str], expected: List[str]):
+	config = AttrDict(
+			typehints_fully_qualified=False,
+			always_document_param_types=False,
+			typehints_document_rtype=True,
+			hide_none_rtype=False,
+			)
+
+	typehints.process_docstring(AttrDict(config=config), "function", "demo_function", demo_function, {}, lines)  # type: ignore
+	assert lines == expected
+
+
+class Unresolvable:
+	attribute: "DoesNotExist"  # type: ignore  # noqa: F821
+
+
+def test_type_hints_cache():
+
+	class Demo:
+		a: int
+		b: List[str]
+
+	cache = typehints.TypeHintsCache()
+
+	hints = cache.get_type_hints(Demo)
+	assert hints == {'a': int, 'b': List[str]}
+	assert len(cache) == 1
+
+	# Modifying the returned value doesn't affect the cache
+	hints.pop('a')
+	assert cache.get_type_hints(Demo) == {'a': int, 'b': List[str]}
+	assert len(cache) == 1
+
+	# Replacing the annotations invalidates the entry
+	Demo.__annotations__ = {'c': float}
+	assert cache.get_type_hints(Demo) == {'c': float}
+	assert len(cache) == 1
+
+	# Errors are cached too, and a new exception is raised each time
+	raised = []
+	for _ in range(3):
+		with pytest.raises(NameError, match="DoesNotExist") as exc_info:
+			cache.get_type_hints(Unresolvable)
+		raised.append(exc_info.value)
+
+	assert len(cache) == 2
+	assert raised[1] is not raised[2]
+	assert len(traceback.extract_tb(raised[2].__traceback__)) == len(traceback.extract_tb(raised[1].__traceback__))
+
+	cache.clear()
+	assert len(cache) == 0
+
+
 def test_setup():
 	try:
 		Sphinx.extensions = []  # type: ignore
 
 		setup_ret, directives, roles, additional_nodes, app = run_setup(typehints.setup)
 
-		assert setup_ret == {"parallel_read_safe": True, "version": __version__}
+		assert setup_ret == {"parallel_read_safe": True, "parallel_write_safe": True, "version": __version__}
 
 		assert app.config.values["hide_none_rtype"] == (False, "env", [bool])
 
@@ -90,7 +90,7 @@ def test_get_variable_type():
 def test_setup():
 	setup_ret, directives, roles, additional_nodes, app = run_setup(variables.setup)
 
-	assert setup_ret == {"parallel_read_safe": True, "version": __version__}
+	assert setup_ret == {"parallel_read_safe": True, "parallel_write_safe": True, "version": __version__}
 
 	assert directives == {
 			"autovariable": AutodocDirective,
@@ -1,6 +1,8 @@
 # 3rd party
+import pytest
 from coincidence.regressions import AdvancedFileRegressionFixture
 from sphinx.ext.autodoc.directive import AutodocDirective
+from sphinx.util.inspect import safe_getattr
 
 # this package
 from sphinx_toolbox import __version__, more_autosummary
@@ -10,7 +12,7 @@ from sphinx_toolbox.testing import run_setup
 def test_setup(advanced_file_regression: AdvancedFileRegressionFixture):
 	setup_ret, directives, roles, additional_nodes, app = run_setup(more_autosummary.setup)
 
-	assert setup_ret == {"parallel_read_safe": True, "version": __version__}
+	assert setup_ret == {"parallel_read_safe": True, "parallel_write_safe": True, "version": __version__}
 
 	assert directives == {
 			"autosummary": more_autosummary.PatchedAutosummary,
@@ -34,3 +36,52 @@ def test_setup(advanced_file_regression: AdvancedFileRegressionFixture):
 	assert app.config.values["autodocsumm_member_order"][2].candidates == (
 			"alphabetic", "alphabetical", "bysource"
 			)
+
+
+class Base:
+	base_attr: int
+	shared = 1
+
+	def base_method(self):
+		pass
+
+
+class Middle(Base):
+	shared = 2
+
+	def middle_method(self):
+		pass
+
+
+class Child(Middle):
+	child_attr: str
+
+	def base_method(self):
+		pass
+
+
+def _is_filtered_inherited_member(obj, inherited_members, name) -> bool:
+	# The implementation prior to 2.19.0, which walked the MRO for every member.
+	for cls in obj.__mro__:
+		if cls.__name__ == inherited_members and cls != obj:
+			return True
+		elif name in cls.__dict__:
+			return False
+		elif name in safe_getattr(cls, "__annotations__", {}):
+			return False
+
+	return False
+
+
+@pytest.mark.parametrize("inherited_members", [None, "Child", "Middle", "Base", "object"])
+def test_index_mro(inherited_members):
+	stop_index, defined_in = more_autosummary._index_mro(Child, inherited_members, safe_getattr)
+
+	if inherited_members in {None, "Child"}:
+		assert stop_index is None
+	else:
+		assert stop_index == [cls.__name__ for cls in Child.__mro__].index(inherited_members)
+
+	for name in [*dir(Child), "child_attr", "base_attr", "missing"]:
+		filtered = stop_index is not None and stop_index <= defined_in.get(name, stop_index)
+		assert filtered == _is_filtered_inherited_member(Child, inherited_members, name), name
@@ -0,0 +1,191 @@
+# stdlib
+import csv
+import json
+from io import StringIO
+
+# 3rd party
+import pytest
+from domdf_python_tools.paths import PathPlus
+from sphinx.application import Sphinx
+from sphinx.events import EventListener
+from sphinx.util.docutils import docutils_namespace
+
+# this package
+from sphinx_toolbox import collapse, latex, profiling, wikipedia
+from sphinx_toolbox.testing import run_setup
+
+
+@pytest.fixture(autouse=True)
+def no_profile_env_var(monkeypatch):
+	monkeypatch.delenv(profiling.PROFILE_ENV_VAR, raising=False)
+
+
+def test_setup():
+	setup_ret, directives, roles, additional_nodes, app = run_setup(profiling.setup)
+
+	assert setup_ret["parallel_read_safe"] is True
+	assert app.config.values["toolbox_profile"] == (False, '', [bool, str])
+	assert app.events.listeners == {}
+	assert profiling.get_profiler(app) is None  # type: ignore[arg-type]
+
+
+def test_setup_env_var(monkeypatch):
+	monkeypatch.setenv(profiling.PROFILE_ENV_VAR, "1")
+	setup_ret, directives, roles, additional_nodes, app = run_setup(profiling.setup)
+
+	assert app.events.listeners == {"build-finished": [EventListener(0, profiling._report, 900)]}
+	assert isinstance(profiling.get_profiler(app), profiling.Profiler)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+		"env_var, raw_config, expected",
+		[
+				('', {}, False),
+				('1', {}, True),
+				("on", {}, True),
+				("report.csv", {}, "report.csv"),
+				('', {"toolbox_profile": True}, True),
+				('', {"toolbox_profile": "report.json"}, "report.json"),
+				("1", {"toolbox_profile": False}, False),
+				]
+		)
+def test_get_profile_setting(monkeypatch, env_var: str, raw_config, expected):
+	monkeypatch.setenv(profiling.PROFILE_ENV_VAR, env_var)
+	app = run_setup(lambda app: None).app
+	app.config._raw_config = raw_config  # type: ignore[attr-defined]
+
+	assert profiling.get_profile_setting(app) == expected  # type: ignore[arg-type]
+
+
+def test_component_stats():
+	stats = profiling.ComponentStats("event", "build-finished", "sphinx_toolbox.foo.bar")
+	assert stats.calls == 0
+	assert stats.p95 == 0
+
+	stats.durations.extend(x / 1000 for x in range(100, 0, -1))
+	assert stats.calls == 100
+	assert stats.total == pytest.approx(5.05)
+	assert stats.p95 == pytest.approx(0.095)
+	assert stats.as_dict() == {
+			"kind": "event",
+			"name": "build-finished",
+			"handler": "sphinx_toolbox.foo.bar",
+			"calls": 100,
+			"total": stats.total,
+			"p95": stats.p95,
+			"bytes_written": 0,
+			}
+
+
+def instrumented_setup(app):
+	profiling.instrument_app(app)
+	collapse.setup(app)
+	wikipedia.setup(app)
+	app.connect("build-finished", print)
+	return latex.setup(app)
+
+
+def test_instrument_app():
+	setup_ret, directives, roles, additional_nodes, app = run_setup(instrumented_setup)
+	profiler = profiling.get_profiler(app)  # type: ignore[arg-type]
+	assert profiler is not None
+	assert profiling.instrument_app(app) is profiler  # type: ignore[arg-type]
+
+	# Directives are subclassed, and functions are wrapped.
+	assert directives["collapse"] is not collapse.CollapseDirective
+	assert issubclass(directives["collapse"], collapse.CollapseDirective)
+	assert directives["collapse"].__qualname__ == "CollapseDirective"
+	assert roles["wikipedia"].__wrapped__ is wikipedia.make_wikipedia_link
+
+	visit, depart = app.registry.translation_handlers["html"]["CollapseNode"]
+	assert visit.__wrapped__ is collapse.visit_collapse_node
+	assert depart.__wrapped__ is collapse.depart_collapse_node
+
+	listeners = app.events.listeners
+	assert listeners["config-inited"][0].handler.__wrapped__ is latex.configure
+
+	# Handlers from outside sphinx-toolbox are left alone.
+	assert listeners["build-finished"][0].handler is print
+
+	class Translator:
+		body = ["<p>"]
+		context = ["</details>"]
+
+	translator = Translator()
+	node = collapse.CollapseNode(label="Details")
+	visit(translator, node)
+	depart(translator, node)
+	depart(translator, node)
+
+	summary = profiler.summary()
+	assert {(s["kind"], s["name"], s["handler"], s["calls"]) for s in summary} == {
+			("visit", "CollapseNode", "sphinx_toolbox.collapse.visit_collapse_node", 1),
+			("depart", "CollapseNode", "sphinx_toolbox.collapse.depart_collapse_node", 2),
+			}
+	assert [s["bytes_written"] for s in summary if s["kind"] == "depart"] == [len("</details>") * 2]
+
+
+def test_write_report(tmp_pathplus: PathPlus):
+	profiler = profiling.Profiler()
+	profiler.get_stats("role", "wikipedia", "sphinx_toolbox.wikipedia.make_wikipedia_link").durations.append(0.5)
+	profiler.get_stats("event", "build-finished", "sphinx_toolbox.code.copy_asset_files").durations.append(1.5)
+	profiler.get_stats("directive", "collapse", "sphinx_toolbox.collapse.CollapseDirective")
+
+	profiling.write_report(tmp_pathplus / "report.json", profiler)
+	report = json.loads((tmp_pathplus / "report.json").read_text())
+	assert [(s["kind"], s["total"]) for s in report] == [("event", 1.5), ("role", 0.5)]
+
+	profiling.write_report(tmp_pathplus / "report.csv", profiler)
+	with (tmp_pathplus / "report.csv").open(newline='') as fp:
+		rows = list(csv.DictReader(fp))
+
+	assert [row["handler"] for row in rows] == [
+			"sphinx_toolbox.code.copy_asset_files",
+			"sphinx_toolbox.wikipedia.make_wikipedia_link",
+			]
+	assert rows[0]["calls"] == '1'
+
+
+def test_build(tmp_pathplus: PathPlus):
+	srcdir = tmp_pathplus / "src"
+	srcdir.mkdir()
+	(srcdir / "conf.py").write_lines([
+			'extensions = ["sphinx_toolbox.collapse", "sphinx_toolbox.latex", "sphinx_toolbox.wikipedia"]',
+			'project = "Demo"',
+			'toolbox_profile = "profile.json"',
+			])
+	(srcdir / "index.rst").write_lines([
+			"Demo",
+			"====",
+			'',
+			".. collapse:: Details",
+			'',
+			"	See :wikipedia:`Sphinx`.",
+			])
+
+	status = StringIO()
+
+	with docutils_namespace():
+		app = Sphinx(
+				srcdir,
+				srcdir,
+				tmp_pathplus / "out",
+				tmp_pathplus / "doctrees",
+				"html",
+				freshenv=True,
+				status=status,
+				warning=StringIO(),
+				)
+		app.build()
+
+	report = json.loads((tmp_pathplus / "out" / "profile.json").read_text())
+	components = {(s["kind"], s["name"]): s for s in report}
+
+	assert components["directive", "collapse"]["calls"] == 1
+	assert components["role", "wikipedia"]["calls"] == 1
+	assert components["visit", "CollapseNode"]["calls"] == 1
+	assert components["visit", "CollapseNode"]["bytes_written"] > 0
+	assert components["event", "config-inited"]["handler"] == "sphinx_toolbox.latex.configure"
+
+	assert "sphinx-toolbox profile" in status.getvalue()
+	assert "profile.json" in status.getvalue()
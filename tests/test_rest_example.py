@@ -113,6 +113,7 @@ def test_setup():
 
 	assert app.events.listeners == {
 			"env-purge-doc": [EventListener(id=0, handler=rest_example_purger.purge_nodes, priority=500), ],
+			"env-merge-info": [EventListener(id=1, handler=rest_example_purger.merge_nodes, priority=500), ],
 			}
 
 	assert directives == {
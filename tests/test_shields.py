@@ -10,7 +10,11 @@ from sphinx_toolbox.testing import check_asset_copy, run_setup
 def test_setup():
 	setup_ret, directives, roles, additional_nodes, app = run_setup(shields.setup)
 
-	assert setup_ret == {"version": sphinx_toolbox.__version__, "parallel_read_safe": True}
+	assert setup_ret == {
+			"version": sphinx_toolbox.__version__,
+			"parallel_read_safe": True,
+			"parallel_write_safe": True,
+			}
 
 	assert additional_nodes == set()
 	assert app.registry.translation_handlers == {}
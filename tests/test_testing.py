@@ -1,21 +1,36 @@
 # stdlib
+import hashlib
+import re
+from io import StringIO
 from typing import Any, Dict
 
 # 3rd party
 import pytest
+import sphinx.application
+from bs4 import BeautifulSoup  # type: ignore
 from docutils.nodes import NodeVisitor
+from docutils.parsers.rst import roles
 from docutils.transforms import Transform
+from domdf_python_tools.paths import PathPlus
 from pygments.lexer import Lexer  # type: ignore
 from sphinx.builders import Builder
 from sphinx.domains import Domain
 from sphinx.events import EventListener
 from sphinx.highlighting import lexer_classes
+from sphinx.util.docutils import docutils_namespace
 
 # this package
 from sphinx_toolbox.config import validate_config
 from sphinx_toolbox.github.issues import IssueNode, depart_issue_node, visit_issue_node
 from sphinx_toolbox.source import source_role
-from sphinx_toolbox.testing import Sphinx, run_setup
+from sphinx_toolbox.testing import (
+		HTMLRegressionFixture,
+		NormalizedHTML,
+		SphinxAppCache,
+		Sphinx,
+		normalize_html,
+		run_setup
+		)
 
 
 class FakeBuilder(Builder):
@@ -162,3 +177,149 @@ def test_testing():
 	assert app.html_themes == {"domdf_sphinx_theme": '.'}
 	assert app.events.listeners["config-inited"] == [EventListener(id=0, handler=validate_config, priority=850)]
 	assert setup_ret == {"version": 12345, "parallel_read_safe": True}
+
+
+@pytest.fixture()
+def demo_root(tmp_pathplus: PathPlus) -> PathPlus:
+	srcdir = tmp_pathplus / "demo-root"
+	srcdir.mkdir()
+	(srcdir / "conf.py").write_lines([
+			'extensions = ["sphinx_toolbox.collapse", "sphinx_toolbox.wikipedia"]',
+			'project = "Demo"',
+			])
+	(srcdir / "index.rst").write_lines([
+			"Demo",
+			"====",
+			'',
+			".. toctree::",
+			'',
+			"	page",
+			'',
+			".. collapse:: Details",
+			'',
+			"	See :wikipedia:`Sphinx`.",
+			])
+	(srcdir / "page.rst").write_lines(["Page", "====", '', "Back to :doc:`index`."])
+	return srcdir
+
+
+def test_sphinx_app_cache(demo_root: PathPlus, tmp_pathplus: PathPlus):
+	# Build the project normally, to compare against.
+	with docutils_namespace():
+		expected_app = sphinx.application.Sphinx(
+				demo_root,
+				demo_root,
+				tmp_pathplus / "expected",
+				tmp_pathplus / "expected_doctrees",
+				"html",
+				freshenv=True,
+				status=StringIO(),
+				warning=StringIO(),
+				)
+		expected_app.build()
+
+	cache = SphinxAppCache(tmp_pathplus / "cache")
+	shared = cache.get(demo_root)
+	assert cache.get(demo_root) is shared
+	assert cache.get(demo_root, confoverrides={"project": "Other"}) is not shared
+	assert not (demo_root / "_build").exists()
+
+	# The extensions' roles are only registered while reading and building.
+	assert "wikipedia" not in roles._roles  # type: ignore[attr-defined]
+
+	doctree = PathPlus(shared.app.doctreedir) / "index.doctree"
+	doctree_mtime = doctree.stat().st_mtime_ns
+
+	# Extensions prepare each new builder in their env-updated handlers.
+	updated_builders = []
+	shared.app.connect("env-updated", lambda app, env: updated_builders.append(app.builder))
+
+	for _ in range(2):
+		app = shared.build()
+		assert "wikipedia" not in roles._roles  # type: ignore[attr-defined]
+		assert updated_builders[-1] is app.builder
+
+		for pagename in ("index.html", "page.html"):
+			expected = (tmp_pathplus / "expected" / pagename).read_text()
+			assert (shared.outdir / pagename).read_text() == expected
+
+		# Changes made to the environment by one build do not carry over to the next.
+		app.env.titles.clear()
+
+	assert doctree.stat().st_mtime_ns == doctree_mtime
+	assert shared.warning.getvalue() == ''
+	assert len(updated_builders) == 2
+
+	shared.build(["index"])
+	assert (shared.outdir / "index.html").is_file()
+	assert not (shared.outdir / "page.html").is_file()
+
+
+demo_page = """<!DOCTYPE html>
+<html>
+<head>
+<link rel="stylesheet" href="_static/pygments.css" type="text/css" />
+<script src="_static/language_data.js"></script>
+<script src="_static/doctools.js"></script>
+</head>
+<body>
+<div class="body"><p>Hello <a href="https://example.com">world</a></p>
+<div class="highlight"><pre><span class="n">x</span><span class="w"> </span><span class="p">=</span>\
+<span class="w"> </span><span class="mi">1</span></pre></div>
+<link rel="canonical" href="https://example.com" />
+</div>
+<div class="sphinxsidebar"><div class="sphinxsidebarwrapper"><p>Sidebar</p></div></div>
+<div class="footer">&copy; 2022</div>
+</body>
+</html>
+"""
+
+
+def test_normalize_html():
+	normalized = normalize_html(demo_page)
+
+	assert isinstance(normalized, NormalizedHTML)
+	assert normalized.sha256 == hashlib.sha256(normalized.html.encode("UTF-8")).hexdigest()
+	assert normalized == normalize_html(BeautifulSoup(demo_page, "html5lib"))
+
+	assert "pygments.css" not in normalized.html
+	assert "language_data.js" not in normalized.html
+	assert "doctools.js" in normalized.html
+	assert "Sidebar" not in normalized.html
+	assert "footer" not in normalized.html
+	assert "Hello" in normalized.html
+
+	# Only link tags in the head are removed.
+	assert "canonical" in normalized.html
+	assert 'class="w"' in normalized.html
+
+	normalized = normalize_html(demo_page, pygments_whitespace=True)
+	assert 'class="w"' not in normalized.html
+	assert 'class="p"' not in normalized.html
+	assert "= 1" in normalized.html
+
+
+def test_html_regression_hash(tmp_pathplus: PathPlus, request):
+	original_datadir = tmp_pathplus / "original"
+	datadir = tmp_pathplus / "data"
+	html_regression = HTMLRegressionFixture(datadir, original_datadir, request)
+	normalized = normalize_html(demo_page, pygments_whitespace=sphinx.version_info >= (4, 3))
+
+	basename = re.sub(r"[\W]", '_', request.node.name)
+	obtained_filename = datadir / f"{basename}.obtained.html"
+
+	for directory in (original_datadir, datadir):
+		directory.mkdir()
+		(directory / f"{basename}.html").write_text(normalized.html)
+
+	# Unchanged pages are compared by hash, without writing the obtained file.
+	html_regression.check(demo_page)
+	assert not obtained_filename.exists()
+
+	for directory in (original_datadir, datadir):
+		(directory / f"{basename}.html").write_text(normalized.html.replace("Hello", "Goodbye"))
+
+	with pytest.raises(AssertionError, match="Goodbye"):
+		html_regression.check(demo_page)
+
+	assert obtained_filename.is_file()
@@ -14,7 +14,7 @@ def test_setup():
 
 		setup_ret, directives, roles, additional_nodes, app = run_setup(footnote_symbols.setup)
 
-		assert setup_ret == {"version": __version__, "parallel_read_safe": True}
+		assert setup_ret == {"version": __version__, "parallel_read_safe": True, "parallel_write_safe": True}
 
 		assert directives == {}
 		assert additional_nodes == set()
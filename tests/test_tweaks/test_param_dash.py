@@ -14,7 +14,11 @@ def test_setup():
 
 		setup_ret, directives, roles, additional_nodes, app = run_setup(param_dash.setup)
 
-		assert setup_ret == {"version": sphinx_toolbox.__version__, "parallel_read_safe": True}
+		assert setup_ret == {
+				"version": sphinx_toolbox.__version__,
+				"parallel_read_safe": True,
+				"parallel_write_safe": True,
+				}
 
 		assert directives == {}
 		assert additional_nodes == set()
@@ -19,7 +19,11 @@ def test_copy_asset_files(tmp_pathplus, advanced_file_regression: AdvancedFileRe
 def test_setup():
 	setup_ret, directives, roles, additional_nodes, app = run_setup(sphinx_panels_tabs.setup)
 
-	assert setup_ret == {"version": sphinx_toolbox.__version__, "parallel_read_safe": True}
+	assert setup_ret == {
+			"version": sphinx_toolbox.__version__,
+			"parallel_read_safe": True,
+			"parallel_write_safe": True,
+			}
 
 	assert directives == {}
 	assert additional_nodes == set()
@@ -11,7 +11,7 @@ from sphinx_toolbox.tweaks import tabsize
 def test_setup(advanced_file_regression: AdvancedFileRegressionFixture):
 	setup_ret, directives, roles, additional_nodes, app = run_setup(tabsize.setup)
 
-	assert setup_ret == {"version": __version__, "parallel_read_safe": True}
+	assert setup_ret == {"version": __version__, "parallel_read_safe": True, "parallel_write_safe": True}
 
 	advanced_file_regression.check(
 			pformat(
@@ -1,31 +1,45 @@
 # stdlib
 import collections
+import importlib
 import inspect
+import itertools
+import os
 import string
-from typing import NamedTuple
+import sys
+from io import StringIO
+from typing import NamedTuple, Set
 
 # 3rd party
 import pytest
 from apeye.requests_url import RequestsURL
+from docutils import nodes
+from domdf_python_tools.paths import PathPlus
 from domdf_python_tools.utils import strtobool
 from hypothesis import given
 from hypothesis.strategies import text
+from sphinx.application import Sphinx
+from sphinx.errors import PycodeError
+from sphinx.util.docutils import docutils_namespace
 
 # this package
 from sphinx_toolbox import __version__
 from sphinx_toolbox.utils import (
 		NoMatchError,
+		ParameterEvent,
 		Purger,
 		code_repr,
 		escape_trailing__,
 		flag,
 		get_first_matching,
+		get_module_attribute_docs,
 		is_namedtuple,
+		iter_parameters,
 		make_github_url,
 		metadata_add_version,
 		parse_parameters,
 		singleton
 		)
+from tests.common import AttrDict
 
 
 def test_make_github_url():
@@ -62,10 +76,11 @@ demo_purger = Purger("all_demo_nodes")
 @pytest.mark.parametrize(
 		"nodes, output",
 		[
-				([], []),
-				([{"docname": "document"}], []),
-				([{"docname": "foo"}], [{"docname": "foo"}]),
-				([{"docname": "foo"}, {"docname": "document"}], [{"docname": "foo"}]),
+				([], {}),
+				([{"docname": "document"}], {}),
+				([{"docname": "foo"}], {"foo": [{"docname": "foo"}]}),
+				([{"docname": "foo"}, {"docname": "document"}], {"foo": [{"docname": "foo"}]}),
+				({"foo": [{"docname": "foo"}], "document": [{"docname": "document"}]}, {"foo": [{"docname": "foo"}]}),
 				]
 		)
 def test_purge_extras_require(nodes, output):
@@ -74,12 +89,136 @@ def test_purge_extras_require(nodes, output):
 	demo_purger.purge_nodes('', env, "document")  # type: ignore
 	assert not hasattr(env, "all_extras_requires")
 
+	# Flat lists are from environments pickled by older versions
 	env.all_demo_nodes = nodes  # type: ignore
 	demo_purger.purge_nodes('', env, "document")  # type: ignore
 	assert hasattr(env, "all_demo_nodes")
 	assert env.all_demo_nodes == output  # type: ignore
 
 
+def test_purger_add_node():
+	env = MockBuildEnvironment()
+	env.docname = "document"  # type: ignore
+
+	targetnode = nodes.target('', '', ids=["demo-0"])
+	demo_purger.add_node(env, nodes.paragraph(), targetnode, 1)  # type: ignore
+	env.docname = "other"  # type: ignore
+	demo_purger.add_node(env, nodes.paragraph(), targetnode, 2)  # type: ignore
+
+	assert list(env.all_demo_nodes) == ["document", "other"]  # type: ignore
+	assert isinstance(env.all_demo_nodes["document"][0]["installation_node"], nodes.paragraph)  # type: ignore
+	assert env.all_demo_nodes["document"][0]["target"] is targetnode  # type: ignore
+
+	lightweight_purger = Purger("all_lightweight_nodes", lightweight=True)
+	assert repr(lightweight_purger) == "Purger('all_lightweight_nodes', lightweight=True)"
+	lightweight_purger.add_node(env, nodes.paragraph(), targetnode, 3)  # type: ignore
+
+	assert env.all_lightweight_nodes == {  # type: ignore
+		"other": [{"docname": "other", "lineno": 3, "target_ids": ["demo-0"], "dependencies": {}}],
+		}
+
+	other = MockBuildEnvironment()
+	other.docname = "merged"  # type: ignore
+	lightweight_purger.add_node(other, nodes.paragraph(), targetnode, 4)  # type: ignore
+	lightweight_purger.merge_nodes('', env, {"merged"}, other)  # type: ignore
+	assert list(env.all_lightweight_nodes) == ["other", "merged"]  # type: ignore
+
+
+def test_purger_get_outdated_docnames(tmp_pathplus):
+	env = MockBuildEnvironment()
+	env.config = AttrDict({"github_username": "octocat"})  # type: ignore
+	env.app = AttrDict({"builder": AttrDict({"format": "html"})})  # type: ignore
+
+	assert demo_purger.get_outdated_docnames('', env, set(), set(), set()) == []  # type: ignore
+
+	dependency = tmp_pathplus / "dependency.txt"
+	dependency.write_text("Hello World")
+
+	for docname, kwargs in [
+			("no-deps", {}),
+			("config", {"config_values": ["github_username"]}),
+			("file", {"files": [dependency]}),
+			("module", {"modules": ["sphinx_toolbox.utils"]}),
+			("builder", {"builder": True}),
+			]:
+		env.docname = docname  # type: ignore
+		demo_purger.add_node(env, nodes.paragraph(), nodes.target(), 1, **kwargs)  # type: ignore
+
+	# Entries from pickles written by older versions have no dependencies
+	env.all_demo_nodes["legacy"] = [{"docname": "legacy"}]  # type: ignore
+
+	assert demo_purger.get_outdated_docnames('', env, set(), set(), set()) == []  # type: ignore
+
+	env.config.github_username = "domdfcoding"  # type: ignore
+	env.app.builder.format = "latex"  # type: ignore
+	dependency.unlink()
+
+	outdated = demo_purger.get_outdated_docnames('', env, set(), set(), set())  # type: ignore
+	assert outdated == ["builder", "config", "file"]
+	assert demo_purger.get_outdated_docnames('', env, set(), set(), {"file"}) == ["builder", "config"]  # type: ignore
+
+
+def test_purger_directive_dependencies(tmp_pathplus: PathPlus, monkeypatch):
+	srcdir = tmp_pathplus / "src"
+	srcdir.mkdir()
+	(srcdir / "conf.py").write_lines([
+			'extensions = ["sphinx_toolbox.flake8", "sphinx_toolbox.github", "sphinx_toolbox.pre_commit"]',
+			'project = "Demo"',
+			'github_username = "octocat"',
+			'github_repository = "hello-world"',
+			])
+	(srcdir / "index.rst").write_lines([
+			"Demo",
+			"====",
+			'',
+			".. toctree::",
+			'',
+			"\tplain",
+			"\tflake8",
+			"\tpre_commit",
+			])
+	(srcdir / "plain.rst").write_lines(["Plain", "=====", '', "Hello World"])
+	(srcdir / "flake8.rst").write_lines(["Flake8", "======", '', ".. flake8-codes:: demo_flake8_plugin", '', "\tDEMO001"])
+	(srcdir / "pre_commit.rst").write_lines(["Pre-Commit", "==========", '', ".. pre-commit::"])
+
+	plugin = tmp_pathplus / "demo_flake8_plugin.py"
+	plugin.write_text('DEMO001 = "DEMO001 Hello World"\n')
+	monkeypatch.syspath_prepend(str(tmp_pathplus))
+
+	hook_file = tmp_pathplus / ".pre-commit-hooks.yaml"
+	hook_file.write_lines(["- id: demo", "  name: demo", "  entry: demo", "  language: python"])
+	monkeypatch.chdir(tmp_pathplus)
+
+	def build() -> Set[str]:
+		read: Set[str] = set()
+
+		with docutils_namespace():
+			app = Sphinx(
+					srcdir,
+					srcdir,
+					tmp_pathplus / "html",
+					tmp_pathplus / "doctrees",
+					"html",
+					status=StringIO(),
+					warning=StringIO(),
+					)
+			app.connect("env-before-read-docs", lambda app, env, docnames: read.update(docnames))
+			app.build()
+
+		return read
+
+	assert build() == {"index", "plain", "flake8", "pre_commit"}
+	assert build() == set()
+
+	mtime = hook_file.stat().st_mtime + 10
+	os.utime(hook_file, (mtime, mtime))
+	assert build() == {"pre_commit"}
+
+	mtime = plugin.stat().st_mtime + 10
+	os.utime(plugin, (mtime, mtime))
+	assert build() == {"flake8"}
+
+
 def test_get_first_matching():
 
 	assert get_first_matching(strtobool, [True, "True", 0, "False", False])
@@ -146,6 +285,11 @@ def test_parse_parameters():
 			'',
 			".. versionadded:: 0.8.0",
 			'',
+			".. versionchanged:: 2.19.0",
+			'',
+			"    Each line is now matched against a single combined regular expression.",
+			"    See :func:`~.iter_parameters` for a version which parses the docstring lazily.",
+			'',
 			]
 	post_output = [
 			'',
@@ -160,6 +304,33 @@ def test_parse_parameters():
 	assert parse_parameters(docstring.split('\n'), tab_size=4) == (docstring_dict, pre_output, post_output)
 
 
+def test_iter_parameters():
+	lines = [
+			"Summary.",
+			'',
+			":param str foo: The foo.",
+			"    More about foo.",
+			":param bar: The bar.",
+			":type bar: int",
+			'',
+			":rtype: str",
+			":raises ValueError:",
+			]
+
+	events = iter_parameters(lines, tab_size=4)
+
+	assert list(itertools.islice(events, 6)) == [
+			ParameterEvent("pre", "Summary."),
+			ParameterEvent("pre", ''),
+			ParameterEvent("param", ":param str foo: The foo.", "foo", doc="The foo.", type="str"),
+			ParameterEvent("doc", "    More about foo.", "foo", doc="    More about foo."),
+			ParameterEvent("param", ":param bar: The bar.", "bar", doc="The bar."),
+			ParameterEvent("type", ":type bar: int", "bar", type="int"),
+			]
+
+	assert [event.kind for event in events] == ["post", "post", "post"]
+
+
 class NT(NamedTuple):
 	foo: str
 	bar: int
@@ -197,3 +368,40 @@ def test_metadata_add_version():
 		return {"parallel_read_safe": True}
 
 	assert setup(None) == {"parallel_read_safe": True, "version": __version__}  # type: ignore
+
+
+def test_get_module_attribute_docs(tmp_pathplus, monkeypatch):
+	monkeypatch.syspath_prepend(str(tmp_pathplus))
+	source = tmp_pathplus / "attribute_docs_demo.py"
+	source.write_lines([
+			"class Movie:",
+			"	title: str  #: The title of the movie.",
+			"	year: int  #: The year of release.",
+			'',
+			"class Book:",
+			"	#: The title of the book.",
+			"	title: str",
+			])
+
+	module = importlib.import_module("attribute_docs_demo")
+	monkeypatch.setitem(sys.modules, "attribute_docs_demo", module)
+
+	docs = get_module_attribute_docs("attribute_docs_demo")
+	assert docs.attr_docs[("Movie", "year")] == ["The year of release.", '']
+	assert docs.annotations[("Movie", "year")] == "int"
+	assert docs.by_namespace["Movie"]["title"] == ["The title of the movie.", '']
+	assert docs.by_namespace["Book"]["title"] == ["The title of the book.", '']
+	assert docs.by_name["title"] == ["The title of the book.", '']
+
+	# Cached until the source changes
+	assert get_module_attribute_docs("attribute_docs_demo") is docs
+
+	source.write_lines(["#: The answer.", "answer: int = 42"])
+	os.utime(source, (0, 0))
+
+	docs = get_module_attribute_docs("attribute_docs_demo")
+	assert docs.attr_docs == {('', "answer"): ["The answer.", '']}
+	assert docs.by_name == {"answer": ["The answer.", '']}
+
+	with pytest.raises(PycodeError):
+		get_module_attribute_docs("does_not_exist")